@@ -0,0 +1,245 @@
+"""Record/replay layer for chat model calls.
+
+``wrap_chat_model`` puts a ``CassetteChatModel`` in front of the ChatOllama
+client used by ``initialize_agent`` and the result processor's examiner when
+``AGENT_LLM_CASSETTE_MODE`` is set:
+
+* ``record``: every call goes to the real model and the response is stored
+  under a hash of the normalized request (model settings, messages, bound
+  tools, stop sequences);
+* ``replay``: responses are served from disk and the model is never called,
+  so runs are deterministic and work without Ollama. A request that was not
+  recorded raises ``CassetteMissError``.
+
+Cassettes live in ``AGENT_LLM_CASSETTE_DIR`` (default ``data/llm_cassettes``)
+as one JSON file per request, fanned out by hash prefix. The clock tools
+(``time_elapsed``, ``time_left``) return wall-clock values, so each response
+is also stored under a "loose" key that ignores the outputs of those tools,
+and only those. Replay falls back to it only when ``AGENT_LLM_CASSETTE_LOOSE``
+is set, and reports every loose hit on stderr.
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Literal, Optional, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import ConfigDict
+
+CASSETTE_MODE_ENV = "AGENT_LLM_CASSETTE_MODE"
+CASSETTE_DIR_ENV = "AGENT_LLM_CASSETTE_DIR"
+CASSETTE_LOOSE_ENV = "AGENT_LLM_CASSETTE_LOOSE"
+DEFAULT_CASSETTE_DIR = Path("data/llm_cassettes")
+
+CassetteMode = Literal["record", "replay"]
+
+# Client settings that do not change what the model answers.
+_IGNORED_MODEL_FIELDS = frozenset({
+    "base_url",
+    "disable_streaming",
+    "keep_alive",
+    "name",
+    "validate_model_on_init",
+})
+# Message fields that differ between otherwise identical requests.
+_VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+# Tools whose output depends on the wall clock; the loose key ignores it.
+_CLOCK_TOOLS = frozenset({"time_elapsed", "time_left"})
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode for a request that has no recorded response."""
+
+
+class LLMCassette:
+    """Directory of recorded chat responses keyed by normalized request hash."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def get(self, request: dict[str, Any], *, loose: bool = False) -> Optional[ChatResult]:
+        """The recorded response, falling back to the loose key only with ``loose``."""
+        path = self._path(_request_key(request))
+        if not path.is_file() and loose:
+            path = self._path(_loose_key(request), loose=True)
+            if path.is_file():
+                sys.stderr.write(
+                    f"cassette: loose match for request {_request_key(request)}"
+                    f" (clock tool outputs ignored): {path}\n"
+                )
+        if not path.is_file():
+            return None
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return _result_from_dict(payload["response"])
+
+    def put(self, request: dict[str, Any], result: ChatResult) -> str:
+        key = _request_key(request)
+        payload = json.dumps(
+            {"key": key, "request": request, "response": _result_to_dict(result)},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        self._write(self._path(key), payload)
+        self._write(self._path(_loose_key(request), loose=True), payload)
+        return key
+
+    def _path(self, key: str, *, loose: bool = False) -> Path:
+        root = self.root / "loose" if loose else self.root
+        return root / key[:2] / f"{key}.json"
+
+    @staticmethod
+    def _write(path: Path, payload: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            delete=False,
+        ) as tmp:
+            tmp.write(payload)
+        os.replace(tmp.name, path)
+
+
+class CassetteChatModel(BaseChatModel):
+    """Chat model that records or replays the responses of ``inner``."""
+
+    inner: BaseChatModel
+    cassette: LLMCassette
+    mode: CassetteMode
+    # Replay may fall back to the loose key (see module docstring).
+    loose: bool = False
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def _llm_type(self) -> str:
+        return f"cassette-{self.inner._llm_type}"
+
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable | Any],
+        *,
+        tool_choice: Optional[Any] = None,
+        **kwargs: Any,
+    ):
+        # Let the wrapped client format the tools, then bind the same kwargs
+        # here so they reach _generate (and the request hash).
+        bound = self.inner.bind_tools(tools, tool_choice=tool_choice, **kwargs)
+        return self.bind(**getattr(bound, "kwargs", {}))
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        request = normalize_request(self.inner, messages, stop=stop, **kwargs)
+        if self.mode == "replay":
+            recorded = self.cassette.get(request, loose=self.loose)
+            if recorded is None:
+                raise CassetteMissError(
+                    f"no recorded response for request {_request_key(request)} in {self.cassette.root}"
+                )
+            return recorded
+        result = self.inner._generate(messages, stop=stop, **kwargs)
+        self.cassette.put(request, result)
+        return result
+
+
+def normalize_request(
+    model: BaseChatModel,
+    messages: list[BaseMessage],
+    *,
+    stop: Optional[list[str]] = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """JSON-ready description of a chat call with volatile fields removed."""
+    normalized_messages = []
+    for message in messages:
+        entry = message_to_dict(message)
+        for field in _VOLATILE_MESSAGE_FIELDS:
+            entry["data"].pop(field, None)
+        normalized_messages.append(entry)
+    return {
+        "model": _model_identity(model),
+        "messages": normalized_messages,
+        "stop": stop,
+        "kwargs": json.loads(json.dumps(kwargs, default=str, sort_keys=True)),
+    }
+
+
+def cassette_mode_from_env() -> Optional[CassetteMode]:
+    raw = (os.environ.get(CASSETTE_MODE_ENV) or "").strip().lower()
+    if raw in {"", "off"}:
+        return None
+    if raw not in {"record", "replay"}:
+        raise ValueError(f"{CASSETTE_MODE_ENV} must be 'record', 'replay' or 'off', got {raw!r}")
+    return raw  # type: ignore[return-value]
+
+
+def wrap_chat_model(model: BaseChatModel) -> BaseChatModel:
+    """Return ``model`` behind a cassette when record/replay is enabled, else unchanged."""
+    mode = cassette_mode_from_env()
+    if mode is None:
+        return model
+    root = Path(os.environ.get(CASSETTE_DIR_ENV) or DEFAULT_CASSETTE_DIR)
+    loose = (os.environ.get(CASSETTE_LOOSE_ENV) or "").strip().lower() in {"1", "true", "yes", "on"}
+    return CassetteChatModel(inner=model, cassette=LLMCassette(root), mode=mode, loose=loose)
+
+
+def _model_identity(model: BaseChatModel) -> dict[str, Any]:
+    identity: dict[str, Any] = {"llm_type": model._llm_type}
+    for name, value in model.model_dump().items():
+        if name in _IGNORED_MODEL_FIELDS or value is None:
+            continue
+        if isinstance(value, (str, int, float, bool)):
+            identity[name] = value
+    return identity
+
+
+def _request_key(request: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _loose_key(request: dict[str, Any]) -> str:
+    """Request key with the outputs of clock tools blanked out."""
+    clock_calls = {
+        call.get("id")
+        for entry in request["messages"]
+        for call in entry["data"].get("tool_calls") or []
+        if call.get("name") in _CLOCK_TOOLS
+    }
+    loose = dict(request)
+    loose["messages"] = [
+        {**entry, "data": {**entry["data"], "content": None}}
+        if entry.get("type") == "tool" and entry["data"].get("tool_call_id") in clock_calls
+        else entry
+        for entry in request["messages"]
+    ]
+    return _request_key(loose)
+
+
+def _result_to_dict(result: ChatResult) -> dict[str, Any]:
+    return {
+        "generations": [
+            {"message": message_to_dict(generation.message), "generation_info": generation.generation_info}
+            for generation in result.generations
+        ],
+        "llm_output": result.llm_output,
+    }
+
+
+def _result_from_dict(payload: dict[str, Any]) -> ChatResult:
+    generations = []
+    for entry in payload["generations"]:
+        (message,) = messages_from_dict([entry["message"]])
+        generations.append(ChatGeneration(message=message, generation_info=entry.get("generation_info")))
+    return ChatResult(generations=generations, llm_output=payload.get("llm_output"))
@@ -11,9 +11,11 @@ from langchain.agents import create_agent
 from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel
 
+from agent.cassette import wrap_chat_model
 from agent.interface.invoke import invoke_agent
 from agent.interface.response import format_agent_response
 from agent.interface.streaming import stream_agent
+from agent.ollama_host import ollama_base_url
 from agent.prompts import EXAMINEE_SYSTEM_MESSAGE, EXAMINER_SYSTEM_MESSAGE, TOOL_USE_ENFORCEMENT
 from agent.tools import create_validator_tools, create_performer_tools
 
@@ -65,13 +67,13 @@ def initialize_agent(
     else:
         raise ValueError(f"Invalid role: {role}")
 
-    llm_model = ChatOllama(
+    llm_model = wrap_chat_model(ChatOllama(
         model=llm_model,
         reasoning=reasoning_enabled,
-        base_url="http://localhost:11434",
+        base_url=ollama_base_url(),
         temperature=temperature,
         num_ctx=num_ctx,
-    )
+    ))
 
     return create_agent(
         model=llm_model,
@@ -0,0 +1,454 @@
+"""Local stand-in for the Ollama HTTP API, for load and latency testing.
+
+``FakeOllamaServer`` implements the endpoints ``langchain_ollama`` uses
+(``/api/chat``, ``/api/generate``, ``/api/tags``) with simulated timing:
+
+* prompt processing takes ``prefill_per_1k_tokens`` per 1000 prompt tokens
+  (estimated as characters / 4) before the first chunk is sent;
+* every generated token takes ``decode_per_token``;
+* at most ``slots`` requests are served at once, the rest wait in line, like
+  ``OLLAMA_NUM_PARALLEL`` on a real daemon.
+
+Chat requests that offer tools walk ``tool_script``: the n-th assistant turn
+after the user message calls the n-th scripted tool (when it is offered),
+then the model answers with ``answer``. JSON-mode requests get
+``json_reply(prompt)``; the server knows nothing of any prompt format, so
+callers that need meaningful JSON (the result processor's benchmark) inject
+their own reply function.
+
+Point the agent and the examiner at it with ``OLLAMA_HOST=<base_url>``, or
+run it standalone with ``python -m agent.fake_ollama``. The standalone server
+takes its scripted replies from ``--config``, a JSON file with optional
+``models``, ``tool_script`` (``[{"name": ..., "arguments": {...}}]``),
+``answer`` and ``json_reply`` (an object returned for every JSON-mode
+request) keys; ``--json-reply-function module:name`` imports a reply function
+instead, e.g. ``result_processor.commands.benchmark:fake_examiner_reply``.
+"""
+import argparse
+import importlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator, Optional
+
+_TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+
+DEFAULT_ANSWER = "[The fake model has no knowledge of this corpus.] [file:README.md, lines:0-1]"
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Normally distributed delay in seconds, truncated at zero."""
+
+    mean_s: float = 0.0
+    stddev_s: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.stddev_s <= 0:
+            return max(self.mean_s, 0.0)
+        return max(rng.gauss(self.mean_s, self.stddev_s), 0.0)
+
+
+@dataclass(frozen=True)
+class ScriptedToolCall:
+    name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+
+def _empty_json_reply(prompt: str) -> dict[str, Any]:
+    return {}
+
+
+@dataclass
+class FakeOllamaConfig:
+    # Models listed by /api/tags; empty means every model name is accepted.
+    models: tuple[str, ...] = ()
+    slots: int = 1
+    prefill_per_1k_tokens: Latency = Latency(0.05)
+    decode_per_token: Latency = Latency(0.005)
+    tool_script: tuple[ScriptedToolCall, ...] = ()
+    answer: str = DEFAULT_ANSWER
+    json_reply: Callable[[str], dict[str, Any]] = _empty_json_reply
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class FakeOllamaStats:
+    requests: int
+    peak_in_flight: int
+    # Time requests spent waiting for a free slot.
+    queue_wait_s: float
+    # Simulated model time summed over requests.
+    service_s: float
+    # Wall time during which at least one request was being served.
+    busy_s: float
+    # Estimated prompt tokens summed over requests.
+    prompt_tokens: int = 0
+
+
+class FakeOllamaServer:
+    def __init__(self, config: Optional[FakeOllamaConfig] = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or FakeOllamaConfig()
+        if self.config.slots < 1:
+            raise ValueError(f"fake Ollama slots must be at least 1, got {self.config.slots}")
+        self._slots = threading.BoundedSemaphore(self.config.slots)
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._intervals: list[tuple[float, float]] = []
+        self._queue_wait_s = 0.0
+        self._prompt_tokens = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._httpd = ThreadingHTTPServer((host, port), _handler_class(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FakeOllamaServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-ollama", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stats(self) -> FakeOllamaStats:
+        with self._lock:
+            intervals = sorted(self._intervals)
+            return FakeOllamaStats(
+                requests=len(intervals),
+                peak_in_flight=self._peak_in_flight,
+                queue_wait_s=self._queue_wait_s,
+                service_s=sum(end - start for start, end in intervals),
+                busy_s=_union_length(intervals),
+                prompt_tokens=self._prompt_tokens,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._intervals.clear()
+            self._queue_wait_s = 0.0
+            self._prompt_tokens = 0
+            self._peak_in_flight = self._in_flight
+
+    def accepts(self, model: str) -> bool:
+        return not self.config.models or model in self.config.models
+
+    def reply(self, body: dict[str, Any], *, chat: bool) -> tuple[str, list[dict[str, Any]]]:
+        """Return (text, tool_calls) for a request body."""
+        if chat:
+            messages = body.get("messages") or []
+            prompt = next((m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), "")
+        else:
+            prompt = body.get("prompt") or ""
+        if body.get("format"):
+            return json.dumps(self.config.json_reply(prompt)), []
+        if chat and body.get("tools"):
+            tool_call = self._scripted_tool_call(body["messages"], body["tools"])
+            if tool_call is not None:
+                return "", [tool_call]
+        return self.config.answer, []
+
+    def serve(self, body: dict[str, Any], *, chat: bool) -> Iterator[dict[str, Any]]:
+        """Yield response chunks for a request, holding a slot and sleeping as configured."""
+        text, tool_calls = self.reply(body, chat=chat)
+        prompt_tokens = _estimate_tokens(json.dumps(body.get("messages") or body.get("prompt") or ""))
+        tokens = _TOKEN_PATTERN.findall(text) or [""]
+        with self._lock:
+            self._prompt_tokens += prompt_tokens
+            prefill_s = self.config.prefill_per_1k_tokens.sample(self._rng) * prompt_tokens / 1000
+            decode_s = [self.config.decode_per_token.sample(self._rng) for _ in tokens]
+
+        queued_at = time.perf_counter()
+        with self._slots:
+            started = time.perf_counter()
+            with self._lock:
+                self._queue_wait_s += started - queued_at
+                self._in_flight += 1
+                self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            try:
+                time.sleep(prefill_s)
+                prefill_done = time.perf_counter()
+                for index, (token, delay) in enumerate(zip(tokens, decode_s)):
+                    time.sleep(delay)
+                    last = index == len(tokens) - 1
+                    yield _chunk(body, token, tool_calls if last else [], chat=chat)
+                finished = time.perf_counter()
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self._intervals.append((started, time.perf_counter()))
+        yield _final_chunk(
+            body,
+            chat=chat,
+            total_s=finished - queued_at,
+            prompt_tokens=prompt_tokens,
+            prefill_s=prefill_done - started,
+            eval_tokens=len(tokens),
+            eval_s=finished - prefill_done,
+        )
+
+    def _scripted_tool_call(self, messages: list[dict[str, Any]], tools: list[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        last_user = max((i for i, m in enumerate(messages) if m.get("role") == "user"), default=-1)
+        turn = sum(1 for m in messages[last_user + 1:] if m.get("role") == "assistant" and m.get("tool_calls"))
+        if turn >= len(self.config.tool_script):
+            return None
+        scripted = self.config.tool_script[turn]
+        offered = {(tool.get("function") or {}).get("name") for tool in tools}
+        if scripted.name not in offered:
+            return None
+        return {"function": {"name": scripted.name, "arguments": scripted.arguments}}
+
+
+def _handler_class(server: FakeOllamaServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if self.path == "/api/tags":
+                self._send_json(200, {"models": [_model_entry(name) for name in server.config.models]})
+            elif self.path == "/api/version":
+                self._send_json(200, {"version": "0.0.0-fake"})
+            else:
+                self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+
+        def do_HEAD(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_POST(self) -> None:
+            if self.path not in {"/api/chat", "/api/generate"}:
+                self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError as exc:
+                self._send_json(400, {"error": f"invalid request body: {exc}"})
+                return
+            model = body.get("model") or ""
+            if not server.accepts(model):
+                self._send_json(404, {"error": f"model '{model}' not found"})
+                return
+
+            chunks = server.serve(body, chat=self.path == "/api/chat")
+            if body.get("stream", True):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for chunk in chunks:
+                    data = (json.dumps(chunk) + "\n").encode("utf-8")
+                    self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                    self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+                return
+            self._send_json(200, _merge_chunks(list(chunks), chat=self.path == "/api/chat"))
+
+        def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def _chunk(body: dict[str, Any], token: str, tool_calls: list[dict[str, Any]], *, chat: bool) -> dict[str, Any]:
+    chunk: dict[str, Any] = {"model": body.get("model"), "created_at": _now(), "done": False}
+    if chat:
+        message: dict[str, Any] = {"role": "assistant", "content": token}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        chunk["message"] = message
+    else:
+        chunk["response"] = token
+    return chunk
+
+
+def _final_chunk(
+    body: dict[str, Any],
+    *,
+    chat: bool,
+    total_s: float,
+    prompt_tokens: int,
+    prefill_s: float,
+    eval_tokens: int,
+    eval_s: float,
+) -> dict[str, Any]:
+    chunk = _chunk(body, "", [], chat=chat)
+    chunk.update({
+        "done": True,
+        "done_reason": "stop",
+        "total_duration": int(total_s * 1e9),
+        "load_duration": 0,
+        "prompt_eval_count": prompt_tokens,
+        "prompt_eval_duration": int(prefill_s * 1e9),
+        "eval_count": eval_tokens,
+        "eval_duration": int(eval_s * 1e9),
+    })
+    return chunk
+
+
+def _merge_chunks(chunks: list[dict[str, Any]], *, chat: bool) -> dict[str, Any]:
+    merged = dict(chunks[-1])
+    if chat:
+        messages = [chunk["message"] for chunk in chunks]
+        merged["message"] = {
+            "role": "assistant",
+            "content": "".join(message["content"] for message in messages),
+        }
+        tool_calls = [call for message in messages for call in message.get("tool_calls", [])]
+        if tool_calls:
+            merged["message"]["tool_calls"] = tool_calls
+    else:
+        merged["response"] = "".join(chunk["response"] for chunk in chunks)
+    return merged
+
+
+def _model_entry(name: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "model": name,
+        "modified_at": _now(),
+        "size": 0,
+        "digest": "0" * 64,
+        "details": {"format": "gguf", "family": "fake", "parameter_size": "0B", "quantization_level": "none"},
+    }
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _union_length(intervals: list[tuple[float, float]]) -> float:
+    total = 0.0
+    current_start: Optional[float] = None
+    current_end = 0.0
+    for start, end in intervals:
+        if current_start is None or start > current_end:
+            if current_start is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_start is not None:
+        total += current_end - current_start
+    return total
+
+
+def load_config_file(path: str) -> dict[str, Any]:
+    """``FakeOllamaConfig`` fields from a ``--config`` JSON file."""
+    with open(path, encoding="utf-8") as handle:
+        payload = json.load(handle)
+    if not isinstance(payload, dict):
+        raise ValueError(f"{path}: fake Ollama config must be a JSON object")
+    unknown = set(payload) - {"models", "tool_script", "answer", "json_reply"}
+    if unknown:
+        raise ValueError(f"{path}: unknown fake Ollama config keys: {sorted(unknown)}")
+    fields: dict[str, Any] = {}
+    if "models" in payload:
+        fields["models"] = tuple(payload["models"])
+    if "tool_script" in payload:
+        fields["tool_script"] = tuple(
+            ScriptedToolCall(step["name"], dict(step.get("arguments") or {})) for step in payload["tool_script"]
+        )
+    if "answer" in payload:
+        fields["answer"] = str(payload["answer"])
+    if "json_reply" in payload:
+        reply = payload["json_reply"]
+        if not isinstance(reply, dict):
+            raise ValueError(f"{path}: json_reply must be a JSON object")
+        fields["json_reply"] = lambda prompt: dict(reply)
+    return fields
+
+
+def import_json_reply(spec: str) -> Callable[[str], dict[str, Any]]:
+    """Import the reply function named by ``module:name``."""
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"--json-reply-function must look like module:name, got {spec!r}")
+    function = getattr(importlib.import_module(module_name), attribute)
+    if not callable(function):
+        raise ValueError(f"{spec} is not callable")
+    return function
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="fake-ollama", description="Serve a simulated Ollama API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--slots", type=int, default=1)
+    parser.add_argument("--prefill-ms-per-1k-tokens", dest="prefill_ms", type=float, default=50.0)
+    parser.add_argument("--decode-ms-per-token", dest="decode_ms", type=float, default=5.0)
+    parser.add_argument("--jitter", type=float, default=0.0, help="Standard deviation as a fraction of the mean")
+    parser.add_argument(
+        "--config",
+        help="JSON file with the scripted replies: models, tool_script, answer and json_reply",
+    )
+    parser.add_argument(
+        "--json-reply-function",
+        dest="json_reply_function",
+        help="module:name of a function mapping a JSON-mode prompt to its reply object (overrides json_reply)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    fields = load_config_file(args.config) if args.config else {}
+    if args.json_reply_function:
+        fields["json_reply"] = import_json_reply(args.json_reply_function)
+    config = FakeOllamaConfig(
+        slots=args.slots,
+        prefill_per_1k_tokens=Latency(args.prefill_ms / 1000, args.prefill_ms * args.jitter / 1000),
+        decode_per_token=Latency(args.decode_ms / 1000, args.decode_ms * args.jitter / 1000),
+        **fields,
+    )
+    server = FakeOllamaServer(config, host=args.host, port=args.port)
+    sys.stdout.write(f"fake Ollama listening on {server.base_url}\n")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
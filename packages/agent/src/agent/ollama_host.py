@@ -0,0 +1,29 @@
+"""Where the ChatOllama clients connect.
+
+``OLLAMA_HOST`` is the variable the Ollama CLI itself reads; honouring it lets
+a run be pointed at another daemon, or at ``agent.fake_ollama`` for load tests.
+``OLLAMA_NUM_PARALLEL`` is how many requests per model the daemon serves at
+once, so clients that fan out requests use it as their default concurrency.
+"""
+import os
+
+OLLAMA_HOST_ENV = "OLLAMA_HOST"
+OLLAMA_NUM_PARALLEL_ENV = "OLLAMA_NUM_PARALLEL"
+DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
+
+
+def ollama_base_url() -> str:
+    return os.environ.get(OLLAMA_HOST_ENV) or DEFAULT_OLLAMA_BASE_URL
+
+
+def ollama_num_parallel() -> int:
+    raw = os.environ.get(OLLAMA_NUM_PARALLEL_ENV)
+    if not raw:
+        return 1
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{OLLAMA_NUM_PARALLEL_ENV} must be an integer, got {raw!r}") from exc
+    if value < 1:
+        raise ValueError(f"{OLLAMA_NUM_PARALLEL_ENV} must be at least 1, got {value}")
+    return value
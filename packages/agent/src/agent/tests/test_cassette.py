@@ -0,0 +1,112 @@
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+
+from agent.cassette import CassetteChatModel, CassetteMissError, LLMCassette, wrap_chat_model
+
+
+class ScriptedChatModel(BaseChatModel):
+    model: str = "scripted"
+    replies: list[str] = []
+    # A list rather than a counter so it stays out of the cassette's model identity.
+    seen: list[int] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+        return self.bind(tools=[t.name for t in tools], **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        reply = self.replies[len(self.seen)]
+        self.seen.append(len(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+
+@tool
+def time_elapsed() -> str:
+    """Seconds since the run started."""
+    return "0"
+
+
+def _conversation(tool_output: str, tool_name: str = "time_elapsed"):
+    return [
+        HumanMessage(content="How long has it been?"),
+        AIMessage(content="", tool_calls=[{"name": tool_name, "args": {}, "id": "call-1"}]),
+        ToolMessage(content=tool_output, tool_call_id="call-1"),
+    ]
+
+
+def test_cassette_replays_recorded_responses_without_calling_the_model(tmp_path):
+    cassette = LLMCassette(tmp_path)
+    recorder = CassetteChatModel(
+        inner=ScriptedChatModel(replies=["first", "second"]), cassette=cassette, mode="record"
+    )
+    assert recorder.invoke("hello").content == "first"
+    assert recorder.invoke(_conversation("1.5 s")).content == "second"
+
+    inner = ScriptedChatModel(replies=[])
+    replayer = CassetteChatModel(inner=inner, cassette=cassette, mode="replay")
+
+    assert replayer.invoke("hello").content == "first"
+    assert replayer.invoke(_conversation("1.5 s")).content == "second"
+    assert inner.seen == []
+    with pytest.raises(CassetteMissError):
+        replayer.invoke("something else")
+
+
+def test_cassette_loose_replay_is_opt_in_and_ignores_only_clock_tools(tmp_path, capsys):
+    cassette = LLMCassette(tmp_path)
+    recorder = CassetteChatModel(
+        inner=ScriptedChatModel(replies=["clock", "search"]), cassette=cassette, mode="record"
+    )
+    recorder.invoke(_conversation("1.5 s"))
+    recorder.invoke(_conversation("mars.md:1", tool_name="search"))
+
+    strict = CassetteChatModel(inner=ScriptedChatModel(), cassette=cassette, mode="replay")
+    loose = CassetteChatModel(inner=ScriptedChatModel(), cassette=cassette, mode="replay", loose=True)
+
+    # Clock tool outputs differ between runs; only a loose replay matches anyway, and says so.
+    with pytest.raises(CassetteMissError):
+        strict.invoke(_conversation("7.25 s"))
+    assert loose.invoke(_conversation("7.25 s")).content == "clock"
+    assert "cassette: loose match" in capsys.readouterr().err
+    # Any other tool output is part of the request, loose or not.
+    with pytest.raises(CassetteMissError):
+        loose.invoke(_conversation("jupiter.md:1", tool_name="search"))
+
+
+def test_cassette_keys_include_bound_tools(tmp_path):
+    cassette = LLMCassette(tmp_path)
+    recorder = CassetteChatModel(inner=ScriptedChatModel(replies=["plain"]), cassette=cassette, mode="record")
+    recorder.invoke("hello")
+
+    replayer = CassetteChatModel(inner=ScriptedChatModel(), cassette=cassette, mode="replay")
+
+    assert replayer.invoke("hello").content == "plain"
+    with pytest.raises(CassetteMissError):
+        replayer.bind_tools([time_elapsed]).invoke("hello")
+
+
+def test_wrap_chat_model_follows_environment(monkeypatch, tmp_path):
+    model = ScriptedChatModel()
+
+    monkeypatch.delenv("AGENT_LLM_CASSETTE_MODE", raising=False)
+    assert wrap_chat_model(model) is model
+
+    monkeypatch.setenv("AGENT_LLM_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("AGENT_LLM_CASSETTE_DIR", str(tmp_path))
+    wrapped = wrap_chat_model(model)
+    assert isinstance(wrapped, CassetteChatModel)
+    assert wrapped.mode == "replay"
+    assert wrapped.cassette.root == tmp_path
+    assert wrapped.loose is False
+    monkeypatch.setenv("AGENT_LLM_CASSETTE_LOOSE", "1")
+    assert wrap_chat_model(model).loose is True
+
+    monkeypatch.setenv("AGENT_LLM_CASSETTE_MODE", "sometimes")
+    with pytest.raises(ValueError):
+        wrap_chat_model(model)
@@ -0,0 +1,101 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import tool
+from langchain_ollama import ChatOllama
+
+from agent.fake_ollama import (
+    FakeOllamaConfig,
+    FakeOllamaServer,
+    Latency,
+    ScriptedToolCall,
+    import_json_reply,
+    load_config_file,
+)
+
+
+@tool
+def list_paths(pattern: str) -> list[str]:
+    """List paths matching a glob pattern."""
+    return []
+
+
+def test_fake_ollama_serves_scripted_tool_calls_then_the_answer():
+    config = FakeOllamaConfig(
+        models=("qwen3:4b",),
+        prefill_per_1k_tokens=Latency(0.0),
+        decode_per_token=Latency(0.0),
+        tool_script=(ScriptedToolCall("list_paths", {"pattern": "*.md"}),),
+        answer="Mars is red.",
+        json_reply=lambda prompt: {"echo": prompt},
+    )
+    with FakeOllamaServer(config) as server:
+        model = ChatOllama(model="qwen3:4b", base_url=server.base_url).bind_tools([list_paths])
+
+        first = model.invoke([HumanMessage(content="What colour is Mars?")])
+        assert first.tool_calls[0]["name"] == "list_paths"
+        assert first.tool_calls[0]["args"] == {"pattern": "*.md"}
+
+        second = model.invoke([
+            HumanMessage(content="What colour is Mars?"),
+            first,
+            {"role": "tool", "content": "[]", "tool_call_id": first.tool_calls[0]["id"]},
+        ])
+        assert second.content == "Mars is red."
+        assert second.usage_metadata["output_tokens"] == 3
+
+        examiner = ChatOllama(model="qwen3:4b", base_url=server.base_url, format="json")
+        assert json.loads(examiner.invoke("classify").content) == {"echo": "classify"}
+
+        with pytest.raises(Exception, match="not found"):
+            ChatOllama(model="llama3.1:8b", base_url=server.base_url).invoke("hi")
+
+    assert server.stats().requests == 3
+
+
+def test_fake_ollama_limits_concurrency_to_its_slots():
+    config = FakeOllamaConfig(slots=2, prefill_per_1k_tokens=Latency(0.0), decode_per_token=Latency(0.02))
+    with FakeOllamaServer(config) as server:
+        model = ChatOllama(model="qwen3:4b", base_url=server.base_url)
+        barrier = threading.Barrier(5)
+
+        def ask(_index: int) -> str:
+            barrier.wait()
+            return model.invoke("hello").content
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            answers = list(pool.map(ask, range(5)))
+
+        stats = server.stats()
+
+    assert len(set(answers)) == 1
+    assert stats.requests == 5
+    assert stats.peak_in_flight == 2
+    assert stats.queue_wait_s > 0
+    assert stats.busy_s < stats.service_s
+
+
+def test_fake_ollama_config_file_scripts_the_standalone_server(tmp_path):
+    path = tmp_path / "fake.json"
+    path.write_text(json.dumps({
+        "tool_script": [{"name": "list_paths", "arguments": {"pattern": "*.md"}}],
+        "answer": "Mars is red.",
+        "json_reply": {"status": "supported"},
+    }), encoding="utf-8")
+    config = FakeOllamaConfig(prefill_per_1k_tokens=Latency(0.0), decode_per_token=Latency(0.0), **load_config_file(str(path)))
+
+    with FakeOllamaServer(config) as server:
+        model = ChatOllama(model="qwen3:4b", base_url=server.base_url).bind_tools([list_paths])
+        assert model.invoke("What colour is Mars?").tool_calls[0]["args"] == {"pattern": "*.md"}
+        examiner = ChatOllama(model="qwen3:4b", base_url=server.base_url, format="json")
+        assert json.loads(examiner.invoke("classify").content) == {"status": "supported"}
+
+    assert import_json_reply("json:dumps") is json.dumps
+    path.write_text(json.dumps({"replies": []}), encoding="utf-8")
+    with pytest.raises(ValueError, match="unknown fake Ollama config keys"):
+        load_config_file(str(path))
+    with pytest.raises(ValueError, match="module:name"):
+        import_json_reply("json.dumps")
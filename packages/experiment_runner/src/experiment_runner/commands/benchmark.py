@@ -0,0 +1,268 @@
+"""Scheduler benchmark for ``run_suite`` using the mock system.
+
+For every task count the benchmark plans a suite of ``SystemName.MOCK`` tasks
+over a synthetic corpus and measures:
+
+* planning, persisting and resuming (load + reconcile) the suite state;
+* the cost of one heartbeat write and one cancellation poll against a store
+  of that size;
+* per-task orchestration overhead: ``sample_tasks`` tasks are really executed
+  while every other task is already marked succeeded, so ``run_suite`` still
+  walks the full task list. Overhead is wall time minus the runner's own
+  execution time;
+* cancel latency: one task is told to hang, and the time from requesting
+  cancellation to ``run_suite`` returning is recorded.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from experiment_runner.commands.suite import (
+    build_suite_state,
+    open_suite_store,
+    reconcile_suite_state,
+    run_suite,
+)
+from experiment_runner.models.enums import Corpus, SystemName
+from experiment_runner.models.suite import (
+    ExperimentSuiteConfig,
+    ExperimentSuiteState,
+    SuiteCorpusSelection,
+    SuiteTaskStatus,
+)
+from experiment_runner.result_store import iter_result_file
+from experiment_runner.runners.mock import LatencyDistribution, write_synthetic_corpus
+
+_CORPUS = Corpus.SOLAR_SYSTEM_WIKI
+_CANCEL_TIMEOUT_S = 60.0
+
+
+def benchmark_scheduler(
+    *,
+    task_counts: list[int],
+    sample_tasks: int = 10,
+    latency: str = "fixed:0",
+    probe_samples: int = 200,
+    work_dir: str | Path | None = None,
+) -> dict[str, Any]:
+    if not task_counts or min(task_counts) < 1:
+        raise ValueError("--tasks values must be at least 1")
+    if sample_tasks < 1:
+        raise ValueError(f"--sample-tasks must be at least 1, got {sample_tasks}")
+    LatencyDistribution.parse(latency)
+
+    with _scratch_dir(work_dir) as root:
+        corpus_dir = root / "corpus"
+        write_synthetic_corpus(corpus_dir)
+        levels = [
+            _benchmark_level(
+                root / f"tasks_{count}",
+                corpus_dir,
+                count,
+                sample_tasks=min(sample_tasks, count),
+                latency=latency,
+                probe_samples=probe_samples,
+            )
+            for count in task_counts
+        ]
+    return {"latency": latency, "sample_tasks": sample_tasks, "levels": levels}
+
+
+def _benchmark_level(
+    level_dir: Path,
+    corpus_dir: Path,
+    count: int,
+    *,
+    sample_tasks: int,
+    latency: str,
+    probe_samples: int,
+) -> dict[str, Any]:
+    level_dir.mkdir(parents=True, exist_ok=True)
+    questions_file = level_dir / "questions.json"
+    _write_questions(questions_file, count)
+    config = ExperimentSuiteConfig(
+        name=f"scheduler-benchmark-{count}",
+        systems=[SystemName.MOCK],
+        models=["mock"],
+        corpora=[SuiteCorpusSelection(
+            corpus=_CORPUS,
+            questions_file=str(questions_file),
+            path_to_corpora=str(corpus_dir),
+        )],
+        output_dir=str(level_dir / "experiment_results"),
+        no_trace=True,
+        use_cache=False,
+    )
+    placeholder = Path(config.output_dir) / "placeholder.jsonl"
+    placeholder.parent.mkdir(parents=True, exist_ok=True)
+    placeholder.write_text("{}\n", encoding="utf-8")
+
+    started = time.perf_counter()
+    state = build_suite_state(config)
+    plan_s = time.perf_counter() - started
+
+    run_state_path = level_dir / "run.state.json"
+    _mark_done_except(state, keep=sample_tasks, placeholder=placeholder)
+    with open_suite_store(run_state_path) as store:
+        started = time.perf_counter()
+        store.replace(state)
+        persist_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        reconcile_suite_state(config, store.load())
+        resume_s = time.perf_counter() - started
+
+        heartbeat_ms, cancel_poll_ms = _probe_store(store, state, probe_samples)
+
+    with _mock_env(latency=latency, hang_rate="0"):
+        started = time.perf_counter()
+        finished = run_suite(config, run_state_path)
+        run_wall_s = time.perf_counter() - started
+    executed = [task for task in finished.tasks if task.result_path != str(placeholder)]
+    runner_s = sum(_execution_time(task.result_path) for task in executed)
+
+    cancel_state_path = level_dir / "cancel.state.json"
+    _mark_done_except(state, keep=1, placeholder=placeholder)
+    with open_suite_store(cancel_state_path) as store:
+        store.replace(state)
+    cancel_latency_s = _measure_cancel_latency(config, cancel_state_path, state.tasks[0].task_id)
+
+    return {
+        "tasks": count,
+        "plan_s": round(plan_s, 3),
+        "persist_s": round(persist_s, 3),
+        "resume_s": round(resume_s, 3),
+        "heartbeat_ms": round(heartbeat_ms, 3),
+        "cancel_poll_ms": round(cancel_poll_ms, 3),
+        "executed_tasks": len(executed),
+        "succeeded_tasks": sum(1 for task in executed if task.status == SuiteTaskStatus.SUCCEEDED),
+        "run_wall_s": round(run_wall_s, 3),
+        "runner_s": round(runner_s, 3),
+        "overhead_per_task_s": round((run_wall_s - runner_s) / max(len(executed), 1), 3),
+        "cancel_latency_s": round(cancel_latency_s, 3) if cancel_latency_s is not None else None,
+    }
+
+
+def _mark_done_except(state: ExperimentSuiteState, *, keep: int, placeholder: Path) -> None:
+    for index, task in enumerate(state.tasks):
+        if index < keep:
+            task.status = SuiteTaskStatus.PENDING
+            task.result_path = None
+        else:
+            task.status = SuiteTaskStatus.SUCCEEDED
+            task.result_path = str(placeholder)
+
+
+def _probe_store(store, state: ExperimentSuiteState, samples: int) -> tuple[float, float]:
+    rng = random.Random(0)
+    task_ids = [task.task_id for task in state.tasks]
+    heartbeat_s = 0.0
+    poll_s = 0.0
+    for _ in range(samples):
+        task = store.get_task(rng.choice(task_ids))
+        started = time.perf_counter()
+        store.update_task(task, active_pid=os.getpid())
+        heartbeat_s += time.perf_counter() - started
+        started = time.perf_counter()
+        store.cancel_requested()
+        poll_s += time.perf_counter() - started
+    store.update_meta(active_pid=None)
+    samples = max(samples, 1)
+    return heartbeat_s * 1000 / samples, poll_s * 1000 / samples
+
+
+def _measure_cancel_latency(config: ExperimentSuiteConfig, state_path: Path, task_id: str) -> float | None:
+    with _mock_env(latency="fixed:0", hang_rate="1"):
+        runner = threading.Thread(target=run_suite, args=(config, state_path), daemon=True)
+        runner.start()
+        with open_suite_store(state_path) as store:
+            deadline = time.monotonic() + _CANCEL_TIMEOUT_S
+            while time.monotonic() < deadline:
+                task = store.get_task(task_id)
+                if task is not None and task.status == SuiteTaskStatus.RUNNING:
+                    break
+                time.sleep(0.05)
+            else:
+                return None
+            # Let the task's process get past start-up so the cancel hits a hung run.
+            time.sleep(1.0)
+            started = time.perf_counter()
+            store.update_meta(cancel_requested=True)
+        runner.join(_CANCEL_TIMEOUT_S)
+        if runner.is_alive():
+            return None
+        return time.perf_counter() - started
+
+
+def _execution_time(result_path: str | None) -> float:
+    if not result_path:
+        return 0.0
+    try:
+        return sum((run.metrics.execution_time_s or 0.0) for run in iter_result_file(result_path) if run.metrics)
+    except (OSError, ValueError):
+        return 0.0
+
+
+def _write_questions(path: Path, count: int) -> None:
+    questions = [
+        {
+            "id": f"mock_L1_{index:06d}",
+            "corpus": _CORPUS.value,
+            "level": 1,
+            "question": f"Which synthetic planet does document {index % 8 + 1} describe?",
+            "expected_facts": [f"synthetic planet number {index % 8 + 1}"],
+        }
+        for index in range(1, count + 1)
+    ]
+    path.write_text(json.dumps(questions), encoding="utf-8")
+
+
+@contextmanager
+def _scratch_dir(work_dir: str | Path | None) -> Iterator[Path]:
+    if work_dir is not None:
+        path = Path(work_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        yield path
+        return
+    with tempfile.TemporaryDirectory(prefix="scheduler_bench_") as tmp:
+        yield Path(tmp)
+
+
+@contextmanager
+def _mock_env(*, latency: str, hang_rate: str) -> Iterator[None]:
+    overrides = {
+        "EXPERIMENT_RUNNER_MOCK_LATENCY": latency,
+        "EXPERIMENT_RUNNER_MOCK_HANG_RATE": hang_rate,
+        "EXPERIMENT_RUNNER_MOCK_FAIL_RATE": "0",
+    }
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    report = benchmark_scheduler(
+        task_counts=args.tasks,
+        sample_tasks=args.sample_tasks,
+        latency=args.latency,
+        probe_samples=args.probe_samples,
+        work_dir=args.work_dir,
+    )
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
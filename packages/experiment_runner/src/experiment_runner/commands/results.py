@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from experiment_runner.commands.suite import load_suite_state
+from experiment_runner.result_store import (
+    ResultStore,
+    compact_results_dir,
+    iter_jsonl_runs,
+    result_store_path,
+    source_key,
+)
+
+
+def _suite_ids_by_source(state_paths: list[str]) -> dict[str, str]:
+    suite_ids: dict[str, str] = {}
+    for state_path in state_paths:
+        state = load_suite_state(state_path)
+        for task in state.tasks:
+            if task.result_path:
+                suite_ids[source_key(task.result_path)] = state.suite_id
+    return suite_ids
+
+
+def run_results_compact(args: argparse.Namespace) -> None:
+    results_dir = Path(args.results_dir)
+    if not results_dir.is_dir():
+        raise ValueError(f"Results directory not found: {results_dir}")
+    stats = compact_results_dir(
+        results_dir,
+        suite_ids_by_source=_suite_ids_by_source(args.suite_states),
+        remove_sources=not args.keep_sources,
+    )
+    for message in stats.skipped:
+        sys.stderr.write(f"skipped {message}\n")
+    sys.stdout.write(
+        f"compacted {stats.files_compacted} file(s), {stats.runs_imported} run(s) "
+        f"into {result_store_path(results_dir)}; removed {stats.files_removed} file(s)\n"
+    )
+
+
+def run_results_import(args: argparse.Namespace) -> None:
+    total = 0
+    with ResultStore(result_store_path(args.results_dir)) as store:
+        for raw_path in args.files:
+            path = Path(raw_path)
+            runs = list(iter_jsonl_runs(path))
+            total += store.replace_source(runs, source_file=path, suite_id=args.suite_id)
+    sys.stdout.write(f"imported {total} run(s) from {len(args.files)} file(s)\n")
+
+
+def run_results_export(args: argparse.Namespace) -> None:
+    store_path = result_store_path(args.results_dir)
+    if not store_path.is_file():
+        raise ValueError(f"No result store found at {store_path}")
+    filters = {"suite_id": args.suite_id, "system_name": args.system, "model": args.model}
+    inline_traces = not args.trace_refs
+    with ResultStore(store_path) as store:
+        if args.output == "-":
+            count = store.export_jsonl(sys.stdout, inline_traces=inline_traces, **filters)
+        else:
+            output = Path(args.output)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with output.open("w", encoding="utf-8") as handle:
+                count = store.export_jsonl(handle, inline_traces=inline_traces, **filters)
+    sys.stderr.write(f"exported {count} run(s)\n")
+
+
+def run_results_partitions(args: argparse.Namespace) -> None:
+    store_path = result_store_path(args.results_dir)
+    if not store_path.is_file():
+        raise ValueError(f"No result store found at {store_path}")
+    with ResultStore(store_path) as store:
+        sys.stdout.write(json.dumps(store.partitions(), indent=2) + "\n")
@@ -5,16 +5,23 @@ import json
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator, Optional
 from uuid import uuid4
 
-from experiment_runner.corpus_isolation import isolated_corpus
+from experiment_runner.corpus_isolation import CorpusPrefetcher
 from experiment_runner.models.config import RunConfig
 from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
 from experiment_runner.models.question import Question
 from experiment_runner.models.result import RunResult
+from experiment_runner.result_store import ResultStore, result_store_path
+from experiment_runner.runners.base import BaseRunner
+from experiment_runner.runners.baseline.workspace_pool import WorkspacePool
 from experiment_runner.runners.registry import get_runner
+from experiment_runner.trace_store import TraceStore, externalize_trace, trace_store_dir
 
 
 RESULT_PATH_PREFIX = "results → "
@@ -26,6 +33,14 @@ _ISOLATED_CORPUS_SYSTEMS: frozenset[SystemName] = frozenset({
     SystemName.CLAWCODE,
 })
 
+# CLI baselines run each question in a sandbox workspace as an independent
+# subprocess, so several questions can be in flight at once.
+_WORKSPACE_POOL_SYSTEMS: frozenset[SystemName] = frozenset({
+    SystemName.CLAUDE_CODE_LOCAL,
+    SystemName.CHATGPT_CODEX,
+    SystemName.CLAWCODE,
+})
+
 
 def load_questions(path: str, ids: list[str] | None) -> list[Question]:
     raw = json.loads(Path(path).read_text(encoding="utf-8"))
@@ -65,8 +80,19 @@ def _uses_isolated_corpus(config: RunConfig) -> bool:
     return config.system in _ISOLATED_CORPUS_SYSTEMS and config.path_to_corpora is not None
 
 
-def _run_one_question(config: RunConfig, question: Question) -> RunResult:
+def _get_runner(config: RunConfig, workspaces: Optional[WorkspacePool]) -> BaseRunner:
     runner = get_runner(config)
+    if workspaces is not None:
+        runner.workspace_pool = workspaces
+    return runner
+
+
+def _run_one_question(
+    config: RunConfig,
+    question: Question,
+    workspaces: Optional[WorkspacePool] = None,
+) -> RunResult:
+    runner = _get_runner(config, workspaces)
     runner.setup()
     try:
         return runner.run(question)
@@ -74,16 +100,122 @@ def _run_one_question(config: RunConfig, question: Question) -> RunResult:
         runner.teardown()
 
 
-def _run_one_question_with_isolated_corpus(config: RunConfig, question: Question) -> RunResult:
-    if config.path_to_corpora is None:
-        raise ValueError("isolated corpus requires path_to_corpora to be set")
-    with isolated_corpus(Path(config.path_to_corpora)) as (prepared_corpus_path, snapshot):
+def _run_one_question_with_isolated_corpus(
+    config: RunConfig,
+    question: Question,
+    corpora: CorpusPrefetcher,
+    workspaces: Optional[WorkspacePool] = None,
+) -> RunResult:
+    with corpora.acquire() as (prepared_corpus_path, snapshot):
         isolated_config = config.model_copy(update={"path_to_corpora": prepared_corpus_path})
-        result = _run_one_question(isolated_config, question)
+        result = _run_one_question(isolated_config, question, workspaces)
     result.corpus_snapshot = snapshot
     return result
 
 
+def _write_progress(index: int, total: int, question: Question) -> None:
+    sys.stderr.write(f"[{index}/{total}] {question.id}: {question.question[:72]}\n")
+
+
+def _iter_results(
+    config: RunConfig,
+    questions: list[Question],
+    *,
+    concurrency: int = 1,
+) -> Iterator[RunResult]:
+    """Yield one result per question, in question order.
+
+    CLI baselines borrow their sandbox from a pool of ``concurrency``
+    workspaces, and with ``concurrency`` above one that many questions run
+    at the same time; other systems always run one question at a time.
+    """
+    total = len(questions)
+    with ExitStack() as stack:
+        workspaces: Optional[WorkspacePool] = None
+        if config.system in _WORKSPACE_POOL_SYSTEMS:
+            workspaces = stack.enter_context(WorkspacePool(concurrency))
+        else:
+            concurrency = 1
+
+        corpora: Optional[CorpusPrefetcher] = None
+        if _uses_isolated_corpus(config):
+            assert config.path_to_corpora is not None
+            corpora = stack.enter_context(CorpusPrefetcher(Path(config.path_to_corpora), total))
+            shared_runner = None
+        else:
+            shared_runner = _get_runner(config, workspaces)
+            shared_runner.setup()
+            stack.callback(shared_runner.teardown)
+
+        def run_question(index: int, question: Question) -> RunResult:
+            _write_progress(index, total, question)
+            if corpora is not None:
+                return _run_one_question_with_isolated_corpus(config, question, corpora, workspaces)
+            assert shared_runner is not None
+            return shared_runner.run(question)
+
+        if concurrency <= 1:
+            for i, question in enumerate(questions, 1):
+                yield run_question(i, question)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="baseline-run")
+        futures = [executor.submit(run_question, i, question) for i, question in enumerate(questions, 1)]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_into_jsonl(
+    config: RunConfig,
+    questions: list[Question],
+    out_path: Path,
+    *,
+    concurrency: int = 1,
+) -> None:
+    tmp_path = _temp_output_path(out_path)
+    traces = TraceStore(trace_store_dir(out_path.parent))
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for result in _iter_results(config, questions, concurrency=concurrency):
+                externalize_trace(result, traces)
+                f.write(result.model_dump_json() + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, out_path)
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _run_into_result_store(
+    config: RunConfig,
+    questions: list[Question],
+    out_path: Path,
+    *,
+    suite_id: str | None,
+    concurrency: int = 1,
+) -> None:
+    """Append results to the directory's result store under ``out_path`` as their source.
+
+    Like the JSONL path this is all-or-nothing: the results are held back and
+    inserted in one transaction once every question has run, so an invocation
+    that fails, times out or is killed leaves no rows behind.
+    """
+    traces = TraceStore(trace_store_dir(out_path.parent))
+    results = [
+        externalize_trace(result, traces)
+        for result in _iter_results(config, questions, concurrency=concurrency)
+    ]
+    with ResultStore(result_store_path(out_path.parent)) as store:
+        store.append_many(results, source_file=out_path, suite_id=suite_id)
+
+
 def run_experiment(args: argparse.Namespace) -> None:
     inference_config: dict = {"num_ctx": args.num_ctx}
 
@@ -98,6 +230,9 @@ def run_experiment(args: argparse.Namespace) -> None:
         inference_config=inference_config,
     )
 
+    if args.concurrency < 1:
+        raise ValueError(f"--concurrency must be at least 1, got {args.concurrency}")
+
     questions = load_questions(args.questions_file, args.question_ids)
     if not questions:
         raise ValueError("No questions to run after filtering")
@@ -113,38 +248,16 @@ def run_experiment(args: argparse.Namespace) -> None:
 
     out_path = _output_path(args.output_dir, config)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = _temp_output_path(out_path)
 
-    total = len(questions)
-
-    try:
-        if _uses_isolated_corpus(config):
-            with tmp_path.open("w", encoding="utf-8") as f:
-                for i, question in enumerate(questions, 1):
-                    sys.stderr.write(f"[{i}/{total}] {question.id}: {question.question[:72]}\n")
-                    result = _run_one_question_with_isolated_corpus(config, question)
-                    f.write(result.model_dump_json() + "\n")
-                    f.flush()
-                    os.fsync(f.fileno())
-        else:
-            runner = get_runner(config)
-            runner.setup()
-            try:
-                with tmp_path.open("w", encoding="utf-8") as f:
-                    for i, question in enumerate(questions, 1):
-                        sys.stderr.write(f"[{i}/{total}] {question.id}: {question.question[:72]}\n")
-                        result = runner.run(question)
-                        f.write(result.model_dump_json() + "\n")
-                        f.flush()
-                        os.fsync(f.fileno())
-            finally:
-                runner.teardown()
-        os.replace(tmp_path, out_path)
-    except Exception:
-        try:
-            tmp_path.unlink()
-        except OSError:
-            pass
-        raise
+    if args.result_store:
+        _run_into_result_store(
+            config,
+            questions,
+            out_path,
+            suite_id=args.suite_id,
+            concurrency=args.concurrency,
+        )
+    else:
+        _run_into_jsonl(config, questions, out_path, concurrency=args.concurrency)
 
     sys.stderr.write(f"{RESULT_PATH_PREFIX}{out_path}\n")
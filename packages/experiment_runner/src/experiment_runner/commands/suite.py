@@ -9,11 +9,13 @@ import subprocess
 import sys
 import tempfile
 import time
+from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
 from experiment_runner.commands.run import RESULT_PATH_PREFIX, load_questions
+from experiment_runner.corpus_isolation import source_corpus_content_hash
 from experiment_runner.models.enums import AutomationLevel, SystemName
 from experiment_runner.models.question import Question
 from experiment_runner.models.suite import (
@@ -23,11 +25,22 @@ from experiment_runner.models.suite import (
     SuiteTaskStatus,
     default_state_path,
 )
+from experiment_runner.result_cache import ResultIndex, result_index_path, task_fingerprint
+from experiment_runner.result_store import result_file_exists
 from experiment_runner.runners.registry import DISABLED_SYSTEMS, SYSTEM_AUTOMATION_LEVELS
+from experiment_runner.suite_estimate import estimate_suite, format_duration
+from experiment_runner.suite_store import SuiteStateStore, suite_store_path
+from experiment_runner.timeout_policy import (
+    DurationHistory,
+    adaptive_timeout,
+    load_duration_history,
+    validate_timeout_policy,
+)
 
 
 TASK_HEARTBEAT_INTERVAL_S = 30.0
-
+# Minimum spacing between full JSON snapshots of a store-backed suite state.
+SUITE_SNAPSHOT_INTERVAL_S = 60.0
 
 
 def load_suite_config(path: str | Path) -> ExperimentSuiteConfig:
@@ -41,16 +54,73 @@ def save_suite_config(path: str | Path, config: ExperimentSuiteConfig) -> None:
 
 
 def load_suite_state(path: str | Path) -> ExperimentSuiteState:
-    return ExperimentSuiteState.model_validate_json(Path(path).read_text(encoding="utf-8"))
+    """Read a suite state without writing to its store (or anything else)."""
+    json_path = Path(path)
+    if suite_store_path(json_path).is_file():
+        with SuiteStateStore(suite_store_path(json_path), read_only=True) as store:
+            if not _json_needs_import(json_path, store):
+                return store.load()
+    return ExperimentSuiteState.model_validate_json(json_path.read_text(encoding="utf-8"))
 
 
 def save_suite_state(path: str | Path, state: ExperimentSuiteState) -> None:
     out = Path(path)
     out.parent.mkdir(parents=True, exist_ok=True)
     state.updated_at = datetime.now(timezone.utc)
+    if suite_store_path(out).is_file():
+        with open_suite_store(out) as store:
+            store.replace(state)
+            _write_suite_snapshot(out, store, state)
+        return
     _atomic_write_text(out, state.model_dump_json(indent=2) + "\n")
 
 
+def open_suite_store(path: str | Path) -> SuiteStateStore:
+    """Open (creating if needed) the SQLite store next to a suite state JSON.
+
+    Legacy JSON-only suites are imported on first open, and a JSON file that
+    was rewritten outside the store since its last snapshot is re-imported
+    unless a live runner owns the store. Only writers should call this;
+    readers go through ``load_suite_state``.
+    """
+    json_path = Path(path)
+    store = SuiteStateStore(suite_store_path(json_path))
+    try:
+        if _json_needs_import(json_path, store):
+            mtime_ns = json_path.stat().st_mtime_ns
+            store.replace(
+                ExperimentSuiteState.model_validate_json(json_path.read_text(encoding="utf-8"))
+            )
+            store.set_snapshot_mtime_ns(mtime_ns)
+    except Exception:
+        store.close()
+        raise
+    return store
+
+
+def _json_needs_import(json_path: Path, store: SuiteStateStore) -> bool:
+    """True when ``json_path`` holds state the store has not seen and no live runner owns the store."""
+    if not json_path.is_file():
+        return False
+    if not store.has_state():
+        return True
+    if store.snapshot_mtime_ns() == json_path.stat().st_mtime_ns:
+        return False
+    # A live runner's own snapshot lands before its mtime is recorded.
+    runner_pid = store.runner_pid()
+    return runner_pid is None or not _is_pid_alive(runner_pid)
+
+
+def _write_suite_snapshot(
+    path: Path,
+    store: SuiteStateStore,
+    state: ExperimentSuiteState | None = None,
+) -> None:
+    snapshot = state if state is not None else store.load()
+    _atomic_write_text(path, snapshot.model_dump_json(indent=2) + "\n")
+    store.set_snapshot_mtime_ns(path.stat().st_mtime_ns)
+
+
 def _atomic_write_text(path: Path, text: str) -> None:
     tmp_name: str | None = None
     with tempfile.NamedTemporaryFile(
@@ -92,6 +162,11 @@ def validate_suite_config(config: ExperimentSuiteConfig) -> None:
             invalid.append(f"{system.value} is not fully automated")
     if invalid:
         raise ValueError("suite can only run enabled automated systems: " + "; ".join(invalid))
+    if config.task_timeout_s < 1:
+        raise ValueError(f"task_timeout_s must be at least 1, got {config.task_timeout_s}")
+    problems = validate_timeout_policy(config.timeout_policy)
+    if problems:
+        raise ValueError("; ".join(problems))
 
 
 def _task_id(model: str, corpus: str, question_id: str, system: str) -> str:
@@ -111,6 +186,8 @@ def _build_task_command(
     question_id: str,
     reasoning_enabled: bool,
     no_trace: bool,
+    result_store: bool = False,
+    suite_id: str | None = None,
 ) -> list[str]:
     command = [
         sys.executable,
@@ -140,6 +217,10 @@ def _build_task_command(
         command.append("--reasoning-enabled")
     if no_trace:
         command.append("--no-trace")
+    if result_store:
+        command.append("--result-store")
+        if suite_id:
+            command.extend(["--suite-id", suite_id])
     return command
 
 
@@ -159,19 +240,36 @@ def _selected_questions(selection, questions: list[Question]) -> list[Question]:
     return selected
 
 
+def _corpus_content_hash(path_to_corpora: str) -> str | None:
+    try:
+        return source_corpus_content_hash(Path(path_to_corpora))
+    except OSError:
+        return None
+
+
 def build_suite_tasks(config: ExperimentSuiteConfig) -> list[SuiteTask]:
+    """Expand the suite into ordered tasks, marking fingerprint cache hits when enabled."""
     validate_suite_config(config)
     raw_tasks: list[tuple[int, int, int, int, str, SuiteTask]] = []
+    all_questions = [load_questions(selection.questions_file, None) for selection in config.corpora]
+    history: DurationHistory = {}
+    if config.timeout_policy.adaptive:
+        history = load_duration_history(config.output_dir)
 
     for corpus_index, selection in enumerate(config.corpora):
-        questions = _selected_questions(selection, load_questions(selection.questions_file, None))
+        questions = _selected_questions(selection, all_questions[corpus_index])
         if not questions:
             raise ValueError(f"No questions selected for corpus {selection.corpus.value}")
         questions = sorted(questions, key=lambda q: (q.level, q.id))
+        corpus_hash = _corpus_content_hash(selection.path_to_corpora)
 
         for model_index, model in enumerate(config.models):
             for question in questions:
                 for system_index, system in enumerate(config.systems):
+                    timeout_s, timeout_samples = adaptive_timeout(
+                        config,
+                        history.get((system.value, model, question.level), []),
+                    )
                     task = SuiteTask(
                         task_id=_task_id(model, selection.corpus.value, question.id, system.value),
                         index=0,
@@ -194,7 +292,20 @@ def build_suite_tasks(config: ExperimentSuiteConfig) -> list[SuiteTask]:
                             question_id=question.id,
                             reasoning_enabled=config.reasoning_enabled,
                             no_trace=config.no_trace,
+                            result_store=config.result_store,
+                            suite_id=config.suite_id,
                         ),
+                        fingerprint=task_fingerprint(
+                            system=system,
+                            model=model,
+                            corpus_hash=corpus_hash,
+                            question_text=question.question,
+                            num_ctx=config.num_ctx,
+                            reasoning_enabled=config.reasoning_enabled,
+                            trace_enabled=not config.no_trace,
+                        ) if corpus_hash else None,
+                        timeout_s=timeout_s,
+                        timeout_samples=timeout_samples,
                     )
                     raw_tasks.append((
                         model_index,
@@ -208,9 +319,27 @@ def build_suite_tasks(config: ExperimentSuiteConfig) -> list[SuiteTask]:
     sorted_tasks = [item[-1] for item in sorted(raw_tasks, key=lambda item: item[:-1])]
     for index, task in enumerate(sorted_tasks, 1):
         task.index = index
+    if config.use_cache:
+        _apply_cached_results(config, sorted_tasks)
     return sorted_tasks
 
 
+def _apply_cached_results(config: ExperimentSuiteConfig, tasks: list[SuiteTask]) -> None:
+    index_path = result_index_path(config.output_dir)
+    if not index_path.is_file():
+        return
+    with ResultIndex(index_path) as index:
+        for task in tasks:
+            if task.fingerprint is None:
+                continue
+            for result_path in index.candidates(task.fingerprint):
+                if result_file_exists(result_path):
+                    task.status = SuiteTaskStatus.SUCCEEDED
+                    task.result_path = result_path
+                    task.cache_hit = True
+                    break
+
+
 def build_suite_state(
     config: ExperimentSuiteConfig,
     *,
@@ -236,6 +365,11 @@ def reconcile_suite_state(config: ExperimentSuiteConfig, state: ExperimentSuiteS
         # Keep persisted suite order stable on resume. Newly-created suites use
         # the current planner order; existing state files keep their saved order.
         planned.index = previous.index
+        previous_done = previous.status == SuiteTaskStatus.SUCCEEDED and _task_result_exists(previous)
+        if (planned.cache_hit and not previous_done) or (previous.cache_hit and not config.use_cache):
+            # A new cache hit replaces an unfinished task; --no-cache re-runs old hits.
+            tasks.append(planned)
+            continue
         planned.status = previous.status
         planned.result_path = previous.result_path
         planned.error = previous.error
@@ -243,6 +377,7 @@ def reconcile_suite_state(config: ExperimentSuiteConfig, state: ExperimentSuiteS
         planned.last_heartbeat_at = previous.last_heartbeat_at
         planned.finished_at = previous.finished_at
         planned.return_code = previous.return_code
+        planned.cache_hit = previous.cache_hit
         tasks.append(planned)
     for planned in planned_by_id.values():
         planned.index = len(tasks) + 1
@@ -265,6 +400,7 @@ def summarize_suite_state(state: ExperimentSuiteState) -> dict[str, int | str |
         "total": len(state.tasks),
         "completed": completed,
         "cancel_requested": state.cancel_requested,
+        "cache_hits": sum(1 for task in state.tasks if task.cache_hit),
         **counts,
     }
 
@@ -277,11 +413,7 @@ def _result_path_from_output(lines: Iterable[str]) -> str | None:
 
 
 def _task_result_exists(task: SuiteTask) -> bool:
-    return bool(
-        task.result_path
-        and Path(task.result_path).is_file()
-        and Path(task.result_path).stat().st_size > 0
-    )
+    return bool(task.result_path and result_file_exists(task.result_path))
 
 
 def build_augmented_suite_state(
@@ -308,6 +440,7 @@ def build_augmented_suite_state(
         task.last_heartbeat_at = previous.last_heartbeat_at
         task.finished_at = previous.finished_at
         task.return_code = previous.return_code
+        task.cache_hit = previous.cache_hit
 
     augmented_from = list(source_state.augmented_from_state_paths)
     if source_state_path:
@@ -360,8 +493,19 @@ def run_suite(
     config_path: str | None = None,
 ) -> ExperimentSuiteState:
     path = Path(state_path)
-    if path.exists():
-        state = reconcile_suite_state(config, load_suite_state(path))
+    with open_suite_store(path) as store:
+        return _run_suite_with_store(config, path, store, config_path=config_path)
+
+
+def _run_suite_with_store(
+    config: ExperimentSuiteConfig,
+    path: Path,
+    store: SuiteStateStore,
+    *,
+    config_path: str | None,
+) -> ExperimentSuiteState:
+    if store.has_state():
+        state = reconcile_suite_state(config, store.load())
         if state.runner_pid is not None and _is_pid_alive(state.runner_pid):
             raise RuntimeError(
                 f"Suite runner is already active (pid={state.runner_pid}). "
@@ -377,20 +521,32 @@ def run_suite(
     state.cancel_requested = False
     state.runner_pid = os.getpid()
     state.active_pid = None
-    save_suite_state(path, state)
+    state.updated_at = datetime.now(timezone.utc)
+    store.replace(state)
+    _write_suite_snapshot(path, store, state)
+    last_snapshot = time.monotonic()
 
     log_path = Path(state.log_path or path.with_suffix(".log"))
     log_path.parent.mkdir(parents=True, exist_ok=True)
+    total_tasks = len(state.tasks)
+    task_ids = [task.task_id for task in state.tasks]
 
     env = {**os.environ, "PYTHONUNBUFFERED": "1"}
-    with log_path.open("a", encoding="utf-8") as log:
-        for task in state.tasks:
-            if path.exists():
-                state = load_suite_state(path)
-                task = state.tasks[task.index - 1]
-            if state.cancel_requested:
+    with (
+        log_path.open("a", encoding="utf-8") as log,
+        ResultIndex(result_index_path(config.output_dir)) as result_index,
+    ):
+        for task_id in task_ids:
+            if store.cancel_requested():
                 break
+            task = store.get_task(task_id)
+            if task is None:
+                continue
             if task.status == SuiteTaskStatus.SUCCEEDED and _task_result_exists(task):
+                if task.cache_hit:
+                    log.write(f"\n=== task {task.index}/{total_tasks} {task.task_id} ===\n")
+                    log.write(f"cached result reused: {task.result_path}\n")
+                    log.flush()
                 continue
 
             task.status = SuiteTaskStatus.RUNNING
@@ -399,10 +555,10 @@ def run_suite(
             task.finished_at = None
             task.error = None
             task.return_code = None
-            state.active_pid = None
-            save_suite_state(path, state)
+            store.update_task(task, active_pid=None)
 
-            log.write(f"\n=== task {task.index}/{len(state.tasks)} {task.task_id} ===\n")
+            timeout_s = task.timeout_s or config.task_timeout_s
+            log.write(f"\n=== task {task.index}/{total_tasks} {task.task_id} ===\n")
             log.write(" ".join(task.command) + "\n")
             log.flush()
 
@@ -414,9 +570,8 @@ def run_suite(
                 env=env,
                 start_new_session=True,
             )
-            state.active_pid = process.pid
-            save_suite_state(path, state)
-            log.write(f"started pid={process.pid} timeout={config.task_timeout_s}s\n")
+            store.update_meta(active_pid=process.pid)
+            log.write(f"started pid={process.pid} timeout={timeout_s}s\n")
             log.flush()
 
             lines: list[str] = []
@@ -449,7 +604,7 @@ def run_suite(
 
             timed_out = False
             started_monotonic = time.monotonic()
-            deadline = started_monotonic + max(config.task_timeout_s, 1)
+            deadline = started_monotonic + max(timeout_s, 1)
             next_heartbeat = started_monotonic + TASK_HEARTBEAT_INTERVAL_S
             selector = selectors.DefaultSelector()
             selector.register(process.stdout, selectors.EVENT_READ)
@@ -457,14 +612,13 @@ def run_suite(
                 for _, _ in selector.select(timeout=0.5):
                     drain_stdout()
 
-                current = load_suite_state(path)
-                if current.cancel_requested:
+                if store.cancel_requested():
                     _terminate_process_tree(process)
                     break
                 now = time.monotonic()
                 if now >= deadline:
                     timed_out = True
-                    log.write(f"task timed out after {config.task_timeout_s}s\n")
+                    log.write(f"task timed out after {timeout_s}s\n")
                     log.flush()
                     _terminate_process_tree(process)
                     break
@@ -476,12 +630,10 @@ def run_suite(
                         f"timeout_in={remaining}s\n"
                     )
                     log.flush()
-                    heartbeat_state = load_suite_state(path)
-                    heartbeat_task = heartbeat_state.tasks[task.index - 1]
-                    if heartbeat_task.task_id == task.task_id:
+                    heartbeat_task = store.get_task(task.task_id)
+                    if heartbeat_task is not None:
                         heartbeat_task.last_heartbeat_at = datetime.now(timezone.utc)
-                        heartbeat_state.active_pid = process.pid
-                        save_suite_state(path, heartbeat_state)
+                        store.update_task(heartbeat_task, active_pid=process.pid)
                     next_heartbeat = now + TASK_HEARTBEAT_INTERVAL_S
 
             selector.close()
@@ -494,23 +646,21 @@ def run_suite(
                     log.write(line + "\n")
                     log.flush()
                 pending_output = b""
-            state = load_suite_state(path)
-            task = state.tasks[task.index - 1]
+            task = store.get_task(task.task_id) or task
             task.return_code = rc
             task.finished_at = datetime.now(timezone.utc)
             reported_result_path = _result_path_from_output(lines)
             task.result_path = reported_result_path or task.result_path
-            state.active_pid = None
-            elapsed = int(time.monotonic() - started_monotonic)
-            log.write(f"finished pid={process.pid} rc={rc} elapsed={elapsed}s\n")
+            wall_s = time.monotonic() - started_monotonic
+            log.write(f"finished pid={process.pid} rc={rc} elapsed={int(wall_s)}s\n")
             log.flush()
 
-            if state.cancel_requested:
+            if store.cancel_requested():
                 task.status = SuiteTaskStatus.CANCELLED
                 task.error = "Suite cancellation requested."
             elif timed_out:
                 task.status = SuiteTaskStatus.FAILED
-                task.error = f"Task timed out after {config.task_timeout_s}s"
+                task.error = f"Task timed out after {timeout_s}s"
             elif rc == 0:
                 if reported_result_path and _task_result_exists(task):
                     task.status = SuiteTaskStatus.SUCCEEDED
@@ -520,23 +670,82 @@ def run_suite(
             else:
                 task.status = SuiteTaskStatus.FAILED
                 task.error = "\n".join(lines[-20:]) or f"Command exited with {rc}"
-            save_suite_state(path, state)
-
-    state = load_suite_state(path)
-    state.runner_pid = None
-    state.active_pid = None
-    save_suite_state(path, state)
+            store.update_task(task, active_pid=None)
+            if task.status != SuiteTaskStatus.CANCELLED:
+                result_index.record_duration(
+                    system=task.system.value,
+                    model=task.model,
+                    corpus=task.corpus.value,
+                    question_id=task.question_id,
+                    level=task.level,
+                    wall_s=wall_s,
+                    deadline_s=timeout_s,
+                    succeeded=task.status == SuiteTaskStatus.SUCCEEDED,
+                    timed_out=timed_out,
+                )
+            if task.status == SuiteTaskStatus.SUCCEEDED and task.fingerprint and task.result_path:
+                result_index.record(
+                    task.fingerprint,
+                    task.result_path,
+                    suite_id=state.suite_id,
+                    task_id=task.task_id,
+                )
+
+            if time.monotonic() - last_snapshot >= SUITE_SNAPSHOT_INTERVAL_S:
+                _write_suite_snapshot(path, store)
+                last_snapshot = time.monotonic()
+
+    store.update_meta(runner_pid=None, active_pid=None)
+    state = store.load()
+    _write_suite_snapshot(path, store, state)
     return state
 
 
 def run_suite_plan(args: argparse.Namespace) -> None:
     config = load_suite_config(args.config)
+    if args.no_cache:
+        config.use_cache = False
     tasks = build_suite_tasks(config)
     if args.json:
         sys.stdout.write(json.dumps([task.model_dump(mode="json") for task in tasks], indent=2) + "\n")
         return
     for task in tasks:
-        sys.stdout.write(f"[{task.index}/{len(tasks)}] {' '.join(task.command)}\n")
+        if task.cache_hit:
+            sys.stdout.write(f"[{task.index}/{len(tasks)}] cached {task.task_id} → {task.result_path}\n")
+            continue
+        sys.stdout.write(f"[{task.index}/{len(tasks)}] {_timeout_label(task)} {' '.join(task.command)}\n")
+
+
+def run_suite_estimate(args: argparse.Namespace) -> None:
+    config = load_suite_config(args.config)
+    if args.no_cache:
+        config.use_cache = False
+    estimate = estimate_suite(config, build_suite_tasks(config), workers=args.parallelism)
+    if args.json:
+        payload = asdict(estimate)
+        payload.pop("task_expected_s")
+        sys.stdout.write(json.dumps(payload, indent=2) + "\n")
+        return
+    sys.stdout.write(
+        f"tasks: {estimate.tasks} ({estimate.cached_tasks} cached, {estimate.pending_tasks} to run, "
+        f"{estimate.tasks_without_history} without history)\n"
+        f"expected total: {format_duration(estimate.expected_total_s)} "
+        f"(p90 {format_duration(estimate.p90_total_s)})\n"
+        f"model loads: {estimate.model_loads}\n"
+    )
+    if estimate.parallelism:
+        sys.stdout.write("what-if (suites run one task at a time; assumes linear scaling):\n")
+    for level in estimate.parallelism:
+        sys.stdout.write(
+            f"  {level.workers} worker(s): expected {format_duration(level.expected_s)}, "
+            f"p90 {format_duration(level.p90_s)}\n"
+        )
+
+
+def _timeout_label(task: SuiteTask) -> str:
+    if task.timeout_samples:
+        return f"timeout={task.timeout_s}s (learned from {task.timeout_samples} runs)"
+    return f"timeout={task.timeout_s}s"
 
 
 def run_suite_status(args: argparse.Namespace) -> None:
@@ -545,14 +754,20 @@ def run_suite_status(args: argparse.Namespace) -> None:
 
 
 def run_suite_cancel(args: argparse.Namespace) -> None:
-    state = load_suite_state(args.state)
-    state.cancel_requested = True
-    save_suite_state(args.state, state)
+    if suite_store_path(args.state).is_file():
+        with open_suite_store(args.state) as store:
+            store.update_meta(cancel_requested=True)
+    else:
+        state = load_suite_state(args.state)
+        state.cancel_requested = True
+        save_suite_state(args.state, state)
     sys.stdout.write(f"cancel requested for {args.state}\n")
 
 
 def run_suite_run(args: argparse.Namespace) -> None:
     config = load_suite_config(args.config)
+    if args.no_cache:
+        config.use_cache = False
     state_path = Path(args.state) if args.state else default_state_path(args.config, config)
     state = run_suite(config, state_path, config_path=args.config)
     sys.stdout.write(json.dumps(summarize_suite_state(state), indent=2) + "\n")
@@ -0,0 +1,215 @@
+"""Merkle-tree fingerprints of corpus directories.
+
+Replaces the old ``tree -a`` text captures: a corpus is summarised by a flat
+manifest of ``relative path -> (size, mtime, content digest)`` plus a Merkle
+root over it, and a post-run mutation check is a manifest diff.
+
+Content digests are expensive, so they are reused whenever a file's stat
+signature proves the content cannot have changed:
+
+* the source corpus manifest is cached per corpus (in memory and on disk under
+  the isolation temp root) and only files whose stat changed are re-hashed;
+* a freshly prepared snapshot inherits digests from the source manifest,
+  because every preparation strategy preserves size and mtime;
+* the post-run walk re-hashes only files whose size, mtime, ctime or inode
+  changed. ctime cannot be set from userspace, so any write is detected.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Mapping
+
+from experiment_runner.models.result import CorpusDiff
+
+# Per-list cap on paths stored in a CorpusDiff so a runaway agent that writes
+# thousands of files cannot bloat the result row again.
+MAX_DIFF_PATHS = 200
+
+_CACHE_DIR_NAME = ".merkle_cache"
+_CACHE_VERSION = 1
+_SOURCE_CACHE: dict[str, dict[str, FileEntry]] = {}
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+    ino: int
+    digest: str
+
+
+def scan_source_corpus(
+    source: Path,
+    included: tuple[str, ...],
+    *,
+    cache_root: Path | None = None,
+) -> dict[str, FileEntry]:
+    """Return the manifest of ``included`` paths under ``source``, using the cache."""
+    key = str(source.resolve())
+    known = _SOURCE_CACHE.get(key)
+    if known is None and cache_root is not None:
+        known = _load_disk_cache(_cache_path(cache_root, key))
+    manifest = scan_tree(source, known=known, strict=True, included=included)
+    _SOURCE_CACHE[key] = manifest
+    if cache_root is not None and manifest != known:
+        _store_disk_cache(_cache_path(cache_root, key), manifest)
+    return manifest
+
+
+def scan_tree(
+    root: Path,
+    *,
+    known: Mapping[str, FileEntry] | None = None,
+    strict: bool = True,
+    included: tuple[str, ...] | None = None,
+) -> dict[str, FileEntry]:
+    """Walk ``root`` with ``os.scandir`` and return ``{posix path: FileEntry}``.
+
+    A digest from ``known`` is reused when size and mtime match and, with
+    ``strict``, also ctime and inode. ``included`` restricts the walk to the
+    given top-level names.
+    """
+    known = known or {}
+    manifest: dict[str, FileEntry] = {}
+    for relative, st in _iter_files(root, included):
+        previous = known.get(relative)
+        if previous is not None and _same_file(previous, st, strict=strict):
+            digest = previous.digest
+        else:
+            digest = _hash_file(root / relative)
+        manifest[relative] = FileEntry(
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            ctime_ns=st.st_ctime_ns,
+            ino=st.st_ino,
+            digest=digest,
+        )
+    return manifest
+
+
+def merkle_root(manifest: Mapping[str, FileEntry]) -> str:
+    """Return the hex Merkle root of a manifest (empty directories are not represented)."""
+    tree: dict = {}
+    for relative, entry in manifest.items():
+        node = tree
+        *parents, name = relative.split("/")
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[name] = entry
+    return _hash_node(tree)
+
+
+def content_hash(manifest: Mapping[str, FileEntry]) -> str:
+    """Digest of paths and file contents only; unlike ``merkle_root`` it ignores mtimes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for relative in sorted(manifest):
+        digest.update(f"{relative}\0{manifest[relative].digest}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def diff_manifests(before: Mapping[str, FileEntry], after: Mapping[str, FileEntry]) -> CorpusDiff:
+    added = sorted(set(after) - set(before))
+    removed = sorted(set(before) - set(after))
+    modified = sorted(
+        path
+        for path in set(before) & set(after)
+        if _leaf_hash("", before[path]) != _leaf_hash("", after[path])
+    )
+    truncated = any(len(paths) > MAX_DIFF_PATHS for paths in (added, removed, modified))
+    return CorpusDiff(
+        added=added[:MAX_DIFF_PATHS],
+        removed=removed[:MAX_DIFF_PATHS],
+        modified=modified[:MAX_DIFF_PATHS],
+        added_count=len(added),
+        removed_count=len(removed),
+        modified_count=len(modified),
+        truncated=truncated,
+    )
+
+
+def _iter_files(root: Path, included: tuple[str, ...] | None) -> Iterator[tuple[str, os.stat_result]]:
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                children = sorted(entries, key=lambda item: item.name)
+        except FileNotFoundError:
+            continue
+        for entry in children:
+            if not prefix and included is not None and entry.name not in included:
+                continue
+            relative = f"{prefix}{entry.name}"
+            if entry.is_dir():
+                stack.append((entry.path, f"{relative}/"))
+            elif entry.is_file():
+                yield relative, entry.stat()
+
+
+def _same_file(entry: FileEntry, st: os.stat_result, *, strict: bool) -> bool:
+    if entry.size != st.st_size or entry.mtime_ns != st.st_mtime_ns:
+        return False
+    return not strict or (entry.ctime_ns == st.st_ctime_ns and entry.ino == st.st_ino)
+
+
+def _hash_file(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def _leaf_hash(name: str, entry: FileEntry) -> str:
+    payload = f"f\0{name}\0{entry.size}\0{entry.mtime_ns}\0{entry.digest}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _hash_node(node: dict) -> str:
+    parts = []
+    for name in sorted(node):
+        child = node[name]
+        child_hash = _hash_node(child) if isinstance(child, dict) else _leaf_hash(name, child)
+        parts.append(f"{name}\0{child_hash}")
+    return hashlib.blake2b(("d\0" + "\n".join(parts)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_path(cache_root: Path, source_key: str) -> Path:
+    name = hashlib.blake2b(source_key.encode("utf-8"), digest_size=8).hexdigest()
+    return cache_root / _CACHE_DIR_NAME / f"{name}.json"
+
+
+def _load_disk_cache(path: Path) -> dict[str, FileEntry] | None:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if raw.get("version") != _CACHE_VERSION:
+            return None
+        return {relative: FileEntry(**fields) for relative, fields in raw["files"].items()}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+def _store_disk_cache(path: Path, manifest: Mapping[str, FileEntry]) -> None:
+    payload = {
+        "version": _CACHE_VERSION,
+        "files": {relative: asdict(entry) for relative, entry in manifest.items()},
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            tmp.write(json.dumps(payload))
+        os.replace(tmp.name, path)
+    except OSError:
+        # The cache is an optimisation; a read-only temp root just means the
+        # next process re-hashes the source corpus.
+        pass
@@ -1,41 +1,80 @@
 from __future__ import annotations
 
+import errno
+import fcntl
 import json
 import os
 import shutil
-import subprocess
+import stat
 import tempfile
-from contextlib import contextmanager
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Iterator
 
+from experiment_runner.corpus_integrity import (
+    content_hash,
+    diff_manifests,
+    merkle_root,
+    scan_source_corpus,
+    scan_tree,
+)
+from experiment_runner.models.enums import CorpusSnapshotStrategy
 from experiment_runner.models.result import CorpusSnapshot
 
 _METADATA_FILES = ("config.json", "manifest.jsonl")
+# Paths of a source corpus that make it into an isolated snapshot.
+_SNAPSHOT_INCLUDED = ("text", *_METADATA_FILES)
 _TMP_DIR_ENV = "EXPERIMENT_RUNNER_CORPUS_TMP_DIR"
+# Comma-separated strategy preference (e.g. "reflink,copy"). Reflinks only
+# work when the temp root shares a filesystem with the source corpus, so point
+# EXPERIMENT_RUNNER_CORPUS_TMP_DIR at such a directory to benefit from them;
+# otherwise every file silently falls back to a copy.
+#
+# Hardlinks share the source inode, so a write through the link changes the
+# source corpus. They are never used unless requested here, are refused when
+# running as root, and only link source files that are already read-only
+# (other files are copied); the mode of a shared inode is never changed.
+# They are only safe when the agent cannot chmod the source files.
+_STRATEGY_ENV = "EXPERIMENT_RUNNER_CORPUS_STRATEGY"
+_DEFAULT_STRATEGIES = (
+    CorpusSnapshotStrategy.REFLINK,
+    CorpusSnapshotStrategy.COPY,
+)
+# From strongest to weakest isolation.
+_STRATEGY_ORDER = (
+    CorpusSnapshotStrategy.REFLINK,
+    CorpusSnapshotStrategy.COPY,
+    CorpusSnapshotStrategy.HARDLINK,
+)
+# _IOW(0x94, 9, int) from linux/fs.h.
+_FICLONE = 0x40049409
+# errnos meaning "this strategy cannot work on this filesystem pair" rather
+# than a problem with one particular file.
+_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EINVAL,
+    errno.EPERM,
+    errno.EMLINK,
+    errno.ENOSYS,
+})
+# Number of snapshots prepared ahead of the one in use (0 disables prefetching).
+# Each staged snapshot is a full corpus copy on the temp root, so this caps
+# tmpfs usage at (depth + 1) corpora.
+_PREFETCH_ENV = "EXPERIMENT_RUNNER_CORPUS_PREFETCH"
+_DEFAULT_PREFETCH_DEPTH = 1
 _AUTO_TEMP_DIR_NAME = "ace_corpora"
 _AUTO_TEMP_ROOTS = (Path("/dev/shm"), Path("/tmp"))
 _MIN_FREE_BYTES = 100 * 1024 * 1024
 _MIN_FREE_MULTIPLIER = 2
 
 
-def capture_tree(path: Path) -> str:
-    try:
-        completed = subprocess.run(
-            ["tree", "-a", str(path)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            check=False,
-        )
-    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-        return _fallback_tree(path)
-    if completed.returncode == 0 and completed.stdout.strip():
-        return completed.stdout
-    return _fallback_tree(path)
-
-
 @contextmanager
 def isolated_corpus(source_corpus_path: Path) -> Iterator[tuple[Path, CorpusSnapshot]]:
     source = source_corpus_path.resolve()
@@ -43,17 +82,128 @@ def isolated_corpus(source_corpus_path: Path) -> Iterator[tuple[Path, CorpusSnap
     temp_root = _select_temp_root(required_bytes)
     with TemporaryDirectory(prefix="experiment_corpus_", dir=str(temp_root) if temp_root else None) as tmp:
         prepared = Path(tmp) / source.name
+        started = time.perf_counter()
         snapshot = _prepare_corpus(source, prepared)
+        snapshot.prepare_time_s = time.perf_counter() - started
         snapshot.temp_root_path = str(temp_root) if temp_root else None
         snapshot.temp_root_filesystem = _filesystem_type(Path(tmp))
-        snapshot.pre_run_tree = capture_tree(prepared)
+        pre_run = None
+        try:
+            source_manifest = scan_source_corpus(source, _SNAPSHOT_INCLUDED, cache_root=temp_root)
+            # Every strategy preserves size and mtime, so the snapshot inherits
+            # the source digests instead of re-hashing its own files.
+            pre_run = scan_tree(prepared, known=source_manifest, strict=False)
+            snapshot.pre_run_root_hash = merkle_root(pre_run)
+        except Exception as exc:
+            snapshot.error = _append_error(snapshot.error, f"pre-run snapshot failed: {exc}")
         try:
             yield prepared, snapshot
         finally:
+            if pre_run is not None:
+                try:
+                    post_run = scan_tree(prepared, known=pre_run, strict=True)
+                    snapshot.post_run_root_hash = merkle_root(post_run)
+                    snapshot.post_run_diff = diff_manifests(pre_run, post_run)
+                except Exception as exc:
+                    snapshot.error = _append_error(snapshot.error, f"post-run snapshot failed: {exc}")
+
+
+def source_corpus_content_hash(source_corpus_path: Path) -> str:
+    """Content digest of the files an isolated snapshot of ``source_corpus_path`` contains."""
+    source = source_corpus_path.resolve()
+    if not source.is_dir():
+        raise FileNotFoundError(f"corpus directory not found: {source}")
+    manifest = scan_source_corpus(source, _SNAPSHOT_INCLUDED, cache_root=_select_temp_root(0))
+    return content_hash(manifest)
+
+
+class CorpusPrefetcher:
+    """Hand out ``count`` isolated corpora, preparing upcoming ones in the background.
+
+    ``acquire()`` behaves like ``isolated_corpus`` but, with a prefetch depth
+    above zero, the next snapshots are prepared on a worker thread while the
+    current one is in use, taking preparation off the critical path.
+    ``acquire()`` may be called from several threads at once.
+    """
+
+    def __init__(self, source_corpus_path: Path, count: int, depth: int | None = None) -> None:
+        self._source = source_corpus_path
+        self._unscheduled = count
+        self._depth = _prefetch_depth() if depth is None else depth
+        self._pending: deque[Future[tuple[ExitStack, Path, CorpusSnapshot]]] = deque()
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="corpus-prefetch")
+            if self._depth > 0
+            else None
+        )
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> CorpusPrefetcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @contextmanager
+    def acquire(self) -> Iterator[tuple[Path, CorpusSnapshot]]:
+        started = time.perf_counter()
+        if self._executor is None:
+            with self._lock:
+                self._unscheduled -= 1
+            stack, prepared, snapshot = _enter_isolated_corpus(self._source)
+        else:
+            with self._lock:
+                if not self._pending:
+                    self._submit()
+                future = self._pending.popleft()
+                self._fill()
+            stack, prepared, snapshot = future.result()
+        snapshot.wait_time_s = time.perf_counter() - started
+        with stack:
+            yield prepared, snapshot
+
+    def close(self) -> None:
+        """Discard staged snapshots that were never acquired."""
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        for future in pending:
+            if future.cancel():
+                continue
             try:
-                snapshot.post_run_tree = capture_tree(prepared)
-            except Exception as exc:
-                snapshot.error = _append_error(snapshot.error, f"post-run snapshot failed: {exc}")
+                stack, _, _ = future.result()
+            except Exception:
+                continue
+            stack.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _fill(self) -> None:
+        while len(self._pending) < self._depth and self._unscheduled > 0:
+            self._submit()
+
+    def _submit(self) -> None:
+        if self._unscheduled <= 0:
+            raise ValueError("all isolated corpora have already been handed out")
+        assert self._executor is not None
+        self._unscheduled -= 1
+        self._pending.append(self._executor.submit(_enter_isolated_corpus, self._source))
+
+
+def _enter_isolated_corpus(source: Path) -> tuple[ExitStack, Path, CorpusSnapshot]:
+    with ExitStack() as stack:
+        prepared, snapshot = stack.enter_context(isolated_corpus(source))
+        return stack.pop_all(), prepared, snapshot
+
+
+def _prefetch_depth() -> int:
+    raw = os.environ.get(_PREFETCH_ENV)
+    if not raw:
+        return _DEFAULT_PREFETCH_DEPTH
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        raise ValueError(f"{_PREFETCH_ENV} must be an integer, got {raw!r}") from None
 
 
 def _prepare_corpus(source: Path, prepared: Path) -> CorpusSnapshot:
@@ -65,28 +215,124 @@ def _prepare_corpus(source: Path, prepared: Path) -> CorpusSnapshot:
 
     text_source = source / "text"
     text_target = prepared / "text"
+    used: set[CorpusSnapshotStrategy] = set()
     try:
         if not text_source.is_dir():
             snapshot.error = f"source corpus text directory not found: {text_source}"
             return snapshot
-
-        shutil.copytree(text_source, text_target)
+        strategies = _configured_strategies()
+
+        for dirpath, dirnames, filenames in os.walk(text_source, followlinks=True):
+            relative = Path(dirpath).relative_to(text_source)
+            target_dir = text_target / relative
+            target_dir.mkdir(parents=True, exist_ok=True)
+            dirnames.sort()
+            for filename in sorted(filenames):
+                size = _materialize_file(Path(dirpath) / filename, target_dir / filename, strategies, used)
+                snapshot.file_count += 1
+                snapshot.total_bytes += size
         snapshot.copied_paths.append("text")
 
         for filename in _METADATA_FILES:
             source_file = source / filename
             if source_file.is_file():
-                shutil.copy2(source_file, prepared / filename)
+                size = _materialize_file(source_file, prepared / filename, strategies, used)
+                snapshot.file_count += 1
+                snapshot.total_bytes += size
                 snapshot.copied_paths.append(filename)
 
+        snapshot.strategy = _weakest_strategy(used)
         snapshot.config_json = _load_config_json(prepared / "config.json")
         snapshot.manifest_entry_count = _count_manifest_entries(prepared / "manifest.jsonl")
-        snapshot.file_count, snapshot.total_bytes = _count_files(prepared)
     except Exception as exc:
+        snapshot.strategy = _weakest_strategy(used)
         snapshot.error = _append_error(snapshot.error, f"corpus preparation failed: {exc}")
     return snapshot
 
 
+def _configured_strategies() -> list[CorpusSnapshotStrategy]:
+    override = os.environ.get(_STRATEGY_ENV)
+    if not override:
+        return list(_DEFAULT_STRATEGIES)
+    strategies = []
+    for part in filter(None, (part.strip() for part in override.split(","))):
+        try:
+            strategies.append(CorpusSnapshotStrategy(part))
+        except ValueError:
+            choices = ", ".join(strategy.value for strategy in _STRATEGY_ORDER)
+            raise ValueError(f"{_STRATEGY_ENV} has unknown strategy {part!r}; expected {choices}") from None
+    if CorpusSnapshotStrategy.HARDLINK in strategies and os.geteuid() == 0:
+        raise ValueError(
+            f"{_STRATEGY_ENV}=hardlink is refused when running as root: root can write through"
+            " a hardlink into the source corpus"
+        )
+    # A byte copy is always the last resort, even when not requested explicitly.
+    if CorpusSnapshotStrategy.COPY not in strategies:
+        strategies.append(CorpusSnapshotStrategy.COPY)
+    return strategies
+
+
+def _materialize_file(
+    source: Path,
+    target: Path,
+    strategies: list[CorpusSnapshotStrategy],
+    used: set[CorpusSnapshotStrategy],
+) -> int:
+    """Place ``source`` at ``target`` using the first strategy that works.
+
+    A strategy that fails with a "not supported here" errno is removed from
+    ``strategies`` so later files do not retry it. Returns the file size.
+    """
+    size = source.stat().st_size
+    for strategy in list(strategies):
+        if strategy == CorpusSnapshotStrategy.COPY:
+            shutil.copy2(source, target)
+            used.add(strategy)
+            return size
+        try:
+            if strategy == CorpusSnapshotStrategy.REFLINK:
+                _reflink(source, target)
+            elif _is_writable(source):
+                # Linking would let a write through the link reach the source corpus.
+                continue
+            else:
+                _hardlink(source, target)
+        except OSError as exc:
+            try:
+                target.unlink()
+            except FileNotFoundError:
+                pass
+            if exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            strategies.remove(strategy)
+            continue
+        used.add(strategy)
+        return size
+    raise OSError(f"no corpus snapshot strategy could materialize {source}")
+
+
+def _reflink(source: Path, target: Path) -> None:
+    with source.open("rb") as src, target.open("xb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    shutil.copystat(source, target)
+
+
+def _hardlink(source: Path, target: Path) -> None:
+    # New files and deletions stay local to the snapshot's own directories.
+    os.link(source, target)
+
+
+def _is_writable(path: Path) -> bool:
+    return bool(stat.S_IMODE(path.stat().st_mode) & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def _weakest_strategy(used: set[CorpusSnapshotStrategy]) -> CorpusSnapshotStrategy | None:
+    for strategy in reversed(_STRATEGY_ORDER):
+        if strategy in used:
+            return strategy
+    return None
+
+
 def _select_temp_root(required_bytes: int) -> Path | None:
     override = os.environ.get(_TMP_DIR_ENV)
     if override:
@@ -158,33 +404,6 @@ def _count_manifest_entries(path: Path) -> int | None:
         return None
 
 
-def _count_files(path: Path) -> tuple[int, int]:
-    count = 0
-    total_bytes = 0
-    for item in path.rglob("*"):
-        if not item.is_file():
-            continue
-        count += 1
-        try:
-            total_bytes += item.stat().st_size
-        except OSError:
-            pass
-    return count, total_bytes
-
-
-def _fallback_tree(path: Path) -> str:
-    lines = [path.name]
-    for item in sorted(path.rglob("*")):
-        try:
-            relative = item.relative_to(path)
-        except ValueError:
-            continue
-        indent = "  " * (len(relative.parts) - 1)
-        suffix = "/" if item.is_dir() else ""
-        lines.append(f"{indent}{relative.name}{suffix}")
-    return "\n".join(lines) + "\n"
-
-
 def _filesystem_type(path: Path) -> str | None:
     try:
         mounts = Path("/proc/mounts").read_text(encoding="utf-8").splitlines()
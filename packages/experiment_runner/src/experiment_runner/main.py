@@ -95,6 +95,25 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=False,
         help="Enable chain-of-thought / reasoning mode for the model",
     )
+    run_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Questions run at once by the CLI baselines (claude_code_local, chatgpt_codex, clawcode)",
+    )
+    run_parser.add_argument(
+        "--result-store",
+        dest="result_store",
+        action="store_true",
+        default=False,
+        help="Append results to <output-dir>/results.db instead of writing a JSONL file",
+    )
+    run_parser.add_argument(
+        "--suite-id",
+        dest="suite_id",
+        default=None,
+        help="Suite ID recorded with results in the result store",
+    )
 
     suite = subparsers.add_parser("suite", help="Plan, run, and resume experiment suites")
     suite_subparsers = suite.add_subparsers(dest="suite_command", required=True)
@@ -102,10 +121,24 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     suite_plan = suite_subparsers.add_parser("plan", help="Print the expanded suite task list")
     suite_plan.add_argument("--config", required=True, help="Experiment suite config JSON")
     suite_plan.add_argument("--json", action="store_true", help="Print planned tasks as JSON")
+    suite_plan.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        default=False,
+        help="Do not reuse results of earlier tasks with the same fingerprint",
+    )
 
     suite_run = suite_subparsers.add_parser("run", help="Execute or resume a suite")
     suite_run.add_argument("--config", required=True, help="Experiment suite config JSON")
     suite_run.add_argument("--state", default=None, help="Suite state JSON path")
+    suite_run.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        default=False,
+        help="Re-run tasks even when an earlier result with the same fingerprint exists",
+    )
 
     suite_status = suite_subparsers.add_parser("status", help="Print suite progress state")
     suite_status.add_argument("--state", required=True, help="Suite state JSON path")
@@ -113,6 +146,111 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     suite_cancel = suite_subparsers.add_parser("cancel", help="Request cooperative suite cancellation")
     suite_cancel.add_argument("--state", required=True, help="Suite state JSON path")
 
+    suite_estimate = suite_subparsers.add_parser(
+        "estimate",
+        help="Estimate suite wall-clock time from past task wall times",
+    )
+    suite_estimate.add_argument("--config", required=True, help="Experiment suite config JSON")
+    suite_estimate.add_argument(
+        "--parallelism",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="What-if numbers of concurrent tasks to compare (suites run one task at a time)",
+    )
+    suite_estimate.add_argument("--json", action="store_true", help="Print the estimate as JSON")
+    suite_estimate.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Estimate as if no earlier results could be reused",
+    )
+
+    suite_benchmark = suite_subparsers.add_parser(
+        "benchmark",
+        help="Measure scheduler overhead with the mock system",
+    )
+    suite_benchmark.add_argument(
+        "--tasks",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="Suite sizes to benchmark",
+    )
+    suite_benchmark.add_argument(
+        "--sample-tasks",
+        dest="sample_tasks",
+        type=int,
+        default=10,
+        help="Tasks actually executed per suite size",
+    )
+    suite_benchmark.add_argument(
+        "--latency",
+        default="fixed:0",
+        help="Mock runner latency distribution (fixed:S, uniform:LO,HI, normal:MEAN,SD, lognormal:MU,SIGMA)",
+    )
+    suite_benchmark.add_argument(
+        "--probe-samples",
+        dest="probe_samples",
+        type=int,
+        default=200,
+        help="Heartbeat writes and cancel polls timed per suite size",
+    )
+    suite_benchmark.add_argument(
+        "--work-dir",
+        dest="work_dir",
+        default=None,
+        help="Keep suite state and results here instead of a temp directory",
+    )
+
+    results = subparsers.add_parser("results", help="Manage the consolidated result store")
+    results_subparsers = results.add_subparsers(dest="results_command", required=True)
+
+    results_compact = results_subparsers.add_parser(
+        "compact",
+        help="Merge per-run JSONL files into the directory's result store",
+    )
+    results_compact.add_argument("--results-dir", required=True, dest="results_dir", help="Experiment results directory")
+    results_compact.add_argument(
+        "--suite-state",
+        dest="suite_states",
+        nargs="*",
+        default=[],
+        help="Suite state files used to tag compacted rows with their suite ID",
+    )
+    results_compact.add_argument(
+        "--keep-sources",
+        dest="keep_sources",
+        action="store_true",
+        default=False,
+        help="Keep the JSONL files after importing them",
+    )
+
+    results_import = results_subparsers.add_parser("import", help="Import JSONL files into a result store")
+    results_import.add_argument("--results-dir", required=True, dest="results_dir", help="Experiment results directory")
+    results_import.add_argument("--suite-id", dest="suite_id", default=None, help="Suite ID to tag rows with")
+    results_import.add_argument("files", nargs="+", help="RunResult JSONL files")
+
+    results_export = results_subparsers.add_parser("export", help="Export stored results as JSONL")
+    results_export.add_argument("--results-dir", required=True, dest="results_dir", help="Experiment results directory")
+    results_export.add_argument("--output", required=True, help="JSONL file to write ('-' for stdout)")
+    results_export.add_argument("--suite-id", dest="suite_id", default=None, help="Only export this suite")
+    results_export.add_argument("--system", default=None, help="Only export this system")
+    results_export.add_argument("--model", default=None, help="Only export this model")
+    results_export.add_argument(
+        "--trace-refs",
+        dest="trace_refs",
+        action="store_true",
+        default=False,
+        help="Keep traces as trace_id references instead of inlining them",
+    )
+
+    results_partitions = results_subparsers.add_parser(
+        "partitions",
+        help="List stored (suite, system, model) partitions",
+    )
+    results_partitions.add_argument("--results-dir", required=True, dest="results_dir", help="Experiment results directory")
+
     return parser.parse_args(argv)
 
 
@@ -127,8 +265,10 @@ def main(argv: list[str] | None = None) -> None:
             sys.stderr.write(f"error: {exc}\n")
             raise SystemExit(1) from exc
     elif args.command == "suite":
+        from experiment_runner.commands.benchmark import run_benchmark
         from experiment_runner.commands.suite import (
             run_suite_cancel,
+            run_suite_estimate,
             run_suite_plan,
             run_suite_run,
             run_suite_status,
@@ -142,6 +282,29 @@ def main(argv: list[str] | None = None) -> None:
                 run_suite_status(args)
             elif args.suite_command == "cancel":
                 run_suite_cancel(args)
+            elif args.suite_command == "estimate":
+                run_suite_estimate(args)
+            elif args.suite_command == "benchmark":
+                run_benchmark(args)
+        except (ValueError, OSError) as exc:
+            sys.stderr.write(f"error: {exc}\n")
+            raise SystemExit(1) from exc
+    elif args.command == "results":
+        from experiment_runner.commands.results import (
+            run_results_compact,
+            run_results_export,
+            run_results_import,
+            run_results_partitions,
+        )
+        try:
+            if args.results_command == "compact":
+                run_results_compact(args)
+            elif args.results_command == "import":
+                run_results_import(args)
+            elif args.results_command == "export":
+                run_results_export(args)
+            elif args.results_command == "partitions":
+                run_results_partitions(args)
         except (ValueError, OSError) as exc:
             sys.stderr.write(f"error: {exc}\n")
             raise SystemExit(1) from exc
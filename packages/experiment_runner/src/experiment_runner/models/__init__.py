@@ -1,15 +1,17 @@
 from .config import RunConfig
-from .enums import AutomationLevel, CitationQuality, Corpus, SystemName
+from .enums import AutomationLevel, CitationQuality, Corpus, CorpusSnapshotStrategy, SystemName
 from .metrics import RunMetrics, TokenCounts
 from .question import Question
-from .result import CorpusSnapshot, RunResult
+from .result import CorpusDiff, CorpusSnapshot, RunResult
 from .trace import SessionTrace, TraceBlock, TraceMessage, TraceUsage
 
 __all__ = [
     "AutomationLevel",
     "CitationQuality",
     "Corpus",
+    "CorpusDiff",
     "CorpusSnapshot",
+    "CorpusSnapshotStrategy",
     "Question",
     "RunConfig",
     "RunMetrics",
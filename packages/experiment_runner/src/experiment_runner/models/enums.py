@@ -12,6 +12,8 @@ class SystemName(str, Enum):
     OPEN_WEBUI = "open_webui"
     PRIVATEGPT = "privategpt"
     PERPLEXITY = "perplexity"
+    # Synthetic system for scheduler benchmarks; no model involved.
+    MOCK = "mock"
 
 
 class Corpus(str, Enum):
@@ -35,3 +37,12 @@ class CitationQuality(str, Enum):
     INCORRECT = "incorrect"
     # System does not produce citations at all.
     NOT_APPLICABLE = "not_applicable"
+
+
+class CorpusSnapshotStrategy(str, Enum):
+    # Copy-on-write clone via the FICLONE ioctl (btrfs, XFS, bcachefs, ...).
+    REFLINK = "reflink"
+    # Hard links to already read-only source inodes; explicit opt-in only.
+    HARDLINK = "hardlink"
+    # Plain byte copy — always possible, slowest and most memory-hungry.
+    COPY = "copy"
@@ -25,6 +25,11 @@ class RunMetrics(BaseModel):
     step_count: Optional[int] = None
     tool_call_count: Optional[int] = None
     tokens: Optional[TokenCounts] = None
+    # Streaming CLI runners: seconds from launch to the first streamed event
+    # (a time-to-first-token proxy) and per-tool durations aligned with
+    # tool_call_sequence (None where start and finish could not be paired).
+    time_to_first_event_s: Optional[float] = None
+    tool_call_durations_s: list[Optional[float]] = Field(default_factory=list)
 
     # Nominal scale
     corpus_used: Optional[bool] = None
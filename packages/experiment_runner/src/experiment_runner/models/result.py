@@ -1,23 +1,49 @@
 import uuid
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from .enums import AutomationLevel, Corpus, SystemName
+from .enums import AutomationLevel, Corpus, CorpusSnapshotStrategy, SystemName
 from .metrics import RunMetrics
 from .trace import SessionTrace
 
 
+class CorpusDiff(BaseModel):
+    # Paths relative to the prepared corpus, each list capped (see *_count for
+    # the true totals and ``truncated`` for whether any list was cut).
+    added: list[str] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    modified: list[str] = Field(default_factory=list)
+    added_count: int = 0
+    removed_count: int = 0
+    modified_count: int = 0
+    truncated: bool = False
+
+
 class CorpusSnapshot(BaseModel):
     source_corpus_path: str
     prepared_corpus_path: str
     temp_root_path: Optional[str] = None
     temp_root_filesystem: Optional[str] = None
     copied_paths: list[str] = Field(default_factory=list)
+    # How the text tree was materialised (weakest strategy used for any file)
+    # and the wall-clock time spent preparing the snapshot.
+    strategy: Optional[CorpusSnapshotStrategy] = None
+    prepare_time_s: Optional[float] = None
+    # Time the run actually blocked waiting for the snapshot; near zero when
+    # it was prefetched while the previous question was running.
+    wait_time_s: Optional[float] = None
     file_count: int = 0
     total_bytes: int = 0
     config_json: Optional[dict[str, Any]] = None
     manifest_entry_count: Optional[int] = None
+    # Merkle roots over (path, size, mtime, content hash) of the prepared
+    # corpus before and after the run; ``post_run_diff`` lists what changed.
+    pre_run_root_hash: Optional[str] = None
+    post_run_root_hash: Optional[str] = None
+    post_run_diff: Optional[CorpusDiff] = None
+    # Full ``tree -a`` listings; only present in results from older runs.
     pre_run_tree: Optional[str] = None
     post_run_tree: Optional[str] = None
     error: Optional[str] = None
@@ -56,4 +82,11 @@ class RunResult(BaseModel):
     corpus_snapshot: Optional[CorpusSnapshot] = None
 
     # --- Full session trace (optional, may be large) ---
+    # New results store the trace out of line in the results directory's
+    # trace store and keep only its content hash in ``trace_id``; use
+    # ``experiment_runner.trace_store.load_trace`` to read either form.
     trace: Optional[SessionTrace] = None
+    trace_id: Optional[str] = None
+
+    # Trace store the run was loaded next to; set by the result loaders.
+    _trace_store_root: Optional[Path] = PrivateAttr(default=None)
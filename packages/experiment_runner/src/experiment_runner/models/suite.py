@@ -28,6 +28,19 @@ class SuiteCorpusSelection(BaseModel):
     levels: list[int] = Field(default_factory=list)
 
 
+class TaskTimeoutPolicy(BaseModel):
+    # Learn per-(system, model, level) deadlines from past task wall times.
+    adaptive: bool = False
+    quantile: float = 0.99
+    factor: float = 1.5
+    # Added to the learned deadline to absorb process and model start-up jitter.
+    startup_margin_s: int = 30
+    floor_s: int = 60
+    ceiling_s: int = 1800
+    # Groups with fewer recorded past tasks keep the suite's task_timeout_s.
+    min_samples: int = 5
+
+
 class ExperimentSuiteConfig(BaseModel):
     suite_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
@@ -36,9 +49,15 @@ class ExperimentSuiteConfig(BaseModel):
     corpora: list[SuiteCorpusSelection]
     output_dir: str = "./data/experiment_results"
     num_ctx: int = 8192
+    # Deadline for tasks without enough history under timeout_policy.
     task_timeout_s: int = 240
+    timeout_policy: TaskTimeoutPolicy = Field(default_factory=TaskTimeoutPolicy)
     reasoning_enabled: bool = False
     no_trace: bool = False
+    # Append task results to <output_dir>/results.db instead of one JSONL file per task.
+    result_store: bool = False
+    # Reuse results of earlier tasks with the same fingerprint (see result_cache).
+    use_cache: bool = True
 
 
 class SuiteTask(BaseModel):
@@ -60,6 +79,14 @@ class SuiteTask(BaseModel):
     last_heartbeat_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
     return_code: Optional[int] = None
+    # Content fingerprint of the task inputs; None when the corpus could not be hashed.
+    fingerprint: Optional[str] = None
+    # True when result_path was reused from an earlier run instead of executed.
+    cache_hit: bool = False
+    # Deadline applied to this task (None on older states: task_timeout_s)
+    # and how many past runs it was learned from (0: the suite default).
+    timeout_s: Optional[int] = None
+    timeout_samples: int = 0
 
 
 class ExperimentSuiteState(BaseModel):
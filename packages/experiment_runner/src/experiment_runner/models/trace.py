@@ -18,6 +18,7 @@ class TraceStep(BaseModel):
     name: Optional[str] = None      # tool name for tool_call / tool_result
     input: Optional[str] = None     # JSON-encoded tool input
     output: Optional[str] = None    # tool result output
+    elapsed_s: Optional[float] = None  # seconds since launch, for streamed runs
 
 
 class TraceBlock(BaseModel):
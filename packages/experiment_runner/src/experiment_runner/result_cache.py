@@ -0,0 +1,180 @@
+"""Content fingerprints for suite tasks and an index of results by fingerprint.
+
+A suite task is fully determined by what the system under test sees: the
+system and model, the corpus content, the question text, the examinee prompt,
+the context size, the reasoning flag, whether a trace is stored and the
+runner code. ``task_fingerprint``
+hashes exactly those inputs, so two tasks with equal fingerprints would
+produce interchangeable results no matter which suite planned them.
+
+Succeeded tasks are recorded in ``<output_dir>/result_index.db`` under their
+fingerprint. When planning, ``build_suite_tasks`` looks every fingerprint up
+and marks tasks whose result still exists as cache hits pointing at it. The
+same database keeps the wall time of every finished task, which
+``timeout_policy`` learns deadlines from.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import sqlite3
+from datetime import datetime, timezone
+from functools import cache
+from pathlib import Path
+
+from agent.prompts import EXAMINEE_SYSTEM_MESSAGE
+from experiment_runner.models.enums import SystemName
+from experiment_runner.runners.registry import get_runner_class
+
+RESULT_INDEX_FILENAME = "result_index.db"
+
+# Bump to invalidate every recorded fingerprint (e.g. when the result format
+# changes in a way old results cannot be reused).
+_FINGERPRINT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT NOT NULL,
+    result_path TEXT NOT NULL,
+    suite_id TEXT,
+    task_id TEXT,
+    recorded_at TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, result_path)
+);
+CREATE TABLE IF NOT EXISTS task_durations (
+    system TEXT NOT NULL,
+    model TEXT NOT NULL,
+    corpus TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    wall_s REAL NOT NULL,
+    deadline_s INTEGER NOT NULL,
+    succeeded INTEGER NOT NULL,
+    timed_out INTEGER NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+"""
+
+
+def result_index_path(output_dir: str | Path) -> Path:
+    return Path(output_dir) / RESULT_INDEX_FILENAME
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@cache
+def prompt_version() -> str:
+    return _sha256(EXAMINEE_SYSTEM_MESSAGE)[:16]
+
+
+@cache
+def runner_version(system: SystemName) -> str:
+    """Digest of the runner's source module, so editing a runner invalidates its results."""
+    source_file = inspect.getsourcefile(get_runner_class(system))
+    if source_file is None:
+        return "unknown"
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()[:16]
+
+
+def task_fingerprint(
+    *,
+    system: SystemName,
+    model: str,
+    corpus_hash: str,
+    question_text: str,
+    num_ctx: int,
+    reasoning_enabled: bool,
+    trace_enabled: bool,
+) -> str:
+    payload = {
+        "version": _FINGERPRINT_VERSION,
+        "system": system.value,
+        "model": model,
+        "corpus_hash": corpus_hash,
+        "question_sha256": _sha256(question_text),
+        "prompt_version": prompt_version(),
+        "num_ctx": num_ctx,
+        "reasoning_enabled": reasoning_enabled,
+        # A result stored without a trace cannot stand in for one with it.
+        "trace_enabled": trace_enabled,
+        "runner_version": runner_version(system),
+    }
+    return _sha256(json.dumps(payload, sort_keys=True))
+
+
+class ResultIndex:
+    """SQLite (WAL mode) map from task fingerprint to result paths."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> ResultIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def record(
+        self,
+        fingerprint: str,
+        result_path: str,
+        *,
+        suite_id: str | None = None,
+        task_id: str | None = None,
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (fingerprint, result_path, suite_id, task_id, recorded_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (fingerprint, result_path, suite_id, task_id, datetime.now(timezone.utc).isoformat()),
+        )
+
+    def record_duration(
+        self,
+        *,
+        system: str,
+        model: str,
+        corpus: str,
+        question_id: str,
+        level: int,
+        wall_s: float,
+        deadline_s: int,
+        succeeded: bool,
+        timed_out: bool = False,
+    ) -> None:
+        """Record how long a suite task ran, start to exit, under ``deadline_s``."""
+        self._conn.execute(
+            "INSERT INTO task_durations"
+            " (system, model, corpus, question_id, level, wall_s, deadline_s, succeeded, timed_out, recorded_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                system,
+                model,
+                corpus,
+                question_id,
+                level,
+                wall_s,
+                deadline_s,
+                int(succeeded),
+                int(timed_out),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+
+    def candidates(self, fingerprint: str) -> list[str]:
+        """Result paths recorded for ``fingerprint``, newest first."""
+        rows = self._conn.execute(
+            "SELECT result_path FROM results WHERE fingerprint = ? ORDER BY recorded_at DESC",
+            (fingerprint,),
+        )
+        return [row[0] for row in rows]
@@ -0,0 +1,326 @@
+"""Consolidated SQLite store for experiment results.
+
+``run`` historically wrote one small JSONL file per invocation, and suites run
+one invocation per question, so a results directory accumulates tens of
+thousands of files that every loader has to glob and parse. The store keeps
+all rows of a results directory in ``<results_dir>/results.db``, partitioned
+by (suite, system, model) and indexed by ``run_id``.
+
+Each row remembers the JSONL path it was written as (``source_file``). That
+path stays the public handle for a batch of results: suite state keeps it as
+``result_path`` and ``result_file_exists`` / ``iter_result_file`` resolve it
+against the real file first and the sibling store second, so code holding a
+result path does not care whether it was compacted.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+from experiment_runner.models.result import RunResult
+from experiment_runner.trace_store import (
+    TraceStore,
+    bind_trace_store,
+    externalize_trace,
+    inline_trace,
+    trace_store_dir,
+)
+
+RESULT_STORE_FILENAME = "results.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    suite_id TEXT,
+    system_name TEXT NOT NULL,
+    model TEXT NOT NULL,
+    corpus TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    source_file TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_partition ON runs (suite_id, system_name, model);
+CREATE INDEX IF NOT EXISTS runs_source_file ON runs (source_file, position);
+"""
+
+
+def result_store_path(results_dir: str | Path) -> Path:
+    return Path(results_dir) / RESULT_STORE_FILENAME
+
+
+def source_key(path: str | Path) -> str:
+    return str(Path(path).resolve())
+
+
+class ResultStore:
+    """SQLite (WAL mode) store holding every RunResult of one results directory."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def append(self, run: RunResult, *, source_file: str | Path, suite_id: str | None = None) -> None:
+        self.append_many([run], source_file=source_file, suite_id=suite_id)
+
+    def append_many(
+        self,
+        runs: Iterable[RunResult],
+        *,
+        source_file: str | Path,
+        suite_id: str | None = None,
+    ) -> int:
+        """Insert ``runs`` (replacing rows with the same run_id) in one transaction."""
+        return self._write_source(runs, source_key(source_file), suite_id, replace=False)
+
+    def replace_source(
+        self,
+        runs: Iterable[RunResult],
+        *,
+        source_file: str | Path,
+        suite_id: str | None = None,
+    ) -> int:
+        """Swap every row of ``source_file`` for ``runs`` in one transaction."""
+        return self._write_source(runs, source_key(source_file), suite_id, replace=True)
+
+    def delete_source(self, source_file: str | Path) -> int:
+        cursor = self._conn.execute("DELETE FROM runs WHERE source_file = ?", (source_key(source_file),))
+        return cursor.rowcount
+
+    def get(self, run_id: str) -> RunResult | None:
+        row = self._conn.execute("SELECT payload FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return self._parse(row[0]) if row else None
+
+    def source_for_run(self, run_id: str) -> str | None:
+        row = self._conn.execute("SELECT source_file FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] if row else None
+
+    def has_source(self, source_file: str | Path) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM runs WHERE source_file = ? LIMIT 1",
+            (source_key(source_file),),
+        ).fetchone()
+        return row is not None
+
+    def source_files(self) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT DISTINCT source_file FROM runs")}
+
+    def iter_runs(
+        self,
+        *,
+        suite_id: str | None = None,
+        system_name: str | None = None,
+        model: str | None = None,
+        source_file: str | Path | None = None,
+    ) -> Iterator[RunResult]:
+        for payload in self._iter_payloads(
+            suite_id=suite_id,
+            system_name=system_name,
+            model=model,
+            source_file=source_file,
+        ):
+            yield self._parse(payload)
+
+    def iter_source_runs(self, source_file: str | Path, *, from_position: int = 0) -> Iterator[tuple[int, RunResult]]:
+        """``(position, run)`` for the rows of one source file at or after ``from_position``."""
+        rows = self._conn.execute(
+            "SELECT position, payload FROM runs WHERE source_file = ? AND position >= ? ORDER BY position",
+            (source_key(source_file), from_position),
+        )
+        for position, payload in rows:
+            yield position, self._parse(payload)
+
+    def next_position(self, source_file: str | Path) -> int:
+        """Position the next row appended for ``source_file`` will get."""
+        (position,) = self._conn.execute(
+            "SELECT COALESCE(MAX(position) + 1, 0) FROM runs WHERE source_file = ?",
+            (source_key(source_file),),
+        ).fetchone()
+        return position
+
+    def partitions(self) -> list[dict[str, str | int | None]]:
+        rows = self._conn.execute(
+            "SELECT suite_id, system_name, model, COUNT(*) FROM runs"
+            " GROUP BY suite_id, system_name, model ORDER BY suite_id, system_name, model"
+        )
+        return [
+            {"suite_id": suite_id, "system_name": system_name, "model": model, "runs": count}
+            for suite_id, system_name, model, count in rows
+        ]
+
+    def export_jsonl(self, handle: IO[str], *, inline_traces: bool = False, **filters: str | None) -> int:
+        """Write matching rows to ``handle`` as RunResult JSONL; returns the row count.
+
+        ``inline_traces`` copies out-of-line traces back into each row so the
+        output is usable without this directory's trace store.
+        """
+        count = 0
+        for payload in self._iter_payloads(**filters):
+            if inline_traces:
+                payload = inline_trace(self._parse(payload)).model_dump_json()
+            handle.write(payload + "\n")
+            count += 1
+        return count
+
+    def _write_source(
+        self,
+        runs: Iterable[RunResult],
+        source: str,
+        suite_id: str | None,
+        *,
+        replace: bool,
+    ) -> int:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            if replace:
+                self._conn.execute("DELETE FROM runs WHERE source_file = ?", (source,))
+            position = self.next_position(source)
+            count = 0
+            for run in runs:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO runs (run_id, suite_id, system_name, model, corpus,"
+                    " question_id, created_at, source_file, position, payload)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        run.run_id,
+                        suite_id,
+                        run.system_name.value,
+                        run.model,
+                        run.corpus.value,
+                        run.question_id,
+                        run.created_at.isoformat(),
+                        source,
+                        position + count,
+                        run.model_dump_json(),
+                    ),
+                )
+                count += 1
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return count
+
+    def _parse(self, payload: str) -> RunResult:
+        return bind_trace_store(RunResult.model_validate_json(payload), self.path.parent)
+
+    def _iter_payloads(
+        self,
+        *,
+        suite_id: str | None = None,
+        system_name: str | None = None,
+        model: str | None = None,
+        source_file: str | Path | None = None,
+    ) -> Iterator[str]:
+        clauses: list[str] = []
+        params: list[str] = []
+        for column, value in (("suite_id", suite_id), ("system_name", system_name), ("model", model)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if source_file is not None:
+            clauses.append("source_file = ?")
+            params.append(source_key(source_file))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT payload FROM runs{where} ORDER BY source_file, position"
+        for (payload,) in self._conn.execute(query, params):
+            yield payload
+
+
+@dataclass
+class CompactionStats:
+    files_compacted: int = 0
+    runs_imported: int = 0
+    files_removed: int = 0
+    skipped: list[str] = field(default_factory=list)
+
+
+def result_file_exists(path: str | Path) -> bool:
+    """True when ``path`` is a non-empty JSONL file or was compacted into its directory's store."""
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size > 0
+    store_path = result_store_path(path.parent)
+    if not store_path.is_file():
+        return False
+    with ResultStore(store_path) as store:
+        return store.has_source(path)
+
+
+def iter_result_file(path: str | Path) -> Iterator[RunResult]:
+    """Yield the runs of a result path, reading the JSONL file or its compacted rows."""
+    path = Path(path)
+    if path.is_file():
+        yield from iter_jsonl_runs(path)
+        return
+    store_path = result_store_path(path.parent)
+    if not store_path.is_file():
+        raise FileNotFoundError(f"result file not found: {path}")
+    with ResultStore(store_path) as store:
+        yield from store.iter_runs(source_file=path)
+
+
+def iter_jsonl_runs(path: Path) -> Iterator[RunResult]:
+    with path.open("r", encoding="utf-8") as handle:
+        for line_no, raw_line in enumerate(handle, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{line_no}: invalid JSON ({exc})") from exc
+            yield bind_trace_store(RunResult.model_validate(payload), path.parent)
+
+
+def compact_results_dir(
+    results_dir: str | Path,
+    *,
+    suite_ids_by_source: dict[str, str] | None = None,
+    remove_sources: bool = True,
+) -> CompactionStats:
+    """Merge every ``*.jsonl`` file in ``results_dir`` into its result store.
+
+    Files are imported one transaction each and only removed after their rows
+    are committed; files that fail to parse are left in place and reported.
+    Inline traces of older results are moved into the trace store on the way.
+    """
+    results_dir = Path(results_dir)
+    suite_ids_by_source = suite_ids_by_source or {}
+    stats = CompactionStats()
+    traces = TraceStore(trace_store_dir(results_dir))
+    with ResultStore(result_store_path(results_dir)) as store:
+        for jsonl in sorted(results_dir.glob("*.jsonl")):
+            source = source_key(jsonl)
+            try:
+                runs = [externalize_trace(run, traces) for run in iter_jsonl_runs(jsonl)]
+            except (ValueError, OSError) as exc:
+                stats.skipped.append(f"{jsonl}: {exc}")
+                continue
+            stats.runs_imported += store.replace_source(
+                runs,
+                source_file=source,
+                suite_id=suite_ids_by_source.get(source),
+            )
+            stats.files_compacted += 1
+            if remove_sources:
+                jsonl.unlink()
+                stats.files_removed += 1
+    return stats
@@ -1,14 +1,19 @@
+import json
+import os
+import socket
 import subprocess
+import sys
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
+from typing import Optional
 
 from agent.prompts import EXAMINEE_SYSTEM_MESSAGE
+from experiment_runner.models.config import RunConfig
 from experiment_runner.models.metrics import RunMetrics
 from experiment_runner.models.question import Question
 from experiment_runner.models.result import RunResult
 from experiment_runner.runners.base import BaseRunner
+from experiment_runner.runners.baseline.anythingllm_client import AnythingLLMClient
 
 
 # Per-question wall-clock budget for the AnythingLLM CLI subprocess.
@@ -16,8 +21,20 @@ _TIMEOUT_SECONDS = 180
 
 _CONTAINER_NAME = "anythingllm-thesis"
 _STORAGE_DIR = Path.home() / "anythingllm-thesis-data"
-_READY_URL = "http://localhost:3001/api/ping"
 _READY_TIMEOUT_SECONDS = 90
+# Readiness poll backoff: first retry after 0.25s, doubling up to 4s.
+_READY_INITIAL_DELAY_S = 0.25
+_READY_MAX_DELAY_S = 4.0
+
+# Same variables the `any` CLI reads, so both clients talk to one server.
+_BASE_URL_ENV = "ANYTHING_LLM_BASE_URL"
+_API_KEY_ENV = "ANYTHING_LLM_API_KEY"
+_DEFAULT_BASE_URL = "http://localhost:3001"
+# "http" (keep-alive API client) or "cli" (`any` subprocess). Defaults to
+# "http" when an API key is configured, since the developer API requires one.
+_CLIENT_ENV = "EXPERIMENT_RUNNER_ANYTHINGLLM_CLIENT"
+# Set to 0 to restart the container for every batch, as before.
+_REUSE_CONTAINER_ENV = "EXPERIMENT_RUNNER_ANYTHINGLLM_REUSE_CONTAINER"
 
 
 def build_anythingllm_prompt_command(*, prompt: str, workspace: str) -> list[str]:
@@ -48,15 +65,62 @@ class AnythingLLMRunner(BaseRunner):
     Because the `any` CLI exposes no structured output, token counts and
     tool-call sequences are unavailable; only ``execution_time_s`` and
     ``corpus_used`` are populated in ``RunMetrics``.
+
+    With an API key configured the runner talks to the developer API directly
+    instead (see ``anythingllm_client``): one keep-alive connection per batch,
+    a fresh ``sessionId`` per question, and the streamed reply's first chunk
+    recorded as ``time_to_first_event_s``. Suites run one process per task,
+    so a running container that already serves the requested model is reused
+    rather than restarted, and left running on teardown.
     """
 
+    def __init__(self, config: RunConfig) -> None:
+        super().__init__(config)
+        self._client: Optional[AnythingLLMClient] = None
+        self._use_http = False
+
     def setup(self) -> None:
-        self._stop_container()
-        self._start_container()
+        self._use_http = _client_mode() == "http"
+        self._client = AnythingLLMClient(
+            os.environ.get(_BASE_URL_ENV) or _DEFAULT_BASE_URL,
+            os.environ.get(_API_KEY_ENV),
+            timeout=_TIMEOUT_SECONDS,
+        )
+        if _reuse_container() and self._running_container_model() == self.config.model:
+            sys.stderr.write(f"Reusing running {_CONTAINER_NAME} container\n")
+        else:
+            self._stop_container()
+            self._start_container()
         self._wait_for_ready()
 
     def teardown(self) -> None:
-        self._stop_container()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if not _reuse_container():
+            self._stop_container()
+
+    def _running_container_model(self) -> Optional[str]:
+        """OLLAMA_MODEL_PREF of the running container, or None if it is not running."""
+        inspected = subprocess.run(
+            ["docker", "inspect", _CONTAINER_NAME],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if inspected.returncode != 0:
+            return None
+        try:
+            (container,) = json.loads(inspected.stdout)
+        except ValueError:
+            return None
+        if not container.get("State", {}).get("Running"):
+            return None
+        for entry in container.get("Config", {}).get("Env") or []:
+            name, _, value = entry.partition("=")
+            if name == "OLLAMA_MODEL_PREF":
+                return value
+        return None
 
     def _stop_container(self) -> None:
         subprocess.run(["docker", "stop", _CONTAINER_NAME], capture_output=True, check=False)
@@ -84,18 +148,24 @@ class AnythingLLMRunner(BaseRunner):
         )
 
     def _wait_for_ready(self) -> None:
+        assert self._client is not None
         deadline = time.monotonic() + _READY_TIMEOUT_SECONDS
-        while time.monotonic() < deadline:
-            try:
-                urllib.request.urlopen(_READY_URL, timeout=2)
+        delay = _READY_INITIAL_DELAY_S
+        while True:
+            if self._client.ping():
                 return
-            except (urllib.error.URLError, OSError):
-                time.sleep(2)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _READY_MAX_DELAY_S)
         raise RuntimeError(
             f"AnythingLLM did not become ready within {_READY_TIMEOUT_SECONDS}s"
         )
 
     def run(self, question: Question) -> RunResult:
+        if self._use_http and self._client is not None:
+            return self._run_http(question)
         result = self._base_result(question)
         workspace = self.config.corpus.value
         t_start = time.perf_counter()
@@ -135,6 +205,36 @@ class AnythingLLMRunner(BaseRunner):
         )
         return result
 
+    def _run_http(self, question: Question) -> RunResult:
+        assert self._client is not None
+        result = self._base_result(question)
+        t_start = time.perf_counter()
+        try:
+            reply = self._client.stream_chat(
+                self.config.corpus.value,
+                self._build_prompt(question.question),
+            )
+        except (TimeoutError, socket.timeout):
+            self._client.close()
+            result.answer_error = f"AnythingLLM API timed out after {_TIMEOUT_SECONDS}s"
+            result.metrics = RunMetrics(execution_time_s=time.perf_counter() - t_start)
+            return result
+        except Exception as exc:
+            self._client.close()
+            result.answer_error = f"AnythingLLM runner failed: {exc}"
+            result.metrics = RunMetrics(execution_time_s=time.perf_counter() - t_start)
+            return result
+
+        answer_text = reply.text.strip() or None
+        result.answer_text = answer_text
+        result.metrics = RunMetrics(
+            execution_time_s=time.perf_counter() - t_start,
+            time_to_first_event_s=reply.first_chunk_s,
+            # Same definition as the CLI path so both modes stay comparable.
+            corpus_used=answer_text is not None,
+        )
+        return result
+
     @staticmethod
     def _build_prompt(question: str) -> str:
         return f"{EXAMINEE_SYSTEM_MESSAGE}\n\nQuestion:\n{question}"
@@ -149,3 +249,17 @@ class AnythingLLMRunner(BaseRunner):
             timeout=_TIMEOUT_SECONDS,
             check=False,
         )
+
+
+def _client_mode() -> str:
+    raw = os.environ.get(_CLIENT_ENV)
+    if not raw:
+        return "http" if os.environ.get(_API_KEY_ENV) else "cli"
+    mode = raw.strip().lower()
+    if mode not in {"http", "cli"}:
+        raise ValueError(f"{_CLIENT_ENV} must be 'http' or 'cli', got {raw!r}")
+    return mode
+
+
+def _reuse_container() -> bool:
+    return os.environ.get(_REUSE_CONTAINER_ENV, "1").strip() != "0"
@@ -0,0 +1,174 @@
+"""Keep-alive HTTP client for the AnythingLLM developer API.
+
+The ``any`` CLI opens a new connection (and a new Node process) for every
+prompt. ``AnythingLLMClient`` holds one ``http.client`` connection for the
+whole question batch and reads ``stream-chat`` replies as server-sent events,
+so the time to the first text chunk is observable. A connection the server
+closed between questions is reopened once, transparently.
+"""
+from __future__ import annotations
+
+import http.client
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import quote, urlsplit
+
+# Errors that mean an idle keep-alive connection went away; retried once.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class AnythingLLMAPIError(RuntimeError):
+    """Raised for non-2xx responses and ``error`` events from the API."""
+
+
+@dataclass
+class ChatReply:
+    text: str
+    # Seconds from sending the request to the first text chunk.
+    first_chunk_s: Optional[float] = None
+    sources: list[dict[str, Any]] = field(default_factory=list)
+
+
+class AnythingLLMClient:
+    def __init__(self, base_url: str, api_key: Optional[str], *, timeout: float) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"invalid AnythingLLM base URL: {base_url!r}")
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._api_key = api_key
+        self._timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def __enter__(self) -> AnythingLLMClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def ping(self, *, timeout: float = 2.0) -> bool:
+        """True when ``/api/ping`` answers 200; never raises for network errors."""
+        conn = self._new_connection(timeout)
+        try:
+            conn.request("GET", f"{self._prefix}/api/ping")
+            response = conn.getresponse()
+            response.read()
+            return response.status == 200
+        except (OSError, http.client.HTTPException):
+            return False
+        finally:
+            conn.close()
+
+    def stream_chat(self, workspace: str, message: str, *, mode: str = "chat") -> ChatReply:
+        """Send ``message`` on a fresh session and collect the streamed reply.
+
+        Every call uses a new ``sessionId`` so no conversation history from an
+        earlier question reaches the model (the CLI's ``--nt``).
+        """
+        body = json.dumps({
+            "message": message,
+            "mode": mode,
+            "sessionId": uuid.uuid4().hex,
+        }).encode("utf-8")
+        path = f"{self._prefix}/api/v1/workspace/{quote(workspace, safe='')}/stream-chat"
+        started = time.perf_counter()
+        response = self._request("POST", path, body, accept="text/event-stream")
+        if response.status >= 300:
+            detail = response.read().decode("utf-8", errors="replace").strip()
+            raise AnythingLLMAPIError(f"stream-chat returned HTTP {response.status}: {detail[:500]}")
+
+        reply = ChatReply(text="")
+        chunks: list[str] = []
+        for event in _iter_sse_events(response):
+            if event.get("error"):
+                response.close()
+                self.close()
+                raise AnythingLLMAPIError(f"stream-chat error: {event['error']}")
+            text = event.get("textResponse")
+            if isinstance(text, str) and text:
+                if reply.first_chunk_s is None:
+                    reply.first_chunk_s = time.perf_counter() - started
+                chunks.append(text)
+            sources = event.get("sources")
+            if isinstance(sources, list) and sources:
+                reply.sources = sources
+            if event.get("close"):
+                break
+        # Drain whatever is left so the connection can carry the next request.
+        response.read()
+        if response.will_close:
+            self.close()
+        reply.text = "".join(chunks)
+        return reply
+
+    def _request(self, method: str, path: str, body: bytes, *, accept: str) -> http.client.HTTPResponse:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": accept,
+            "Connection": "keep-alive",
+        }
+        if self._api_key:
+            headers["Authorization"] = f"Bearer {self._api_key}"
+        for attempt in (1, 2):
+            if self._conn is None:
+                self._conn = self._new_connection(self._timeout)
+            try:
+                self._conn.request(method, path, body=body, headers=headers)
+                return self._conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                self.close()
+                if attempt == 2:
+                    raise
+        raise AssertionError("unreachable")
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+
+def _iter_sse_events(response: http.client.HTTPResponse):
+    """Yield the JSON payload of each ``data:`` event in a server-sent event stream."""
+    data_lines: list[str] = []
+    while True:
+        raw = response.readline()
+        if not raw:
+            break
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line.startswith("data:"):
+            data_lines.append(line[5:].lstrip())
+            continue
+        if line or not data_lines:
+            continue
+        payload = "\n".join(data_lines)
+        data_lines = []
+        try:
+            event = json.loads(payload)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict):
+            yield event
+            if event.get("close"):
+                return
+    if data_lines:
+        try:
+            event = json.loads("\n".join(data_lines))
+        except json.JSONDecodeError:
+            return
+        if isinstance(event, dict):
+            yield event
@@ -1,7 +1,6 @@
 import json
 import os
 import subprocess
-import tempfile
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -12,6 +11,14 @@ from experiment_runner.models.question import Question
 from experiment_runner.models.result import RunResult
 from experiment_runner.models.trace import SessionTrace
 from experiment_runner.runners.base import BaseRunner
+from experiment_runner.runners.baseline.streaming import (
+    StreamedProcess,
+    is_result_envelope,
+    result_envelope,
+    run_jsonl_stream,
+    stream_json_tool_calls,
+)
+from experiment_runner.runners.baseline.workspace_pool import WorkspacePool, sandbox_workspace
 
 # Per-question wall-clock budget for the Claude Code subprocess.
 _TIMEOUT_SECONDS = 180
@@ -32,7 +39,8 @@ def build_claude_command(*, model: str, prompt: str) -> list[str]:
         "--model",
         model,
         "--output-format",
-        "json",
+        "stream-json",
+        "--verbose",
         "--permission-mode",
         "bypassPermissions",
         "--allowedTools",
@@ -52,10 +60,10 @@ def claude_environment_overrides() -> dict[str, str]:
 class ClaudeCodeLocalRunner(BaseRunner):
     """Runner for the Claude Code CLI baseline against a local Ollama model.
 
-    Each question is executed inside a fresh temporary workspace so the real
+    Each question is executed inside a clean sandbox workspace so the real
     corpus directory is never written to and concurrent runs cannot interfere
     with each other. The corpus is exposed via a single symlink at ``./corpus``
-    inside the temp workspace, keeping file paths stable in the model's context
+    inside the workspace, keeping file paths stable in the model's context
     while the process runs in ``workspace-write`` permission mode.
 
     Local inference is routed through Ollama by setting ``ANTHROPIC_BASE_URL``
@@ -63,12 +71,17 @@ class ClaudeCodeLocalRunner(BaseRunner):
     placeholder value. The model name is prefixed with ``ollama/`` as required
     by Claude Code when routing to a local provider.
 
-    The runner shells out to ``claude --output-format json``, captures stdout,
-    and maps the JSON envelope onto the framework's RunResult / RunMetrics types.
+    The runner shells out to ``claude --output-format stream-json --verbose``,
+    times the tool calls and first event of the stream, and maps the final
+    result envelope onto the framework's RunResult / RunMetrics types.
     Any subprocess, parsing, or I/O failure is converted into a populated
     ``answer_error`` instead of a raised exception.
     """
 
+    # Set by the run loop to recycle sandboxes across runs; a fresh
+    # temporary directory is used per run when left unset.
+    workspace_pool: Optional[WorkspacePool] = None
+
     def run(self, question: Question) -> RunResult:
         result = self._base_result(question)
 
@@ -86,12 +99,11 @@ class ClaudeCodeLocalRunner(BaseRunner):
         t_start = time.perf_counter()
 
         try:
-            with tempfile.TemporaryDirectory(prefix="claudelocal_run_") as tmp:
-                workspace = Path(tmp)
-                # Mirror the corpus into the sandbox via a symlink so Claude Code
-                # sees the content under a predictable, sandboxed path.
-                corpus_link = workspace / "corpus"
-                corpus_link.symlink_to(corpus_root, target_is_directory=True)
+            # The sandbox mirrors the corpus via a ``corpus`` symlink so Claude
+            # Code sees the content under a predictable, sandboxed path.
+            with sandbox_workspace(
+                self.workspace_pool, corpus_root, prefix="claudelocal_run_"
+            ) as workspace:
 
                 completed = self._invoke_claude(
                     self._build_prompt(question.question),
@@ -108,7 +120,8 @@ class ClaudeCodeLocalRunner(BaseRunner):
                     )
                     return result
 
-                data = self._parse_json_output(completed.stdout)
+                events = completed.events if isinstance(completed, StreamedProcess) else []
+                data = result_envelope(events) or self._parse_json_output(completed.stdout)
         except subprocess.TimeoutExpired:
             result.answer_error = f"claude timed out after {_TIMEOUT_SECONDS}s"
             result.metrics = RunMetrics(execution_time_s=time.perf_counter() - t_start)
@@ -147,7 +160,10 @@ class ClaudeCodeLocalRunner(BaseRunner):
         else:
             answer_text = None
 
-        tool_sequence = self._extract_tool_sequence(data.get("tool_uses"))
+        tool_calls = stream_json_tool_calls(events)
+        tool_sequence = [name for name, _ in tool_calls] or self._extract_tool_sequence(data.get("tool_uses"))
+        # A lone envelope arrives when the run is over; it says nothing about latency.
+        first_event_s = events[0].elapsed_s if events and not is_result_envelope(events[0].payload) else None
         tokens = self._extract_tokens(data.get("usage"))
 
         result.answer_text = answer_text
@@ -163,6 +179,8 @@ class ClaudeCodeLocalRunner(BaseRunner):
             tokens=tokens,
             tool_call_sequence=tool_sequence,
             corpus_used=len(tool_sequence) > 0,
+            time_to_first_event_s=first_event_s,
+            tool_call_durations_s=[duration for _, duration in tool_calls],
         )
         return result
 
@@ -182,22 +200,21 @@ class ClaudeCodeLocalRunner(BaseRunner):
         for _var in ("CLAUDECODE", "AI_AGENT", "CLAUDE_CODE_ENTRYPOINT", "CLAUDE_CODE_EXECPATH"):
             env.pop(_var, None)
 
-        return subprocess.run(
+        return run_jsonl_stream(
             cmd,
-            cwd=str(workspace),
+            cwd=workspace,
             env=env,
-            capture_output=True,
-            text=True,
             timeout=_TIMEOUT_SECONDS,
-            check=False,
+            label="claude",
+            is_terminal=is_result_envelope,
         )
 
     @staticmethod
     def _parse_json_output(stdout: str) -> Optional[dict[str, Any]]:
         if not stdout:
             return None
-        # Claude Code emits a single JSON envelope on stdout, but be tolerant
-        # of leading/trailing whitespace or stray banner lines.
+        # Fallback for output that was not streamed as events: a single JSON
+        # envelope, tolerating leading/trailing whitespace or stray banner lines.
         stripped = stdout.strip()
         try:
             return json.loads(stripped)
@@ -1,7 +1,6 @@
 import json
 import os
 import subprocess
-import tempfile
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -12,6 +11,14 @@ from experiment_runner.models.question import Question
 from experiment_runner.models.result import RunResult
 from experiment_runner.models.trace import SessionTrace
 from experiment_runner.runners.base import BaseRunner
+from experiment_runner.runners.baseline.streaming import (
+    StreamedProcess,
+    is_result_envelope,
+    result_envelope,
+    run_jsonl_stream,
+    stream_json_tool_calls,
+)
+from experiment_runner.runners.baseline.workspace_pool import WorkspacePool, sandbox_workspace
 
 # Per-question wall-clock budget for the ClawCode subprocess.
 _TIMEOUT_SECONDS = 180
@@ -37,7 +44,8 @@ def build_claw_command(*, model: str, prompt: str) -> list[str]:
         "--model",
         normalize_claw_model(model),
         "--output-format",
-        "json",
+        "stream-json",
+        "--verbose",
         "--permission-mode",
         "workspace-write",
         "--allowedTools",
@@ -56,18 +64,22 @@ def claw_environment_overrides() -> dict[str, str]:
 class ClawCodeRunner(BaseRunner):
     """Runner for the ClawCode CLI baseline.
 
-    Each question is executed inside a fresh temporary workspace so the real
+    Each question is executed inside a clean sandbox workspace so the real
     corpus directory is never written to and concurrent runs cannot interfere
     with each other. The corpus is exposed to ClawCode via a single symlink
-    inside the temp workspace, which keeps file paths stable in the model's
+    inside the workspace, which keeps file paths stable in the model's
     context while still letting the framework operate in `workspace-write` mode.
 
-    The runner shells out to `claw` with `--output-format json`, captures
-    stdout, and maps the JSON envelope onto the framework's RunResult /
-    RunMetrics types. Any subprocess, parsing, or I/O failure is converted into
+    The runner shells out to `claw` with `--output-format stream-json
+    --verbose`, times the tool calls and first event of the stream, and maps
+    the final envelope onto the framework's RunResult / RunMetrics types. Any subprocess, parsing, or I/O failure is converted into
     a populated `answer_error` instead of a raised exception.
     """
 
+    # Set by the run loop to recycle sandboxes across runs; a fresh
+    # temporary directory is used per run when left unset.
+    workspace_pool: Optional[WorkspacePool] = None
+
     def run(self, question: Question) -> RunResult:
         result = self._base_result(question)
 
@@ -85,12 +97,11 @@ class ClawCodeRunner(BaseRunner):
         t_start = time.perf_counter()
 
         try:
-            with tempfile.TemporaryDirectory(prefix="clawcode_run_") as tmp:
-                workspace = Path(tmp)
-                # Mirror the corpus into the sandbox via a symlink so ClawCode
-                # sees the content under a predictable, sandboxed path.
-                corpus_link = workspace / "corpus"
-                corpus_link.symlink_to(corpus_root, target_is_directory=True)
+            # The sandbox mirrors the corpus via a ``corpus`` symlink so
+            # ClawCode sees the content under a predictable, sandboxed path.
+            with sandbox_workspace(
+                self.workspace_pool, corpus_root, prefix="clawcode_run_"
+            ) as workspace:
 
                 completed = self._invoke_claw(
                     self._build_prompt(question.question),
@@ -107,7 +118,8 @@ class ClawCodeRunner(BaseRunner):
                     )
                     return result
 
-                data = self._parse_json_output(completed.stdout)
+                events = completed.events if isinstance(completed, StreamedProcess) else []
+                data = result_envelope(events) or self._parse_json_output(completed.stdout)
         except subprocess.TimeoutExpired:
             result.answer_error = f"claw timed out after {_TIMEOUT_SECONDS}s"
             result.metrics = RunMetrics(execution_time_s=time.perf_counter() - t_start)
@@ -134,7 +146,10 @@ class ClawCodeRunner(BaseRunner):
         else:
             answer_text = None
 
-        tool_sequence = self._extract_tool_sequence(data.get("tool_uses"))
+        tool_calls = stream_json_tool_calls(events)
+        tool_sequence = [name for name, _ in tool_calls] or self._extract_tool_sequence(data.get("tool_uses"))
+        # A lone envelope arrives when the run is over; it says nothing about latency.
+        first_event_s = events[0].elapsed_s if events and not is_result_envelope(events[0].payload) else None
         tokens = self._extract_tokens(data.get("usage"))
 
         result.answer_text = answer_text
@@ -150,6 +165,8 @@ class ClawCodeRunner(BaseRunner):
             tokens=tokens,
             tool_call_sequence=tool_sequence,
             corpus_used=len(tool_sequence) > 0,
+            time_to_first_event_s=first_event_s,
+            tool_call_durations_s=[duration for _, duration in tool_calls],
         )
         return result
 
@@ -167,22 +184,21 @@ class ClawCodeRunner(BaseRunner):
         env.pop("ANTHROPIC_API_KEY", None)
         env.pop("DASHSCOPE_API_KEY", None)
 
-        return subprocess.run(
+        return run_jsonl_stream(
             cmd,
-            cwd=str(workspace),
+            cwd=workspace,
             env=env,
-            capture_output=True,
-            text=True,
             timeout=_TIMEOUT_SECONDS,
-            check=False,
+            label="claw",
+            is_terminal=is_result_envelope,
         )
 
     @staticmethod
     def _parse_json_output(stdout: str) -> Optional[dict[str, Any]]:
         if not stdout:
             return None
-        # ClawCode is documented to emit a single JSON envelope on stdout, but
-        # be tolerant of leading/trailing whitespace or stray banner lines.
+        # Fallback for output that was not streamed as events: a single JSON
+        # envelope, tolerating leading/trailing whitespace or stray banner lines.
         stripped = stdout.strip()
         try:
             return json.loads(stripped)
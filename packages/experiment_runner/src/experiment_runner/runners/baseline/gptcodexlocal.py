@@ -1,7 +1,6 @@
 import json
 import os
 import subprocess
-import tempfile
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -12,6 +11,8 @@ from experiment_runner.models.question import Question
 from experiment_runner.models.result import RunResult
 from experiment_runner.models.trace import SessionTrace, TraceStep
 from experiment_runner.runners.base import BaseRunner
+from experiment_runner.runners.baseline.streaming import StreamedProcess, run_jsonl_stream
+from experiment_runner.runners.baseline.workspace_pool import WorkspacePool, sandbox_workspace
 
 # Per-question wall-clock budget for the Codex subprocess.
 _TIMEOUT_SECONDS = 180
@@ -19,6 +20,9 @@ _TIMEOUT_SECONDS = 180
 # Ollama local provider identifier passed to the Codex CLI.
 _LOCAL_PROVIDER = "ollama"
 
+# Codex ends every ``exec`` turn with one of these; anything after is shutdown.
+_TERMINAL_EVENT_TYPES = frozenset({"turn.completed", "turn.failed"})
+
 
 def build_codex_command(*, model: str, prompt: str) -> list[str]:
     return [
@@ -36,10 +40,10 @@ def build_codex_command(*, model: str, prompt: str) -> list[str]:
 class GptCodexLocalRunner(BaseRunner):
     """Runner for the OpenAI Codex CLI baseline against a local Ollama model.
 
-    Each question is executed inside a fresh temporary workspace so the real
+    Each question is executed inside a clean sandbox workspace so the real
     corpus directory is never written to and concurrent runs cannot interfere
     with each other. The corpus is exposed via a single symlink at ``./corpus``
-    inside the temp workspace, keeping file paths stable in the model's context.
+    inside the workspace, keeping file paths stable in the model's context.
 
     The Codex CLI is invoked in read-only sandbox mode with a local Ollama
     provider, so the agent can read corpus files but cannot mutate the
@@ -50,10 +54,14 @@ class GptCodexLocalRunner(BaseRunner):
 
     The prompt is passed as the final positional argument (no ``-p`` flag).
 
-    Codex emits JSON Lines on stdout — one object per event. The runner
-    scans the stream for ``item.completed`` events whose ``item.type`` is
-    ``"agent_message"`` and uses the last such item's ``text`` field as the
-    answer. Token counts are extracted from the ``turn.completed`` event.
+    Codex emits JSON Lines on stdout — one object per event. The stream is
+    parsed as it arrives (see ``streaming.run_jsonl_stream``) so every event
+    is timestamped and the CLI is stopped shortly after ``turn.completed``.
+    The runner scans the stream for ``item.completed`` events whose
+    ``item.type`` is ``"agent_message"`` and uses the last such item's
+    ``text`` field as the answer. Token counts are extracted from the
+    ``turn.completed`` event; the first event time and paired
+    ``item.started``/``item.completed`` times give TTFT and tool durations.
     Stderr lines (e.g. Codex model-download progress or non-fatal error logs)
     are tolerated and not treated as failures; only a non-zero exit code or a
     missing agent_message triggers an error.
@@ -62,6 +70,10 @@ class GptCodexLocalRunner(BaseRunner):
     ``answer_error`` instead of a raised exception.
     """
 
+    # Set by the run loop to recycle sandboxes across runs; a fresh
+    # temporary directory is used per run when left unset.
+    workspace_pool: Optional[WorkspacePool] = None
+
     def run(self, question: Question) -> RunResult:
         result = self._base_result(question)
 
@@ -79,10 +91,9 @@ class GptCodexLocalRunner(BaseRunner):
         t_start = time.perf_counter()
 
         try:
-            with tempfile.TemporaryDirectory(prefix="codex_run_") as tmp:
-                workspace = Path(tmp)
-                corpus_link = workspace / "corpus"
-                corpus_link.symlink_to(corpus_root, target_is_directory=True)
+            with sandbox_workspace(
+                self.workspace_pool, corpus_root, prefix="codex_run_"
+            ) as workspace:
 
                 completed = self._invoke_codex(
                     self._build_prompt(question.question),
@@ -99,7 +110,12 @@ class GptCodexLocalRunner(BaseRunner):
                     )
                     return result
 
-                events = self._parse_jsonlines(completed.stdout)
+                if isinstance(completed, StreamedProcess):
+                    events = [event.payload for event in completed.events]
+                    event_times: Optional[list[float]] = [event.elapsed_s for event in completed.events]
+                else:
+                    events = self._parse_jsonlines(completed.stdout)
+                    event_times = None
 
         except subprocess.TimeoutExpired:
             result.answer_error = f"codex timed out after {_TIMEOUT_SECONDS}s"
@@ -122,13 +138,15 @@ class GptCodexLocalRunner(BaseRunner):
 
         result.answer_text = answer_text
         if self.config.store_trace:
-            result.trace = SessionTrace(steps=self._extract_steps(events))
+            result.trace = SessionTrace(steps=self._extract_steps(events, event_times))
         result.metrics = RunMetrics(
             execution_time_s=execution_time,
             tokens=tokens,
             tool_call_count=len(tool_sequence),
             tool_call_sequence=tool_sequence,
             corpus_used=len(tool_sequence) > 0,
+            time_to_first_event_s=event_times[0] if event_times else None,
+            tool_call_durations_s=self._extract_tool_durations(events, event_times),
         )
         return result
 
@@ -145,14 +163,13 @@ class GptCodexLocalRunner(BaseRunner):
         for _var in ("CLAUDECODE", "AI_AGENT", "CLAUDE_CODE_ENTRYPOINT", "CLAUDE_CODE_EXECPATH"):
             env.pop(_var, None)
 
-        return subprocess.run(
+        return run_jsonl_stream(
             cmd,
-            cwd=str(workspace),
+            cwd=workspace,
             env=env,
-            capture_output=True,
-            text=True,
             timeout=_TIMEOUT_SECONDS,
-            check=False,
+            label="codex",
+            is_terminal=lambda event: event.get("type") in _TERMINAL_EVENT_TYPES,
         )
 
     @staticmethod
@@ -170,12 +187,16 @@ class GptCodexLocalRunner(BaseRunner):
         return events
 
     @staticmethod
-    def _extract_steps(events: list[dict[str, Any]]) -> list[TraceStep]:
+    def _extract_steps(
+        events: list[dict[str, Any]],
+        event_times: Optional[list[float]] = None,
+    ) -> list[TraceStep]:
         """Convert item.completed events into ordered TraceStep records."""
         steps: list[TraceStep] = []
-        for event in events:
+        for index, event in enumerate(events):
             if event.get("type") != "item.completed":
                 continue
+            step_count = len(steps)
             item = event.get("item")
             if not isinstance(item, dict):
                 continue
@@ -199,6 +220,8 @@ class GptCodexLocalRunner(BaseRunner):
                         output=json.dumps(item, ensure_ascii=False),
                     )
                 )
+            if event_times is not None and len(steps) > step_count:
+                steps[-1].elapsed_s = event_times[index]
         return steps
 
     @staticmethod
@@ -233,6 +256,30 @@ class GptCodexLocalRunner(BaseRunner):
             sequence.append(GptCodexLocalRunner._tool_name(item))
         return sequence
 
+    @staticmethod
+    def _extract_tool_durations(
+        events: list[dict[str, Any]],
+        event_times: Optional[list[float]],
+    ) -> list[Optional[float]]:
+        """Pair item.started/item.completed by item id; aligned with the tool sequence."""
+        if event_times is None:
+            return []
+        started: dict[str, float] = {}
+        durations: list[Optional[float]] = []
+        for event, elapsed in zip(events, event_times):
+            item = event.get("item")
+            if not isinstance(item, dict):
+                continue
+            item_id = item.get("id")
+            if event.get("type") == "item.started" and isinstance(item_id, str):
+                started[item_id] = elapsed
+            elif event.get("type") == "item.completed":
+                if not GptCodexLocalRunner._is_tool_call_item_type(item.get("type")):
+                    continue
+                start = started.get(item_id) if isinstance(item_id, str) else None
+                durations.append(elapsed - start if start is not None else None)
+        return durations
+
     @staticmethod
     def _is_tool_call_item_type(item_type: Any) -> bool:
         if not isinstance(item_type, str):
@@ -0,0 +1,254 @@
+"""Streaming JSON Lines subprocess adapter for the CLI baselines.
+
+``subprocess.run(capture_output=True)`` only hands the output over after the
+CLI exits, which hides progress, loses per-event timing, and waits for CLIs
+that linger (telemetry flushes, MCP shutdown) long after the answer is out.
+``run_jsonl_stream`` reads stdout incrementally instead: each complete JSON
+object line becomes a timestamped ``StreamEvent``, a one-line summary is
+forwarded to stderr (which suite logs capture), and once ``is_terminal``
+accepts an event the child gets a short grace period to exit on its own
+before its process group is terminated.
+
+``claude`` and ``claw`` stream with ``--output-format stream-json``:
+``assistant`` and ``user`` events carry Anthropic-style messages whose
+``tool_use``/``tool_result`` blocks ``stream_json_tool_calls`` pairs up, and
+the run ends with the envelope ``is_result_envelope`` recognizes.
+"""
+from __future__ import annotations
+
+import json
+import os
+import selectors
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# How long a CLI may linger after its terminal event before it is stopped.
+_TERMINAL_GRACE_S = 2.0
+_KILL_GRACE_S = 2.0
+_READ_CHUNK = 65536
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    payload: dict[str, Any]
+    # Seconds since the process was launched.
+    elapsed_s: float
+
+
+class StreamedProcess(subprocess.CompletedProcess):
+    """``CompletedProcess`` plus the timestamped events parsed from stdout.
+
+    When the child was stopped after its terminal event, ``terminated_early``
+    is set and ``returncode`` is reported as 0: the run itself completed.
+    """
+
+    def __init__(
+        self,
+        args: list[str],
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        events: list[StreamEvent],
+        terminated_early: bool = False,
+    ) -> None:
+        super().__init__(args, returncode, stdout, stderr)
+        self.events = events
+        self.terminated_early = terminated_early
+
+
+def run_jsonl_stream(
+    cmd: list[str],
+    *,
+    cwd: str | Path,
+    env: dict[str, str],
+    timeout: float,
+    label: str,
+    is_terminal: Callable[[dict[str, Any]], bool],
+    grace_s: float = _TERMINAL_GRACE_S,
+) -> StreamedProcess:
+    """Run ``cmd`` and parse its stdout as JSON Lines while it is produced.
+
+    Raises ``subprocess.TimeoutExpired`` (after killing the process group)
+    when ``timeout`` elapses before the child exits or emits a terminal event,
+    and ``FileNotFoundError`` when the executable is missing, mirroring
+    ``subprocess.run``.
+    """
+    started = time.perf_counter()
+    deadline = started + timeout
+    process = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+        start_new_session=True,
+    )
+    assert process.stdout is not None and process.stderr is not None
+    stdout_raw = bytearray()
+    stderr_raw = bytearray()
+    pending = bytearray()
+    events: list[StreamEvent] = []
+    terminal_at: Optional[float] = None
+
+    def handle_line(raw_line: bytes) -> None:
+        nonlocal terminal_at
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        if not line.startswith("{"):
+            return
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(payload, dict):
+            return
+        elapsed = time.perf_counter() - started
+        events.append(StreamEvent(payload=payload, elapsed_s=elapsed))
+        sys.stderr.write(f"  {label} +{elapsed:.1f}s {_describe(payload)}\n")
+        sys.stderr.flush()
+        if terminal_at is None and is_terminal(payload):
+            terminal_at = time.perf_counter()
+
+    selector = selectors.DefaultSelector()
+    selector.register(process.stdout, selectors.EVENT_READ, "stdout")
+    selector.register(process.stderr, selectors.EVENT_READ, "stderr")
+    try:
+        while selector.get_map():
+            now = time.perf_counter()
+            if terminal_at is not None and now - terminal_at >= grace_s:
+                break
+            if now >= deadline:
+                _terminate_process_group(process)
+                raise subprocess.TimeoutExpired(
+                    cmd,
+                    timeout,
+                    output=bytes(stdout_raw).decode("utf-8", errors="replace"),
+                    stderr=bytes(stderr_raw).decode("utf-8", errors="replace"),
+                )
+            wait_s = deadline - now
+            if terminal_at is not None:
+                wait_s = min(wait_s, terminal_at + grace_s - now)
+            for key, _ in selector.select(timeout=max(wait_s, 0.0)):
+                chunk = os.read(key.fileobj.fileno(), _READ_CHUNK)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    if key.data == "stdout" and pending:
+                        handle_line(bytes(pending))
+                        pending.clear()
+                    continue
+                if key.data == "stderr":
+                    stderr_raw.extend(chunk)
+                    continue
+                stdout_raw.extend(chunk)
+                pending.extend(chunk)
+                while b"\n" in pending:
+                    raw_line, _, rest = bytes(pending).partition(b"\n")
+                    pending[:] = rest
+                    handle_line(raw_line)
+
+        terminated_early = False
+        if terminal_at is not None and process.poll() is None:
+            _terminate_process_group(process)
+            terminated_early = True
+        try:
+            returncode = process.wait(timeout=max(deadline - time.perf_counter(), 0.1))
+        except subprocess.TimeoutExpired:
+            _terminate_process_group(process)
+            raise
+    finally:
+        selector.close()
+        process.stdout.close()
+        process.stderr.close()
+        if process.poll() is None:
+            _terminate_process_group(process)
+
+    return StreamedProcess(
+        args=cmd,
+        returncode=0 if terminated_early else returncode,
+        stdout=bytes(stdout_raw).decode("utf-8", errors="replace"),
+        stderr=bytes(stderr_raw).decode("utf-8", errors="replace"),
+        events=events,
+        terminated_early=terminated_early,
+    )
+
+
+def is_result_envelope(event: dict[str, Any]) -> bool:
+    """Whether ``event`` is the final JSON envelope of ``claude -p`` or ``claw``.
+
+    Claude Code tags it ``"type": "result"``; ClawCode prints an untyped object
+    carrying the answer next to its usage or session fields. Streamed
+    ``assistant``/``user`` events also carry a ``message`` and never match.
+    """
+    if event.get("type") == "result":
+        return True
+    if "type" in event:
+        return False
+    has_answer = "result" in event or "message" in event
+    return has_answer and ("usage" in event or "session_id" in event)
+
+
+def result_envelope(events: list[StreamEvent]) -> Optional[dict[str, Any]]:
+    """The last final envelope among ``events``, if any."""
+    for event in reversed(events):
+        if is_result_envelope(event.payload):
+            return event.payload
+    return None
+
+
+def stream_json_tool_calls(events: list[StreamEvent]) -> list[tuple[str, Optional[float]]]:
+    """(name, duration in seconds) of every tool call in a ``stream-json`` stream.
+
+    A call is a ``tool_use`` block of a streamed message; it is timed until the
+    ``tool_result`` block with its id arrives, and None when that never does.
+    """
+    calls: list[tuple[str, Optional[float]]] = []
+    started: dict[str, tuple[int, float]] = {}
+    for event in events:
+        message = event.payload.get("message")
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, list):
+            continue
+        for block in content:
+            if not isinstance(block, dict):
+                continue
+            if block.get("type") == "tool_use" and isinstance(block.get("name"), str):
+                if isinstance(block.get("id"), str):
+                    started[block["id"]] = (len(calls), event.elapsed_s)
+                calls.append((block["name"], None))
+            elif block.get("type") == "tool_result" and isinstance(block.get("tool_use_id"), str):
+                call = started.pop(block["tool_use_id"], None)
+                if call is not None:
+                    index, started_s = call
+                    calls[index] = (calls[index][0], event.elapsed_s - started_s)
+    return calls
+
+
+def _describe(payload: dict[str, Any]) -> str:
+    parts = [str(payload.get("type") or "event")]
+    item = payload.get("item")
+    if isinstance(item, dict) and item.get("type"):
+        parts.append(str(item["type"]))
+    return " ".join(parts)
+
+
+def _terminate_process_group(process: subprocess.Popen) -> None:
+    if process.poll() is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except OSError:
+        process.terminate()
+    try:
+        process.wait(timeout=_KILL_GRACE_S)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            process.kill()
+        process.wait()
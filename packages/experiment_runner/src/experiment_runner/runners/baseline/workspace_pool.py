@@ -0,0 +1,104 @@
+"""Recycled sandbox workspaces for the CLI baseline runners.
+
+Every CLI baseline run happens in a scratch directory that contains nothing
+but a ``corpus`` symlink. ``WorkspacePool`` creates ``size`` of them up front
+and hands them out one per run; a workspace comes back into the pool only if
+the run left it as it found it, otherwise it is deleted and replaced. Because
+there are exactly ``size`` workspaces, checking one out also bounds how many
+CLI subprocesses run at the same time.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import queue
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+_CORPUS_LINK = "corpus"
+
+
+class WorkspacePool:
+    def __init__(self, size: int, *, prefix: str = "baseline_ws_") -> None:
+        if size < 1:
+            raise ValueError(f"workspace pool size must be at least 1, got {size}")
+        self.size = size
+        self.recycled = 0
+        self.discarded = 0
+        self._root = Path(tempfile.mkdtemp(prefix=prefix))
+        self._indices = itertools.count(1)
+        self._free: queue.Queue[Path] = queue.Queue()
+        for _ in range(size):
+            self._free.put(self._new_workspace())
+
+    def __enter__(self) -> WorkspacePool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @contextmanager
+    def checkout(self, corpus_root: Path) -> Iterator[Path]:
+        """Borrow a clean workspace whose ``corpus`` symlink points at ``corpus_root``.
+
+        Blocks while all ``size`` workspaces are in use.
+        """
+        workspace = self._free.get()
+        try:
+            (workspace / _CORPUS_LINK).symlink_to(corpus_root, target_is_directory=True)
+            yield workspace
+        finally:
+            self._free.put(self._recycle(workspace))
+
+    def close(self) -> None:
+        shutil.rmtree(self._root, ignore_errors=True)
+
+    def _recycle(self, workspace: Path) -> Path:
+        if _is_clean(workspace):
+            try:
+                (workspace / _CORPUS_LINK).unlink(missing_ok=True)
+            except OSError:
+                pass
+            else:
+                self.recycled += 1
+                return workspace
+        shutil.rmtree(workspace, ignore_errors=True)
+        self.discarded += 1
+        return self._new_workspace()
+
+    def _new_workspace(self) -> Path:
+        workspace = self._root / f"ws{next(self._indices):04d}"
+        workspace.mkdir()
+        return workspace
+
+
+@contextmanager
+def sandbox_workspace(
+    pool: Optional[WorkspacePool],
+    corpus_root: Path,
+    *,
+    prefix: str,
+) -> Iterator[Path]:
+    """Workspace for one run: from ``pool`` when given, else a throwaway temp dir."""
+    if pool is not None:
+        with pool.checkout(corpus_root) as workspace:
+            yield workspace
+        return
+    with tempfile.TemporaryDirectory(prefix=prefix) as tmp:
+        workspace = Path(tmp)
+        (workspace / _CORPUS_LINK).symlink_to(corpus_root, target_is_directory=True)
+        yield workspace
+
+
+def _is_clean(workspace: Path) -> bool:
+    """True when ``workspace`` holds nothing but (at most) the corpus symlink."""
+    try:
+        entries = os.listdir(workspace)
+    except OSError:
+        return False
+    if not entries:
+        return True
+    return entries == [_CORPUS_LINK] and (workspace / _CORPUS_LINK).is_symlink()
@@ -0,0 +1,155 @@
+"""Mock system for benchmarking the suite scheduler without a model.
+
+``MockRunner`` sleeps for a sampled latency and answers with sentences taken
+verbatim from the corpus, each cited with its real file and line range, so the
+result processor classifies every claim as resolvable. It is driven entirely
+by environment variables, because suite tasks run it in a subprocess:
+
+* ``EXPERIMENT_RUNNER_MOCK_LATENCY``: ``fixed:S``, ``uniform:LO,HI``,
+  ``normal:MEAN,STDDEV`` or ``lognormal:MU,SIGMA`` seconds (default
+  ``fixed:0``);
+* ``EXPERIMENT_RUNNER_MOCK_FAIL_RATE``: share of questions answered with an
+  ``answer_error``;
+* ``EXPERIMENT_RUNNER_MOCK_HANG_RATE``: share of questions that never return,
+  to exercise timeouts and cancellation;
+* ``EXPERIMENT_RUNNER_MOCK_SEED``: seed for the above.
+
+Every random choice is seeded per question ID, so a question fails, hangs or
+cites the same lines on every run.
+"""
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from experiment_runner.models.metrics import RunMetrics
+from experiment_runner.models.question import Question
+from experiment_runner.models.result import RunResult
+from experiment_runner.runners.base import BaseRunner
+
+_LATENCY_ENV = "EXPERIMENT_RUNNER_MOCK_LATENCY"
+_FAIL_RATE_ENV = "EXPERIMENT_RUNNER_MOCK_FAIL_RATE"
+_HANG_RATE_ENV = "EXPERIMENT_RUNNER_MOCK_HANG_RATE"
+_SEED_ENV = "EXPERIMENT_RUNNER_MOCK_SEED"
+
+_CLAIMS_PER_ANSWER = 3
+_TEXT_SUFFIXES = frozenset({".md", ".txt"})
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    kind: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        kind, _, raw_params = spec.strip().partition(":")
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if kind not in expected:
+            raise ValueError(f"unknown mock latency distribution {kind!r} in {spec!r}")
+        try:
+            params = tuple(float(value) for value in raw_params.split(",")) if raw_params else ()
+        except ValueError as exc:
+            raise ValueError(f"invalid mock latency parameters in {spec!r}") from exc
+        if len(params) != expected[kind]:
+            raise ValueError(f"{kind} mock latency takes {expected[kind]} parameter(s), got {spec!r}")
+        return cls(kind, params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        else:
+            value = rng.lognormvariate(*self.params)
+        return max(value, 0.0)
+
+
+@dataclass(frozen=True)
+class MockSettings:
+    latency: LatencyDistribution
+    fail_rate: float = 0.0
+    hang_rate: float = 0.0
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls) -> "MockSettings":
+        try:
+            return cls(
+                latency=LatencyDistribution.parse(os.environ.get(_LATENCY_ENV) or "fixed:0"),
+                fail_rate=float(os.environ.get(_FAIL_RATE_ENV) or 0.0),
+                hang_rate=float(os.environ.get(_HANG_RATE_ENV) or 0.0),
+                seed=int(os.environ.get(_SEED_ENV) or 0),
+            )
+        except ValueError as exc:
+            raise ValueError(f"invalid mock runner settings: {exc}") from exc
+
+
+class MockRunner(BaseRunner):
+    """Runner for ``SystemName.MOCK``; see the module docstring for settings."""
+
+    def __init__(self, config) -> None:
+        super().__init__(config)
+        self.settings = MockSettings.from_env()
+        self._documents: list[tuple[str, list[str]]] | None = None
+
+    def run(self, question: Question) -> RunResult:
+        result = self._base_result(question)
+        rng = random.Random(f"{self.settings.seed}:{question.id}")
+        latency_s = self.settings.latency.sample(rng)
+        roll = rng.random()
+
+        t_start = time.perf_counter()
+        if roll < self.settings.hang_rate:
+            while True:
+                time.sleep(3600)
+        time.sleep(latency_s)
+
+        if roll < self.settings.hang_rate + self.settings.fail_rate:
+            result.answer_error = f"mock failure for {question.id}"
+        else:
+            claims = self._cite(rng)
+            result.answer_text = " ".join(claims) or "The mock system found no text in the corpus."
+        result.metrics = RunMetrics(
+            execution_time_s=time.perf_counter() - t_start,
+            tool_call_count=0,
+            corpus_used=result.answer_text is not None and "[file:" in result.answer_text,
+        )
+        return result
+
+    def _cite(self, rng: random.Random) -> list[str]:
+        documents = self._load_documents()
+        claims = []
+        for relative, lines in rng.sample(documents, min(_CLAIMS_PER_ANSWER, len(documents))):
+            candidates = [index for index, line in enumerate(lines) if line.strip()]
+            if not candidates:
+                continue
+            index = rng.choice(candidates)
+            claims.append(f"[{lines[index].strip()}] [file:{relative}, lines:{index}-{index + 1}]")
+        return claims
+
+    def _load_documents(self) -> list[tuple[str, list[str]]]:
+        if self._documents is None:
+            root = Path(self.config.path_to_corpora) if self.config.path_to_corpora else None
+            self._documents = []
+            if root is not None and root.is_dir():
+                for path in sorted(root.rglob("*")):
+                    if path.suffix in _TEXT_SUFFIXES and path.is_file():
+                        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+                        self._documents.append((path.relative_to(root).as_posix(), lines))
+        return self._documents
+
+
+def write_synthetic_corpus(root: Path, *, documents: int = 8, lines_per_document: int = 40) -> None:
+    """Write a small markdown corpus under ``root/text`` for mock and benchmark runs."""
+    text_dir = root / "text"
+    text_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(1, documents + 1):
+        lines = [f"Document {index} describes synthetic planet number {index}."] + [
+            f"Line {line} of document {index} records fact {index * 1000 + line}."
+            for line in range(1, lines_per_document)
+        ]
+        (text_dir / f"doc{index}.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -13,6 +13,12 @@ DISABLED_SYSTEMS: frozenset[SystemName] = frozenset({
     SystemName.OPENCLAW,
 })
 
+# Systems left out of the dashboard's system pickers unless
+# EXPERIMENT_RUNNER_SHOW_HIDDEN_SYSTEMS=1 (they still run from the CLI).
+HIDDEN_SYSTEMS: frozenset[SystemName] = frozenset({
+    SystemName.MOCK,
+})
+
 SYSTEM_AUTOMATION_LEVELS: dict[SystemName, AutomationLevel] = {
     SystemName.ACE: AutomationLevel.FULL,
     SystemName.CLAUDE_CODE_LOCAL: AutomationLevel.FULL,
@@ -24,6 +30,7 @@ SYSTEM_AUTOMATION_LEVELS: dict[SystemName, AutomationLevel] = {
     SystemName.OPEN_WEBUI: AutomationLevel.MANUAL,
     SystemName.PRIVATEGPT: AutomationLevel.MANUAL,
     SystemName.PERPLEXITY: AutomationLevel.MANUAL,
+    SystemName.MOCK: AutomationLevel.FULL,
 }
 
 
@@ -35,6 +42,7 @@ def _build_registry() -> dict[SystemName, type[BaseRunner]]:
     from experiment_runner.runners.baseline.gptcodexlocal import GptCodexLocalRunner
     from experiment_runner.runners.baseline.openclaw import OpenClawRunner
     from experiment_runner.runners.manual import ManualRunner
+    from experiment_runner.runners.mock import MockRunner
 
     return {
         SystemName.ACE: AceRunner,
@@ -47,15 +55,20 @@ def _build_registry() -> dict[SystemName, type[BaseRunner]]:
         SystemName.OPEN_WEBUI: ManualRunner,
         SystemName.PRIVATEGPT: ManualRunner,
         SystemName.PERPLEXITY: ManualRunner,
+        SystemName.MOCK: MockRunner,
     }
 
 
-def get_runner(config: RunConfig) -> BaseRunner:
+def get_runner_class(system: SystemName) -> type[BaseRunner]:
     global _REGISTRY
     if _REGISTRY is None:
         _REGISTRY = _build_registry()
 
-    runner_cls = _REGISTRY.get(config.system)
+    runner_cls = _REGISTRY.get(system)
     if runner_cls is None:
-        raise ValueError(f"No runner registered for system: {config.system!r}")
-    return runner_cls(config)
+        raise ValueError(f"No runner registered for system: {system!r}")
+    return runner_cls
+
+
+def get_runner(config: RunConfig) -> BaseRunner:
+    return get_runner_class(config.system)(config)
@@ -0,0 +1,185 @@
+"""Wall-clock estimate for a suite before it is launched.
+
+Every task that still has to run is given the past wall times of the most
+specific group with history: (system, model, corpus, level), then (system,
+model, level) over all corpora, then (system, model). Wall times are the suite
+runner's start-to-exit records in ``<output_dir>/result_index.db``, so they
+include process start-up, imports and corpus preparation; failed tasks count
+too, since they hold up the suite just as long. A task with no history at all
+is assumed to run into its timeout, which keeps the estimate on the
+pessimistic side and is reported as ``tasks_without_history``.
+
+The expected total is the sum of per-task means, which is the estimate for
+``run_suite``: it runs tasks one at a time. Percentiles come from a seeded
+Monte Carlo simulation in which each trial draws one past wall time per task.
+``parallelism`` is a what-if view on top of that: the same draws handed, in
+suite order, to the earliest free of ``workers`` slots, assuming tasks would
+not slow each other down.
+"""
+from __future__ import annotations
+
+import heapq
+import random
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import fmean
+from typing import Sequence
+
+from experiment_runner.models.suite import ExperimentSuiteConfig, SuiteTask, SuiteTaskStatus
+from experiment_runner.result_cache import result_index_path
+from experiment_runner.timeout_policy import quantile
+
+# (system, model, corpus, level) -> past suite-task wall times in seconds.
+DurationSamples = dict[tuple[str, str, str, int], list[float]]
+
+# Upper bound on simulated task draws, so huge suites still estimate quickly.
+_SIMULATION_BUDGET = 2_000_000
+_MIN_TRIALS = 20
+
+
+@dataclass(frozen=True)
+class ParallelismEstimate:
+    """What-if makespan with ``workers`` concurrent tasks, assuming linear scaling."""
+
+    workers: int
+    expected_s: float
+    p90_s: float
+
+
+@dataclass(frozen=True)
+class SuiteEstimate:
+    tasks: int
+    pending_tasks: int
+    cached_tasks: int
+    tasks_without_history: int
+    expected_total_s: float
+    p90_total_s: float
+    # Times the scheduler switches to a different model, counting the first.
+    model_loads: int
+    # Hypothetical: run_suite itself runs one task at a time.
+    parallelism: list[ParallelismEstimate] = field(default_factory=list)
+    # Mean past duration (or timeout) per pending task_id.
+    task_expected_s: dict[str, float] = field(default_factory=dict)
+
+
+def estimate_suite(
+    config: ExperimentSuiteConfig,
+    tasks: Sequence[SuiteTask],
+    *,
+    workers: Sequence[int] = (1, 2, 4),
+    trials: int = 200,
+    seed: int = 0,
+) -> SuiteEstimate:
+    if not workers or min(workers) < 1:
+        raise ValueError("parallelism values must be at least 1")
+    pending = [task for task in tasks if task.status != SuiteTaskStatus.SUCCEEDED]
+    samples = load_duration_samples(config.output_dir)
+    pooled = _pool(samples)
+
+    draws: list[list[float]] = []
+    without_history = 0
+    for task in pending:
+        durations = _durations_for(task, samples, pooled)
+        if not durations:
+            without_history += 1
+            durations = [float(task.timeout_s or config.task_timeout_s)]
+        draws.append(durations)
+
+    task_expected_s = {task.task_id: fmean(durations) for task, durations in zip(pending, draws)}
+    trials = max(_MIN_TRIALS, min(trials, _SIMULATION_BUDGET // max(len(pending), 1)))
+    rng = random.Random(seed)
+    makespans: dict[int, list[float]] = {count: [] for count in workers}
+    totals: list[float] = []
+    for _ in range(trials):
+        durations = [rng.choice(options) for options in draws]
+        totals.append(sum(durations))
+        for count in workers:
+            makespans[count].append(_makespan(durations, count))
+
+    return SuiteEstimate(
+        tasks=len(tasks),
+        pending_tasks=len(pending),
+        cached_tasks=sum(1 for task in tasks if task.cache_hit),
+        tasks_without_history=without_history,
+        expected_total_s=sum(task_expected_s.values()),
+        p90_total_s=quantile(totals, 0.9) if totals else 0.0,
+        model_loads=_model_loads(pending),
+        parallelism=[
+            ParallelismEstimate(
+                workers=count,
+                expected_s=fmean(makespans[count]) if makespans[count] else 0.0,
+                p90_s=quantile(makespans[count], 0.9) if makespans[count] else 0.0,
+            )
+            for count in workers
+        ],
+        task_expected_s=task_expected_s,
+    )
+
+
+def format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}d {hours}h {minutes}m"
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+def load_duration_samples(output_dir: str | Path) -> DurationSamples:
+    """Group the suite runner's recorded task wall times by (system, model, corpus, level)."""
+    samples: DurationSamples = {}
+    path = result_index_path(output_dir)
+    if not path.is_file():
+        return samples
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=30.0)
+    try:
+        rows = conn.execute("SELECT system, model, corpus, level, wall_s FROM task_durations").fetchall()
+    except sqlite3.Error:
+        rows = []
+    finally:
+        conn.close()
+    for system, model, corpus, level, wall_s in rows:
+        samples.setdefault((system, model, corpus, level), []).append(float(wall_s))
+    return samples
+
+
+def _pool(samples: DurationSamples) -> dict[tuple, list[float]]:
+    pooled: dict[tuple, list[float]] = {}
+    for (system, model, _corpus, level), durations in samples.items():
+        pooled.setdefault((system, model, level), []).extend(durations)
+        pooled.setdefault((system, model), []).extend(durations)
+    return pooled
+
+
+def _durations_for(task: SuiteTask, samples: DurationSamples, pooled: dict[tuple, list[float]]) -> list[float]:
+    system = task.system.value
+    return (
+        samples.get((system, task.model, task.corpus.value, task.level))
+        or pooled.get((system, task.model, task.level))
+        or pooled.get((system, task.model))
+        or []
+    )
+
+
+def _makespan(durations: Sequence[float], workers: int) -> float:
+    if workers == 1:
+        return sum(durations)
+    free_at = [0.0] * workers
+    for duration in durations:
+        heapq.heapreplace(free_at, free_at[0] + duration)
+    return max(free_at)
+
+
+def _model_loads(tasks: Sequence[SuiteTask]) -> int:
+    loads = 0
+    current = None
+    for task in tasks:
+        if task.model != current:
+            loads += 1
+            current = task.model
+    return loads
@@ -0,0 +1,177 @@
+"""Indexed SQLite store backing experiment suite state.
+
+The suite runner used to re-parse and rewrite the whole ``*.state.json`` file
+on every poll, heartbeat, and status change. The store keeps one row per task
+(keyed by ``task_id``) plus a small key/value table for suite-level fields, so
+task updates and the cancel-flag check are O(1) regardless of suite size.
+
+The ``*.state.json`` file stays the canonical, portable path: the store lives
+next to it (``suite.state.json`` -> ``suite.state.db``) and the runner writes
+periodic JSON snapshots so exports and older tooling keep working. A JSON file
+rewritten by something other than the store is re-imported the next time the
+store is opened for writing, unless a live runner owns it (the JSON then is
+the runner's own snapshot, caught between its write and its mtime record).
+Readers open the store read-only and never import anything.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from experiment_runner.models.suite import ExperimentSuiteState, SuiteTask
+
+_SNAPSHOT_MTIME_KEY = "_json_snapshot_mtime_ns"
+_STATE_FIELDS = tuple(name for name in ExperimentSuiteState.model_fields if name != "tasks")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS suite_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS suite_tasks (
+    task_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS suite_tasks_position ON suite_tasks (position);
+"""
+
+
+def suite_store_path(state_path: str | Path) -> Path:
+    return Path(state_path).with_suffix(".db")
+
+
+class SuiteStateStore:
+    """SQLite (WAL mode) store for one suite's state.
+
+    Connections are cheap and short-lived for readers (dashboard, ``suite
+    status``), which pass ``read_only``; the suite runner keeps one open for
+    the duration of a run.
+    """
+
+    def __init__(self, path: str | Path, *, read_only: bool = False) -> None:
+        self.path = Path(path)
+        if read_only:
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=30.0, isolation_level=None)
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> SuiteStateStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def has_state(self) -> bool:
+        row = self._conn.execute("SELECT 1 FROM suite_meta WHERE key = 'suite_id'").fetchone()
+        return row is not None
+
+    def load(self) -> ExperimentSuiteState:
+        meta = self._meta()
+        tasks = [
+            SuiteTask.model_validate_json(payload)
+            for (payload,) in self._conn.execute("SELECT payload FROM suite_tasks ORDER BY position")
+        ]
+        return ExperimentSuiteState.model_validate({
+            **{key: value for key, value in meta.items() if key in _STATE_FIELDS},
+            "tasks": tasks,
+        })
+
+    def replace(self, state: ExperimentSuiteState) -> None:
+        """Overwrite the stored state with ``state`` in a single transaction."""
+        payload = state.model_dump(mode="json", exclude={"tasks"})
+        with self._transaction():
+            self._conn.execute(
+                "DELETE FROM suite_meta WHERE key != ?",
+                (_SNAPSHOT_MTIME_KEY,),
+            )
+            self._conn.executemany(
+                "INSERT INTO suite_meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in payload.items()],
+            )
+            self._conn.execute("DELETE FROM suite_tasks")
+            self._conn.executemany(
+                "INSERT INTO suite_tasks (task_id, position, payload) VALUES (?, ?, ?)",
+                [(task.task_id, task.index, task.model_dump_json()) for task in state.tasks],
+            )
+
+    def get_task(self, task_id: str) -> SuiteTask | None:
+        row = self._conn.execute(
+            "SELECT payload FROM suite_tasks WHERE task_id = ?",
+            (task_id,),
+        ).fetchone()
+        return SuiteTask.model_validate_json(row[0]) if row else None
+
+    def task_ids(self) -> list[str]:
+        return [row[0] for row in self._conn.execute("SELECT task_id FROM suite_tasks ORDER BY position")]
+
+    def update_task(self, task: SuiteTask, **meta: Any) -> None:
+        """Persist one task (and optional suite-level fields) atomically."""
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE suite_tasks SET payload = ?, position = ? WHERE task_id = ?",
+                (task.model_dump_json(), task.index, task.task_id),
+            )
+            self._write_meta(meta)
+
+    def update_meta(self, **meta: Any) -> None:
+        with self._transaction():
+            self._write_meta(meta)
+
+    def cancel_requested(self) -> bool:
+        row = self._conn.execute("SELECT value FROM suite_meta WHERE key = 'cancel_requested'").fetchone()
+        return bool(row and json.loads(row[0]))
+
+    def runner_pid(self) -> int | None:
+        row = self._conn.execute("SELECT value FROM suite_meta WHERE key = 'runner_pid'").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def snapshot_mtime_ns(self) -> int | None:
+        row = self._conn.execute(
+            "SELECT value FROM suite_meta WHERE key = ?",
+            (_SNAPSHOT_MTIME_KEY,),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_snapshot_mtime_ns(self, mtime_ns: int) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO suite_meta (key, value) VALUES (?, ?)",
+            (_SNAPSHOT_MTIME_KEY, json.dumps(mtime_ns)),
+        )
+
+    def _meta(self) -> dict[str, Any]:
+        return {key: json.loads(value) for key, value in self._conn.execute("SELECT key, value FROM suite_meta")}
+
+    def _write_meta(self, meta: dict[str, Any]) -> None:
+        unknown = set(meta) - set(_STATE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown suite state fields: {sorted(unknown)}")
+        meta = {**meta, "updated_at": datetime.now(timezone.utc).isoformat()}
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO suite_meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in meta.items()],
+        )
+
+    def _transaction(self) -> _Transaction:
+        return _Transaction(self._conn)
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from experiment_runner.models.config import RunConfig
+from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
+from experiment_runner.models.question import Question
+from experiment_runner.runners.baseline import anythingllm
+from experiment_runner.runners.baseline.anythingllm import AnythingLLMRunner
+
+
+class _FakeAnythingLLM(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Requests answered 503 before /api/ping reports ready.
+    ping_failures = 0
+    client_ports: list[int] = []
+    chat_bodies: list[dict] = []
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path != "/api/ping":
+            self.send_error(404)
+            return
+        cls = type(self)
+        status = 200
+        if cls.ping_failures > 0:
+            cls.ping_failures -= 1
+            status = 503
+        self._send(status, b'{"online": true}', "application/json")
+
+    def do_POST(self) -> None:
+        type(self).client_ports.append(self.client_address[1])
+        length = int(self.headers["Content-Length"])
+        body = json.loads(self.rfile.read(length))
+        type(self).chat_bodies.append(body)
+        if self.headers.get("Authorization") != "Bearer test-key":
+            self._send(403, b'{"error": "forbidden"}', "application/json")
+            return
+        events = [
+            {"type": "textResponseChunk", "textResponse": "Mars is ", "close": False},
+            {"type": "textResponseChunk", "textResponse": "red.", "close": False},
+            {"type": "textResponseChunk", "textResponse": "", "sources": [{"title": "mars.md"}], "close": True},
+        ]
+        payload = "".join(f"data: {json.dumps(event)}\n\n" for event in events).encode("utf-8")
+        self._send(200, payload, "text/event-stream")
+
+    def _send(self, status: int, payload: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    _FakeAnythingLLM.ping_failures = 0
+    _FakeAnythingLLM.client_ports = []
+    _FakeAnythingLLM.chat_bodies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeAnythingLLM)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("ANYTHING_LLM_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setenv("ANYTHING_LLM_API_KEY", "test-key")
+    monkeypatch.delenv("EXPERIMENT_RUNNER_ANYTHINGLLM_CLIENT", raising=False)
+    monkeypatch.delenv("EXPERIMENT_RUNNER_ANYTHINGLLM_REUSE_CONTAINER", raising=False)
+    yield _FakeAnythingLLM
+    server.shutdown()
+    server.server_close()
+
+
+def _config() -> RunConfig:
+    return RunConfig(
+        system=SystemName.ANYTHINGLLM,
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        model="qwen3:4b",
+        automation_level=AutomationLevel.FULL,
+        path_to_corpora=Path("/unused"),
+    )
+
+
+def _question(question_id: str) -> Question:
+    return Question(
+        id=question_id,
+        corpus="solar_system_wiki",
+        question="What colour is Mars?",
+        level=1,
+        expected_facts=["red"],
+    )
+
+
+def _fake_docker(monkeypatch, *, running_model: str | None) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[:2] == ["docker", "inspect"]:
+            if running_model is None:
+                return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="No such object")
+            container = {"State": {"Running": True}, "Config": {"Env": [f"OLLAMA_MODEL_PREF={running_model}"]}}
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps([container]), stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(anythingllm.subprocess, "run", fake_run)
+    return calls
+
+
+def test_http_mode_reuses_matching_container_and_one_keep_alive_connection(monkeypatch, fake_server) -> None:
+    docker_calls = _fake_docker(monkeypatch, running_model="qwen3:4b")
+    runner = AnythingLLMRunner(_config())
+
+    runner.setup()
+    try:
+        first = runner.run(_question("ss_L1_001"))
+        second = runner.run(_question("ss_L1_002"))
+    finally:
+        runner.teardown()
+
+    assert docker_calls == [["docker", "inspect", "anythingllm-thesis"]]
+    assert first.answer_error is None
+    assert first.answer_text == "Mars is red."
+    assert first.metrics.corpus_used is True
+    assert first.metrics.time_to_first_event_s is not None
+    assert second.answer_text == "Mars is red."
+    assert len(set(fake_server.client_ports)) == 1
+    sessions = [body["sessionId"] for body in fake_server.chat_bodies]
+    assert len(set(sessions)) == 2
+
+
+def test_setup_restarts_container_for_other_model_and_polls_with_backoff(monkeypatch, tmp_path, fake_server) -> None:
+    docker_calls = _fake_docker(monkeypatch, running_model="gemma3:4b")
+    monkeypatch.setattr(anythingllm, "_READY_INITIAL_DELAY_S", 0.01)
+    sleeps: list[float] = []
+    real_sleep = anythingllm.time.sleep
+    monkeypatch.setattr(anythingllm.time, "sleep", lambda seconds: (sleeps.append(seconds), real_sleep(seconds)))
+    monkeypatch.setattr(anythingllm, "_STORAGE_DIR", tmp_path / "anythingllm-data")
+    fake_server.ping_failures = 3
+    runner = AnythingLLMRunner(_config())
+
+    runner.setup()
+    runner.teardown()
+
+    assert [call[:2] for call in docker_calls] == [
+        ["docker", "inspect"],
+        ["docker", "stop"],
+        ["docker", "rm"],
+        ["docker", "run"],
+    ]
+    assert sleeps == [0.01, 0.02, 0.04]
+
+
+def test_http_mode_reports_api_errors_as_answer_errors(monkeypatch, fake_server) -> None:
+    _fake_docker(monkeypatch, running_model="qwen3:4b")
+    monkeypatch.setenv("ANYTHING_LLM_API_KEY", "wrong-key")
+    runner = AnythingLLMRunner(_config())
+
+    runner.setup()
+    try:
+        result = runner.run(_question("ss_L1_001"))
+    finally:
+        runner.teardown()
+
+    assert result.answer_text is None
+    assert "HTTP 403" in result.answer_error
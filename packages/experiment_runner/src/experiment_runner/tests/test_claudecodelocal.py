@@ -7,6 +7,32 @@ from experiment_runner.models.config import RunConfig
 from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
 from experiment_runner.models.question import Question
 from experiment_runner.runners.baseline.claudecodelocal import ClaudeCodeLocalRunner
+from experiment_runner.runners.baseline.clawcode import ClawCodeRunner
+from experiment_runner.runners.baseline.streaming import StreamedProcess, StreamEvent
+
+
+def _config(system: SystemName, corpus) -> RunConfig:
+    return RunConfig(
+        system=system,
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        model="qwen3:4b",
+        automation_level=AutomationLevel.FULL,
+        path_to_corpora=corpus,
+    )
+
+
+def _question() -> Question:
+    return Question(id="ss_L1_001", corpus="solar_system_wiki", level=1, question="What is Mars?", expected_facts=[])
+
+
+def _streamed(timed_events: list[tuple[dict, float]]) -> StreamedProcess:
+    return StreamedProcess(
+        args=["claude"],
+        returncode=0,
+        stdout="",
+        stderr="",
+        events=[StreamEvent(payload=payload, elapsed_s=elapsed) for payload, elapsed in timed_events],
+    )
 
 
 def test_claude_json_error_envelope_sets_answer_error(tmp_path, monkeypatch) -> None:
@@ -52,3 +78,39 @@ def test_claude_json_error_envelope_sets_answer_error(tmp_path, monkeypatch) ->
     assert result.answer_text is None
     assert result.trace is not None
     assert result.trace.extra["api_error_status"] == 404
+
+
+def test_claude_run_times_tool_calls_from_the_event_stream(tmp_path, monkeypatch) -> None:
+    runner = ClaudeCodeLocalRunner(_config(SystemName.CLAUDE_CODE_LOCAL, tmp_path))
+    tool_use = {"type": "tool_use", "id": "toolu_1", "name": "grep_search", "input": {"pattern": "Mars"}}
+    tool_result = {"type": "tool_result", "tool_use_id": "toolu_1", "content": "mars.md:1: Mars"}
+    events = [
+        ({"type": "system", "subtype": "init", "session_id": "s"}, 0.5),
+        ({"type": "assistant", "message": {"content": [tool_use]}, "session_id": "s"}, 2.0),
+        ({"type": "user", "message": {"content": [tool_result]}, "session_id": "s"}, 2.25),
+        ({"type": "assistant", "message": {"content": [{"type": "text", "text": "Mars."}]}, "session_id": "s"}, 4.0),
+        ({"type": "result", "result": "Mars.", "usage": {"input_tokens": 10, "output_tokens": 2}, "session_id": "s"}, 4.1),
+    ]
+    monkeypatch.setattr(runner, "_invoke_claude", lambda _prompt, _workspace: _streamed(events))
+
+    result = runner.run(_question())
+
+    assert result.answer_text == "Mars."
+    assert result.metrics.time_to_first_event_s == 0.5
+    assert result.metrics.tool_call_sequence == ["grep_search"]
+    assert result.metrics.tool_call_durations_s == [0.25]
+    assert result.metrics.tokens.output == 2
+
+
+def test_claw_single_envelope_output_leaves_first_event_unset(tmp_path, monkeypatch) -> None:
+    runner = ClawCodeRunner(_config(SystemName.CLAWCODE, tmp_path))
+    envelope = {"message": "Mars.", "usage": {"input_tokens": 10}, "tool_uses": [{"name": "read_file"}]}
+    monkeypatch.setattr(runner, "_invoke_claw", lambda _prompt, _workspace: _streamed([(envelope, 30.0)]))
+
+    result = runner.run(_question())
+
+    assert result.answer_text == "Mars."
+    # The envelope only arrives at exit, so its timestamp is the whole run.
+    assert result.metrics.time_to_first_event_s is None
+    assert result.metrics.tool_call_sequence == ["read_file"]
+    assert result.metrics.tool_call_durations_s == []
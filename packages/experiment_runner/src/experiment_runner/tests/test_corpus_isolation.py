@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import errno
 import json
+import os
 from pathlib import Path
 
-from experiment_runner import corpus_isolation
+import pytest
+
+from experiment_runner import corpus_integrity, corpus_isolation
 from experiment_runner.commands import run as run_command
-from experiment_runner.corpus_isolation import capture_tree, isolated_corpus
-from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
+from experiment_runner.corpus_isolation import CorpusPrefetcher, isolated_corpus
+from experiment_runner.models.enums import AutomationLevel, Corpus, CorpusSnapshotStrategy, SystemName
 from experiment_runner.models.metrics import RunMetrics
 from experiment_runner.models.question import Question
 from experiment_runner.models.result import RunResult
@@ -53,6 +57,9 @@ def _args(tmp_path: Path, source_corpus: Path, system: SystemName) -> argparse.N
         reasoning_enabled=False,
         no_trace=True,
         dry_run=False,
+        result_store=False,
+        suite_id=None,
+        concurrency=1,
     )
 
 
@@ -71,24 +78,64 @@ def test_isolated_corpus_copies_text_and_metadata_without_tool_artifacts(tmp_pat
     assert snapshot.manifest_entry_count == 2
     assert snapshot.file_count == 3
     assert "text" in snapshot.copied_paths
-    assert "planets.md" in (snapshot.pre_run_tree or "")
-    assert "planets.md" in (snapshot.post_run_tree or "")
+    assert snapshot.pre_run_root_hash
+    assert snapshot.post_run_root_hash == snapshot.pre_run_root_hash
+    assert snapshot.post_run_diff is not None
+    assert snapshot.post_run_diff.added_count == 0
+    assert snapshot.pre_run_tree is None
     assert not Path(snapshot.prepared_corpus_path).exists()
 
 
-def test_capture_tree_uses_python_fallback_when_tree_is_missing(monkeypatch, tmp_path) -> None:
-    (tmp_path / "text").mkdir()
-    (tmp_path / "text" / "doc.md").write_text("content", encoding="utf-8")
+def test_isolated_corpus_detects_mutations_with_merkle_diff(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    _write_source_corpus(source)
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_STRATEGY", "copy")
+
+    with isolated_corpus(source) as (prepared, snapshot):
+        planets = prepared / "text" / "planets.md"
+        stat_before = planets.stat()
+        # Same size and mtime: only the content digest (via ctime) can tell.
+        planets.write_text("Earth\nVenu\n", encoding="utf-8")
+        os.utime(planets, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns))
+        (prepared / "manifest.jsonl").unlink()
+        (prepared / ".claw").mkdir()
+        (prepared / ".claw" / "state.json").write_text("{}", encoding="utf-8")
+
+    assert snapshot.post_run_root_hash != snapshot.pre_run_root_hash
+    diff = snapshot.post_run_diff
+    assert diff is not None
+    assert diff.modified == ["text/planets.md"]
+    assert diff.removed == ["manifest.jsonl"]
+    assert diff.added == [".claw/state.json"]
+
+
+def test_source_corpus_manifest_is_cached_and_only_rehashes_changed_files(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    _write_source_corpus(source)
+    cache_root = tmp_path / "cache"
+    included = ("text", "config.json", "manifest.jsonl")
+    hashed: list[str] = []
+    original_hash_file = corpus_integrity._hash_file
+
+    def counting_hash_file(path: Path) -> str:
+        hashed.append(path.name)
+        return original_hash_file(path)
 
-    def raise_missing(*args, **kwargs):
-        raise FileNotFoundError("tree")
+    monkeypatch.setattr(corpus_integrity, "_hash_file", counting_hash_file)
+    monkeypatch.setattr(corpus_integrity, "_SOURCE_CACHE", {})
 
-    monkeypatch.setattr(corpus_isolation.subprocess, "run", raise_missing)
+    first = corpus_integrity.scan_source_corpus(source, included, cache_root=cache_root)
+    assert sorted(first) == ["config.json", "manifest.jsonl", "text/planets.md"]
+    assert len(hashed) == 3
 
-    output = capture_tree(tmp_path)
+    # A fresh process only has the on-disk cache.
+    monkeypatch.setattr(corpus_integrity, "_SOURCE_CACHE", {})
+    hashed.clear()
+    (source / "config.json").write_text(json.dumps({"name": "other"}), encoding="utf-8")
+    second = corpus_integrity.scan_source_corpus(source, included, cache_root=cache_root)
 
-    assert "text/" in output
-    assert "doc.md" in output
+    assert hashed == ["config.json"]
+    assert corpus_integrity.merkle_root(second) != corpus_integrity.merkle_root(first)
 
 
 def test_isolated_corpus_uses_configured_temp_root_when_usable(monkeypatch, tmp_path) -> None:
@@ -103,6 +150,94 @@ def test_isolated_corpus_uses_configured_temp_root_when_usable(monkeypatch, tmp_
         assert (prepared / "text" / "planets.md").is_file()
 
 
+def test_isolated_corpus_defaults_never_let_writes_reach_the_source_inode(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    _write_source_corpus(source)
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_TMP_DIR", str(tmp_path / "same_fs_tmp"))
+    monkeypatch.delenv("EXPERIMENT_RUNNER_CORPUS_STRATEGY", raising=False)
+    planets = source / "text" / "planets.md"
+    mode_before = planets.stat().st_mode
+
+    with isolated_corpus(source) as (prepared, snapshot):
+        prepared_planets = prepared / "text" / "planets.md"
+        assert not os.path.samefile(prepared_planets, planets)
+        prepared_planets.chmod(0o644)
+        prepared_planets.write_text("Earth\nPluto\n", encoding="utf-8")
+
+    assert snapshot.strategy in {CorpusSnapshotStrategy.REFLINK, CorpusSnapshotStrategy.COPY}
+    assert planets.read_text(encoding="utf-8") == "Earth\nMars\n"
+    assert planets.stat().st_mode == mode_before
+
+
+def test_isolated_corpus_hardlinks_only_read_only_sources_without_changing_their_mode(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    _write_source_corpus(source)
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_TMP_DIR", str(tmp_path / "same_fs_tmp"))
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_STRATEGY", "hardlink")
+    monkeypatch.setattr(corpus_isolation.os, "geteuid", lambda: 1000)
+    planets = source / "text" / "planets.md"
+    planets.chmod(0o444)
+    config_mode = (source / "config.json").stat().st_mode
+
+    with isolated_corpus(source) as (prepared, snapshot):
+        assert os.path.samefile(prepared / "text" / "planets.md", planets)
+        # A writable source file is copied rather than linked.
+        assert not os.path.samefile(prepared / "config.json", source / "config.json")
+
+    assert snapshot.strategy == CorpusSnapshotStrategy.HARDLINK
+    assert snapshot.file_count == 3
+    assert snapshot.total_bytes == sum(
+        (source / name).stat().st_size for name in ("text/planets.md", "config.json", "manifest.jsonl")
+    )
+    assert snapshot.prepare_time_s is not None and snapshot.prepare_time_s >= 0.0
+    assert (source / "config.json").stat().st_mode == config_mode
+    assert planets.stat().st_mode & 0o777 == 0o444
+
+
+def test_isolated_corpus_refuses_hardlinks_as_root(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    _write_source_corpus(source)
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_STRATEGY", "hardlink")
+    monkeypatch.setattr(corpus_isolation.os, "geteuid", lambda: 0)
+
+    with isolated_corpus(source) as (prepared, snapshot):
+        assert not (prepared / "text").exists()
+    assert "refused when running as root" in snapshot.error
+
+
+def test_isolated_corpus_reports_an_unknown_strategy_in_the_snapshot(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    _write_source_corpus(source)
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_STRATEGY", "reflink,symlink")
+
+    with isolated_corpus(source) as (_prepared, snapshot):
+        pass
+    assert "unknown strategy 'symlink'; expected reflink, copy, hardlink" in snapshot.error
+
+
+def test_isolated_corpus_falls_back_to_copy_when_links_are_unsupported(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    _write_source_corpus(source)
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_TMP_DIR", str(tmp_path / "other_fs_tmp"))
+    attempts: list[str] = []
+
+    def unsupported_reflink(src, dst):
+        attempts.append("reflink")
+        raise OSError(errno.EOPNOTSUPP, "reflink unsupported")
+
+    monkeypatch.setattr(corpus_isolation, "_reflink", unsupported_reflink)
+
+    with isolated_corpus(source) as (prepared, snapshot):
+        copied = prepared / "text" / "planets.md"
+        assert copied.read_text(encoding="utf-8") == "Earth\nMars\n"
+        assert not os.path.samefile(copied, source / "text" / "planets.md")
+
+    assert snapshot.strategy == CorpusSnapshotStrategy.COPY
+    assert snapshot.file_count == 3
+    # Each unsupported strategy is probed once, not once per file; hardlinks are never a default.
+    assert attempts == ["reflink"]
+
+
 def test_select_temp_root_auto_creates_named_directory(monkeypatch, tmp_path) -> None:
     ram_root = tmp_path / "dev_shm"
     disk_root = tmp_path / "tmp"
@@ -114,6 +249,32 @@ def test_select_temp_root_auto_creates_named_directory(monkeypatch, tmp_path) ->
     assert selected.is_dir()
 
 
+def test_corpus_prefetcher_stages_next_snapshot_within_depth(monkeypatch, tmp_path) -> None:
+    source = tmp_path / "solar_system_wiki"
+    temp_root = tmp_path / "ram_tmp"
+    _write_source_corpus(source)
+    monkeypatch.setenv("EXPERIMENT_RUNNER_CORPUS_TMP_DIR", str(temp_root))
+
+    def staged() -> list[Path]:
+        return sorted(temp_root.glob("experiment_corpus_*"))
+
+    seen: list[Path] = []
+    with CorpusPrefetcher(source, 3, depth=1) as corpora:
+        for _ in range(2):
+            with corpora.acquire() as (prepared, snapshot):
+                seen.append(prepared)
+                assert (prepared / "text" / "planets.md").is_file()
+                assert snapshot.wait_time_s is not None
+                corpora._pending[0].result()
+                # The snapshot in use plus one staged for the next question.
+                assert len(staged()) == 2
+        # The third snapshot was staged but never acquired.
+        assert len(staged()) == 1
+
+    assert len(set(seen)) == 2
+    assert staged() == []
+
+
 def test_run_experiment_uses_clean_isolated_corpus_per_question(monkeypatch, tmp_path) -> None:
     source = tmp_path / "solar_system_wiki"
     _write_source_corpus(source)
@@ -155,7 +316,8 @@ def test_run_experiment_uses_clean_isolated_corpus_per_question(monkeypatch, tmp
     result_file = next((tmp_path / "results").glob("*.jsonl"))
     rows = [json.loads(line) for line in result_file.read_text(encoding="utf-8").splitlines()]
     assert all(row["corpus_snapshot"]["file_count"] == 3 for row in rows)
-    assert all(".claw" not in row["corpus_snapshot"]["pre_run_tree"] for row in rows)
+    assert all(row["corpus_snapshot"]["pre_run_root_hash"] for row in rows)
+    assert len({row["corpus_snapshot"]["pre_run_root_hash"] for row in rows}) == 1
 
 
 def test_run_experiment_does_not_isolate_anythingllm(monkeypatch, tmp_path) -> None:
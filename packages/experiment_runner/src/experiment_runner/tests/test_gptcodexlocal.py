@@ -8,6 +8,7 @@ from experiment_runner.models.config import RunConfig
 from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
 from experiment_runner.models.question import Question
 from experiment_runner.runners.baseline.gptcodexlocal import GptCodexLocalRunner
+from experiment_runner.runners.baseline.streaming import StreamedProcess, StreamEvent
 from agent.prompts import EXAMINEE_SYSTEM_MESSAGE
 
 
@@ -116,3 +117,37 @@ def test_codex_run_does_not_mark_corpus_used_without_command_events(monkeypatch,
     assert result.metrics.corpus_used is False
     assert result.metrics.tool_call_count == 0
     assert result.metrics.tool_call_sequence == []
+
+
+def test_codex_run_records_event_timing_from_streamed_output(monkeypatch, tmp_path) -> None:
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    runner = GptCodexLocalRunner(_config(corpus))
+    shell_call = {"id": "item_1", "type": "local_shell_call", "command": "grep -R Mars ./corpus"}
+    timed_events = [
+        ({"type": "thread.started"}, 0.4),
+        ({"type": "item.started", "item": shell_call}, 1.0),
+        ({"type": "item.completed", "item": shell_call}, 1.75),
+        ({"type": "item.completed", "item": {"type": "agent_message", "text": "Mars."}}, 3.0),
+        ({"type": "turn.completed", "usage": {"input_tokens": 10, "output_tokens": 12}}, 3.1),
+    ]
+
+    def fake_invoke(self, prompt: str, workspace: Path) -> StreamedProcess:
+        return StreamedProcess(
+            args=["codex"],
+            returncode=0,
+            stdout="",
+            stderr="",
+            events=[StreamEvent(payload=payload, elapsed_s=elapsed) for payload, elapsed in timed_events],
+            terminated_early=True,
+        )
+
+    monkeypatch.setattr(GptCodexLocalRunner, "_invoke_codex", fake_invoke)
+
+    result = runner.run(_question())
+
+    assert result.answer_text == "Mars."
+    assert result.metrics.time_to_first_event_s == 0.4
+    assert result.metrics.tool_call_sequence == ["grep -R Mars ./corpus"]
+    assert result.metrics.tool_call_durations_s == [0.75]
+    assert [step.elapsed_s for step in result.trace.steps] == [1.75, 3.0]
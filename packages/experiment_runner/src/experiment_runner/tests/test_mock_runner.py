@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+from experiment_runner.commands.benchmark import benchmark_scheduler
+from experiment_runner.models.config import RunConfig
+from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
+from experiment_runner.models.question import Question
+from experiment_runner.runners.mock import LatencyDistribution, MockRunner, write_synthetic_corpus
+from experiment_runner.runners.registry import get_runner
+
+
+def _config(corpus: Path) -> RunConfig:
+    return RunConfig(
+        system=SystemName.MOCK,
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        model="mock",
+        automation_level=AutomationLevel.FULL,
+        path_to_corpora=corpus,
+    )
+
+
+def _question(question_id: str = "mock_L1_001") -> Question:
+    return Question(id=question_id, corpus="solar_system_wiki", level=1, question="Q?", expected_facts=[])
+
+
+def test_mock_runner_cites_real_corpus_lines(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("EXPERIMENT_RUNNER_MOCK_FAIL_RATE", raising=False)
+    monkeypatch.delenv("EXPERIMENT_RUNNER_MOCK_HANG_RATE", raising=False)
+    write_synthetic_corpus(tmp_path, documents=4)
+    runner = get_runner(_config(tmp_path))
+    assert isinstance(runner, MockRunner)
+
+    result = runner.run(_question())
+
+    citations = re.findall(r"\[([^\]]+)\] \[file:([^,]+), lines:(\d+)-(\d+)\]", result.answer_text)
+    assert len(citations) == 3
+    for statement, relative, start, end in citations:
+        lines = (tmp_path / relative).read_text(encoding="utf-8").splitlines()
+        assert lines[int(start):int(end)] == [statement]
+    assert runner.run(_question()).answer_text == result.answer_text
+
+
+def test_mock_runner_fails_on_request_and_validates_latency(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("EXPERIMENT_RUNNER_MOCK_FAIL_RATE", "1")
+    monkeypatch.setenv("EXPERIMENT_RUNNER_MOCK_LATENCY", "uniform:0,0.01")
+
+    result = MockRunner(_config(tmp_path)).run(_question())
+
+    assert result.answer_text is None
+    assert result.answer_error == "mock failure for mock_L1_001"
+
+    monkeypatch.setenv("EXPERIMENT_RUNNER_MOCK_LATENCY", "gamma:1")
+    with pytest.raises(ValueError, match="unknown mock latency distribution"):
+        MockRunner(_config(tmp_path))
+    with pytest.raises(ValueError, match="takes 2 parameter"):
+        LatencyDistribution.parse("normal:1")
+
+
+def test_scheduler_benchmark_runs_sampled_tasks_and_cancels_a_hung_one(tmp_path) -> None:
+    report = benchmark_scheduler(task_counts=[5], sample_tasks=1, probe_samples=5, work_dir=tmp_path)
+
+    (level,) = report["levels"]
+    assert level["tasks"] == 5
+    assert level["executed_tasks"] == level["succeeded_tasks"] == 1
+    assert level["overhead_per_task_s"] > 0
+    assert level["cancel_latency_s"] is not None
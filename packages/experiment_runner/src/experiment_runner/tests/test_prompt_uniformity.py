@@ -61,7 +61,8 @@ def test_baseline_cli_command_builders() -> None:
     assert build_claw_command(model="qwen3:4b", prompt=prompt) == [
         "claw",
         "--model", "openai/qwen3:4b",
-        "--output-format", "json",
+        "--output-format", "stream-json",
+        "--verbose",
         "--permission-mode", "workspace-write",
         "--allowedTools", "read_file,glob_search,grep_search",
         prompt,
@@ -69,7 +70,8 @@ def test_baseline_cli_command_builders() -> None:
     assert build_claude_command(model="qwen3:4b", prompt=prompt) == [
         "claude",
         "--model", "qwen3:4b",
-        "--output-format", "json",
+        "--output-format", "stream-json",
+        "--verbose",
         "--permission-mode", "bypassPermissions",
         "--allowedTools", "read_file,glob_search,grep_search",
         "-p",
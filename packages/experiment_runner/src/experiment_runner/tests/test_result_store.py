@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import argparse
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from experiment_runner.commands import run as run_command
+from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
+from experiment_runner.models.question import Question
+from experiment_runner.models.result import RunResult
+from experiment_runner.models.trace import SessionTrace, TraceStep
+from experiment_runner.result_store import (
+    ResultStore,
+    compact_results_dir,
+    iter_result_file,
+    result_file_exists,
+    result_store_path,
+    source_key,
+)
+from experiment_runner.trace_store import TraceStore, load_trace, trace_store_dir
+
+
+def _run(question_id: str, *, system: SystemName = SystemName.ACE, model: str = "qwen3:4b") -> RunResult:
+    return RunResult(
+        system_name=system,
+        automation_level=AutomationLevel.FULL,
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        question_id=question_id,
+        question_text=f"{question_id}?",
+        model=model,
+        answer_text="answer",
+    )
+
+
+def _write_jsonl(path: Path, runs: list[RunResult]) -> None:
+    path.write_text("".join(run.model_dump_json() + "\n" for run in runs), encoding="utf-8")
+
+
+class _FakeRunner:
+    def __init__(self, config, fail_on: str | None = None) -> None:
+        self.config = config
+        self.fail_on = fail_on
+
+    def setup(self) -> None:
+        pass
+
+    def teardown(self) -> None:
+        pass
+
+    def run(self, question: Question) -> RunResult:
+        if question.id == self.fail_on:
+            raise RuntimeError("runner crashed")
+        return _run(question.id, system=self.config.system, model=self.config.model)
+
+
+def _args(tmp_path: Path) -> argparse.Namespace:
+    questions_file = tmp_path / "questions.json"
+    questions_file.write_text(json.dumps([
+        {"id": f"ss_L1_00{i}", "corpus": "solar_system_wiki", "level": 1, "question": f"Q{i}?", "expected_facts": []}
+        for i in (1, 2)
+    ]), encoding="utf-8")
+    return argparse.Namespace(
+        system=SystemName.ANYTHINGLLM.value,
+        corpus=Corpus.SOLAR_SYSTEM_WIKI.value,
+        questions_file=str(questions_file),
+        output_dir=str(tmp_path / "results"),
+        model="qwen3:4b",
+        num_ctx=8192,
+        path_to_corpora=None,
+        automation_level=AutomationLevel.FULL.value,
+        question_ids=None,
+        reasoning_enabled=False,
+        no_trace=True,
+        dry_run=False,
+        result_store=True,
+        suite_id="suite-1",
+        concurrency=1,
+    )
+
+
+def test_run_experiment_appends_to_result_store_instead_of_jsonl(monkeypatch, tmp_path, capsys) -> None:
+    monkeypatch.setattr(run_command, "get_runner", lambda config: _FakeRunner(config))
+
+    run_command.run_experiment(_args(tmp_path))
+
+    results_dir = tmp_path / "results"
+    assert list(results_dir.glob("*.jsonl")) == []
+    reported = capsys.readouterr().err.strip().splitlines()[-1]
+    result_path = reported.removeprefix(run_command.RESULT_PATH_PREFIX)
+    assert result_file_exists(result_path)
+    assert [run.question_id for run in iter_result_file(result_path)] == ["ss_L1_001", "ss_L1_002"]
+    with ResultStore(result_store_path(results_dir)) as store:
+        assert store.partitions() == [
+            {"suite_id": "suite-1", "system_name": "anythingllm", "model": "qwen3:4b", "runs": 2},
+        ]
+
+
+def test_run_experiment_removes_partial_batch_from_result_store(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(run_command, "get_runner", lambda config: _FakeRunner(config, fail_on="ss_L1_002"))
+
+    with pytest.raises(RuntimeError):
+        run_command.run_experiment(_args(tmp_path))
+
+    with ResultStore(result_store_path(tmp_path / "results")) as store:
+        assert list(store.iter_runs()) == []
+
+
+def test_run_experiment_writes_nothing_to_the_result_store_before_the_batch_completes(monkeypatch, tmp_path) -> None:
+    store_path = result_store_path(tmp_path / "results")
+
+    class KilledRunner(_FakeRunner):
+        def run(self, question: Question) -> RunResult:
+            if question.id == "ss_L1_002":
+                # The first result is not visible yet, and a kill leaves nothing behind.
+                with ResultStore(store_path) as store:
+                    assert list(store.iter_runs()) == []
+                raise KeyboardInterrupt
+            return super().run(question)
+
+    monkeypatch.setattr(run_command, "get_runner", lambda config: KilledRunner(config))
+
+    with pytest.raises(KeyboardInterrupt):
+        run_command.run_experiment(_args(tmp_path))
+
+    with ResultStore(store_path) as store:
+        assert list(store.iter_runs()) == []
+
+
+def test_compact_results_dir_merges_jsonl_and_keeps_result_paths_resolvable(tmp_path) -> None:
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    first = results_dir / "ace__a.jsonl"
+    second = results_dir / "ace__b.jsonl"
+    broken = results_dir / "ace__broken.jsonl"
+    first_runs = [_run("ss_L1_001"), _run("ss_L1_002")]
+    _write_jsonl(first, first_runs)
+    _write_jsonl(second, [_run("ss_L1_003", model="gemma3:4b")])
+    broken.write_text("{not json\n", encoding="utf-8")
+
+    stats = compact_results_dir(results_dir, suite_ids_by_source={source_key(first): "suite-1"})
+
+    assert stats.files_compacted == 2
+    assert stats.runs_imported == 3
+    assert len(stats.skipped) == 1
+    assert sorted(path.name for path in results_dir.glob("*.jsonl")) == ["ace__broken.jsonl"]
+    assert result_file_exists(first)
+    assert [run.run_id for run in iter_result_file(first)] == [run.run_id for run in first_runs]
+    assert not result_file_exists(results_dir / "ace__missing.jsonl")
+
+    with ResultStore(result_store_path(results_dir)) as store:
+        assert store.get(first_runs[1].run_id).model_dump() == first_runs[1].model_dump()
+        assert [run.question_id for run in store.iter_runs(suite_id="suite-1")] == ["ss_L1_001", "ss_L1_002"]
+        exported = io.StringIO()
+        assert store.export_jsonl(exported, model="gemma3:4b") == 1
+    assert json.loads(exported.getvalue())["question_id"] == "ss_L1_003"
+
+
+def test_replace_source_keeps_old_rows_when_the_reinsert_fails(tmp_path) -> None:
+    source = tmp_path / "ace__a.jsonl"
+    old_runs = [_run("ss_L1_001"), _run("ss_L1_002")]
+
+    def crashing_runs():
+        yield _run("ss_L1_003")
+        raise KeyboardInterrupt
+
+    with ResultStore(result_store_path(tmp_path)) as store:
+        store.append_many(old_runs, source_file=source)
+        with pytest.raises(KeyboardInterrupt):
+            store.replace_source(crashing_runs(), source_file=source)
+        assert [run.run_id for _, run in store.iter_source_runs(source)] == [run.run_id for run in old_runs]
+
+        assert store.replace_source([_run("ss_L1_004")], source_file=source) == 1
+        assert [run.question_id for _, run in store.iter_source_runs(source)] == ["ss_L1_004"]
+
+
+def _trace(text: str) -> SessionTrace:
+    return SessionTrace(steps=[TraceStep(type="reasoning", content=text)])
+
+
+def test_run_experiment_stores_traces_out_of_line_and_loads_them_lazily(monkeypatch, tmp_path, capsys) -> None:
+    class TracingRunner:
+        def __init__(self, config) -> None:
+            self.config = config
+
+        def setup(self) -> None:
+            pass
+
+        def teardown(self) -> None:
+            pass
+
+        def run(self, question: Question):
+            result = _run(question.id, system=self.config.system)
+            # Both questions produce the same trace; it should be stored once.
+            result.trace = _trace("thinking " * 1000)
+            return result
+
+    monkeypatch.setattr(run_command, "get_runner", lambda config: TracingRunner(config))
+    args = _args(tmp_path)
+    args.result_store = False
+
+    run_command.run_experiment(args)
+
+    result_path = capsys.readouterr().err.strip().splitlines()[-1].removeprefix(run_command.RESULT_PATH_PREFIX)
+    rows = [json.loads(line) for line in open(result_path, encoding="utf-8")]
+    assert all(row["trace"] is None and row["trace_id"] for row in rows)
+    assert len({row["trace_id"] for row in rows}) == 1
+    assert len(list(trace_store_dir(tmp_path / "results").rglob("*.json.gz"))) == 1
+
+    runs = list(iter_result_file(result_path))
+    assert load_trace(runs[0]) == _trace("thinking " * 1000)
+
+
+def test_compaction_moves_inline_traces_and_export_can_inline_them_again(tmp_path) -> None:
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    legacy = _run("ss_L1_001")
+    legacy.trace = _trace("legacy")
+    (results_dir / "legacy.jsonl").write_text(legacy.model_dump_json() + "\n", encoding="utf-8")
+
+    compact_results_dir(results_dir)
+
+    with ResultStore(result_store_path(results_dir)) as store:
+        stored = store.get(legacy.run_id)
+        assert stored.trace is None
+        assert TraceStore(trace_store_dir(results_dir)).contains(stored.trace_id)
+        assert load_trace(stored) == legacy.trace
+        exported = io.StringIO()
+        store.export_jsonl(exported, inline_traces=True)
+    assert json.loads(exported.getvalue())["trace"]["steps"][0]["content"] == "legacy"
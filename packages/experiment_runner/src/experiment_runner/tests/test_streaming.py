@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from experiment_runner.runners.baseline.streaming import is_result_envelope, run_jsonl_stream
+
+# Prints two JSONL events a moment apart, then lingers like a CLI flushing
+# telemetry on shutdown.
+_LINGERING_CLI = """
+import json, sys, time
+print(json.dumps({"type": "thread.started"}), flush=True)
+time.sleep(0.2)
+print("not json", flush=True)
+print(json.dumps({"type": "turn.completed", "usage": {"input_tokens": 1}}), flush=True)
+time.sleep(30)
+"""
+
+
+def _is_turn_completed(event: dict) -> bool:
+    return event.get("type") == "turn.completed"
+
+
+def test_run_jsonl_stream_times_events_and_stops_after_terminal_event(tmp_path, capsys) -> None:
+    started = time.perf_counter()
+
+    completed = run_jsonl_stream(
+        [sys.executable, "-c", _LINGERING_CLI],
+        cwd=tmp_path,
+        env=dict(os.environ),
+        timeout=20,
+        label="fake",
+        is_terminal=_is_turn_completed,
+        grace_s=0.1,
+    )
+
+    assert time.perf_counter() - started < 10
+    assert completed.terminated_early is True
+    assert completed.returncode == 0
+    assert [event.payload["type"] for event in completed.events] == ["thread.started", "turn.completed"]
+    assert completed.events[0].elapsed_s < completed.events[1].elapsed_s
+    assert "not json" in completed.stdout
+    assert "  fake +" in capsys.readouterr().err
+
+
+def test_run_jsonl_stream_raises_timeout_without_terminal_event(tmp_path) -> None:
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_jsonl_stream(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            cwd=tmp_path,
+            env=dict(os.environ),
+            timeout=0.5,
+            label="fake",
+            is_terminal=_is_turn_completed,
+        )
+
+
+def test_is_result_envelope_matches_only_the_final_envelope() -> None:
+    # Claude Code's typed envelope and ClawCode's untyped one.
+    assert is_result_envelope({"type": "result", "result": "answer", "session_id": "s"})
+    assert is_result_envelope({"message": "answer", "usage": {"input_tokens": 1}, "tool_uses": []})
+    # Streamed events that merely carry a message or result are not terminal.
+    assert not is_result_envelope({"type": "assistant", "message": {"content": []}, "session_id": "s"})
+    assert not is_result_envelope({"type": "user", "message": {"content": []}})
+    assert not is_result_envelope({"message": "rate limited"})
+    assert not is_result_envelope({"result": "partial"})
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -17,6 +18,10 @@ from experiment_runner.models.suite import (
     SuiteTask,
     SuiteTaskStatus,
 )
+from experiment_runner.result_cache import ResultIndex, result_index_path
+from experiment_runner.suite_estimate import estimate_suite
+from experiment_runner.suite_store import SuiteStateStore, suite_store_path
+from experiment_runner.timeout_policy import TaskDuration, adaptive_timeout, load_duration_history
 
 
 def _write_questions(path: Path, prefix: str = "q") -> None:
@@ -241,6 +246,9 @@ def test_run_suite_marks_timed_out_task_failed(tmp_path, monkeypatch) -> None:
     assert state.tasks[0].error == "Task timed out after 1s"
     assert state.active_pid is None
     assert "task timed out after 1s" in (tmp_path / "suite.state.log").read_text(encoding="utf-8")
+    # The timeout is recorded as a censored sample at its deadline.
+    (recorded,) = load_duration_history(config.output_dir)[("ace", "qwen3:4b", 1)]
+    assert recorded == TaskDuration(1.0, timed_out=True)
 
 
 def test_run_suite_timeout_handles_partial_stdout_line(tmp_path, monkeypatch) -> None:
@@ -305,6 +313,226 @@ def test_run_suite_tracks_immediate_success_result_path(tmp_path, monkeypatch) -
     assert state.tasks[0].result_path == str(result_path)
 
 
+def _cacheable_config(tmp_path: Path) -> ExperimentSuiteConfig:
+    config = _config(tmp_path)
+    corpus = tmp_path / "solar_system_wiki"
+    (corpus / "text").mkdir(parents=True, exist_ok=True)
+    (corpus / "text" / "mars.md").write_text("Mars\n", encoding="utf-8")
+    config.corpora[0].path_to_corpora = str(corpus)
+    return config
+
+
+def test_build_suite_tasks_reuses_results_with_matching_fingerprint(tmp_path) -> None:
+    config = _cacheable_config(tmp_path)
+    tasks = suite.build_suite_tasks(config)
+    assert all(task.fingerprint for task in tasks)
+    assert len({task.fingerprint for task in tasks}) == len(tasks)
+    old_result = tmp_path / "old-suite.jsonl"
+    old_result.write_text("{}\n", encoding="utf-8")
+    with ResultIndex(result_index_path(config.output_dir)) as index:
+        index.record(tasks[0].fingerprint, str(old_result), suite_id="old-suite")
+
+    # A different suite with the same inputs picks the result up.
+    new_suite = config.model_copy(update={"suite_id": "new-suite"})
+    cached = suite.build_suite_tasks(new_suite)
+    assert cached[0].cache_hit is True
+    assert cached[0].status == SuiteTaskStatus.SUCCEEDED
+    assert cached[0].result_path == str(old_result)
+    assert not any(task.cache_hit for task in cached[1:])
+    assert suite.summarize_suite_state(suite.build_suite_state(new_suite))["cache_hits"] == 1
+
+    assert not suite.build_suite_tasks(new_suite.model_copy(update={"use_cache": False}))[0].cache_hit
+    assert not suite.build_suite_tasks(new_suite.model_copy(update={"num_ctx": 4096}))[0].cache_hit
+    # The recorded result was produced without a trace; it cannot serve a suite that wants traces.
+    assert not suite.build_suite_tasks(new_suite.model_copy(update={"no_trace": False}))[0].cache_hit
+    (tmp_path / "solar_system_wiki" / "text" / "mars.md").write_text("Mars, edited\n", encoding="utf-8")
+    assert not suite.build_suite_tasks(new_suite)[0].cache_hit
+
+
+def test_run_suite_logs_reused_cached_results(tmp_path, monkeypatch) -> None:
+    config = _config(tmp_path)
+    old_result = tmp_path / "old-suite.jsonl"
+    old_result.write_text("{}\n", encoding="utf-8")
+    task = SuiteTask(
+        task_id="cached-task",
+        index=1,
+        system=SystemName.ACE,
+        model="qwen3:4b",
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        questions_file=config.corpora[0].questions_file,
+        path_to_corpora=config.corpora[0].path_to_corpora,
+        question_id="ss_L1_001",
+        question_text="Cached?",
+        level=1,
+        command=[sys.executable, "-c", "raise SystemExit(1)"],
+        status=SuiteTaskStatus.SUCCEEDED,
+        result_path=str(old_result),
+        cache_hit=True,
+    )
+    monkeypatch.setattr(suite, "build_suite_tasks", lambda _config: [task])
+
+    state = suite.run_suite(config, tmp_path / "suite.state.json")
+
+    assert state.tasks[0].status == SuiteTaskStatus.SUCCEEDED
+    log = (tmp_path / "suite.state.log").read_text(encoding="utf-8")
+    assert f"=== task 1/1 cached-task ===\ncached result reused: {old_result}" in log
+
+
+def test_build_suite_tasks_learns_timeouts_from_past_task_wall_times(tmp_path, capsys) -> None:
+    config = _config(tmp_path)
+    config.timeout_policy.adaptive = True
+    config.timeout_policy.floor_s = 5
+    config.timeout_policy.startup_margin_s = 0
+    with ResultIndex(result_index_path(config.output_dir)) as index:
+        recorded = dict(system="ace", model="qwen3:4b", corpus="solar_system_wiki", question_id="ss_L1_001", level=1)
+        for seconds in (10, 11, 12, 13, 14):
+            index.record_duration(**recorded, wall_s=float(seconds), deadline_s=240, succeeded=True)
+        # A timeout proposes its own deadline, unscaled; a fast failure is ignored.
+        index.record_duration(**recorded, wall_s=20.5, deadline_s=20, succeeded=False, timed_out=True)
+        index.record_duration(**recorded, wall_s=2.0, deadline_s=240, succeeded=False)
+
+    tasks = {task.task_id: task for task in suite.build_suite_tasks(config)}
+
+    learned = tasks["qwen3-4b--solar-system-wiki--ss-l1-001--ace"]
+    # Proposals are 15, 16.5, 18, 19.5, 21 (x1.5) and 20 (the timeout): p99 is 20.95s.
+    assert (learned.timeout_s, learned.timeout_samples) == (21, 6)
+    config.timeout_policy.startup_margin_s = 15
+    # Successes now propose 30..36s; the timeout still proposes 20s.
+    assert suite.build_suite_tasks(config)[0].timeout_s == 36
+    config.timeout_policy.startup_margin_s = 0
+    for task_id in ("qwen3-4b--solar-system-wiki--ss-l2-002--ace", "qwen3-14b--solar-system-wiki--ss-l1-001--ace"):
+        assert (tasks[task_id].timeout_s, tasks[task_id].timeout_samples) == (240, 0)
+
+    config.timeout_policy.ceiling_s = 18
+    assert suite.build_suite_tasks(config)[0].timeout_s == 18
+    config.timeout_policy.adaptive = False
+    assert {task.timeout_s for task in suite.build_suite_tasks(config)} == {240}
+    config.timeout_policy.quantile = 0
+    with pytest.raises(ValueError, match="quantile"):
+        suite.build_suite_tasks(config)
+
+    config.timeout_policy.adaptive = True
+    config.timeout_policy.quantile = 0.99
+    config_path = tmp_path / "suite.json"
+    config_path.write_text(config.model_dump_json(), encoding="utf-8")
+    suite.run_suite_plan(argparse.Namespace(config=str(config_path), json=False, no_cache=False))
+    assert "timeout=18s (learned from 6 runs)" in capsys.readouterr().out
+
+
+def test_adaptive_timeout_does_not_ratchet_on_repeated_timeouts(tmp_path) -> None:
+    config = _config(tmp_path)
+    config.timeout_policy.adaptive = True
+    config.timeout_policy.floor_s = 5
+    config.timeout_policy.startup_margin_s = 30
+    successes = [TaskDuration(float(seconds)) for seconds in (10, 11, 12, 13)]
+
+    timeout_s, _ = adaptive_timeout(config, successes + [TaskDuration(60.0, timed_out=True)])
+    # Hanging again at the learned deadline proposes that deadline, not 1.5x + 30s more.
+    for _ in range(3):
+        timeout_s, _ = adaptive_timeout(config, successes + [TaskDuration(float(timeout_s), timed_out=True)] * 2)
+    assert timeout_s == 60
+
+
+def test_suite_estimate_uses_past_durations_and_simulates_parallelism(tmp_path, capsys) -> None:
+    config = _config(tmp_path)
+    with ResultIndex(result_index_path(config.output_dir)) as index:
+        index.record_duration(
+            system="ace",
+            model="qwen3:4b",
+            corpus="solar_system_wiki",
+            question_id="ss_L1_001",
+            level=1,
+            wall_s=10.0,
+            deadline_s=240,
+            succeeded=True,
+        )
+    # The runner's own execution time excludes start-up; only wall times count.
+    row = {
+        "system_name": "ace",
+        "model": "qwen3:4b",
+        "corpus": "solar_system_wiki",
+        "question_id": "ss_L1_001",
+        "answer_error": None,
+        "metrics": {"execution_time_s": 4.0},
+    }
+    (Path(config.output_dir) / "history.jsonl").write_text(json.dumps(row) + "\n", encoding="utf-8")
+
+    estimate = estimate_suite(config, suite.build_suite_tasks(config), workers=[1, 2])
+
+    # ace/qwen3:4b has history (level 2 borrows level 1's); the other six tasks
+    # are counted at the 240s default timeout.
+    assert estimate.pending_tasks == 8
+    assert estimate.tasks_without_history == 6
+    assert estimate.expected_total_s == estimate.p90_total_s == 2 * 10 + 6 * 240
+    assert estimate.model_loads == 2
+    assert [(level.workers, level.expected_s) for level in estimate.parallelism] == [(1, 1460), (2, 730)]
+
+    config_path = tmp_path / "suite.json"
+    config_path.write_text(config.model_dump_json(), encoding="utf-8")
+    suite.run_suite_estimate(argparse.Namespace(config=str(config_path), parallelism=[1, 4], json=False, no_cache=False))
+    out = capsys.readouterr().out
+    assert "expected total: 24m 20s (p90 24m 20s)" in out
+    assert "what-if (suites run one task at a time" in out
+    assert "4 worker(s): expected 8m 0s" in out
+
+
+def test_run_suite_applies_the_task_timeout(tmp_path, monkeypatch) -> None:
+    config = _config(tmp_path)
+    task = SuiteTask(
+        task_id="slow-task",
+        index=1,
+        system=SystemName.ACE,
+        model="qwen3:4b",
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        questions_file=config.corpora[0].questions_file,
+        path_to_corpora=config.corpora[0].path_to_corpora,
+        question_id="ss_L1_001",
+        question_text="Slow?",
+        level=1,
+        command=[sys.executable, "-c", "import time; time.sleep(10)"],
+        timeout_s=1,
+    )
+    monkeypatch.setattr(suite, "build_suite_tasks", lambda _config: [task])
+
+    state = suite.run_suite(config, tmp_path / "suite.state.json")
+
+    assert state.tasks[0].error == "Task timed out after 1s"
+
+
+def test_run_suite_records_succeeded_task_in_result_index(tmp_path, monkeypatch) -> None:
+    config = _config(tmp_path)
+    result_path = tmp_path / "recorded.jsonl"
+    task = SuiteTask(
+        task_id="recorded-task",
+        index=1,
+        system=SystemName.ACE,
+        model="qwen3:4b",
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        questions_file=config.corpora[0].questions_file,
+        path_to_corpora=config.corpora[0].path_to_corpora,
+        question_id="ss_L1_001",
+        question_text="Recorded?",
+        level=1,
+        fingerprint="fingerprint-1",
+        command=[
+            sys.executable,
+            "-c",
+            (
+                "from pathlib import Path; "
+                f"p=Path({str(result_path)!r}); "
+                "p.write_text('{}\\n', encoding='utf-8'); "
+                f"print('{suite.RESULT_PATH_PREFIX}{result_path}')"
+            ),
+        ],
+    )
+    monkeypatch.setattr(suite, "build_suite_tasks", lambda _config: [task])
+
+    suite.run_suite(config, tmp_path / "suite.state.json")
+
+    with ResultIndex(result_index_path(config.output_dir)) as index:
+        assert index.candidates("fingerprint-1") == [str(result_path)]
+
+
 def test_run_suite_persists_heartbeat_for_long_running_task(tmp_path, monkeypatch) -> None:
     config = _config(tmp_path)
     config.task_timeout_s = 2
@@ -355,6 +583,106 @@ def test_run_suite_rejects_success_without_result_path(tmp_path, monkeypatch) ->
     assert state.tasks[0].error == "Command exited successfully but did not report a non-empty result file."
 
 
+def test_run_suite_backs_state_with_indexed_store_and_json_snapshot(tmp_path, monkeypatch) -> None:
+    config = _config(tmp_path)
+    result_path = tmp_path / "store.jsonl"
+    task = SuiteTask(
+        task_id="store-task",
+        index=1,
+        system=SystemName.ACE,
+        model="qwen3:4b",
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        questions_file=config.corpora[0].questions_file,
+        path_to_corpora=config.corpora[0].path_to_corpora,
+        question_id="ss_L1_001",
+        question_text="Store?",
+        level=1,
+        command=[
+            sys.executable,
+            "-c",
+            (
+                "from pathlib import Path; "
+                f"Path({str(result_path)!r}).write_text('{{}}\\n', encoding='utf-8'); "
+                f"print('{suite.RESULT_PATH_PREFIX}{result_path}')"
+            ),
+        ],
+    )
+    monkeypatch.setattr(suite, "build_suite_tasks", lambda _config: [task])
+    state_path = tmp_path / "suite.state.json"
+
+    suite.run_suite(config, state_path)
+
+    assert suite_store_path(state_path) == tmp_path / "suite.state.db"
+    with SuiteStateStore(suite_store_path(state_path)) as store:
+        stored = store.get_task("store-task")
+        assert stored is not None
+        assert stored.status == SuiteTaskStatus.SUCCEEDED
+        assert store.cancel_requested() is False
+    snapshot = ExperimentSuiteState.model_validate_json(state_path.read_text(encoding="utf-8"))
+    assert snapshot.tasks[0].status == SuiteTaskStatus.SUCCEEDED
+    assert snapshot.runner_pid is None
+
+    suite.run_suite_cancel(argparse.Namespace(state=str(state_path)))
+
+    assert suite.load_suite_state(state_path).cancel_requested is True
+    assert suite.summarize_suite_state(suite.load_suite_state(state_path))["succeeded"] == 1
+
+
+def test_open_suite_store_migrates_legacy_json_and_reimports_external_rewrites(tmp_path) -> None:
+    config = _config(tmp_path)
+    state_path = tmp_path / "suite.state.json"
+    legacy = suite.build_suite_state(config)
+    legacy.tasks[0].status = SuiteTaskStatus.SUCCEEDED
+    state_path.write_text(legacy.model_dump_json(), encoding="utf-8")
+
+    with suite.open_suite_store(state_path) as store:
+        assert store.get_task(legacy.tasks[0].task_id).status == SuiteTaskStatus.SUCCEEDED
+        assert store.task_ids() == [task.task_id for task in legacy.tasks]
+        failed = store.get_task(legacy.tasks[1].task_id)
+        failed.status = SuiteTaskStatus.FAILED
+        store.update_task(failed, active_pid=123)
+
+    loaded = suite.load_suite_state(state_path)
+    assert loaded.tasks[1].status == SuiteTaskStatus.FAILED
+    assert loaded.active_pid == 123
+
+    rewritten = suite.build_suite_state(config)
+    rewritten.cancel_requested = True
+    state_path.write_text(rewritten.model_dump_json(), encoding="utf-8")
+    os.utime(state_path, ns=(1, 1))
+
+    reloaded = suite.load_suite_state(state_path)
+    assert reloaded.cancel_requested is True
+    assert reloaded.tasks[0].status == SuiteTaskStatus.PENDING
+
+
+def test_suite_state_readers_never_write_and_a_live_runner_blocks_reimports(tmp_path) -> None:
+    config = _config(tmp_path)
+    state_path = tmp_path / "suite.state.json"
+    state = suite.build_suite_state(config)
+    state.runner_pid = os.getpid()
+    state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    task_id = state.tasks[0].task_id
+    with suite.open_suite_store(state_path) as store:
+        task = store.get_task(task_id)
+        task.status = SuiteTaskStatus.SUCCEEDED
+        store.update_task(task)
+    # The runner's own snapshot, caught before it records the snapshot mtime.
+    os.utime(state_path, ns=(1, 1))
+
+    assert suite.load_suite_state(state_path).tasks[0].status == SuiteTaskStatus.SUCCEEDED
+    with suite.open_suite_store(state_path) as store:
+        assert store.get_task(task_id).status == SuiteTaskStatus.SUCCEEDED
+        store.update_meta(runner_pid=None)
+
+    # Without a live runner readers see the rewritten JSON, but leave importing it to writers.
+    assert suite.load_suite_state(state_path).tasks[0].status == SuiteTaskStatus.PENDING
+    with SuiteStateStore(suite_store_path(state_path), read_only=True) as store:
+        assert store.get_task(task_id).status == SuiteTaskStatus.SUCCEEDED
+    with suite.open_suite_store(state_path) as store:
+        assert store.get_task(task_id).status == SuiteTaskStatus.PENDING
+
+
 def test_experiment_runner_parses_suite_subcommands() -> None:
     args = runner_main.parse_args(["suite", "run", "--config", "suite.json", "--state", "state.json"])
 
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from pathlib import Path
+
+from experiment_runner.commands import run as run_command
+from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
+from experiment_runner.models.question import Question
+from experiment_runner.models.result import RunResult
+from experiment_runner.runners.baseline.workspace_pool import WorkspacePool, sandbox_workspace
+
+
+def test_workspace_pool_recycles_clean_workspaces_and_replaces_dirty_ones(tmp_path) -> None:
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+
+    with WorkspacePool(1) as pool:
+        with pool.checkout(corpus) as first:
+            assert (first / "corpus").resolve() == corpus
+        with pool.checkout(corpus) as second:
+            (second / "notes.txt").write_text("left behind", encoding="utf-8")
+        with pool.checkout(corpus) as third:
+            assert sorted(path.name for path in third.iterdir()) == ["corpus"]
+
+        assert second == first
+        assert third != first
+        assert not first.exists()
+        assert (pool.recycled, pool.discarded) == (2, 1)
+
+
+def test_run_experiment_runs_cli_baseline_questions_concurrently_in_order(monkeypatch, tmp_path) -> None:
+    corpus = tmp_path / "solar_system_wiki"
+    (corpus / "text").mkdir(parents=True)
+    (corpus / "text" / "mars.md").write_text("Mars\n", encoding="utf-8")
+    questions_file = tmp_path / "questions.json"
+    questions_file.write_text(json.dumps([
+        {"id": f"ss_L1_00{i}", "corpus": "solar_system_wiki", "level": 1, "question": f"Q{i}?", "expected_facts": []}
+        for i in range(1, 7)
+    ]), encoding="utf-8")
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    workspaces: set[Path] = set()
+
+    class FakeCliRunner:
+        workspace_pool = None
+
+        def __init__(self, config) -> None:
+            self.config = config
+
+        def setup(self) -> None:
+            pass
+
+        def teardown(self) -> None:
+            pass
+
+        def run(self, question: Question) -> RunResult:
+            nonlocal in_flight, peak
+            corpus_root = Path(self.config.path_to_corpora)
+            with sandbox_workspace(self.workspace_pool, corpus_root, prefix="fake_") as workspace:
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                    workspaces.add(workspace)
+                time.sleep(0.1)
+                assert (workspace / "corpus" / "text" / "mars.md").is_file()
+                with lock:
+                    in_flight -= 1
+            return RunResult(
+                system_name=self.config.system,
+                automation_level=self.config.automation_level,
+                corpus=self.config.corpus,
+                question_id=question.id,
+                question_text=question.question,
+                model=self.config.model,
+                answer_text="answer",
+            )
+
+    monkeypatch.setattr(run_command, "get_runner", lambda config: FakeCliRunner(config))
+    args = argparse.Namespace(
+        system=SystemName.CHATGPT_CODEX.value,
+        corpus=Corpus.SOLAR_SYSTEM_WIKI.value,
+        questions_file=str(questions_file),
+        output_dir=str(tmp_path / "results"),
+        model="qwen3:4b",
+        num_ctx=8192,
+        path_to_corpora=str(corpus),
+        automation_level=AutomationLevel.FULL.value,
+        question_ids=None,
+        reasoning_enabled=False,
+        no_trace=True,
+        dry_run=False,
+        result_store=False,
+        suite_id=None,
+        concurrency=3,
+    )
+
+    run_command.run_experiment(args)
+
+    assert 1 < peak <= 3
+    assert len(workspaces) == 3
+    result_file = next((tmp_path / "results").glob("*.jsonl"))
+    rows = [json.loads(line) for line in result_file.read_text(encoding="utf-8").splitlines()]
+    assert [row["question_id"] for row in rows] == [f"ss_L1_00{i}" for i in range(1, 7)]
+    assert all(row["corpus_snapshot"]["file_count"] == 1 for row in rows)
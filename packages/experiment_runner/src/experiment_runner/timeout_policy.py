@@ -0,0 +1,97 @@
+"""Per-task deadlines learned from past task durations.
+
+A single ``task_timeout_s`` either lets a fast system sit on a hung run for
+minutes or kills a slow system/level combination just before it finishes.
+With ``TaskTimeoutPolicy.adaptive`` set, every (system, model, level) group
+instead gets a deadline learned from its past suite tasks, clamped to
+``[floor_s, ceiling_s]``. Groups with fewer than ``min_samples`` usable tasks
+keep ``task_timeout_s``.
+
+Wall times are what the deadline is enforced against: they cover process and
+model start-up, which the runners' own ``execution_time_s`` does not. They
+come from the suite runner's records in ``<output_dir>/result_index.db``. A
+succeeded task proposes its wall time times ``factor`` plus
+``startup_margin_s``. A task that timed out only says its run would have taken
+at least its deadline, so it proposes that deadline unchanged: scaling it
+again would raise the deadline after every hang until it hit the ceiling.
+Tasks that failed before their deadline say nothing about run time and are
+ignored. The learned deadline is the ``quantile`` of the proposals.
+"""
+from __future__ import annotations
+
+import math
+import sqlite3
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from experiment_runner.models.suite import ExperimentSuiteConfig, TaskTimeoutPolicy
+from experiment_runner.result_cache import result_index_path
+
+class TaskDuration(NamedTuple):
+    # Wall time of a succeeded task, or the deadline a task timed out at.
+    seconds: float
+    timed_out: bool = False
+
+
+# (system, model, level) -> past suite tasks that succeeded or timed out.
+DurationHistory = dict[tuple[str, str, int], list[TaskDuration]]
+
+def load_duration_history(output_dir: str | Path) -> DurationHistory:
+    """Group the suite runner's succeeded and timed-out tasks by (system, model, level)."""
+    history: DurationHistory = {}
+    path = result_index_path(output_dir)
+    if not path.is_file():
+        return history
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=30.0)
+    try:
+        rows = conn.execute(
+            "SELECT system, model, level, wall_s, deadline_s, succeeded, timed_out FROM task_durations"
+            " WHERE succeeded OR timed_out"
+        ).fetchall()
+    except sqlite3.Error:
+        rows = []
+    finally:
+        conn.close()
+    for system, model, level, wall_s, deadline_s, succeeded, timed_out in rows:
+        sample = TaskDuration(float(wall_s)) if succeeded else TaskDuration(float(deadline_s), timed_out=True)
+        history.setdefault((system, model, level), []).append(sample)
+    return history
+
+
+def adaptive_timeout(config: ExperimentSuiteConfig, durations: list[TaskDuration]) -> tuple[int, int]:
+    """Return (timeout_s, samples used); samples is 0 when the default applies."""
+    policy = config.timeout_policy
+    if not policy.adaptive or len(durations) < policy.min_samples:
+        return config.task_timeout_s, 0
+    proposals = [
+        sample.seconds if sample.timed_out else sample.seconds * policy.factor + policy.startup_margin_s
+        for sample in durations
+    ]
+    learned = quantile(proposals, policy.quantile)
+    return int(min(max(math.ceil(learned), policy.floor_s), policy.ceiling_s)), len(durations)
+
+
+def validate_timeout_policy(policy: TaskTimeoutPolicy) -> list[str]:
+    problems = []
+    if not 0 < policy.quantile <= 1:
+        problems.append(f"timeout_policy.quantile must be in (0, 1], got {policy.quantile}")
+    if policy.factor <= 0:
+        problems.append(f"timeout_policy.factor must be positive, got {policy.factor}")
+    if policy.startup_margin_s < 0:
+        problems.append(f"timeout_policy.startup_margin_s must not be negative, got {policy.startup_margin_s}")
+    if not 1 <= policy.floor_s <= policy.ceiling_s:
+        problems.append(
+            f"timeout_policy needs 1 <= floor_s <= ceiling_s, got {policy.floor_s} and {policy.ceiling_s}"
+        )
+    if policy.min_samples < 1:
+        problems.append(f"timeout_policy.min_samples must be at least 1, got {policy.min_samples}")
+    return problems
+
+
+def quantile(values: Iterable[float], q: float) -> float:
+    """Linearly interpolated quantile of ``values`` (which must not be empty)."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -0,0 +1,96 @@
+"""Content-addressed, compressed storage for session traces.
+
+Traces are by far the largest part of a RunResult, yet most readers (the
+dashboard tables, charts, the analysis pipeline) never look at them. Runs
+therefore keep only ``trace_id`` (the SHA-256 of the trace JSON) and the
+trace itself lives gzip-compressed under ``<results_dir>/traces/``, shared by
+identical traces and read only when something asks for it.
+
+Loaders call ``bind_trace_store`` on every run they read so ``load_trace`` can
+find the blob later without the caller knowing where the run came from.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from experiment_runner.models.result import RunResult
+from experiment_runner.models.trace import SessionTrace
+
+TRACE_STORE_DIRNAME = "traces"
+
+
+def trace_store_dir(results_dir: str | Path) -> Path:
+    return Path(results_dir) / TRACE_STORE_DIRNAME
+
+
+class TraceStore:
+    """Directory of ``<id[:2]>/<id>.json.gz`` blobs keyed by trace content hash."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def put(self, trace: SessionTrace) -> str:
+        payload = trace.model_dump_json().encode("utf-8")
+        trace_id = hashlib.sha256(payload).hexdigest()
+        path = self._path(trace_id)
+        if path.is_file():
+            return trace_id
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            # mtime=0 keeps the compressed bytes a pure function of the trace.
+            with gzip.GzipFile(fileobj=tmp, mode="wb", mtime=0) as compressed:
+                compressed.write(payload)
+        os.replace(tmp.name, path)
+        return trace_id
+
+    def get(self, trace_id: str) -> SessionTrace | None:
+        path = self._path(trace_id)
+        if not path.is_file():
+            return None
+        with gzip.open(path, "rb") as handle:
+            return SessionTrace.model_validate_json(handle.read())
+
+    def contains(self, trace_id: str) -> bool:
+        return self._path(trace_id).is_file()
+
+    def _path(self, trace_id: str) -> Path:
+        return self.root / trace_id[:2] / f"{trace_id}.json.gz"
+
+
+def externalize_trace(run: RunResult, store: TraceStore) -> RunResult:
+    """Move ``run.trace`` into ``store`` and leave only its ``trace_id`` on the run."""
+    if run.trace is not None:
+        run.trace_id = store.put(run.trace)
+        run.trace = None
+        run._trace_store_root = store.root
+    return run
+
+
+def bind_trace_store(run: RunResult, results_dir: str | Path) -> RunResult:
+    run._trace_store_root = trace_store_dir(results_dir)
+    return run
+
+
+def inline_trace(run: RunResult) -> RunResult:
+    """Copy an out-of-line trace back onto the run, e.g. for a self-contained export."""
+    if run.trace is None and run.trace_id is not None:
+        run.trace = load_trace(run)
+    return run
+
+
+def load_trace(run: RunResult) -> SessionTrace | None:
+    """Return the run's trace, reading it from the trace store on demand."""
+    if run.trace is not None:
+        return run.trace
+    if run.trace_id is None or run._trace_store_root is None:
+        return None
+    return TraceStore(run._trace_store_root).get(run.trace_id)
@@ -8,19 +8,61 @@ verify each cited claim. Here we split the responsibility:
     classify the claim", returning a strict JSON object that we validate.
 
 This keeps the LLM's role narrow (classification) where it is reliable, and
-moves anything mechanical (regex, file IO) out of the agent loop.
+moves anything mechanical (regex, file IO) out of the agent loop. Claim
+questions are independent of each other, so ``classify_claims`` sends up to
+``parallelism`` of them at once; set it to the server's ``OLLAMA_NUM_PARALLEL``.
+
+In ``claim_mode="batch"`` the claims of one answer are instead verified in a
+single request (split only when they would not fit the context window):
+instructions are sent once, and claims citing the same file range share one
+copy of the excerpt. Each returned verdict is validated on its own; claims
+whose verdict is missing or invalid are re-asked one at a time.
+
+With ``num_ctx_mode="dynamic"`` each kind of request (single claim, claim
+batch, summary) gets the smallest context of ``_NUM_CTX_BUCKETS`` that fits a
+character-based estimate of its prompt plus the reply, up to ``num_ctx``.
+Ollama reloads the model runner whenever a request's num_ctx differs from the
+loaded one, so within a kind the context only grows, to the bucket of the
+largest prompt of that kind so far: one long excerpt costs at most one reload
+per bucket instead of one per switch. Kinds are sized apart, so short claim
+checks stay small after a long summary prompt. In either mode a prompt whose estimate exceeds ``num_ctx`` is
+counted in ``truncation_risks``, since Ollama silently drops the start of a
+prompt that does not fit.
 """
 from __future__ import annotations
 
 import json
-from typing import Optional
-
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal, Optional, Sequence, TypeVar
+
+from agent.cassette import wrap_chat_model
+from agent.ollama_host import ollama_base_url
 from langchain_ollama import ChatOllama
 from pydantic import BaseModel, Field, ValidationError
 
-from result_processor.models.analysis import ClaimStatus
+from result_processor.analysis.verdict_cache import VerdictCache, verdict_key
+from result_processor.models.analysis import (
+    CLAIM_MODES,
+    NUM_CTX_MODES,
+    ClaimDecider,
+    ClaimMode,
+    ClaimStatus,
+    NumCtxMode,
+)
 
 
+_CLASSIFICATION_RULES = """\
+Classification rules:
+- supported: the excerpt clearly entails the full claim.
+- partially_supported: the excerpt supports part, but the claim adds extra detail or stronger wording.
+- not_supported: the excerpt does not support the claim, contradicts it, or is unrelated.
+- bad_reference: the excerpt is empty, unreadable, or cannot be matched to the claim at all.
+"""
+
 _CLASSIFY_PROMPT = """\
 You are a strict verifier. Decide whether the CLAIM is supported by the EXCERPT.
 
@@ -30,16 +72,26 @@ CLAIM:
 EXCERPT (file: {file_path}, lines: {a}-{b}):
 {excerpt}
 
-Classification rules:
-- supported: the excerpt clearly entails the full claim.
-- partially_supported: the excerpt supports part, but the claim adds extra detail or stronger wording.
-- not_supported: the excerpt does not support the claim, contradicts it, or is unrelated.
-- bad_reference: the excerpt is empty, unreadable, or cannot be matched to the claim at all.
-
+""" + _CLASSIFICATION_RULES + """
 Respond with a single valid JSON object on one line, no prose, no markdown:
 {{"status": "supported|partially_supported|not_supported|bad_reference", "justification": "1-2 sentences"}}
 """
 
+_BATCH_CLASSIFY_PROMPT = """\
+You are a strict verifier. For every CLAIM below, decide whether it is supported by the EXCERPT it cites.
+Judge each claim only against its own excerpt.
+
+EXCERPTS:
+{excerpts}
+
+CLAIMS:
+{claims}
+
+""" + _CLASSIFICATION_RULES + """
+Respond with a single valid JSON object on one line, no prose, no markdown, with exactly one verdict per claim id:
+{{"verdicts": [{{"id": "C1", "status": "supported|partially_supported|not_supported|bad_reference", "justification": "1-2 sentences"}}]}}
+"""
+
 _SUMMARIZE_PROMPT = """\
 You are scoring an answer that was produced for a question, given the per-claim verdicts of its citations.
 
@@ -59,29 +111,126 @@ Respond with a single valid JSON object on one line, no prose, no markdown:
 {{"helpfulness_rating": <1-5>, "notes": "<one short paragraph>"}}
 """
 
+# A batch request holds at most this many claims, and its claims and excerpts
+# at most this many characters per num_ctx token (about 2/3 of the window at
+# ~3 characters per token, leaving room for the verdicts).
+_MAX_BATCH_CLAIMS = 16
+_BATCH_CHARS_PER_CTX_TOKEN = 2
+
+# Context sizes used in dynamic num_ctx mode, and the token estimate behind
+# them: a conservative ~3 characters per token, plus room for the reply.
+_NUM_CTX_BUCKETS = (2048, 4096, 8192, 16384, 32768, 65536, 131072)
+_CHARS_PER_TOKEN = 3
+_CLAIM_REPLY_TOKENS = 256
+_BATCH_REPLY_TOKENS_PER_CLAIM = 96
+_SUMMARY_REPLY_TOKENS = 512
+
+# Request kinds sized separately in dynamic num_ctx mode.
+_RequestKind = Literal["claim", "batch", "summary"]
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 class _ClaimVerdict(BaseModel):
     status: ClaimStatus
     justification: str = ""
+    # Set by ExaminerLLM, not the model: the context the request was sent
+    # with, and whether its prompt was estimated not to fit.
+    num_ctx: Optional[int] = None
+    truncation_risk: bool = False
+
+
+class _BatchItemVerdict(_ClaimVerdict):
+    id: str
 
 
 class _OverallVerdict(BaseModel):
     helpfulness_rating: int = Field(ge=1, le=5)
     notes: str = ""
+    num_ctx: Optional[int] = None
+    truncation_risk: bool = False
+
+
+@dataclass(frozen=True)
+class ClaimCheck:
+    """One cited claim and the excerpt it points at."""
+
+    claim: str
+    excerpt: Optional[str]
+    file_path: str
+    a: int
+    b: int
+
+
+@dataclass
+class ClaimBatch:
+    """Verdicts of ``classify_claims`` in input order, plus timing."""
+
+    verdicts: list[_ClaimVerdict] = field(default_factory=list)
+    # Per verdict: "examiner", "cache", or "rule" for an unresolved excerpt.
+    decided_by: list[ClaimDecider] = field(default_factory=list)
+    wall_s: float = 0.0
+    # Summed duration of the examiner calls; above ``wall_s`` when they overlapped.
+    call_s: float = 0.0
+    # Examiner requests made, batch requests and per-claim requests alike.
+    calls: int = 0
+    # Verdicts served from the verdict cache without an examiner call.
+    cache_hits: int = 0
+    # Claims answered by a batch request, and claims re-asked one at a time
+    # because their batch verdict was missing or invalid.
+    batched_claims: int = 0
+    batch_fallbacks: int = 0
+    # Examiner requests (not claims) whose prompt was estimated to exceed num_ctx.
+    truncation_risks: int = 0
+
+    @property
+    def concurrency(self) -> Optional[float]:
+        """Mean number of examiner calls in flight while classifying."""
+        return self.call_s / self.wall_s if self.calls and self.wall_s > 0 else None
 
 
 class ExaminerLLM:
     """Stateless wrapper around ChatOllama with JSON-mode validation."""
 
-    def __init__(self, model: str, num_ctx: int = 8192, temperature: float = 0.0) -> None:
+    num_ctx: int = 8192
+    parallelism: int = 1
+    claim_mode: ClaimMode = "per_claim"
+    num_ctx_mode: NumCtxMode = "fixed"
+    verdict_cache: Optional[VerdictCache] = None
+    # Requests whose prompt was estimated to exceed num_ctx.
+    truncation_risks: int = 0
+
+    def __init__(
+        self,
+        model: str,
+        num_ctx: int = 8192,
+        temperature: float = 0.0,
+        parallelism: int = 1,
+        verdict_cache: Optional[VerdictCache] = None,
+        claim_mode: ClaimMode = "per_claim",
+        num_ctx_mode: NumCtxMode = "fixed",
+    ) -> None:
+        if parallelism < 1:
+            raise ValueError(f"examiner parallelism must be at least 1, got {parallelism}")
+        if claim_mode not in CLAIM_MODES:
+            raise ValueError(f"examiner claim mode must be one of {', '.join(CLAIM_MODES)}, got {claim_mode!r}")
+        if num_ctx_mode not in NUM_CTX_MODES:
+            raise ValueError(f"examiner num_ctx mode must be one of {', '.join(NUM_CTX_MODES)}, got {num_ctx_mode!r}")
         self.model = model
-        self._client = ChatOllama(
-            model=model,
-            base_url="http://localhost:11434",
-            temperature=temperature,
-            num_ctx=num_ctx,
-            format="json",
-        )
+        self.num_ctx = num_ctx
+        self.parallelism = parallelism
+        self.verdict_cache = verdict_cache
+        self.claim_mode = claim_mode
+        self.num_ctx_mode = num_ctx_mode
+        self.truncation_risks = 0
+        self._temperature = temperature
+        self._lock = threading.Lock()
+        # Dynamic mode: per request kind, the context of its largest prompt so far.
+        self._dynamic_num_ctx: dict[_RequestKind, int] = {}
+        # One client per context size; _client is the one for num_ctx.
+        self._clients = {}
+        self._client = self._client_for(num_ctx)
 
     def classify_claim(
         self,
@@ -90,13 +239,23 @@ class ExaminerLLM:
         file_path: str,
         a: int,
         b: int,
+        *,
+        lookup: bool = True,
     ) -> _ClaimVerdict:
+        """Classify one claim; ``lookup=False`` skips the verdict cache read but still fills it."""
         if excerpt is None:
             return _ClaimVerdict(
                 status=ClaimStatus.BAD_REFERENCE,
                 justification="Excerpt could not be resolved (missing file or empty range).",
             )
 
+        cache = self.verdict_cache
+        key = self._verdict_key(claim, excerpt, _CLASSIFY_PROMPT) if cache is not None else None
+        if cache is not None and lookup:
+            cached = cache.get(key)
+            if cached is not None:
+                return _ClaimVerdict(status=cached.status, justification=cached.justification)
+
         prompt = _CLASSIFY_PROMPT.format(
             claim=claim,
             file_path=file_path,
@@ -104,10 +263,89 @@ class ExaminerLLM:
             b=b,
             excerpt=excerpt,
         )
-        return self._invoke_json(prompt, _ClaimVerdict, fallback=_ClaimVerdict(
+        fallback = _ClaimVerdict(
             status=ClaimStatus.BAD_REFERENCE,
             justification="Examiner failed to produce a parseable verdict.",
-        ))
+        )
+        verdict = self._invoke_json(prompt, _ClaimVerdict, fallback=fallback, reply_tokens=_CLAIM_REPLY_TOKENS)
+        if cache is not None and verdict is not fallback:
+            cache.put(key, examiner_model=self.model, status=verdict.status, justification=verdict.justification)
+        return verdict
+
+    def classify_claims(self, checks: Sequence[ClaimCheck]) -> ClaimBatch:
+        """Classify ``checks`` with at most ``parallelism`` calls in flight.
+
+        Claims found in the verdict cache are answered up front, in one
+        lookup, and never reach the examiner.
+        """
+        started = time.perf_counter()
+        timed = []
+        template = _BATCH_CLASSIFY_PROMPT if self.claim_mode == "batch" else _CLASSIFY_PROMPT
+        verdicts: dict[int, _ClaimVerdict] = {}
+        if self.verdict_cache is not None:
+            keys = {
+                index: self._verdict_key(check.claim, check.excerpt, template)
+                for index, check in enumerate(checks)
+                if check.excerpt is not None
+            }
+            found = self.verdict_cache.get_many(list(keys.values()))
+            verdicts = {
+                index: _ClaimVerdict(status=found[key].status, justification=found[key].justification)
+                for index, key in keys.items()
+                if key in found
+            }
+        cached = set(verdicts)
+
+        def timed_call(call: Callable[[_T], _R]) -> Callable[[_T], _R]:
+            def run(item: _T) -> _R:
+                call_started = time.perf_counter()
+                result = call(item)
+                timed.append(time.perf_counter() - call_started)
+                return result
+            return run
+
+        batched = 0
+        truncation_risks = 0
+        if self.claim_mode == "batch":
+            pending = [index for index, check in enumerate(checks) if index not in verdicts and check.excerpt is not None]
+            chunks = self._batch_chunks(checks, pending)
+            for answered, risk in self._map(timed_call(lambda chunk: self._classify_batch(checks, chunk)), chunks):
+                verdicts.update(answered)
+                batched += len(answered)
+                truncation_risks += risk
+
+        def classify(index: int) -> _ClaimVerdict:
+            check = checks[index]
+            return self.classify_claim(
+                claim=check.claim,
+                excerpt=check.excerpt,
+                file_path=check.file_path,
+                a=check.a,
+                b=check.b,
+                lookup=False,
+            )
+
+        remaining = [index for index in range(len(checks)) if index not in verdicts]
+        asked = [index for index in remaining if checks[index].excerpt is not None]
+        unresolved = [index for index in remaining if checks[index].excerpt is None]
+        verdicts.update(zip(asked, self._map(timed_call(classify), asked)))
+        verdicts.update(zip(unresolved, map(classify, unresolved)))
+        # Each re-asked claim was a request of its own.
+        truncation_risks += sum(1 for index in asked if verdicts[index].truncation_risk)
+        return ClaimBatch(
+            verdicts=[verdicts[index] for index in range(len(checks))],
+            decided_by=[
+                "rule" if check.excerpt is None else "cache" if index in cached else "examiner"
+                for index, check in enumerate(checks)
+            ],
+            wall_s=time.perf_counter() - started,
+            call_s=sum(timed),
+            calls=len(timed),
+            cache_hits=len(cached),
+            batched_claims=batched,
+            batch_fallbacks=len(asked) if self.claim_mode == "batch" else 0,
+            truncation_risks=truncation_risks,
+        )
 
     def summarize(
         self,
@@ -123,24 +361,179 @@ class ExaminerLLM:
         return self._invoke_json(prompt, _OverallVerdict, fallback=_OverallVerdict(
             helpfulness_rating=1,
             notes="Examiner failed to produce a parseable summary.",
-        ))
+        ), reply_tokens=_SUMMARY_REPLY_TOKENS, kind="summary")
 
-    def _invoke_json(self, prompt: str, schema: type[BaseModel], *, fallback: BaseModel) -> BaseModel:
+    def _classify_batch(
+        self,
+        checks: Sequence[ClaimCheck],
+        indices: list[int],
+    ) -> tuple[dict[int, _ClaimVerdict], bool]:
+        """Verify ``checks[indices]`` in one request.
+
+        Returns the verdicts that validated, and whether the request's prompt
+        was estimated not to fit (also when no verdict came back).
+        """
+        excerpt_ids: dict[tuple[str, int, int, str], str] = {}
+        excerpt_blocks = []
+        claim_lines = []
+        claim_ids: dict[str, int] = {}
+        for number, index in enumerate(indices, start=1):
+            check = checks[index]
+            group = (check.file_path, check.a, check.b, check.excerpt)
+            if group not in excerpt_ids:
+                excerpt_ids[group] = f"E{len(excerpt_ids) + 1}"
+                excerpt_blocks.append(
+                    f"[{excerpt_ids[group]}] file: {check.file_path}, lines: {check.a}-{check.b}\n{check.excerpt}"
+                )
+            claim_id = f"C{number}"
+            claim_ids[claim_id] = index
+            claim_lines.append(f"[{claim_id}] (cites {excerpt_ids[group]}) {' '.join(check.claim.split())}")
+
+        prompt = _BATCH_CLASSIFY_PROMPT.format(
+            excerpts="\n\n".join(excerpt_blocks),
+            claims="\n".join(claim_lines),
+        )
+        data, num_ctx, truncation_risk = self._invoke_raw_json(
+            prompt,
+            reply_tokens=_BATCH_REPLY_TOKENS_PER_CLAIM * (len(indices) + 1),
+            kind="batch",
+        )
+        items = data.get("verdicts") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            return {}, truncation_risk
+
+        answered: dict[int, _ClaimVerdict] = {}
+        for item in items:
+            try:
+                parsed = _BatchItemVerdict.model_validate(item)
+            except ValidationError:
+                continue
+            index = claim_ids.get(parsed.id.strip().strip("[]"))
+            if index is None or index in answered:
+                continue
+            answered[index] = _ClaimVerdict(
+                status=parsed.status,
+                justification=parsed.justification,
+                num_ctx=num_ctx,
+                truncation_risk=truncation_risk,
+            )
+        if self.verdict_cache is not None:
+            for index, verdict in answered.items():
+                check = checks[index]
+                self.verdict_cache.put(
+                    self._verdict_key(check.claim, check.excerpt, _BATCH_CLASSIFY_PROMPT),
+                    examiner_model=self.model,
+                    status=verdict.status,
+                    justification=verdict.justification,
+                )
+        return answered, truncation_risk
+
+    def _batch_chunks(self, checks: Sequence[ClaimCheck], indices: list[int]) -> list[list[int]]:
+        """Split ``indices`` into batches, keeping claims that share an excerpt together."""
+        groups: dict[tuple[str, int, int, Optional[str]], list[int]] = {}
+        for index in indices:
+            check = checks[index]
+            groups.setdefault((check.file_path, check.a, check.b, check.excerpt), []).append(index)
+
+        budget = self.num_ctx * _BATCH_CHARS_PER_CTX_TOKEN
+        chunks: list[list[int]] = []
+        current: list[int] = []
+        used = 0
+        for (_file, _a, _b, excerpt), members in groups.items():
+            for start in range(0, len(members), _MAX_BATCH_CLAIMS):
+                part = members[start:start + _MAX_BATCH_CLAIMS]
+                size = len(excerpt or "") + sum(len(checks[index].claim) for index in part)
+                if current and (len(current) + len(part) > _MAX_BATCH_CLAIMS or used + size > budget):
+                    chunks.append(current)
+                    current, used = [], 0
+                current.extend(part)
+                used += size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _map(self, call: Callable[[_T], _R], items: Sequence[_T]) -> list[_R]:
+        """``call`` over ``items`` in order, with at most ``parallelism`` in flight."""
+        workers = min(self.parallelism, len(items))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="examiner") as pool:
+                return list(pool.map(call, items))
+        return [call(item) for item in items]
+
+    def _verdict_key(self, claim: str, excerpt: str, template: str) -> str:
+        return verdict_key(
+            examiner_model=self.model,
+            prompt_template=template,
+            claim=claim,
+            excerpt=excerpt,
+        )
+
+    def _context_size(self, prompt: str, reply_tokens: int, kind: _RequestKind) -> tuple[int, bool]:
+        """(num_ctx for ``prompt``, whether its estimate exceeds ``self.num_ctx``)."""
+        needed = math.ceil(len(prompt) / _CHARS_PER_TOKEN) + reply_tokens
+        if self.num_ctx_mode == "fixed":
+            return self.num_ctx, needed > self.num_ctx
+        size = next((size for size in _NUM_CTX_BUCKETS if size >= needed), self.num_ctx)
+        with self._lock:
+            grown = self._dynamic_num_ctx[kind] = max(self._dynamic_num_ctx.get(kind, 0), min(size, self.num_ctx))
+            return grown, needed > self.num_ctx
+
+    def _client_for(self, num_ctx: int) -> Any:
+        with self._lock:
+            client = self._clients.get(num_ctx)
+            if client is None:
+                client = self._clients[num_ctx] = wrap_chat_model(ChatOllama(
+                    model=self.model,
+                    base_url=ollama_base_url(),
+                    temperature=self._temperature,
+                    num_ctx=num_ctx,
+                    format="json",
+                ))
+            return client
+
+    def _invoke_raw_json(
+        self,
+        prompt: str,
+        *,
+        reply_tokens: int = _CLAIM_REPLY_TOKENS,
+        kind: _RequestKind = "claim",
+    ) -> tuple[Optional[Any], int, bool]:
+        """(parsed JSON reply or None when the call or parsing fails, num_ctx, truncation risk)."""
+        num_ctx, truncation_risk = self._context_size(prompt, reply_tokens, kind)
+        if truncation_risk:
+            with self._lock:
+                self.truncation_risks += 1
+        client = self._client if num_ctx == self.num_ctx else self._client_for(num_ctx)
         try:
-            response = self._client.invoke(prompt)
+            response = client.invoke(prompt)
         except Exception:
-            return fallback
+            return None, num_ctx, truncation_risk
 
         content = getattr(response, "content", "") or ""
         if not content:
-            return fallback
+            return None, num_ctx, truncation_risk
 
         try:
-            data = json.loads(content)
+            return json.loads(content), num_ctx, truncation_risk
         except json.JSONDecodeError:
-            return fallback
+            return None, num_ctx, truncation_risk
 
-        try:
-            return schema.model_validate(data)
-        except ValidationError:
-            return fallback
+    def _invoke_json(
+        self,
+        prompt: str,
+        schema: type[BaseModel],
+        *,
+        fallback: BaseModel,
+        reply_tokens: int = _CLAIM_REPLY_TOKENS,
+        kind: _RequestKind = "claim",
+    ) -> BaseModel:
+        data, num_ctx, truncation_risk = self._invoke_raw_json(prompt, reply_tokens=reply_tokens, kind=kind)
+        result = fallback
+        if data is not None:
+            try:
+                result = schema.model_validate(data)
+            except ValidationError:
+                pass
+        result.num_ctx = num_ctx
+        result.truncation_risk = truncation_risk
+        return result
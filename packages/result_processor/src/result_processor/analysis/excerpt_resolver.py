@@ -2,10 +2,23 @@
 
 This is the deterministic counterpart of the A2 agent's `resolve_reference`
 tool — invoked directly without going through the LLM.
+
+Answers cite the same few files over and over, so the resolver keeps a
+bounded LRU of loaded files keyed by (corpus, path, mtime, size): a changed
+file is simply a new key. Files up to ``_INDEX_ONLY_BYTES`` are kept as
+decoded lines. Larger ones are kept as a table of line start offsets, and
+only the cited byte ranges are read; their lines are split on "\\n" alone,
+where small files use ``str.splitlines``.
 """
 from __future__ import annotations
 
+import stat
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Sequence
 
 from experiment_runner.models.enums import Corpus
 
@@ -19,15 +32,57 @@ CORPUS_DIR_NAMES: dict[Corpus, str] = {
     Corpus.SCIPY: "scipy_repo",
 }
 
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_FILES = 512
 
 _MAX_EXCERPT_CHARS = 12_000
+# An excerpt of a large file never needs more bytes than this: at most 4
+# bytes per character, one character past the limit to detect truncation.
+_MAX_EXCERPT_BYTES = 4 * (_MAX_EXCERPT_CHARS + 2)
+_INDEX_ONLY_BYTES = 8 * 1024 * 1024
+_INDEX_CHUNK_BYTES = 1024 * 1024
 
+# (relative_path, a, b) as cited in an answer.
+Reference = tuple[str, int, int]
 
-class ExcerptResolver:
-    """Reads corpus excerpts for a fixed corpora root."""
 
-    def __init__(self, corpora_root: Path) -> None:
+@dataclass(frozen=True)
+class _LoadedFile:
+    # Decoded lines of a small file; None for an indexed large file.
+    lines: Optional[list[str]]
+    # Byte offset of every line start of a large file.
+    line_starts: Optional[array]
+    size: int
+    # Bytes this entry counts against the cache budget.
+    cost: int
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines) if self.lines is not None else len(self.line_starts)
+
+
+class ExcerptResolver:
+    """Reads corpus excerpts for a fixed corpora root.
+
+    Safe to share between the threads of one analysis.
+    """
+
+    def __init__(
+        self,
+        corpora_root: Path,
+        *,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+        cache_files: int = DEFAULT_CACHE_FILES,
+    ) -> None:
         self.corpora_root = corpora_root
+        self.cache_bytes = cache_bytes
+        self.cache_files = cache_files
+        # Times a file was loaded from disk rather than the cache.
+        self.file_loads = 0
+        self._files: OrderedDict[tuple[Corpus, str, int, int], _LoadedFile] = OrderedDict()
+        self._cached_bytes = 0
+        self._corpus_roots: dict[Corpus, Path] = {}
+        self._lock = threading.Lock()
 
     def corpus_dir(self, corpus: Corpus) -> Path:
         return self.corpora_root / CORPUS_DIR_NAMES[corpus]
@@ -38,40 +93,134 @@ class ExcerptResolver:
         None signals the caller that the citation deserves a BAD_REFERENCE
         status without any LLM call.
         """
-        if a < 0 or b <= a:
-            return None
-
+        return self.resolve_many(corpus, [(relative_path, a, b)])[0]
+
+    def resolve_many(self, corpus: Corpus, references: Sequence[Reference]) -> list[str | None]:
+        """``resolve`` for every reference, in order, looking up each cited file once."""
+        excerpts: list[str | None] = [None] * len(references)
+        by_path: dict[str, list[int]] = {}
+        for index, (relative_path, a, b) in enumerate(references):
+            if a >= 0 and b > a:
+                by_path.setdefault(relative_path, []).append(index)
+
+        for relative_path, indices in by_path.items():
+            path = self._locate(corpus, relative_path)
+            loaded = self._load(corpus, path) if path is not None else None
+            if loaded is None or loaded.line_count == 0:
+                continue
+            for index in indices:
+                _, a, b = references[index]
+                excerpts[index] = self._excerpt(path, loaded, a, b)
+        return excerpts
+
+    def _locate(self, corpus: Corpus, relative_path: str) -> Optional[Path]:
         requested_path = Path(relative_path)
         if requested_path.is_absolute():
             return None
 
-        corpus_root = self.corpus_dir(corpus).resolve()
+        corpus_root = self._corpus_roots.get(corpus)
+        if corpus_root is None:
+            corpus_root = self._corpus_roots.setdefault(corpus, self.corpus_dir(corpus).resolve())
         path = (corpus_root / requested_path).resolve()
         if not path.is_relative_to(corpus_root):
             return None
+        return path
 
-        if not path.exists() or not path.is_file():
+    def _load(self, corpus: Corpus, path: Path) -> Optional[_LoadedFile]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
             return None
 
-        try:
-            text = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            try:
-                text = path.read_text(encoding="utf-8", errors="replace")
-            except OSError:
-                return None
+        key = (corpus, str(path), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            loaded = self._files.get(key)
+            if loaded is not None:
+                self._files.move_to_end(key)
+                return loaded
 
-        lines = text.splitlines()
-        n = len(lines)
-        if n == 0:
+        loaded = _read_small(path) if st.st_size <= _INDEX_ONLY_BYTES else _index_large(path)
+        if loaded is None:
             return None
-
+        with self._lock:
+            self.file_loads += 1
+            if key not in self._files:
+                self._files[key] = loaded
+                self._cached_bytes += loaded.cost
+            while len(self._files) > 1 and (
+                len(self._files) > self.cache_files or self._cached_bytes > self.cache_bytes
+            ):
+                _, evicted = self._files.popitem(last=False)
+                self._cached_bytes -= evicted.cost
+        return loaded
+
+    def _excerpt(self, path: Path, loaded: _LoadedFile, a: int, b: int) -> str | None:
+        n = loaded.line_count
         a_clamped = max(0, min(a, n))
         b_clamped = max(0, min(b, n))
         if b_clamped <= a_clamped:
             return None
 
-        chunk = "\n".join(lines[a_clamped:b_clamped])
+        if loaded.lines is not None:
+            chunk = "\n".join(loaded.lines[a_clamped:b_clamped])
+        else:
+            chunk = _read_lines(path, loaded, a_clamped, b_clamped)
+            if chunk is None:
+                return None
         if len(chunk) > _MAX_EXCERPT_CHARS:
             chunk = chunk[:_MAX_EXCERPT_CHARS] + "\n...[truncated]"
         return chunk
+
+
+def _read_small(path: Path) -> Optional[_LoadedFile]:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("utf-8", errors="replace")
+    return _LoadedFile(lines=text.splitlines(), line_starts=None, size=len(data), cost=len(data))
+
+
+def _index_large(path: Path) -> Optional[_LoadedFile]:
+    line_starts = array("q", [0])
+    size = 0
+    try:
+        with path.open("rb") as handle:
+            while chunk := handle.read(_INDEX_CHUNK_BYTES):
+                position = chunk.find(b"\n")
+                while position != -1:
+                    line_starts.append(size + position + 1)
+                    position = chunk.find(b"\n", position + 1)
+                size += len(chunk)
+    except OSError:
+        return None
+    # A trailing newline does not start another line.
+    if line_starts[-1] == size:
+        line_starts.pop()
+    return _LoadedFile(
+        lines=None,
+        line_starts=line_starts,
+        size=size,
+        cost=line_starts.itemsize * len(line_starts),
+    )
+
+
+def _read_lines(path: Path, loaded: _LoadedFile, a: int, b: int) -> Optional[str]:
+    starts = loaded.line_starts
+    start = starts[a]
+    end = starts[b] if b < len(starts) else loaded.size
+    try:
+        with path.open("rb") as handle:
+            handle.seek(start)
+            data = handle.read(min(end - start, _MAX_EXCERPT_BYTES))
+    except OSError:
+        return None
+    lines = data.decode("utf-8", errors="replace").split("\n")
+    if end - start <= _MAX_EXCERPT_BYTES and lines[-1] == "":
+        lines.pop()
+    return "\n".join(line.removesuffix("\r") for line in lines)
@@ -0,0 +1,130 @@
+"""Trim long excerpts to the lines that matter for a claim.
+
+A claim citing a 200-line range to support one sentence still sends every
+line to the examiner, and on a CPU-bound Ollama prompt processing dominates
+analysis time. ``trim_excerpt`` scores every line of the cited range against
+the claim with BM25, then keeps the best lines (each with ``context_lines``
+neighbours) until the kept text fills ``token_budget``. Gaps are replaced by
+an explicit marker naming the omitted line range, so the examiner knows the
+excerpt is partial.
+
+Excerpts that already fit the budget are left alone. When no line shares a
+content word with the claim, the start of the range is kept.
+"""
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+
+from result_processor.analysis.lexical_classifier import is_content_word, normalized_words
+
+# Rough size of a token, as in the examiner's batch budget.
+CHARS_PER_TOKEN = 3
+
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+@dataclass(frozen=True)
+class TrimmedExcerpt:
+    text: str
+    # Absolute [start, end) line ranges of the cited range that were kept.
+    ranges: list[tuple[int, int]] = field(default_factory=list)
+
+
+def trim_excerpt(
+    claim: str,
+    excerpt: str,
+    first_line: int,
+    token_budget: int,
+    *,
+    context_lines: int = 1,
+) -> TrimmedExcerpt | None:
+    """The claim's best-matching lines of ``excerpt`` within ``token_budget``, or None if it fits.
+
+    ``first_line`` is the absolute line number of the excerpt's first line.
+    """
+    if token_budget < 1:
+        raise ValueError(f"excerpt token budget must be at least 1, got {token_budget}")
+    budget = token_budget * CHARS_PER_TOKEN
+    if len(excerpt) <= budget:
+        return None
+
+    lines = excerpt.split("\n")
+    scores = _bm25(claim, lines)
+    ranked = sorted((index for index, score in enumerate(scores) if score > 0), key=lambda index: -scores[index])
+    if not ranked:
+        ranked = list(range(len(lines)))
+
+    kept: set[int] = set()
+    used = 0
+    for best in ranked:
+        if used >= budget:
+            break
+        window = range(max(best - context_lines, 0), min(best + context_lines + 1, len(lines)))
+        # The matching line goes first so the budget is not spent on its neighbours.
+        for index in sorted(window, key=lambda index: index != best):
+            cost = len(lines[index]) + 1
+            # Only the first kept line may exceed the budget (it is cut when rendered).
+            if index in kept or (used + cost > budget and kept):
+                continue
+            kept.add(index)
+            used += cost
+
+    return _render(lines, sorted(kept), first_line, budget)
+
+
+def _bm25(claim: str, lines: list[str]) -> list[float]:
+    terms = {word for word in normalized_words(claim) if is_content_word(word)}
+    documents = [Counter(normalized_words(line)) for line in lines]
+    if not terms or not documents:
+        return [0.0] * len(lines)
+    average_length = sum(sum(document.values()) for document in documents) / len(documents) or 1.0
+    idf = {}
+    for term in terms:
+        frequency = sum(1 for document in documents if term in document)
+        idf[term] = math.log(1 + (len(documents) - frequency + 0.5) / (frequency + 0.5))
+
+    scores = []
+    for document in documents:
+        length = sum(document.values())
+        score = 0.0
+        for term in terms:
+            tf = document.get(term, 0)
+            if tf:
+                score += idf[term] * tf * (_BM25_K1 + 1) / (
+                    tf + _BM25_K1 * (1 - _BM25_B + _BM25_B * length / average_length)
+                )
+        scores.append(score)
+    return scores
+
+
+def _render(lines: list[str], kept: list[int], first_line: int, budget: int) -> TrimmedExcerpt:
+    spans: list[tuple[int, int]] = []
+    for index in kept:
+        if spans and spans[-1][1] == index:
+            spans[-1] = (spans[-1][0], index + 1)
+        else:
+            spans.append((index, index + 1))
+
+    parts = []
+    previous_end = 0
+    for start, end in spans:
+        if start > previous_end:
+            parts.append(_elision(first_line + previous_end, first_line + start))
+        text = "\n".join(lines[start:end])
+        # A single line longer than the whole budget is cut.
+        parts.append(text[:budget] + " ..." if len(text) > budget else text)
+        previous_end = end
+    if previous_end < len(lines):
+        parts.append(_elision(first_line + previous_end, first_line + len(lines)))
+
+    return TrimmedExcerpt(
+        text="\n".join(parts),
+        ranges=[(first_line + start, first_line + end) for start, end in spans],
+    )
+
+
+def _elision(start: int, end: int) -> str:
+    return f"[... lines {start}-{end} omitted ...]"
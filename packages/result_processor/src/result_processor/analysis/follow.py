@@ -0,0 +1,253 @@
+"""Follow result files while a suite is still producing them.
+
+``analyze_directory`` normally lists its input files once and reads each of
+them whole, so analysis can only start after the experiments finish. In
+follow mode it polls a ``ResultFollower`` instead, which hands out the runs
+that landed since the previous poll: new complete lines of a JSONL file (read
+from a byte offset) and new rows of a file written to, or compacted into, its
+directory's result store (read from a row position).
+
+Files are discovered on every poll: the explicit input files plus, when a
+suite state is followed, every task's result path; with neither, every result
+file of the results directory. A followed suite is finished once none of its
+tasks is pending or running, or once no live runner owns it (its
+``runner_pid`` is unset or dead): a crashed or cancelled runner leaves tasks
+pending that nothing will run.
+
+Read offsets are saved to ``FOLLOW_OFFSETS_FILENAME`` in the output directory
+so a restarted follow resumes where it stopped. A file's saved offset only
+moves past runs once every run handed out from that file has been accounted
+for (written, or skipped as already analyzed); a failed run pins it so the
+next start retries that run. Runs re-read after a restart are skipped by
+run_id like in any resumed analysis.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Literal, Optional
+
+from experiment_runner.commands.suite import load_suite_state
+from experiment_runner.models.result import RunResult
+from experiment_runner.models.suite import SuiteTaskStatus
+from experiment_runner.result_store import ResultStore, result_store_path
+from experiment_runner.trace_store import bind_trace_store
+
+FOLLOW_OFFSETS_FILENAME = "follow.offsets.json"
+DEFAULT_POLL_INTERVAL_S = 10.0
+
+# Minimum spacing between writes of the offsets file while following.
+_SAVE_INTERVAL_S = 5.0
+
+SourceKind = Literal["jsonl", "store"]
+
+
+@dataclass
+class _Source:
+    kind: SourceKind
+    # Where the next poll reads from.
+    scan: int = 0
+    # Offset past the last run handed to ``accept`` or ``skip``.
+    read: int = 0
+    # Offset a restart resumes from.
+    committed: int = 0
+    # Accepted runs not yet reported by ``done``.
+    outstanding: int = 0
+    # A run of this file failed; its committed offset stays put until restart.
+    pinned: bool = False
+
+
+@dataclass(frozen=True)
+class FollowedRun:
+    target: Path
+    run: RunResult
+    # Offset just past this run in ``target``.
+    offset: int
+
+
+class ResultFollower:
+    """Incremental reader of a results directory (or a suite's result files).
+
+    ``poll`` is called from one thread; ``done`` may be called from another.
+    """
+
+    def __init__(
+        self,
+        results_dir: Path,
+        offsets_path: Path,
+        *,
+        input_files: Optional[Iterable[str | Path]] = None,
+        suite_state_path: Optional[str | Path] = None,
+    ) -> None:
+        self.results_dir = results_dir.resolve()
+        self.offsets_path = offsets_path
+        self.input_files = [Path(f).resolve() for f in input_files or []]
+        self.suite_state_path = Path(suite_state_path) if suite_state_path else None
+        # True once a poll saw the followed suite with no pending or running
+        # task, or without a live runner.
+        self.suite_finished = False
+        self._sources: dict[Path, _Source] = {}
+        self._lock = threading.Lock()
+        self._last_save = time.monotonic()
+        self._load_offsets()
+
+    def poll(self) -> list[FollowedRun]:
+        """Every run that landed in a followed file since the previous poll."""
+        targets = self._targets()
+        runs: list[FollowedRun] = []
+        for target in targets:
+            runs.extend(self._read_new(target))
+        if time.monotonic() - self._last_save >= _SAVE_INTERVAL_S:
+            self.save()
+        return runs
+
+    def accept(self, followed: FollowedRun) -> None:
+        """``followed`` was handed to the analysis; its offset commits once ``done`` reports it."""
+        with self._lock:
+            source = self._sources[followed.target]
+            source.outstanding += 1
+            source.read = followed.offset
+
+    def skip(self, followed: FollowedRun) -> None:
+        """``followed`` needs no analysis (its result is already on disk)."""
+        with self._lock:
+            source = self._sources[followed.target]
+            source.read = followed.offset
+            self._advance(source)
+
+    def done(self, target: Path, ok: bool) -> None:
+        with self._lock:
+            source = self._sources[target]
+            # A run accepted before its file was reset is no longer counted.
+            source.outstanding = max(source.outstanding - 1, 0)
+            source.pinned = source.pinned or not ok
+            self._advance(source)
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {
+                "sources": {
+                    str(path): {"kind": source.kind, "offset": source.committed}
+                    for path, source in sorted(self._sources.items())
+                },
+            }
+        self.offsets_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.offsets_path.parent,
+            prefix=f".{self.offsets_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            tmp.write(json.dumps(payload, indent=2) + "\n")
+        os.replace(tmp.name, self.offsets_path)
+        self._last_save = time.monotonic()
+
+    @staticmethod
+    def _advance(source: _Source) -> None:
+        if source.outstanding == 0 and not source.pinned:
+            source.committed = source.read
+
+    def _load_offsets(self) -> None:
+        if not self.offsets_path.is_file():
+            return
+        payload = json.loads(self.offsets_path.read_text(encoding="utf-8"))
+        for path, entry in payload.get("sources", {}).items():
+            offset = int(entry["offset"])
+            self._sources[Path(path)] = _Source(kind=entry["kind"], scan=offset, read=offset, committed=offset)
+
+    def _targets(self) -> list[Path]:
+        targets = set(self.input_files)
+        if self.suite_state_path is not None:
+            # Read before any file, so a finished suite's results are all on disk.
+            state = load_suite_state(self.suite_state_path)
+            self.suite_finished = not _is_pid_alive(state.runner_pid) or not any(
+                task.status in {SuiteTaskStatus.PENDING, SuiteTaskStatus.RUNNING} for task in state.tasks
+            )
+            targets.update(Path(task.result_path).resolve() for task in state.tasks if task.result_path)
+        elif not targets:
+            targets.update(p.resolve() for p in self.results_dir.glob("*.jsonl") if p.is_file())
+            store_path = result_store_path(self.results_dir)
+            if store_path.is_file():
+                with ResultStore(store_path) as store:
+                    compacted = {Path(source) for source in store.source_files()}
+                targets.update(p for p in compacted if p.parent == self.results_dir)
+        return sorted(targets)
+
+    def _read_new(self, target: Path) -> list[FollowedRun]:
+        if target.is_file():
+            return self._read_jsonl(target)
+        store_path = result_store_path(target.parent)
+        if not store_path.is_file():
+            return []
+        with ResultStore(store_path) as store:
+            source = self._source(target, "store")
+            if store.next_position(target) < source.scan:
+                # The file's rows were deleted and written again.
+                self._reset(source)
+            runs = [
+                FollowedRun(target, run, position + 1)
+                for position, run in store.iter_source_runs(target, from_position=source.scan)
+            ]
+        if runs:
+            source.scan = runs[-1].offset
+        return runs
+
+    def _read_jsonl(self, target: Path) -> list[FollowedRun]:
+        source = self._source(target, "jsonl")
+        size = target.stat().st_size
+        if size == source.scan:
+            return []
+        if size < source.scan:
+            # The file was replaced by a shorter one.
+            self._reset(source)
+        with target.open("rb") as handle:
+            handle.seek(source.scan)
+            data = handle.read()
+        # A line without its newline is still being written.
+        complete = data[: data.rfind(b"\n") + 1]
+        runs: list[FollowedRun] = []
+        offset = source.scan
+        for raw_line in complete.splitlines(keepends=True):
+            offset += len(raw_line)
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{target}: invalid JSON at byte {offset - len(raw_line)} ({exc})") from exc
+            runs.append(FollowedRun(target, bind_trace_store(RunResult.model_validate(payload), target.parent), offset))
+        source.scan = offset
+        return runs
+
+    def _source(self, target: Path, kind: SourceKind) -> _Source:
+        with self._lock:
+            source = self._sources.get(target)
+            if source is None or source.kind != kind:
+                # New file, or one that moved between a JSONL file and the store.
+                source = self._sources[target] = _Source(kind=kind)
+            return source
+
+    def _reset(self, source: _Source) -> None:
+        with self._lock:
+            source.scan = source.read = source.committed = source.outstanding = 0
+            source.pinned = False
+
+
+def _is_pid_alive(pid: Optional[int]) -> bool:
+    if pid is None or pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -6,21 +6,14 @@ from pathlib import Path
 from typing import Iterator
 
 from experiment_runner.models.result import RunResult
+from experiment_runner.result_store import iter_result_file
 
 from result_processor.models.analysis import AnalysisResult
 
 
 def iter_run_results(jsonl_path: Path) -> Iterator[RunResult]:
-    with jsonl_path.open("r", encoding="utf-8") as handle:
-        for line_no, raw_line in enumerate(handle, start=1):
-            line = raw_line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"{jsonl_path}:{line_no}: invalid JSON ({exc})") from exc
-            yield RunResult.model_validate(payload)
+    """Yield runs from a result JSONL file, or from its rows in the directory's result store."""
+    yield from iter_result_file(jsonl_path)
 
 
 def load_existing_run_ids(analysis_path: Path) -> set[str]:
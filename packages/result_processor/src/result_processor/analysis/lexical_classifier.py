@@ -0,0 +1,167 @@
+"""Deterministic fast path for claims that need no examiner call.
+
+Many cited claims are decidable from the words alone: the excerpt repeats the
+claim nearly verbatim, or the two share no content words at all. The
+``classify_lexically`` check runs before the examiner and returns a verdict
+only when one of these holds, and None (ask the examiner) otherwise:
+
+  * SUPPORTED when some window of the excerpt matches the claim's words, in
+    order, with a similarity of at least ``support_similarity``; every number
+    and capitalized name of the claim must occur in the excerpt, and the
+    window must contain a negation exactly when the claim does. Sharing the
+    claim's words in another order is not enough ("A is faster than B" against
+    "B is faster than A").
+  * NOT_SUPPORTED when at most ``reject_coverage`` of the claim's content
+    words, and none of its numbers, occur in the excerpt.
+
+Words are lowercased and reduced to a crude singular; stop words and
+negations are not content words. It never produces PARTIALLY_SUPPORTED or
+BAD_REFERENCE: those need judgement and stay with the examiner.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Optional
+
+from result_processor.models.analysis import ClaimStatus
+
+_WORD = re.compile(r"\d+(?:[.,]\d+)*|[^\W\d_][\w'-]*")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+
+_STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+during each for from had has have he her hers him his how i if in into is it its itself may might
+more most much must of on once only or other our over same she should so some such than that the
+their them then there these they this those through to too under until up very was we were what
+when where which while who whom why will with would you your
+""".split())
+_NEGATIONS = frozenset({"no", "not", "never", "none", "neither", "nor", "nothing", "cannot", "without"})
+
+# Excerpts longer than this many words skip the sliding-window similarity.
+_MAX_WINDOW_SCAN_WORDS = 20_000
+
+
+@dataclass(frozen=True)
+class LexicalThresholds:
+    support_similarity: float = 0.9
+    reject_coverage: float = 0.0
+    # Claims with fewer content words are always left to the examiner.
+    min_content_words: int = 3
+
+    def __post_init__(self) -> None:
+        for name in ("support_similarity", "reject_coverage"):
+            value = getattr(self, name)
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"fast path {name} must be in [0, 1], got {value}")
+        if self.reject_coverage >= 1.0:
+            raise ValueError(f"fast path reject_coverage must be below 1, got {self.reject_coverage}")
+        if self.min_content_words < 1:
+            raise ValueError(f"fast path min_content_words must be at least 1, got {self.min_content_words}")
+
+
+@dataclass(frozen=True)
+class LexicalVerdict:
+    status: ClaimStatus
+    justification: str
+    # Share of the claim's content words found in the excerpt, and the best
+    # window similarity (None when it was not needed).
+    coverage: float
+    similarity: Optional[float] = None
+
+
+def classify_lexically(
+    claim: str,
+    excerpt: Optional[str],
+    thresholds: LexicalThresholds = LexicalThresholds(),
+) -> Optional[LexicalVerdict]:
+    """A confident verdict for ``claim`` against ``excerpt``, or None to ask the examiner."""
+    if not excerpt or not excerpt.strip():
+        return None
+    claim_words = normalized_words(claim)
+    excerpt_words = normalized_words(excerpt)
+    content = {word for word in claim_words if is_content_word(word)}
+    if len(content) < thresholds.min_content_words:
+        return None
+
+    excerpt_vocabulary = set(excerpt_words)
+    coverage = len(content & excerpt_vocabulary) / len(content)
+    claim_numbers = _numbers(claim)
+    excerpt_numbers = _numbers(excerpt)
+
+    if coverage <= thresholds.reject_coverage and not claim_numbers & excerpt_numbers:
+        return LexicalVerdict(
+            status=ClaimStatus.NOT_SUPPORTED,
+            justification=f"Lexical fast path: the excerpt shares {coverage:.0%} of the claim's content words.",
+            coverage=coverage,
+        )
+    names = {_stem(word) for word in _WORD.findall(claim)[1:] if word[:1].isupper()}
+    if not claim_numbers <= excerpt_numbers or not names <= excerpt_vocabulary:
+        return None
+
+    similarity = _window_similarity(claim_words, excerpt_words)
+    if similarity < thresholds.support_similarity:
+        return None
+    return LexicalVerdict(
+        status=ClaimStatus.SUPPORTED,
+        justification=f"Lexical fast path: the excerpt contains the claim nearly verbatim (similarity {similarity:.2f}).",
+        coverage=coverage,
+        similarity=similarity,
+    )
+
+
+def _stem(word: str) -> str:
+    word = word.lower().strip("'-")
+    if word.endswith("n't"):
+        return "not"
+    if word.endswith("'s"):
+        word = word[:-2]
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def normalized_words(text: str) -> list[str]:
+    """Lowercased, crudely singularized words and numbers of ``text``."""
+    return [_stem(word) for word in _WORD.findall(text)]
+
+
+def is_content_word(word: str) -> bool:
+    return word not in _STOP_WORDS and word not in _NEGATIONS
+
+
+def _numbers(text: str) -> set[str]:
+    return {number.replace(",", "") for number in _NUMBER.findall(text)}
+
+
+def _window_similarity(claim_words: list[str], excerpt_words: list[str]) -> float:
+    """Best ``SequenceMatcher`` ratio of the claim against same-length windows of the excerpt.
+
+    Only windows that contain a negation exactly when the claim does count, so
+    a negation elsewhere in the excerpt neither blocks nor fakes a match.
+    """
+    size = len(claim_words)
+    if not size or len(excerpt_words) > _MAX_WINDOW_SCAN_WORDS:
+        return 0.0
+    matcher = SequenceMatcher(autojunk=False)
+    # SequenceMatcher caches what it learns about the second sequence.
+    matcher.set_seq2(claim_words)
+    claim_vocabulary = set(claim_words)
+    negated = bool(_NEGATIONS & claim_vocabulary)
+    best = 0.0
+    for start in range(max(len(excerpt_words) - size + 1, 1)):
+        if excerpt_words[start] not in claim_vocabulary:
+            continue
+        window = excerpt_words[start:start + size]
+        if negated != bool(_NEGATIONS.intersection(window)):
+            continue
+        matcher.set_seq1(window)
+        if matcher.real_quick_ratio() <= best or matcher.quick_ratio() <= best:
+            continue
+        best = max(best, matcher.ratio())
+        if best == 1.0:
+            break
+    return best
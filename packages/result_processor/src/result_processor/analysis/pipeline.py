@@ -6,11 +6,16 @@ default — runs already present in the output are skipped.
 """
 from __future__ import annotations
 
+import queue
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
+from agent.ollama_host import ollama_num_parallel
 from experiment_runner.models.result import RunResult
+from experiment_runner.result_store import ResultStore, result_store_path
 from rich.console import Console
 from tqdm import tqdm
 
@@ -19,18 +24,36 @@ from result_processor.analysis.citation_parser import (
     extract_citations,
     split_sentences,
 )
-from result_processor.analysis.examiner import ExaminerLLM
+from result_processor.analysis.examiner import ClaimBatch, ClaimCheck, ExaminerLLM, _OverallVerdict
 from result_processor.analysis.excerpt_resolver import ExcerptResolver
+from result_processor.analysis.excerpt_window import trim_excerpt
+from result_processor.analysis.follow import (
+    DEFAULT_POLL_INTERVAL_S,
+    FOLLOW_OFFSETS_FILENAME,
+    ResultFollower,
+)
 from result_processor.analysis.io import (
     append_analysis,
     iter_run_results,
     load_existing_run_ids,
 )
+from result_processor.analysis.lexical_classifier import LexicalThresholds, classify_lexically
 from result_processor.analysis.qa_metrics import QAMetrics, compute_qa_metrics
+from result_processor.analysis.verdict_cache import (
+    DEFAULT_MAX_ENTRIES,
+    VerdictCacheMode,
+    VerdictCacheStats,
+    open_verdict_cache,
+)
 from result_processor.models.analysis import (
+    FAST_PATH_MODES,
     AnalysisResult,
     ClaimAnalysis,
+    ClaimDecider,
+    ClaimMode,
     ClaimStatus,
+    FastPathMode,
+    NumCtxMode,
     Verdict,
 )
 
@@ -54,7 +77,46 @@ def analyze_directory(
     suite_name: Optional[str] = None,
     suite_config_path: Optional[str] = None,
     suite_state_path: Optional[str] = None,
+    examiner_parallelism: Optional[int] = None,
+    run_parallelism: int = 1,
+    verdict_cache_path: Optional[str] = None,
+    verdict_cache_mode: VerdictCacheMode = "use",
+    verdict_cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+    claim_mode: ClaimMode = "per_claim",
+    fast_path: FastPathMode = "off",
+    lexical_thresholds: Optional[LexicalThresholds] = None,
+    excerpt_token_budget: Optional[int] = None,
+    num_ctx_mode: NumCtxMode = "fixed",
+    follow: bool = False,
+    follow_suite_state_path: Optional[str] = None,
+    follow_poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    follow_idle_timeout_s: Optional[float] = None,
 ) -> None:
+    """Analyze every run under ``experiment_results_dir``.
+
+    ``run_parallelism`` runs, across all input files, are analyzed at once;
+    ``examiner_parallelism`` bounds how many claims of each of them are
+    classified at once and defaults to ``OLLAMA_NUM_PARALLEL`` (or 1). A
+    single writer thread appends results to each output file in input order
+    and reports them as analyzed only once they are on disk. Claim verdicts
+    are reused from and stored in the SQLite file at ``verdict_cache_path``
+    (``verdict_cache_mode`` "refresh" re-asks the examiner, "off" ignores it).
+    ``claim_mode="batch"`` verifies all claims of a run in one examiner call.
+    ``fast_path="use"`` decides near-verbatim and unrelated claims lexically
+    (see ``lexical_classifier``) and only asks the examiner about the rest;
+    "audit" asks about every claim and records the lexical verdicts beside it.
+    With ``excerpt_token_budget`` the examiner is shown only the lines of a
+    longer excerpt that best match the claim (see ``excerpt_window``).
+    ``num_ctx_mode="dynamic"`` sizes the examiner context to the largest
+    prompt so far, growing it up to ``num_ctx`` (see ``examiner``).
+
+    With ``follow`` the input files are polled every ``follow_poll_interval_s``
+    and each new run is analyzed as soon as it lands (see ``analysis.follow``). It stops
+    once the suite at ``follow_suite_state_path`` has finished and its last
+    results are analyzed, after ``follow_idle_timeout_s`` without a new run,
+    or when cancelled; with neither a suite nor a timeout, only cancellation
+    stops it.
+    """
     console = Console()
 
     in_dir = Path(experiment_results_dir).resolve()
@@ -65,23 +127,113 @@ def analyze_directory(
         raise ValueError(f"experiment_results_dir not found: {in_dir}")
     if not corpora_root.is_dir():
         raise ValueError(f"path_to_corpora not found: {corpora_root}")
+    if run_parallelism < 1:
+        raise ValueError(f"run parallelism must be at least 1, got {run_parallelism}")
+    if excerpt_token_budget is not None and excerpt_token_budget < 1:
+        raise ValueError(f"excerpt token budget must be at least 1, got {excerpt_token_budget}")
+    if fast_path not in FAST_PATH_MODES:
+        raise ValueError(f"fast path mode must be one of {', '.join(FAST_PATH_MODES)}, got {fast_path!r}")
+    if follow and follow_poll_interval_s <= 0:
+        raise ValueError(f"follow poll interval must be positive, got {follow_poll_interval_s}")
+    thresholds = lexical_thresholds or LexicalThresholds()
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    if input_files:
+    if follow:
+        targets = []
+    elif input_files:
         targets = [Path(f).resolve() for f in input_files]
     else:
         targets = sorted(p for p in in_dir.glob("*.jsonl") if p.is_file())
-
-    if not targets:
+        store_path = result_store_path(in_dir)
+        if store_path.is_file():
+            # Compacted result files only exist as rows in the result store.
+            with ResultStore(store_path) as store:
+                compacted = {Path(source) for source in store.source_files()}
+            targets = sorted(set(targets) | {p for p in compacted if p.parent == in_dir})
+
+    if not targets and not follow:
         console.print("[yellow]No JSONL files found to analyze.[/yellow]")
         return
 
     resolver = ExcerptResolver(corpora_root=corpora_root)
-    examiner = ExaminerLLM(model=examiner_model, num_ctx=num_ctx)
+    parallelism = examiner_parallelism if examiner_parallelism is not None else ollama_num_parallel()
+    examiner = ExaminerLLM(
+        model=examiner_model,
+        num_ctx=num_ctx,
+        parallelism=parallelism,
+        claim_mode=claim_mode,
+        num_ctx_mode=num_ctx_mode,
+    )
 
-    console.print(f"[bold]Analyzing {len(targets)} file(s) with examiner={examiner_model}[/bold]")
+    scope = "Following new results" if follow else f"Analyzing {len(targets)} file(s)"
+    console.print(
+        f"[bold]{scope} with examiner={examiner_model}"
+        f" ({run_parallelism} run(s) x {parallelism} call(s) at once, {claim_mode} claims, fast path {fast_path})[/bold]"
+    )
 
+    # Callbacks and cancellation checks may read-modify-write a job state
+    # file, so workers and the writer take turns calling them.
+    callback_lock = threading.Lock()
+
+    def report(status: str, run: RunResult, target: Path, error: Optional[str]) -> None:
+        if progress_callback:
+            with callback_lock:
+                progress_callback(status, run, target, error)
+
+    def cancelled() -> bool:
+        if should_cancel is None:
+            return False
+        with callback_lock:
+            return should_cancel()
+
+    was_cancelled = False
+    follower: Optional[ResultFollower] = None
+    # Target of every submitted job, by index, while a follower waits for it.
+    followed_targets: dict[int, Path] = {}
+
+    def followed_jobs() -> Iterator[tuple[Path, Path, RunResult]]:
+        nonlocal was_cancelled
+        done_ids: dict[Path, set[str]] = {}
+        # Jobs are numbered in the order they are yielded, like the writer's indices.
+        accepted = 0
+        idle_since = time.monotonic()
+        while True:
+            batch = follower.poll()
+            for followed in batch:
+                out_path = out_dir / followed.target.name
+                if out_path not in done_ids:
+                    done_ids[out_path] = load_existing_run_ids(out_path) if resume else set()
+                if followed.run.run_id in done_ids[out_path]:
+                    follower.skip(followed)
+                    report("skipped", followed.run, followed.target, None)
+                    continue
+                done_ids[out_path].add(followed.run.run_id)
+                follower.accept(followed)
+                followed_targets[accepted] = followed.target
+                accepted += 1
+                yield followed.target, out_path, followed.run
+            if batch:
+                idle_since = time.monotonic()
+                continue
+            if follower.suite_finished:
+                return
+            if follow_idle_timeout_s is not None and time.monotonic() - idle_since >= follow_idle_timeout_s:
+                console.print(f"[yellow]No new results for {follow_idle_timeout_s:g}s; stopped following.[/yellow]")
+                return
+            wake_at = time.monotonic() + follow_poll_interval_s
+            while time.monotonic() < wake_at:
+                if cancelled():
+                    was_cancelled = True
+                    return
+                time.sleep(min(0.5, follow_poll_interval_s))
+
+    def written(index: int, ok: bool) -> None:
+        target = followed_targets.pop(index, None)
+        if target is not None:
+            follower.done(target, ok)
+
+    jobs: list[tuple[Path, Path, RunResult]] = []
     for target in targets:
         out_path = out_dir / target.name
         already_done = load_existing_run_ids(out_path) if resume else set()
@@ -91,52 +243,175 @@ def analyze_directory(
         skipped_runs = [r for r in runs if r.run_id in already_done]
         skipped = len(runs) - len(pending)
         for run in skipped_runs:
-            if progress_callback:
-                progress_callback("skipped", run, target, None)
+            report("skipped", run, target, None)
 
         console.print(
             f"  → {target.name}: {len(pending)} to analyze, {skipped} cached"
         )
-        if not pending:
-            continue
+        jobs.extend((target, out_path, run) for run in pending)
+
+    if follow:
+        follower = ResultFollower(
+            in_dir,
+            out_dir / FOLLOW_OFFSETS_FILENAME,
+            input_files=input_files,
+            suite_state_path=follow_suite_state_path,
+        )
+    progress = tqdm(total=None if follow else len(jobs), desc="analysis", unit="run", leave=False)
+    writer = _OrderedWriter(report, progress, on_written=written if follow else None)
+
+    def work(index: int, target: Path, out_path: Path, run: RunResult) -> None:
+        report("running", run, target, None)
+        try:
+            analysis = _analyze_one(
+                run,
+                resolver,
+                examiner,
+                examiner_model,
+                fast_path=fast_path,
+                lexical_thresholds=thresholds,
+                excerpt_token_budget=excerpt_token_budget,
+                analysis_run_name=analysis_run_name,
+                suite_id=suite_id,
+                suite_name=suite_name,
+                suite_config_path=suite_config_path,
+                suite_state_path=suite_state_path,
+            )
+        except Exception as exc:
+            report("failed", run, target, str(exc))
+            writer.put(index, None)
+            raise
+        writer.put(index, (out_path, run, target, analysis))
+
+    failure: Optional[BaseException] = None
+    examiner.verdict_cache = open_verdict_cache(verdict_cache_path, verdict_cache_mode, verdict_cache_max_entries)
+    try:
+        with ThreadPoolExecutor(max_workers=run_parallelism, thread_name_prefix="analysis") as pool:
+            in_flight: set[Future] = set()
+            for index, (target, out_path, run) in enumerate(followed_jobs() if follow else jobs):
+                if failure is None and not continue_on_error:
+                    failure = writer.error
+                if failure is not None:
+                    break
+                if cancelled():
+                    was_cancelled = True
+                    break
+                # At most `run_parallelism` runs are in flight, so a cancel or a failure
+                # leaves no more than one batch to finish.
+                while len(in_flight) >= run_parallelism:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    failure = failure or _first_failure(done, continue_on_error)
+                if failure is not None:
+                    break
+                in_flight.add(pool.submit(work, index, target, out_path, run))
+            done, _ = wait(in_flight)
+            failure = failure or _first_failure(done, continue_on_error)
+    finally:
+        writer.close()
+        progress.close()
+        if follower is not None:
+            follower.save()
+        if examiner.verdict_cache is not None:
+            _print_cache_stats(console, examiner.verdict_cache.stats())
+            examiner.verdict_cache.close()
+        if examiner.truncation_risks:
+            console.print(
+                f"[yellow]  {examiner.truncation_risks} examiner prompt(s) were estimated to exceed"
+                f" num_ctx={examiner.num_ctx} and may have been truncated; raise --num-ctx.[/yellow]"
+            )
 
-        for run in tqdm(pending, desc=target.name, unit="run", leave=False):
-            if should_cancel and should_cancel():
-                console.print("[yellow]Analysis cancelled.[/yellow]")
-                return
-            if progress_callback:
-                progress_callback("running", run, target, None)
-            try:
-                analysis = _analyze_one(
-                    run,
-                    resolver,
-                    examiner,
-                    examiner_model,
-                    analysis_run_name=analysis_run_name,
-                    suite_id=suite_id,
-                    suite_name=suite_name,
-                    suite_config_path=suite_config_path,
-                    suite_state_path=suite_state_path,
-                )
-                append_analysis(out_path, analysis)
-            except Exception as exc:
-                if progress_callback:
-                    progress_callback("failed", run, target, str(exc))
-                if continue_on_error:
-                    continue
-                raise
-            if progress_callback:
-                progress_callback("analyzed", run, target, None)
+    if failure is None and not continue_on_error:
+        failure = writer.error
+    if failure is not None:
+        raise failure
+    if was_cancelled:
+        console.print("[yellow]Analysis cancelled.[/yellow]")
+        return
 
     console.print("[bold green]Analysis complete.[/bold green]")
 
 
+def _print_cache_stats(console: Console, stats: VerdictCacheStats) -> None:
+    lookups = stats.hits + stats.misses
+    rate = f"{stats.hit_rate:.0%}" if stats.hit_rate is not None else "n/a"
+    console.print(
+        f"  verdict cache: {stats.hits}/{lookups} hits ({rate}), {stats.writes} new,"
+        f" {stats.evictions} evicted, {stats.entries} stored"
+    )
+
+
+class _OrderedWriter:
+    """Appends finished analyses on one thread, in the order runs were submitted.
+
+    Workers hand over ``(index, item)`` where ``item`` is ``(out_path, run,
+    target, analysis)``, or ``None`` for a run that failed. Keeping submission
+    order makes output files independent of which worker finished first.
+    """
+
+    def __init__(
+        self,
+        report: Callable[[str, RunResult, Path, Optional[str]], None],
+        progress: tqdm,
+        *,
+        on_written: Optional[Callable[[int, bool], None]] = None,
+    ) -> None:
+        self._report = report
+        self._progress = progress
+        # Told, in order, whether each index ended up on disk.
+        self._on_written = on_written
+        self._queue: queue.Queue = queue.Queue()
+        # First append failure; the pipeline stops submitting runs after it.
+        self.error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._drain, name="analysis-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, index: int, item: Optional[tuple[Path, RunResult, Path, AnalysisResult]]) -> None:
+        self._queue.put((index, item))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        ready: dict[int, Optional[tuple[Path, RunResult, Path, AnalysisResult]]] = {}
+        next_index = 0
+        while (entry := self._queue.get()) is not None:
+            ready[entry[0]] = entry[1]
+            while next_index in ready:
+                item = ready.pop(next_index)
+                ok = item is not None and self._write(*item)
+                if self._on_written is not None:
+                    self._on_written(next_index, ok)
+                next_index += 1
+                self._progress.update(1)
+
+    def _write(self, out_path: Path, run: RunResult, target: Path, analysis: AnalysisResult) -> bool:
+        try:
+            append_analysis(out_path, analysis)
+        except Exception as exc:
+            self._report("failed", run, target, str(exc))
+            if self.error is None:
+                self.error = exc
+            return False
+        self._report("analyzed", run, target, None)
+        return True
+
+
+def _first_failure(done: Iterable[Future], continue_on_error: bool) -> Optional[BaseException]:
+    if continue_on_error:
+        return None
+    return next((future.exception() for future in done if future.exception() is not None), None)
+
+
 def _analyze_one(
     run: RunResult,
     resolver: ExcerptResolver,
     examiner: ExaminerLLM,
     examiner_model: str,
     *,
+    fast_path: FastPathMode = "off",
+    lexical_thresholds: LexicalThresholds = LexicalThresholds(),
+    excerpt_token_budget: Optional[int] = None,
     analysis_run_name: Optional[str] = None,
     suite_id: Optional[str] = None,
     suite_name: Optional[str] = None,
@@ -149,23 +424,58 @@ def _analyze_one(
     citations = extract_citations(answer)
     uncited_sentences = split_sentences(answer)
 
-    claim_analyses: list[ClaimAnalysis] = []
-
-    for citation in citations:
-        excerpt = resolver.resolve(
-            run.corpus,
-            citation.file_path,
-            citation.line_start,
-            citation.line_end,
-        )
-        verdict = examiner.classify_claim(
+    # Every cited file is looked up once per run, however often it is cited.
+    excerpts = resolver.resolve_many(
+        run.corpus,
+        [(citation.file_path, citation.line_start, citation.line_end) for citation in citations],
+    )
+    trimmed = [
+        trim_excerpt(citation.statement, excerpt, citation.line_start, excerpt_token_budget)
+        if excerpt is not None and excerpt_token_budget is not None
+        else None
+        for citation, excerpt in zip(citations, excerpts)
+    ]
+    checks = [
+        ClaimCheck(
             claim=citation.statement,
-            excerpt=excerpt,
+            excerpt=window.text if window is not None else excerpt,
             file_path=citation.file_path,
             a=citation.line_start,
             b=citation.line_end,
         )
-        claim_analyses.append(_to_claim_analysis(citation, excerpt, verdict.status, verdict.justification))
+        for citation, excerpt, window in zip(citations, excerpts, trimmed)
+    ]
+    # The fast path is cheap, so it judges the whole excerpt.
+    lexical = [
+        classify_lexically(citation.statement, excerpt, lexical_thresholds) if fast_path != "off" else None
+        for citation, excerpt in zip(citations, excerpts)
+    ]
+    # In "use" mode a confident lexical verdict is final; audit mode asks the
+    # examiner about every claim so the two can be compared.
+    asked = [index for index, verdict in enumerate(lexical) if verdict is None or fast_path == "audit"]
+    # Verdicts come back in citation order, however many ran concurrently.
+    batch = examiner.classify_claims([checks[index] for index in asked])
+    examined = dict(zip(asked, zip(batch.verdicts, batch.decided_by)))
+    claim_analyses: list[ClaimAnalysis] = []
+    for index, (citation, excerpt, lexical_verdict) in enumerate(zip(citations, excerpts, lexical)):
+        num_ctx = None
+        if index in examined:
+            verdict, decided_by = examined[index]
+            status, justification = verdict.status, verdict.justification
+            if decided_by == "examiner":
+                num_ctx = verdict.num_ctx
+        else:
+            status, justification, decided_by = lexical_verdict.status, lexical_verdict.justification, "lexical"
+        claim_analyses.append(_to_claim_analysis(
+            citation,
+            excerpt,
+            status,
+            justification,
+            decided_by=decided_by,
+            lexical_status=lexical_verdict.status if lexical_verdict else None,
+            examined_ranges=trimmed[index].ranges if trimmed[index] is not None and index in examined else None,
+            num_ctx=num_ctx,
+        ))
 
     # Sentences with no citation get auto-classified as BAD_REFERENCE without
     # an LLM call — there is nothing to verify against.
@@ -175,10 +485,17 @@ def _analyze_one(
                 statement=sentence,
                 status=ClaimStatus.BAD_REFERENCE,
                 justification="No citation provided for this claim.",
+                decided_by="rule",
             )
         )
 
-    helpfulness, notes = _summarize(run, examiner, claim_analyses)
+    summary_started_at = time.perf_counter()
+    overall = _summarize(run, examiner, claim_analyses)
+    summary_time_s = time.perf_counter() - summary_started_at
+    helpfulness, notes = (overall.helpfulness_rating, overall.notes) if overall else (None, "No claims to summarize.")
+    truncation_risks = batch.truncation_risks
+    if overall is not None and overall.truncation_risk:
+        truncation_risks += 1
     qa_metrics = compute_qa_metrics(run.answer_text, run.expected_facts)
     analysis_time_s = time.perf_counter() - started_at
     return _aggregate(
@@ -190,6 +507,12 @@ def _analyze_one(
         notes,
         qa_metrics=qa_metrics,
         analysis_time_s=analysis_time_s,
+        classification=batch,
+        summary_time_s=summary_time_s,
+        examiner_claim_mode=examiner.claim_mode,
+        fast_path_mode=fast_path,
+        summary_num_ctx=overall.num_ctx if overall else None,
+        examiner_truncation_risks=truncation_risks,
         analysis_run_name=analysis_run_name,
         suite_id=suite_id,
         suite_name=suite_name,
@@ -203,6 +526,11 @@ def _to_claim_analysis(
     excerpt: Optional[str],
     status: ClaimStatus,
     justification: str,
+    *,
+    decided_by: Optional[ClaimDecider] = None,
+    lexical_status: Optional[ClaimStatus] = None,
+    examined_ranges: Optional[list[tuple[int, int]]] = None,
+    num_ctx: Optional[int] = None,
 ) -> ClaimAnalysis:
     return ClaimAnalysis(
         statement=citation.statement,
@@ -212,6 +540,10 @@ def _to_claim_analysis(
         excerpt=excerpt,
         status=status,
         justification=justification,
+        decided_by=decided_by,
+        lexical_status=lexical_status,
+        examined_ranges=examined_ranges,
+        num_ctx=num_ctx,
     )
 
 
@@ -219,18 +551,17 @@ def _summarize(
     run: RunResult,
     examiner: ExaminerLLM,
     claims: list[ClaimAnalysis],
-) -> tuple[Optional[int], str]:
+) -> Optional[_OverallVerdict]:
     if not claims:
-        return None, "No claims to summarize."
+        return None
     summary_lines = [
         f"- [{c.status.value}] {c.statement[:120]}" for c in claims[:30]
     ]
-    overall = examiner.summarize(
+    return examiner.summarize(
         question=run.question_text,
         answer=run.answer_text or "",
         claim_summary="\n".join(summary_lines),
     )
-    return overall.helpfulness_rating, overall.notes
 
 
 def _aggregate(
@@ -243,6 +574,12 @@ def _aggregate(
     *,
     qa_metrics: Optional[QAMetrics] = None,
     analysis_time_s: Optional[float] = None,
+    classification: Optional[ClaimBatch] = None,
+    summary_time_s: Optional[float] = None,
+    examiner_claim_mode: Optional[ClaimMode] = None,
+    fast_path_mode: Optional[FastPathMode] = None,
+    summary_num_ctx: Optional[int] = None,
+    examiner_truncation_risks: Optional[int] = None,
     analysis_run_name: Optional[str] = None,
     suite_id: Optional[str] = None,
     suite_name: Optional[str] = None,
@@ -263,6 +600,13 @@ def _aggregate(
     else:
         support_rate = error_rate = overclaim_rate = unsupported_ratio = 0.0
 
+    lexically_judged = [c for c in claims if c.lexical_status is not None]
+    lexical_agreement = (
+        sum(1 for c in lexically_judged if c.status == c.lexical_status) / len(lexically_judged)
+        if fast_path_mode == "audit" and lexically_judged
+        else None
+    )
+
     verdict = (
         Verdict.PASS
         if support_rate >= _PASS_SUPPORT_THRESHOLD and not_supported == 0 and total > 0
@@ -278,6 +622,22 @@ def _aggregate(
         suite_config_path=suite_config_path,
         suite_state_path=suite_state_path,
         analysis_time_s=analysis_time_s,
+        classification_time_s=classification.wall_s if classification else None,
+        summary_time_s=summary_time_s,
+        examiner_claim_calls=classification.calls if classification else None,
+        examiner_cache_hits=classification.cache_hits if classification else None,
+        examiner_claim_mode=examiner_claim_mode,
+        examiner_batch_fallbacks=(
+            classification.batch_fallbacks if classification and examiner_claim_mode == "batch" else None
+        ),
+        claim_concurrency=classification.concurrency if classification else None,
+        fast_path_mode=fast_path_mode,
+        claims_decided_lexically=(
+            sum(1 for c in claims if c.decided_by == "lexical") if fast_path_mode in ("use", "audit") else None
+        ),
+        lexical_agreement=lexical_agreement,
+        summary_num_ctx=summary_num_ctx,
+        examiner_truncation_risks=examiner_truncation_risks,
         claims=claims,
         claims_total=total,
         claims_supported=supported,
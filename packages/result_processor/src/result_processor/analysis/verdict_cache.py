@@ -0,0 +1,237 @@
+"""On-disk cache of examiner claim verdicts.
+
+Re-analyzing the same results (after a crash, or to compare analysis runs)
+asks the examiner the same claim questions again, and systems answering the
+same question often cite the same lines for the same claim. A verdict only
+depends on the examiner model, the classification prompt, the claim and the
+excerpt, so ``VerdictCache`` stores it under a hash of exactly those:
+
+    (examiner model, prompt template hash, normalized claim, excerpt hash)
+
+Only verdicts the examiner actually produced are stored; fallbacks for
+failed or unparseable calls are not. The cache is a SQLite (WAL mode) file
+shared by every analysis run under an analysis root and is capped at
+``max_entries`` rows, evicting the least recently used ones.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Literal, Optional, Sequence
+
+from result_processor.models.analysis import ClaimStatus
+
+VERDICT_CACHE_FILENAME = "examiner_verdicts.db"
+DEFAULT_MAX_ENTRIES = 200_000
+
+# use: read and write; refresh: ignore stored verdicts but overwrite them; off: no cache.
+VerdictCacheMode = Literal["use", "refresh", "off"]
+VERDICT_CACHE_MODES: tuple[str, ...] = ("use", "refresh", "off")
+
+# The size cap is enforced on open, on close and after this many writes.
+_EVICT_EVERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    key TEXT PRIMARY KEY,
+    examiner_model TEXT NOT NULL,
+    status TEXT NOT NULL,
+    justification TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    last_used_at TEXT NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used_at);
+"""
+
+
+def verdict_cache_path(analysis_root: str | Path) -> Path:
+    return Path(analysis_root) / VERDICT_CACHE_FILENAME
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def normalize_claim(claim: str) -> str:
+    return re.sub(r"\s+", " ", claim).strip()
+
+
+def verdict_key(*, examiner_model: str, prompt_template: str, claim: str, excerpt: str) -> str:
+    payload = {
+        "examiner_model": examiner_model,
+        "prompt": _sha256(prompt_template)[:16],
+        "claim": normalize_claim(claim),
+        "excerpt": _sha256(excerpt),
+    }
+    return _sha256(json.dumps(payload, sort_keys=True))
+
+
+@dataclass(frozen=True)
+class CachedVerdict:
+    status: ClaimStatus
+    justification: str
+
+
+@dataclass(frozen=True)
+class VerdictCacheStats:
+    # Lookups and writes made through this VerdictCache instance.
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+    # The whole cache file.
+    entries: int
+    lifetime_hits: int
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class VerdictCache:
+    """SQLite (WAL mode) map from ``verdict_key`` to a claim verdict.
+
+    Safe to share between the threads of one analysis: every statement runs
+    under a lock on a single connection.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        mode: VerdictCacheMode = "use",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if mode not in ("use", "refresh"):
+            raise ValueError(f"VerdictCache mode must be 'use' or 'refresh', got {mode!r}")
+        if max_entries < 1:
+            raise ValueError(f"verdict cache max_entries must be at least 1, got {max_entries}")
+        self.path = Path(path)
+        self.mode = mode
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._writes_since_evict = 0
+        with self._lock:
+            self._evict()
+
+    def __enter__(self) -> VerdictCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._evict()
+            self._conn.close()
+
+    def get(self, key: str) -> Optional[CachedVerdict]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, CachedVerdict]:
+        """Stored verdicts for ``keys``; empty in refresh mode."""
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        found: dict[str, CachedVerdict] = {}
+        with self._lock:
+            if self.mode == "refresh":
+                self._misses += len(unique)
+                return found
+            placeholders = ",".join("?" for _ in unique)
+            rows = self._conn.execute(
+                f"SELECT key, status, justification FROM verdicts WHERE key IN ({placeholders})",
+                unique,
+            ).fetchall()
+            for key, status, justification in rows:
+                try:
+                    found[key] = CachedVerdict(ClaimStatus(status), justification)
+                except ValueError:
+                    continue
+            if found:
+                self._conn.executemany(
+                    "UPDATE verdicts SET last_used_at = ?, hit_count = hit_count + 1 WHERE key = ?",
+                    [(_now(), key) for key in found],
+                )
+            self._hits += len(found)
+            self._misses += len(unique) - len(found)
+        return found
+
+    def put(self, key: str, *, examiner_model: str, status: ClaimStatus, justification: str) -> None:
+        now = _now()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts"
+                " (key, examiner_model, status, justification, created_at, last_used_at, hit_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, examiner_model, status.value, justification, now, now),
+            )
+            self._writes += 1
+            self._writes_since_evict += 1
+            if self._writes_since_evict >= _EVICT_EVERY:
+                self._evict()
+
+    def stats(self) -> VerdictCacheStats:
+        with self._lock:
+            entries, lifetime_hits = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM verdicts"
+            ).fetchone()
+            return VerdictCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                writes=self._writes,
+                evictions=self._evictions,
+                entries=entries,
+                lifetime_hits=lifetime_hits,
+            )
+
+    def _evict(self) -> None:
+        self._writes_since_evict = 0
+        (entries,) = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()
+        excess = entries - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM verdicts WHERE key IN"
+                " (SELECT key FROM verdicts ORDER BY last_used_at ASC LIMIT ?)",
+                (excess,),
+            )
+            self._evictions += excess
+
+
+def open_verdict_cache(
+    path: str | Path | None,
+    mode: VerdictCacheMode = "use",
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> Optional[VerdictCache]:
+    """Open the cache at ``path``, or return None when there is none or mode is off."""
+    if mode not in VERDICT_CACHE_MODES:
+        raise ValueError(f"verdict cache mode must be one of {', '.join(VERDICT_CACHE_MODES)}, got {mode!r}")
+    if path is None or mode == "off":
+        return None
+    return VerdictCache(path, mode=mode, max_entries=max_entries)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
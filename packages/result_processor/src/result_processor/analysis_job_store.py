@@ -0,0 +1,217 @@
+"""Indexed SQLite store backing analysis job state.
+
+The analysis job runner used to re-parse and rewrite the whole
+``*.state.json`` file (and ``analysis.meta.json``) on every run status change
+and before every run's cancel check. The store keeps one row per task, keyed
+by ``(source_file, run_id)``, plus a small key/value table for job-level
+fields, so task updates and the cancel-flag check are O(1) regardless of job
+size.
+
+As with suite state, the ``*.state.json`` file stays the canonical, portable
+path: the store lives next to it (``job.state.json`` -> ``job.state.db``) and
+the runner writes periodic JSON snapshots. A JSON file rewritten by something
+other than the store is re-imported the next time the store is opened for
+writing, unless the job's process is alive. Readers open the store read-only.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from result_processor.models.analysis_job import AnalysisJobState, AnalysisJobTask
+
+_SNAPSHOT_MTIME_KEY = "_json_snapshot_mtime_ns"
+_STATE_FIELDS = tuple(name for name in AnalysisJobState.model_fields if name != "tasks")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_tasks (
+    source_file TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (source_file, run_id)
+);
+CREATE INDEX IF NOT EXISTS job_tasks_position ON job_tasks (position);
+"""
+
+
+def analysis_job_store_path(state_path: str | Path) -> Path:
+    return Path(state_path).with_suffix(".db")
+
+
+class AnalysisJobStore:
+    """SQLite (WAL mode) store for one analysis job's state.
+
+    The job runner shares one connection between the analysis worker threads,
+    so every statement runs under a lock. Readers (dashboard, ``analysis-job
+    status``) pass ``read_only``.
+    """
+
+    def __init__(self, path: str | Path, *, read_only: bool = False) -> None:
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        if read_only:
+            self._conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro",
+                uri=True,
+                timeout=30.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> AnalysisJobStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def has_state(self) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM job_meta WHERE key = 'job_name'").fetchone()
+        return row is not None
+
+    def load(self) -> AnalysisJobState:
+        with self._lock:
+            meta = self._meta()
+            payloads = self._conn.execute("SELECT payload FROM job_tasks ORDER BY position").fetchall()
+        return AnalysisJobState.model_validate({
+            **{key: value for key, value in meta.items() if key in _STATE_FIELDS},
+            "tasks": [AnalysisJobTask.model_validate_json(payload) for (payload,) in payloads],
+        })
+
+    def replace(self, state: AnalysisJobState) -> None:
+        """Overwrite the stored state with ``state`` in a single transaction."""
+        payload = state.model_dump(mode="json", exclude={"tasks"})
+        with self._transaction():
+            self._conn.execute(
+                "DELETE FROM job_meta WHERE key != ?",
+                (_SNAPSHOT_MTIME_KEY,),
+            )
+            self._conn.executemany(
+                "INSERT INTO job_meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in payload.items()],
+            )
+            self._conn.execute("DELETE FROM job_tasks")
+            # A run listed twice in one file keeps its first task, the one progress updates used to hit.
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO job_tasks (source_file, run_id, position, payload) VALUES (?, ?, ?, ?)",
+                [
+                    (task.source_file, task.run_id, position, task.model_dump_json())
+                    for position, task in enumerate(state.tasks)
+                ],
+            )
+
+    def get_task(self, source_file: str, run_id: str) -> AnalysisJobTask | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM job_tasks WHERE source_file = ? AND run_id = ?",
+                (source_file, run_id),
+            ).fetchone()
+        return AnalysisJobTask.model_validate_json(row[0]) if row else None
+
+    def add_task(self, task: AnalysisJobTask, **meta: Any) -> None:
+        """Append a task after the existing ones (and set optional job-level fields) atomically."""
+        with self._transaction():
+            self._conn.execute(
+                "INSERT OR IGNORE INTO job_tasks (source_file, run_id, position, payload)"
+                " SELECT ?, ?, COALESCE(MAX(position) + 1, 0), ? FROM job_tasks",
+                (task.source_file, task.run_id, task.model_dump_json()),
+            )
+            self._write_meta(meta)
+
+    def update_task(self, task: AnalysisJobTask, **meta: Any) -> None:
+        """Persist one task (and optional job-level fields) atomically."""
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE job_tasks SET payload = ? WHERE source_file = ? AND run_id = ?",
+                (task.model_dump_json(), task.source_file, task.run_id),
+            )
+            self._write_meta(meta)
+
+    def update_meta(self, **meta: Any) -> None:
+        with self._transaction():
+            self._write_meta(meta)
+
+    def cancel_requested(self) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM job_meta WHERE key = 'cancel_requested'").fetchone()
+        return bool(row and json.loads(row[0]))
+
+    def active_pid(self) -> int | None:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM job_meta WHERE key = 'active_pid'").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def snapshot_mtime_ns(self) -> int | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM job_meta WHERE key = ?",
+                (_SNAPSHOT_MTIME_KEY,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_snapshot_mtime_ns(self, mtime_ns: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_meta (key, value) VALUES (?, ?)",
+                (_SNAPSHOT_MTIME_KEY, json.dumps(mtime_ns)),
+            )
+
+    def _meta(self) -> dict[str, Any]:
+        return {key: json.loads(value) for key, value in self._conn.execute("SELECT key, value FROM job_meta")}
+
+    def _write_meta(self, meta: dict[str, Any]) -> None:
+        unknown = set(meta) - set(_STATE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown analysis job state fields: {sorted(unknown)}")
+        meta = {**meta, "updated_at": datetime.now(timezone.utc).isoformat()}
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO job_meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in meta.items()],
+        )
+
+    def _transaction(self) -> _Transaction:
+        return _Transaction(self._conn, self._lock)
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection, lock: threading.RLock) -> None:
+        self._conn = conn
+        self._lock = lock
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self._lock.release()
@@ -5,32 +5,136 @@ import json
 import os
 import shutil
 import sys
+import tempfile
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 from experiment_runner.models.result import RunResult
+from experiment_runner.result_store import result_file_exists
 
 from result_processor.analysis.io import iter_run_results, load_existing_run_ids
 from result_processor.analysis.pipeline import analyze_directory
+from result_processor.analysis_job_store import AnalysisJobStore, analysis_job_store_path
 from result_processor.models.analysis_job import (
     AnalysisJobState,
     AnalysisJobTask,
     AnalysisTaskStatus,
 )
 
+# Minimum spacing between JSON snapshots (and analysis.meta.json rewrites) of
+# a store-backed analysis job while it runs.
+ANALYSIS_SNAPSHOT_INTERVAL_S = 60.0
+
 
 def load_analysis_job_state(path: str | Path) -> AnalysisJobState:
-    return AnalysisJobState.model_validate_json(Path(path).read_text(encoding="utf-8"))
+    """Read an analysis job state without writing to its store (or anything else)."""
+    json_path = Path(path)
+    if analysis_job_store_path(json_path).is_file():
+        with AnalysisJobStore(analysis_job_store_path(json_path), read_only=True) as store:
+            if not _json_needs_import(json_path, store):
+                return store.load()
+    return AnalysisJobState.model_validate_json(json_path.read_text(encoding="utf-8"))
 
 
 def save_analysis_job_state(path: str | Path, state: AnalysisJobState) -> None:
     out = Path(path)
     out.parent.mkdir(parents=True, exist_ok=True)
     state.updated_at = datetime.now(timezone.utc)
-    out.write_text(state.model_dump_json(indent=2) + "\n", encoding="utf-8")
+    if analysis_job_store_path(out).is_file():
+        with open_analysis_job_store(out) as store:
+            store.replace(state)
+            _write_analysis_job_snapshot(out, store, state)
+        return
+    _atomic_write_text(out, state.model_dump_json(indent=2) + "\n")
     save_analysis_metadata(state, out)
 
 
+def open_analysis_job_store(path: str | Path) -> AnalysisJobStore:
+    """Open (creating if needed) the SQLite store next to an analysis job state JSON.
+
+    JSON-only jobs are imported on first open, and a JSON file that was
+    rewritten outside the store since its last snapshot is re-imported unless
+    the job's process is alive. Only writers should call this; readers go
+    through ``load_analysis_job_state``.
+    """
+    json_path = Path(path)
+    store_path = analysis_job_store_path(json_path)
+    if not json_path.is_file() and not store_path.is_file():
+        raise FileNotFoundError(f"analysis job state not found: {json_path}")
+    store = AnalysisJobStore(store_path)
+    try:
+        if _json_needs_import(json_path, store):
+            mtime_ns = json_path.stat().st_mtime_ns
+            store.replace(
+                AnalysisJobState.model_validate_json(json_path.read_text(encoding="utf-8"))
+            )
+            store.set_snapshot_mtime_ns(mtime_ns)
+    except Exception:
+        store.close()
+        raise
+    return store
+
+
+def _json_needs_import(json_path: Path, store: AnalysisJobStore) -> bool:
+    """True when ``json_path`` holds state the store has not seen and no live job process owns the store."""
+    if not json_path.is_file():
+        return False
+    if not store.has_state():
+        return True
+    if store.snapshot_mtime_ns() == json_path.stat().st_mtime_ns:
+        return False
+    # A running job's own snapshot lands before its mtime is recorded.
+    active_pid = store.active_pid()
+    return active_pid is None or not _is_pid_alive(active_pid)
+
+
+def _is_pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _write_analysis_job_snapshot(
+    path: Path,
+    store: AnalysisJobStore,
+    state: AnalysisJobState | None = None,
+) -> None:
+    snapshot = state if state is not None else store.load()
+    _atomic_write_text(path, snapshot.model_dump_json(indent=2) + "\n")
+    store.set_snapshot_mtime_ns(path.stat().st_mtime_ns)
+    save_analysis_metadata(snapshot, path)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    tmp_name: str | None = None
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as tmp:
+        tmp_name = tmp.name
+        tmp.write(text)
+    try:
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            Path(tmp_name).unlink()
+        except OSError:
+            pass
+        raise
+
+
 def save_analysis_metadata(state: AnalysisJobState, state_path: Path) -> None:
     out_dir = Path(state.output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -42,6 +146,15 @@ def save_analysis_metadata(state: AnalysisJobState, state_path: Path) -> None:
         "path_to_corpora": state.path_to_corpora,
         "examiner_model": state.examiner_model,
         "num_ctx": state.num_ctx,
+        "num_ctx_mode": state.num_ctx_mode,
+        "examiner_parallelism": state.examiner_parallelism,
+        "run_parallelism": state.run_parallelism,
+        "claim_mode": state.claim_mode,
+        "fast_path": state.fast_path,
+        "excerpt_token_budget": state.excerpt_token_budget,
+        "verdict_cache_path": state.verdict_cache_path,
+        "verdict_cache_mode": state.verdict_cache_mode,
+        "follow": state.follow,
         "input_files": state.input_files,
         "suite_id": state.suite_id,
         "suite_name": state.suite_name,
@@ -78,10 +191,24 @@ def build_analysis_job_state(
     suite_config_path: str | None = None,
     suite_state_path: str | None = None,
     augmented_from_state_path: str | None = None,
+    examiner_parallelism: int | None = None,
+    run_parallelism: int = 1,
+    claim_mode: str = "per_claim",
+    fast_path: str = "off",
+    excerpt_token_budget: int | None = None,
+    num_ctx_mode: str = "fixed",
+    verdict_cache_path: str | None = None,
+    verdict_cache_mode: str = "use",
+    follow: bool = False,
+    follow_poll_interval_s: float = 10.0,
+    follow_idle_timeout_s: float | None = None,
 ) -> AnalysisJobState:
     tasks: list[AnalysisJobTask] = []
     for input_file in input_files:
         source = Path(input_file).resolve()
+        if follow and not result_file_exists(source):
+            # Not written yet; its runs become tasks as they land.
+            continue
         output_file = _output_file_for_run_file(output_dir, source)
         existing = load_existing_run_ids(Path(output_file)) if resume else set()
         for run in iter_run_results(source):
@@ -106,6 +233,17 @@ def build_analysis_job_state(
         suite_state_path=suite_state_path,
         augmented_from_state_path=augmented_from_state_path,
         num_ctx=num_ctx,
+        examiner_parallelism=examiner_parallelism,
+        run_parallelism=run_parallelism,
+        claim_mode=claim_mode,
+        fast_path=fast_path,
+        excerpt_token_budget=excerpt_token_budget,
+        num_ctx_mode=num_ctx_mode,
+        verdict_cache_path=verdict_cache_path,
+        verdict_cache_mode=verdict_cache_mode,
+        follow=follow,
+        follow_poll_interval_s=follow_poll_interval_s,
+        follow_idle_timeout_s=follow_idle_timeout_s,
         input_files=[str(Path(f).resolve()) for f in input_files],
         resume=resume,
         log_path=log_path,
@@ -133,6 +271,17 @@ def reconcile_analysis_job_state(state: AnalysisJobState) -> AnalysisJobState:
         suite_config_path=state.suite_config_path,
         suite_state_path=state.suite_state_path,
         augmented_from_state_path=state.augmented_from_state_path,
+        examiner_parallelism=state.examiner_parallelism,
+        run_parallelism=state.run_parallelism,
+        claim_mode=state.claim_mode,
+        fast_path=state.fast_path,
+        excerpt_token_budget=state.excerpt_token_budget,
+        num_ctx_mode=state.num_ctx_mode,
+        verdict_cache_path=state.verdict_cache_path,
+        verdict_cache_mode=state.verdict_cache_mode,
+        follow=state.follow,
+        follow_poll_interval_s=state.follow_poll_interval_s,
+        follow_idle_timeout_s=state.follow_idle_timeout_s,
     )
     for task in rebuilt.tasks:
         old = previous.get(_task_key(task.source_file, task.run_id))
@@ -188,23 +337,45 @@ def summarize_analysis_job_state(state: AnalysisJobState) -> dict[str, int | str
 
 def run_analysis_job(state_path: str | Path) -> AnalysisJobState:
     path = Path(state_path)
-    state = reconcile_analysis_job_state(load_analysis_job_state(path))
-    state.cancel_requested = False
-    save_analysis_job_state(path, state)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open_analysis_job_store(path) as store:
+        state = reconcile_analysis_job_state(store.load())
+        state.cancel_requested = False
+        state.updated_at = datetime.now(timezone.utc)
+        store.replace(state)
+        _write_analysis_job_snapshot(path, store, state)
+        return _run_analysis_job_with_store(path, store, state)
+
 
+def _run_analysis_job_with_store(path: Path, store: AnalysisJobStore, state: AnalysisJobState) -> AnalysisJobState:
     log_path = Path(state.log_path or path.with_suffix(".log"))
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    input_files = state.input_files
+    input_files = list(state.input_files)
+    known_inputs = set(input_files)
+    snapshot_lock = threading.Lock()
+    last_snapshot = time.monotonic()
 
     def should_cancel() -> bool:
-        return load_analysis_job_state(path).cancel_requested
+        return store.cancel_requested()
 
     def mark(status: str, run: RunResult, source: Path, error: str | None) -> None:
-        current = load_analysis_job_state(path)
-        key = _task_key(str(source), run.run_id)
-        task = next((t for t in current.tasks if _task_key(t.source_file, t.run_id) == key), None)
+        nonlocal last_snapshot
+        source_file, run_id = _task_key(str(source), run.run_id)
+        task = store.get_task(source_file, run_id)
         if task is None:
-            return
+            if not state.follow:
+                return
+            # A followed run that landed after the job started.
+            task = AnalysisJobTask(
+                run_id=run_id,
+                source_file=source_file,
+                output_file=_output_file_for_run_file(state.output_dir, source_file),
+            )
+            new_input = source_file not in known_inputs
+            if new_input:
+                known_inputs.add(source_file)
+                input_files.append(source_file)
+            store.add_task(task, **({"input_files": input_files} if new_input else {}))
         if status == "running":
             task.status = AnalysisTaskStatus.RUNNING
             task.started_at = datetime.now(timezone.utc)
@@ -219,7 +390,11 @@ def run_analysis_job(state_path: str | Path) -> AnalysisJobState:
             task.status = AnalysisTaskStatus.FAILED
             task.error = error
             task.finished_at = datetime.now(timezone.utc)
-        save_analysis_job_state(path, current)
+        store.update_task(task)
+        with snapshot_lock:
+            if time.monotonic() - last_snapshot >= ANALYSIS_SNAPSHOT_INTERVAL_S:
+                _write_analysis_job_snapshot(path, store)
+                last_snapshot = time.monotonic()
 
     with log_path.open("a", encoding="utf-8") as log:
         log.write(f"\n=== analysis job {state.job_name} ===\n")
@@ -235,7 +410,19 @@ def run_analysis_job(state_path: str | Path) -> AnalysisJobState:
                 path_to_corpora=state.path_to_corpora,
                 examiner_model=state.examiner_model,
                 num_ctx=state.num_ctx,
-                input_files=input_files,
+                examiner_parallelism=state.examiner_parallelism,
+                run_parallelism=state.run_parallelism,
+                claim_mode=state.claim_mode,
+                fast_path=state.fast_path,
+                excerpt_token_budget=state.excerpt_token_budget,
+                num_ctx_mode=state.num_ctx_mode,
+                verdict_cache_path=state.verdict_cache_path,
+                verdict_cache_mode=state.verdict_cache_mode,
+                follow=state.follow,
+                follow_suite_state_path=state.suite_state_path,
+                follow_poll_interval_s=state.follow_poll_interval_s,
+                follow_idle_timeout_s=state.follow_idle_timeout_s,
+                input_files=state.input_files,
                 resume=state.resume,
                 progress_callback=mark,
                 should_cancel=should_cancel,
@@ -250,26 +437,28 @@ def run_analysis_job(state_path: str | Path) -> AnalysisJobState:
             sys.stdout = stdout
             sys.stderr = stderr
 
-    state = load_analysis_job_state(path)
+    state = store.load()
     if state.cancel_requested:
+        now = datetime.now(timezone.utc)
         for task in state.tasks:
             if task.status in {AnalysisTaskStatus.PENDING, AnalysisTaskStatus.RUNNING}:
                 task.status = AnalysisTaskStatus.CANCELLED
-                task.finished_at = datetime.now(timezone.utc)
-    save_analysis_job_state(path, state)
+                task.finished_at = now
+        state.updated_at = now
+        store.replace(state)
+    _write_analysis_job_snapshot(path, store, state)
     return state
 
 
 def run_analysis_job_run(args: argparse.Namespace) -> None:
-    state = load_analysis_job_state(args.state)
-    state.active_pid = os.getpid()
-    save_analysis_job_state(args.state, state)
+    with open_analysis_job_store(args.state) as store:
+        store.update_meta(active_pid=os.getpid())
     try:
         final = run_analysis_job(args.state)
     finally:
-        state = load_analysis_job_state(args.state)
-        state.active_pid = None
-        save_analysis_job_state(args.state, state)
+        with open_analysis_job_store(args.state) as store:
+            store.update_meta(active_pid=None)
+            _write_analysis_job_snapshot(Path(args.state), store)
     sys.stdout.write(json.dumps(summarize_analysis_job_state(final), indent=2) + "\n")
 
 
@@ -279,7 +468,11 @@ def run_analysis_job_status(args: argparse.Namespace) -> None:
 
 
 def run_analysis_job_cancel(args: argparse.Namespace) -> None:
-    state = load_analysis_job_state(args.state)
-    state.cancel_requested = True
-    save_analysis_job_state(args.state, state)
+    if analysis_job_store_path(args.state).is_file():
+        with open_analysis_job_store(args.state) as store:
+            store.update_meta(cancel_requested=True)
+    else:
+        state = load_analysis_job_state(args.state)
+        state.cancel_requested = True
+        save_analysis_job_state(args.state, state)
     sys.stdout.write(f"cancel requested for {args.state}\n")
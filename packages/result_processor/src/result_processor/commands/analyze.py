@@ -4,7 +4,9 @@ import argparse
 
 
 def run_analyze(args: argparse.Namespace) -> None:
+    from result_processor.analysis.lexical_classifier import LexicalThresholds
     from result_processor.analysis.pipeline import analyze_directory
+    from result_processor.analysis.verdict_cache import verdict_cache_path
 
     analyze_directory(
         experiment_results_dir=args.experiment_results_dir,
@@ -12,6 +14,23 @@ def run_analyze(args: argparse.Namespace) -> None:
         path_to_corpora=args.path_to_corpora,
         examiner_model=args.examiner_model,
         num_ctx=args.num_ctx,
+        num_ctx_mode=args.num_ctx_mode,
+        examiner_parallelism=args.examiner_parallelism,
+        run_parallelism=args.run_parallelism,
+        claim_mode=args.claim_mode,
+        fast_path=args.fast_path,
+        lexical_thresholds=LexicalThresholds(
+            support_similarity=args.fast_path_support_similarity,
+            reject_coverage=args.fast_path_reject_coverage,
+        ),
+        excerpt_token_budget=args.excerpt_token_budget,
+        verdict_cache_path=args.verdict_cache or str(verdict_cache_path(args.output_dir)),
+        verdict_cache_mode=args.verdict_cache_mode,
+        verdict_cache_max_entries=args.verdict_cache_max_entries,
         input_files=args.input_files,
         resume=args.resume,
+        follow=args.follow,
+        follow_suite_state_path=args.follow_suite_state,
+        follow_poll_interval_s=args.follow_poll_interval,
+        follow_idle_timeout_s=args.follow_idle_timeout,
     )
@@ -0,0 +1,223 @@
+"""Orchestration benchmark against the fake Ollama server.
+
+Builds a small synthetic corpus and question set in a scratch directory, then
+for every requested slot count starts ``agent.fake_ollama``, points
+``OLLAMA_HOST`` at it and times ``run_suite`` (ACE tasks) followed by
+``analyze_directory`` over the suite's results. Model time is simulated, so
+whatever a phase spends beyond the fake server's busy time is orchestration
+overhead: process start-up, imports, agent graph construction, file IO.
+Comparing slot counts shows how much of the simulated model parallelism each
+phase can use; comparing ``--claim-mode`` values shows how many prompt tokens
+batched claim verification saves.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from agent.fake_ollama import FakeOllamaConfig, FakeOllamaServer, Latency, ScriptedToolCall
+from agent.ollama_host import OLLAMA_HOST_ENV
+from experiment_runner.commands.suite import run_suite
+from experiment_runner.models.enums import Corpus, SystemName
+from experiment_runner.models.suite import ExperimentSuiteConfig, SuiteCorpusSelection, SuiteTaskStatus
+from experiment_runner.runners.mock import write_synthetic_corpus
+
+from result_processor.analysis.excerpt_resolver import CORPUS_DIR_NAMES
+from result_processor.analysis.pipeline import analyze_directory
+from result_processor.models.analysis import ClaimMode, FastPathMode
+
+_CORPUS = Corpus.SOLAR_SYSTEM_WIKI
+_DOCUMENT_COUNT = 8
+
+
+def benchmark_orchestration(
+    *,
+    questions: int,
+    slot_levels: list[int],
+    prefill: Latency,
+    decode: Latency,
+    model: str = "qwen3:4b",
+    task_timeout_s: int = 240,
+    claim_mode: ClaimMode = "per_claim",
+    fast_path: FastPathMode = "off",
+    work_dir: str | Path | None = None,
+) -> dict[str, Any]:
+    if questions < 1:
+        raise ValueError(f"--questions must be at least 1, got {questions}")
+    if not slot_levels or min(slot_levels) < 1:
+        raise ValueError("--slots values must be at least 1")
+
+    with _scratch_dir(work_dir) as root:
+        corpora_root = root / "corpora"
+        corpus_dir = corpora_root / CORPUS_DIR_NAMES[_CORPUS]
+        questions_file = root / "questions.json"
+        write_synthetic_corpus(corpus_dir, documents=_DOCUMENT_COUNT)
+        _write_questions(questions_file, questions)
+
+        levels = []
+        for slots in slot_levels:
+            level_dir = root / f"slots_{slots}"
+            config = FakeOllamaConfig(
+                models=(model,),
+                slots=slots,
+                prefill_per_1k_tokens=prefill,
+                decode_per_token=decode,
+                tool_script=(
+                    ScriptedToolCall("list_paths", {"pattern": "**/*.md"}),
+                    ScriptedToolCall("read_lines", {"relative_path": "text/doc1.md", "a": 0, "b": 3}),
+                ),
+                answer=_ANSWER,
+                json_reply=fake_examiner_reply,
+            )
+            with FakeOllamaServer(config) as server, _ollama_host(server.base_url):
+                suite_config = ExperimentSuiteConfig(
+                    name=f"benchmark-slots-{slots}",
+                    systems=[SystemName.ACE],
+                    models=[model],
+                    corpora=[SuiteCorpusSelection(
+                        corpus=_CORPUS,
+                        questions_file=str(questions_file),
+                        path_to_corpora=str(corpus_dir),
+                    )],
+                    output_dir=str(level_dir / "experiment_results"),
+                    task_timeout_s=task_timeout_s,
+                    no_trace=True,
+                    use_cache=False,
+                )
+                suite_report = _timed_phase(server, lambda: run_suite(suite_config, level_dir / "suite.state.json"))
+                state = suite_report.pop("value")
+                suite_report["tasks"] = len(state.tasks)
+                suite_report["succeeded"] = sum(1 for t in state.tasks if t.status == SuiteTaskStatus.SUCCEEDED)
+
+                analysis_report = _timed_phase(server, lambda: analyze_directory(
+                    experiment_results_dir=suite_config.output_dir,
+                    output_dir=str(level_dir / "analysis_results"),
+                    path_to_corpora=str(corpora_root),
+                    examiner_model=model,
+                    resume=False,
+                    examiner_parallelism=slots,
+                    run_parallelism=slots,
+                    claim_mode=claim_mode,
+                    fast_path=fast_path,
+                ))
+                analysis_report.pop("value")
+            levels.append({"slots": slots, "suite": suite_report, "analysis": analysis_report})
+
+    for phase in ("suite", "analysis"):
+        baseline = levels[0][phase]["wall_s"]
+        for level in levels:
+            wall_s = level[phase]["wall_s"]
+            level[phase]["speedup"] = round(baseline / wall_s, 3) if wall_s else None
+    return {
+        "model": model,
+        "questions": questions,
+        "claim_mode": claim_mode,
+        "fast_path": fast_path,
+        "prefill_s_per_1k_tokens": {"mean": prefill.mean_s, "stddev": prefill.stddev_s},
+        "decode_s_per_token": {"mean": decode.mean_s, "stddev": decode.stddev_s},
+        "levels": levels,
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    report = benchmark_orchestration(
+        questions=args.questions,
+        slot_levels=args.slots,
+        prefill=Latency(args.prefill_ms / 1000, args.prefill_ms * args.jitter / 1000),
+        decode=Latency(args.decode_ms / 1000, args.decode_ms * args.jitter / 1000),
+        model=args.model,
+        task_timeout_s=args.task_timeout_s,
+        claim_mode=args.claim_mode,
+        fast_path=args.fast_path,
+        work_dir=args.work_dir,
+    )
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+_ANSWER = (
+    "[Document 1 describes synthetic planet number 1.] [file:text/doc1.md, lines:0-2] "
+    "[Document two describes synthetic planet number two.] [file:text/doc2.md, lines:0-2] "
+    "[Document three describes synthetic planet number three.] [file:text/doc3.md, lines:0-2]"
+)
+
+
+def fake_examiner_reply(prompt: str) -> dict[str, Any]:
+    """JSON the fake Ollama server returns for the examiner's prompts.
+
+    Every claim is judged supported; batched prompts get one verdict per
+    ``[C<n>]`` claim line, and the summary prompt gets a fixed rating.
+    """
+    if "helpfulness_rating" in prompt:
+        return {"helpfulness_rating": 4, "notes": "Scored by the fake Ollama server."}
+    verdict = {"status": "supported", "justification": "Verified by the fake Ollama server."}
+    if '"verdicts"' in prompt:
+        claim_ids = dict.fromkeys(re.findall(r"^\[(C\d+)\]", prompt, flags=re.MULTILINE))
+        return {"verdicts": [{"id": claim_id, **verdict} for claim_id in claim_ids]}
+    return verdict
+
+
+def _timed_phase(server: FakeOllamaServer, action: Callable[[], Any]) -> dict[str, Any]:
+    server.reset_stats()
+    started = time.perf_counter()
+    # Keep stdout for the JSON report; the phases print their own progress.
+    with redirect_stdout(sys.stderr):
+        value = action()
+    wall_s = time.perf_counter() - started
+    stats = server.stats()
+    return {
+        "value": value,
+        "wall_s": round(wall_s, 3),
+        "model_busy_s": round(stats.busy_s, 3),
+        "model_service_s": round(stats.service_s, 3),
+        "overhead_s": round(max(wall_s - stats.busy_s, 0.0), 3),
+        "requests": stats.requests,
+        "prompt_tokens": stats.prompt_tokens,
+        "peak_in_flight": stats.peak_in_flight,
+        "queue_wait_s": round(stats.queue_wait_s, 3),
+    }
+
+
+def _write_questions(path: Path, count: int) -> None:
+    questions = [
+        {
+            "id": f"bench_L1_{index:03d}",
+            "corpus": _CORPUS.value,
+            "level": 1,
+            "question": f"What does document {index % _DOCUMENT_COUNT + 1} describe?",
+            "expected_facts": ["planet"],
+        }
+        for index in range(1, count + 1)
+    ]
+    path.write_text(json.dumps(questions, indent=2), encoding="utf-8")
+
+
+@contextmanager
+def _scratch_dir(work_dir: str | Path | None) -> Iterator[Path]:
+    if work_dir is not None:
+        path = Path(work_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        yield path
+        return
+    with tempfile.TemporaryDirectory(prefix="orchestration_bench_") as tmp:
+        yield Path(tmp)
+
+
+@contextmanager
+def _ollama_host(base_url: str) -> Iterator[None]:
+    previous = os.environ.get(OLLAMA_HOST_ENV)
+    os.environ[OLLAMA_HOST_ENV] = base_url
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(OLLAMA_HOST_ENV, None)
+        else:
+            os.environ[OLLAMA_HOST_ENV] = previous
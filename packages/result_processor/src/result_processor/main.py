@@ -3,6 +3,9 @@ from __future__ import annotations
 import argparse
 import sys
 
+from result_processor.analysis.verdict_cache import DEFAULT_MAX_ENTRIES, VERDICT_CACHE_MODES
+from result_processor.models.analysis import CLAIM_MODES, FAST_PATH_MODES, NUM_CTX_MODES
+
 
 def _add_analyze_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
@@ -34,7 +37,86 @@ def _add_analyze_args(parser: argparse.ArgumentParser) -> None:
         dest="num_ctx",
         type=int,
         default=8192,
-        help="Context window size for the examiner model",
+        help="Context window size for the examiner model (the maximum in dynamic mode)",
+    )
+    parser.add_argument(
+        "--num-ctx-mode",
+        dest="num_ctx_mode",
+        choices=NUM_CTX_MODES,
+        default="fixed",
+        help="fixed: every request uses --num-ctx; dynamic: the smallest of a few context sizes that fits"
+        " the largest prompt so far of the same kind (claim, batch or summary), so Ollama rarely reloads the model",
+    )
+    parser.add_argument(
+        "--examiner-parallelism",
+        dest="examiner_parallelism",
+        type=int,
+        default=None,
+        help="Claims of a run classified concurrently (default: OLLAMA_NUM_PARALLEL or 1)",
+    )
+    parser.add_argument(
+        "--run-parallelism",
+        dest="run_parallelism",
+        type=int,
+        default=1,
+        help="Runs analyzed concurrently, across all input files",
+    )
+    parser.add_argument(
+        "--claim-mode",
+        dest="claim_mode",
+        choices=CLAIM_MODES,
+        default="per_claim",
+        help="per_claim: one examiner call per claim; batch: all claims of an answer in one call",
+    )
+    parser.add_argument(
+        "--fast-path",
+        dest="fast_path",
+        choices=FAST_PATH_MODES,
+        default="off",
+        help="use: decide near-verbatim and unrelated claims lexically, without the examiner;"
+        " audit: ask the examiner anyway and record both verdicts",
+    )
+    parser.add_argument(
+        "--fast-path-support-similarity",
+        dest="fast_path_support_similarity",
+        type=float,
+        default=0.9,
+        help="Word-level similarity to an excerpt window at which a claim counts as supported",
+    )
+    parser.add_argument(
+        "--fast-path-reject-coverage",
+        dest="fast_path_reject_coverage",
+        type=float,
+        default=0.0,
+        help="Share of a claim's content words found in the excerpt at or below which it counts as not supported",
+    )
+    parser.add_argument(
+        "--excerpt-token-budget",
+        dest="excerpt_token_budget",
+        type=int,
+        default=None,
+        help="Show the examiner only the lines of a longer excerpt that best match the claim,"
+        " up to about this many tokens (default: whole excerpts)",
+    )
+    parser.add_argument(
+        "--verdict-cache",
+        dest="verdict_cache",
+        default=None,
+        help="SQLite file of cached claim verdicts (default: <output-dir>/examiner_verdicts.db)",
+    )
+    parser.add_argument(
+        "--verdict-cache-mode",
+        dest="verdict_cache_mode",
+        choices=VERDICT_CACHE_MODES,
+        default="use",
+        help="use: reuse and store verdicts; refresh: re-ask the examiner and overwrite; off: bypass",
+    )
+    parser.add_argument(
+        "--verdict-cache-max-entries",
+        dest="verdict_cache_max_entries",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help="Least recently used verdicts beyond this many are evicted",
     )
     parser.add_argument(
         "--input-files",
@@ -43,6 +125,34 @@ def _add_analyze_args(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="Specific JSONL files to analyse (default: all under experiment-results-dir)",
     )
+    parser.add_argument(
+        "--follow",
+        dest="follow",
+        action="store_true",
+        default=False,
+        help="Keep polling the input files and analyze new runs as they land; read offsets are saved"
+        " in <output-dir>/follow.offsets.json so a restart resumes",
+    )
+    parser.add_argument(
+        "--follow-suite-state",
+        dest="follow_suite_state",
+        default=None,
+        help="With --follow: also follow this suite's result files, and stop once the suite has finished",
+    )
+    parser.add_argument(
+        "--follow-poll-interval",
+        dest="follow_poll_interval",
+        type=float,
+        default=10.0,
+        help="With --follow: seconds between polls when there is nothing new",
+    )
+    parser.add_argument(
+        "--follow-idle-timeout",
+        dest="follow_idle_timeout",
+        type=float,
+        default=None,
+        help="With --follow: stop after this many seconds without a new run (default: never)",
+    )
     parser.add_argument(
         "--no-resume",
         dest="resume",
@@ -95,6 +205,70 @@ def _add_dashboard_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_benchmark_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--questions",
+        type=int,
+        default=4,
+        help="Number of synthetic questions (one ACE suite task each)",
+    )
+    parser.add_argument(
+        "--slots",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Fake Ollama parallel slot counts to measure",
+    )
+    parser.add_argument(
+        "--prefill-ms-per-1k-tokens",
+        dest="prefill_ms",
+        type=float,
+        default=50.0,
+        help="Mean simulated prompt processing time per 1000 prompt tokens",
+    )
+    parser.add_argument(
+        "--decode-ms-per-token",
+        dest="decode_ms",
+        type=float,
+        default=5.0,
+        help="Mean simulated generation time per output token",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.2,
+        help="Latency standard deviation as a fraction of the mean",
+    )
+    parser.add_argument("--model", default="qwen3:4b", help="Model name reported to the fake server")
+    parser.add_argument(
+        "--task-timeout-s",
+        dest="task_timeout_s",
+        type=int,
+        default=240,
+        help="Per-task suite timeout",
+    )
+    parser.add_argument(
+        "--claim-mode",
+        dest="claim_mode",
+        choices=CLAIM_MODES,
+        default="per_claim",
+        help="Examiner claim mode used in the analysis phase",
+    )
+    parser.add_argument(
+        "--fast-path",
+        dest="fast_path",
+        choices=FAST_PATH_MODES,
+        default="off",
+        help="Lexical fast-path mode used in the analysis phase",
+    )
+    parser.add_argument(
+        "--work-dir",
+        dest="work_dir",
+        default=None,
+        help="Keep the synthetic corpus and results here instead of a temp directory",
+    )
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="result-processor",
@@ -132,6 +306,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     analysis_job_cancel = analysis_job_subparsers.add_parser("cancel", help="Request cooperative cancellation")
     analysis_job_cancel.add_argument("--state", required=True)
 
+    benchmark = subparsers.add_parser(
+        "benchmark",
+        help="Time run_suite and analyze_directory against a fake Ollama server",
+    )
+    _add_benchmark_args(benchmark)
+
     return parser.parse_args(argv)
 
 
@@ -160,6 +340,9 @@ def main(argv: list[str] | None = None) -> None:
                 run_analysis_job_status(args)
             elif args.analysis_job_command == "cancel":
                 run_analysis_job_cancel(args)
+        elif args.command == "benchmark":
+            from result_processor.commands.benchmark import run_benchmark
+            run_benchmark(args)
     except (ValueError, OSError) as exc:
         sys.stderr.write(f"error: {exc}\n")
         raise SystemExit(1) from exc
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -21,6 +21,28 @@ class ClaimStatus(str, Enum):
     BAD_REFERENCE = "bad_reference"
 
 
+# How the examiner asks about claims: one request per claim, or all claims
+# of an answer in one request.
+ClaimMode = Literal["per_claim", "batch"]
+CLAIM_MODES: tuple[str, ...] = ("per_claim", "batch")
+
+# Examiner context size: always num_ctx, or the smallest of a few sizes that
+# fits the largest prompt so far of the same kind (claim, batch or summary),
+# growing up to num_ctx.
+NumCtxMode = Literal["fixed", "dynamic"]
+NUM_CTX_MODES: tuple[str, ...] = ("fixed", "dynamic")
+
+# Lexical pre-classification of claims before the examiner. off: every claim
+# goes to the examiner; use: confident lexical verdicts are final; audit: the
+# examiner still decides every claim and the lexical verdict is kept next to it.
+FastPathMode = Literal["off", "use", "audit"]
+FAST_PATH_MODES: tuple[str, ...] = ("off", "use", "audit")
+
+# What produced a claim's status: the examiner, the verdict cache, the lexical
+# fast path, or a fixed rule (no citation, unresolvable excerpt).
+ClaimDecider = Literal["examiner", "cache", "lexical", "rule"]
+
+
 class Verdict(str, Enum):
     PASS = "pass"
     FAIL = "fail"
@@ -37,6 +59,20 @@ class ClaimAnalysis(BaseModel):
     status: ClaimStatus
     justification: str = ""
 
+    # Which path decided `status`; None in rows written before it was recorded.
+    decided_by: Optional[ClaimDecider] = None
+    # The lexical fast path's verdict whenever it was confident, including
+    # in audit mode where the examiner's `status` is the one that counts.
+    lexical_status: Optional[ClaimStatus] = None
+
+    # When the excerpt was trimmed for the examiner: the [start, end) line
+    # ranges it was shown, within cited_line_start..cited_line_end (whose
+    # text is `excerpt`). None when the examiner saw the whole excerpt.
+    examined_ranges: Optional[list[tuple[int, int]]] = None
+    # Context size of the examiner request that produced `status`; None
+    # when no request was made (cache, fast path, rule).
+    num_ctx: Optional[int] = None
+
 
 class AnalysisResult(BaseModel):
     """A2 examiner output for a single RunResult.
@@ -63,6 +99,34 @@ class AnalysisResult(BaseModel):
     # Total wall-clock time spent producing this analysis result.
     analysis_time_s: Optional[float] = Field(default=None, ge=0.0)
 
+    # Breakdown of analysis_time_s: wall-clock time of the per-claim examiner
+    # calls and of the summary call, how many claim calls were made, how many
+    # claims were answered from the verdict cache instead, and how many calls
+    # were in flight on average (summed call time / wall time).
+    classification_time_s: Optional[float] = Field(default=None, ge=0.0)
+    summary_time_s: Optional[float] = Field(default=None, ge=0.0)
+    examiner_claim_calls: Optional[int] = Field(default=None, ge=0)
+    examiner_cache_hits: Optional[int] = Field(default=None, ge=0)
+
+    # "per_claim" or "batch" (all claims of the answer in one examiner call),
+    # and in batch mode the claims re-asked one at a time after their batch
+    # verdict failed validation.
+    examiner_claim_mode: Optional[ClaimMode] = None
+    examiner_batch_fallbacks: Optional[int] = Field(default=None, ge=0)
+
+    # Lexical fast-path mode, the claims it decided without the examiner
+    # ("use"), and in "audit" mode the share of its confident verdicts the
+    # examiner agreed with.
+    fast_path_mode: Optional[FastPathMode] = None
+    claims_decided_lexically: Optional[int] = Field(default=None, ge=0)
+    lexical_agreement: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    claim_concurrency: Optional[float] = Field(default=None, ge=0.0)
+
+    # Context size of the summary request, and how many of this result's
+    # examiner requests had a prompt estimated to exceed num_ctx.
+    summary_num_ctx: Optional[int] = None
+    examiner_truncation_risks: Optional[int] = Field(default=None, ge=0)
+
     # Per-claim verifications.
     claims: list[ClaimAnalysis] = Field(default_factory=list)
 
@@ -7,6 +7,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from result_processor.models.analysis import ClaimMode, FastPathMode, NumCtxMode
+
 
 class AnalysisTaskStatus(str, Enum):
     PENDING = "pending"
@@ -39,6 +41,23 @@ class AnalysisJobState(BaseModel):
     suite_state_path: Optional[str] = None
     augmented_from_state_path: Optional[str] = None
     num_ctx: int = 8192
+    num_ctx_mode: NumCtxMode = "fixed"
+    # None means OLLAMA_NUM_PARALLEL (or 1) in the process that runs the job.
+    examiner_parallelism: Optional[int] = None
+    run_parallelism: int = 1
+    claim_mode: ClaimMode = "per_claim"
+    fast_path: FastPathMode = "off"
+    # None shows the examiner whole excerpts.
+    excerpt_token_budget: Optional[int] = None
+    # Shared claim verdict cache; None analyzes without one.
+    verdict_cache_path: Optional[str] = None
+    verdict_cache_mode: str = "use"
+    # Analyze runs as they land in the input files or the suite's result files
+    # instead of a fixed list, until the suite finishes or nothing new arrives
+    # for follow_idle_timeout_s (see analysis.follow).
+    follow: bool = False
+    follow_poll_interval_s: float = 10.0
+    follow_idle_timeout_s: Optional[float] = None
     input_files: list[str] = Field(default_factory=list)
     resume: bool = True
     cancel_requested: bool = False
@@ -2,6 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import json
+import os
+from pathlib import Path
+import re
+import subprocess
+import sys
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -10,13 +17,20 @@ from experiment_runner.commands import run as run_command
 from experiment_runner.models.config import RunConfig
 from experiment_runner.models.enums import AutomationLevel, Corpus, SystemName
 from experiment_runner.models.result import RunResult
+from experiment_runner.models.suite import ExperimentSuiteState, SuiteTask, SuiteTaskStatus
 from result_processor.analysis.citation_parser import extract_citations, split_sentences, strip_reasoning
-from result_processor.analysis.examiner import ExaminerLLM, _ClaimVerdict
+from result_processor.analysis.examiner import ClaimCheck, ExaminerLLM, _ClaimVerdict, _OverallVerdict
+from result_processor.analysis import excerpt_resolver
 from result_processor.analysis.excerpt_resolver import ExcerptResolver
+from result_processor.analysis.excerpt_window import trim_excerpt
+from result_processor.analysis.follow import ResultFollower
+from result_processor.analysis.lexical_classifier import LexicalThresholds, classify_lexically
 from result_processor.analysis.io import append_analysis, iter_run_results, load_existing_run_ids
+from result_processor.analysis import pipeline
 from result_processor.analysis.pipeline import _aggregate, _analyze_one
 from result_processor.analysis.qa_metrics import compute_qa_metrics
-from result_processor.models.analysis import ClaimAnalysis, ClaimStatus, Verdict
+from result_processor.analysis.verdict_cache import VerdictCache
+from result_processor.models.analysis import AnalysisResult, ClaimAnalysis, ClaimStatus, Verdict
 from result_processor.tests.conftest import analysis_result, run_payload, write_jsonl
 
 
@@ -86,6 +100,32 @@ def test_excerpt_resolver_reads_clamped_ranges_and_rejects_bad_references(tmp_pa
     assert resolver.resolve(RunResult.model_validate(run_payload()).corpus, "planets.md", 2, 2) is None
 
 
+def test_excerpt_resolver_reads_each_file_once_and_indexes_large_files(monkeypatch, tmp_path) -> None:
+    corpus_file = tmp_path / "solar_system_wiki" / "planets.md"
+    corpus_file.parent.mkdir(parents=True)
+    corpus_file.write_text("Mercury\r\nVenus\r\nEarth\r\nMars\r\n", encoding="utf-8")
+    corpus = RunResult.model_validate(run_payload()).corpus
+    references = [("planets.md", 0, 1), ("planets.md", 1, 3), ("missing.md", 0, 1), ("planets.md", 2, 2), ("planets.md", 3, 9)]
+    expected = ["Mercury", "Venus\nEarth", None, None, "Mars"]
+
+    resolver = ExcerptResolver(tmp_path)
+    assert resolver.resolve_many(corpus, references) == expected
+    assert resolver.resolve_many(corpus, references) == expected
+    assert resolver.file_loads == 1
+
+    corpus_file.write_text("Jupiter\n", encoding="utf-8")
+    os.utime(corpus_file, ns=(1, 1))
+    assert resolver.resolve(corpus, "planets.md", 0, 1) == "Jupiter"
+    assert resolver.file_loads == 2
+
+    corpus_file.write_text("Mercury\r\nVenus\r\nEarth\r\nMars\r\n", encoding="utf-8")
+    monkeypatch.setattr(excerpt_resolver, "_INDEX_ONLY_BYTES", 8)
+    large = ExcerptResolver(tmp_path)
+    assert large.resolve_many(corpus, references) == expected
+    (loaded,) = large._files.values()
+    assert loaded.lines is None and list(loaded.line_starts) == [0, 9, 16, 23]
+
+
 def test_excerpt_resolver_rejects_paths_outside_corpus(tmp_path) -> None:
     corpus_dir = tmp_path / "solar_system_wiki"
     corpus_dir.mkdir()
@@ -123,15 +163,18 @@ def test_analyze_one_uses_citations_and_aggregates_examiner_results() -> None:
     run = RunResult.model_validate(run_payload())
 
     class Resolver:
-        def resolve(self, corpus, relative_path, a, b):
-            return "Jupiter is a planet."
+        def resolve_many(self, corpus, references):
+            return ["Jupiter is a planet."] * len(references)
+
+    class Examiner(ExaminerLLM):
+        def __init__(self) -> None:
+            pass
 
-    class Examiner:
         def classify_claim(self, **kwargs):
-            return SimpleNamespace(status=ClaimStatus.SUPPORTED, justification="ok")
+            return _ClaimVerdict(status=ClaimStatus.SUPPORTED, justification="ok")
 
         def summarize(self, **kwargs):
-            return SimpleNamespace(helpfulness_rating=5, notes="Useful answer.")
+            return _OverallVerdict(helpfulness_rating=5, notes="Useful answer.")
 
     result = _analyze_one(run, Resolver(), Examiner(), "qwen3:4b")
 
@@ -149,14 +192,156 @@ def test_analyze_one_uses_citations_and_aggregates_examiner_results() -> None:
     assert result.analysis_time_s >= 0.0
 
 
+def test_lexical_classifier_decides_only_obvious_claims() -> None:
+    excerpt = "Jupiter is the largest planet in the Solar System.\nIt has 95 known moons and a faint ring system."
+
+    verbatim = classify_lexically("It has 95 known moons.", excerpt)
+    reordered = classify_lexically("The Solar System's largest planets: Jupiter.", excerpt)
+    unrelated = classify_lexically("Bananas grow quickly in tropical climates.", excerpt)
+
+    assert verbatim.status == ClaimStatus.SUPPORTED and verbatim.similarity == 1.0
+    assert unrelated.status == ClaimStatus.NOT_SUPPORTED and unrelated.coverage == 0.0
+    # Shared words in another order, wrong numbers, names or negation, and very short claims, go to the examiner.
+    assert reordered is None
+    assert classify_lexically("It has 79 known moons.", excerpt) is None
+    assert classify_lexically("Saturn is the largest planet in the Solar System.", excerpt) is None
+    assert classify_lexically("Jupiter is not the largest planet in the Solar System.", excerpt) is None
+    assert classify_lexically("Jupiter is big.", excerpt) is None
+    assert classify_lexically("It has 95 known moons.", None) is None
+    assert classify_lexically(
+        "It has known moons and a ring.", excerpt, LexicalThresholds(support_similarity=0.8)
+    ).status == ClaimStatus.SUPPORTED
+    with pytest.raises(ValueError, match="reject_coverage"):
+        LexicalThresholds(reject_coverage=1.0)
+
+
+def test_lexical_classifier_never_supports_contradicting_excerpts() -> None:
+    swapped = classify_lexically(
+        "Redis is faster than Postgres for bulk writes",
+        "Postgres is faster than Redis for bulk writes in our benchmark.",
+    )
+    negated = classify_lexically(
+        "The runner does not retry failed questions",
+        "The runner does retry failed questions. Timeouts are not retried.",
+    )
+    # A negation outside the matching window neither blocks nor fakes a match.
+    unrelated_negation = classify_lexically(
+        "The runner does retry failed questions",
+        "Timeouts are not retried. The runner does retry failed questions.",
+    )
+
+    assert swapped is None or swapped.status != ClaimStatus.SUPPORTED
+    assert negated is None or negated.status != ClaimStatus.SUPPORTED
+    assert unrelated_negation.status == ClaimStatus.SUPPORTED
+
+
+def test_trim_excerpt_keeps_best_matching_lines_and_marks_elisions() -> None:
+    lines = [f"Filler line {index} talks about the weather." for index in range(60)]
+    lines[30] = "Jupiter has 95 known moons orbiting it."
+    excerpt = "\n".join(lines)
+
+    trimmed = trim_excerpt("Jupiter has 95 moons.", excerpt, first_line=100, token_budget=50)
+
+    assert trimmed.ranges == [(129, 132)]
+    assert trimmed.text.split("\n") == [
+        "[... lines 100-129 omitted ...]",
+        lines[29],
+        lines[30],
+        lines[31],
+        "[... lines 132-160 omitted ...]",
+    ]
+    assert trim_excerpt("Jupiter has 95 moons.", excerpt, first_line=100, token_budget=10_000) is None
+    # Nothing matches: the start of the range is kept.
+    assert trim_excerpt("Bananas are yellow.", excerpt, first_line=0, token_budget=30).ranges == [(0, 2)]
+
+
+def test_analyze_one_shows_the_examiner_a_trimmed_excerpt() -> None:
+    run = RunResult.model_validate(run_payload(answer_text="[Jupiter has 95 known moons.] [file:jupiter.md, lines:10-70]"))
+    lines = [f"Filler line {index} talks about the weather." for index in range(60)]
+    lines[30] = "Jupiter has 95 known moons."
+    excerpt = "\n".join(lines)
+    seen = []
+
+    class Resolver:
+        def resolve_many(self, corpus, references):
+            return [excerpt] * len(references)
+
+    class Examiner(ExaminerLLM):
+        def __init__(self) -> None:
+            pass
+
+        def classify_claim(self, **kwargs):
+            seen.append(kwargs["excerpt"])
+            return _ClaimVerdict(status=ClaimStatus.SUPPORTED, justification="ok")
+
+        def summarize(self, **kwargs):
+            return _OverallVerdict(helpfulness_rating=4, notes="ok")
+
+    result = _analyze_one(run, Resolver(), Examiner(), "qwen3:4b", excerpt_token_budget=50)
+
+    (claim,) = result.claims
+    assert claim.excerpt == excerpt
+    assert claim.examined_ranges == [(39, 42)]
+    assert seen[0].startswith("[... lines 10-39 omitted ...]\n")
+    assert len(seen[0]) < len(excerpt) / 5
+
+
+def test_analyze_one_fast_path_skips_the_examiner_and_audit_keeps_both_verdicts() -> None:
+    run = RunResult.model_validate(run_payload(answer_text=(
+        "[Jupiter has 95 known moons.] [file:jupiter.md, lines:0-1] "
+        "[Jupiter is a gas giant.] [file:giants.md, lines:0-1]"
+    )))
+    excerpts = {"jupiter.md": "Jupiter has 95 known moons.", "giants.md": "Jupiter is mostly hydrogen and helium."}
+    asked = []
+
+    class Resolver:
+        def resolve_many(self, corpus, references):
+            return [excerpts[relative_path] for relative_path, _a, _b in references]
+
+    class Examiner(ExaminerLLM):
+        def __init__(self) -> None:
+            pass
+
+        def classify_claim(self, **kwargs):
+            asked.append(kwargs["claim"])
+            return _ClaimVerdict(status=ClaimStatus.SUPPORTED, justification="examiner")
+
+        def summarize(self, **kwargs):
+            return _OverallVerdict(helpfulness_rating=4, notes="ok")
+
+    used = _analyze_one(run, Resolver(), Examiner(), "qwen3:4b", fast_path="use")
+
+    assert asked == ["Jupiter is a gas giant."]
+    assert [c.decided_by for c in used.claims] == ["lexical", "examiner"]
+    assert [c.lexical_status for c in used.claims] == [ClaimStatus.SUPPORTED, None]
+    assert used.claims[0].justification.startswith("Lexical fast path")
+    assert (used.fast_path_mode, used.claims_decided_lexically, used.lexical_agreement) == ("use", 1, None)
+    assert used.examiner_claim_calls == 1
+
+    asked.clear()
+    audited = _analyze_one(run, Resolver(), Examiner(), "qwen3:4b", fast_path="audit")
+
+    assert len(asked) == 2
+    assert [c.decided_by for c in audited.claims] == ["examiner", "examiner"]
+    assert audited.claims[0].lexical_status == ClaimStatus.SUPPORTED
+    assert (audited.claims_decided_lexically, audited.lexical_agreement) == (0, 1.0)
+
+    off = _analyze_one(run, Resolver(), Examiner(), "qwen3:4b")
+    assert off.fast_path_mode == "off" and off.claims_decided_lexically is None
+    assert all(c.lexical_status is None for c in off.claims)
+
+
 def test_analyze_one_marks_uncited_sentences_as_bad_references() -> None:
     run = RunResult.model_validate(run_payload(answer_text="Jupiter is large. It has moons."))
 
-    class Examiner:
+    class Examiner(ExaminerLLM):
+        def __init__(self) -> None:
+            pass
+
         def summarize(self, **kwargs):
-            return SimpleNamespace(helpfulness_rating=2, notes="Missing citations.")
+            return _OverallVerdict(helpfulness_rating=2, notes="Missing citations.")
 
-    result = _analyze_one(run, resolver=SimpleNamespace(), examiner=Examiner(), examiner_model="qwen3:4b")
+    result = _analyze_one(run, resolver=ExcerptResolver(Path("unused")), examiner=Examiner(), examiner_model="qwen3:4b")
 
     assert result.claims_total == 2
     assert result.claims_bad_reference == 2
@@ -170,15 +355,18 @@ def test_analyze_one_counts_uncited_sentences_in_partially_cited_answers() -> No
     )
 
     class Resolver:
-        def resolve(self, corpus, relative_path, a, b):
-            return "Jupiter is a planet."
+        def resolve_many(self, corpus, references):
+            return ["Jupiter is a planet."] * len(references)
+
+    class Examiner(ExaminerLLM):
+        def __init__(self) -> None:
+            pass
 
-    class Examiner:
         def classify_claim(self, **kwargs):
-            return SimpleNamespace(status=ClaimStatus.SUPPORTED, justification="ok")
+            return _ClaimVerdict(status=ClaimStatus.SUPPORTED, justification="ok")
 
         def summarize(self, **kwargs):
-            return SimpleNamespace(helpfulness_rating=2, notes="One uncited claim.")
+            return _OverallVerdict(helpfulness_rating=2, notes="One uncited claim.")
 
     result = _analyze_one(run, Resolver(), Examiner(), "qwen3:4b")
 
@@ -190,6 +378,235 @@ def test_analyze_one_counts_uncited_sentences_in_partially_cited_answers() -> No
     assert result.verdict == Verdict.FAIL
 
 
+def _analysis_run_ids(path) -> list[str]:
+    return [AnalysisResult.model_validate_json(line).run_id for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _fake_analyze_one(delays: dict[str, float], fail: set[str], peak: list[int]):
+    lock = threading.Lock()
+    in_flight = []
+
+    def analyze(run, resolver, examiner, examiner_model, **kwargs):
+        with lock:
+            in_flight.append(run.run_id)
+            peak.append(len(in_flight))
+        time.sleep(delays.get(run.run_id, 0.0))
+        with lock:
+            in_flight.remove(run.run_id)
+        if run.run_id in fail:
+            raise RuntimeError(f"examiner broke on {run.run_id}")
+        return analysis_result(run_id=run.run_id)
+
+    return analyze
+
+
+def test_analyze_directory_runs_in_parallel_and_writes_in_input_order(monkeypatch, tmp_path) -> None:
+    experiment_dir = tmp_path / "experiment"
+    output_dir = tmp_path / "analysis"
+    (tmp_path / "corpora").mkdir()
+    write_jsonl(experiment_dir / "a.jsonl", [run_payload(run_id=f"r{index}") for index in range(1, 5)])
+    write_jsonl(experiment_dir / "b.jsonl", [run_payload(run_id=f"r{index}") for index in range(5, 7)])
+    write_jsonl(output_dir / "a.jsonl", [analysis_result(run_id="r1")])
+    peak: list[int] = []
+    # Later runs finish first, so the writer has to restore input order.
+    delays = {"r2": 0.15, "r3": 0.1, "r4": 0.05}
+    monkeypatch.setattr(pipeline, "_analyze_one", _fake_analyze_one(delays, {"r3"}, peak))
+    events = []
+
+    pipeline.analyze_directory(
+        experiment_results_dir=str(experiment_dir),
+        output_dir=str(output_dir),
+        path_to_corpora=str(tmp_path / "corpora"),
+        examiner_model="qwen3:4b",
+        progress_callback=lambda status, run, target, error: events.append((status, run.run_id, target.name)),
+        continue_on_error=True,
+        examiner_parallelism=1,
+        run_parallelism=3,
+    )
+
+    assert _analysis_run_ids(output_dir / "a.jsonl") == ["r1", "r2", "r4"]
+    assert _analysis_run_ids(output_dir / "b.jsonl") == ["r5", "r6"]
+    assert 1 < max(peak) <= 3
+    final = {run_id: status for status, run_id, _ in events}
+    assert final == {"r1": "skipped", "r2": "analyzed", "r3": "failed", "r4": "analyzed", "r5": "analyzed",
+                     "r6": "analyzed"}
+    assert ("running", "r5", "b.jsonl") in events
+
+    with pytest.raises(RuntimeError, match="examiner broke on r3"):
+        pipeline.analyze_directory(
+            experiment_results_dir=str(experiment_dir),
+            output_dir=str(tmp_path / "strict"),
+            path_to_corpora=str(tmp_path / "corpora"),
+            examiner_model="qwen3:4b",
+            examiner_parallelism=1,
+            run_parallelism=2,
+        )
+    # Runs already in flight are still written; nothing after the failure is started.
+    assert _analysis_run_ids(tmp_path / "strict" / "a.jsonl") == ["r1", "r2"]
+    assert not (tmp_path / "strict" / "b.jsonl").exists()
+
+
+def test_analyze_directory_cancel_finishes_only_the_in_flight_batch(monkeypatch, tmp_path) -> None:
+    experiment_dir = tmp_path / "experiment"
+    (tmp_path / "corpora").mkdir()
+    write_jsonl(experiment_dir / "a.jsonl", [run_payload(run_id=f"r{index}") for index in range(1, 9)])
+    monkeypatch.setattr(pipeline, "_analyze_one", _fake_analyze_one({}, set(), []))
+    polls = []
+
+    def should_cancel() -> bool:
+        polls.append(1)
+        return len(polls) > 2
+
+    pipeline.analyze_directory(
+        experiment_results_dir=str(experiment_dir),
+        output_dir=str(tmp_path / "analysis"),
+        path_to_corpora=str(tmp_path / "corpora"),
+        examiner_model="qwen3:4b",
+        should_cancel=should_cancel,
+        examiner_parallelism=1,
+        run_parallelism=2,
+    )
+
+    assert load_existing_run_ids(tmp_path / "analysis" / "a.jsonl") == {"r1", "r2"}
+
+
+def test_analyze_directory_follow_analyzes_runs_as_they_land_and_resumes_from_offsets(monkeypatch, tmp_path) -> None:
+    experiment_dir = tmp_path / "experiment"
+    output_dir = tmp_path / "analysis"
+    (tmp_path / "corpora").mkdir()
+    a_path = experiment_dir / "a.jsonl"
+    write_jsonl(a_path, [run_payload(run_id="r1"), run_payload(run_id="r2")])
+    r3_line = json.dumps(run_payload(run_id="r3"))
+    # r3 is still being written: only complete lines are read.
+    with a_path.open("a", encoding="utf-8") as handle:
+        handle.write(r3_line[:20])
+    monkeypatch.setattr(pipeline, "_analyze_one", _fake_analyze_one({}, set(), []))
+    events = []
+
+    def progress(status, run, target, error) -> None:
+        events.append((status, run.run_id))
+        if (status, run.run_id) == ("analyzed", "r2"):
+            with a_path.open("a", encoding="utf-8") as handle:
+                handle.write(r3_line[20:] + "\n")
+            write_jsonl(experiment_dir / "b.jsonl", [run_payload(run_id="r4")])
+
+    def follow_once() -> None:
+        pipeline.analyze_directory(
+            experiment_results_dir=str(experiment_dir),
+            output_dir=str(output_dir),
+            path_to_corpora=str(tmp_path / "corpora"),
+            examiner_model="qwen3:4b",
+            progress_callback=progress,
+            examiner_parallelism=1,
+            run_parallelism=2,
+            follow=True,
+            follow_poll_interval_s=0.01,
+            follow_idle_timeout_s=0.2,
+        )
+
+    follow_once()
+
+    assert _analysis_run_ids(output_dir / "a.jsonl") == ["r1", "r2", "r3"]
+    assert _analysis_run_ids(output_dir / "b.jsonl") == ["r4"]
+    offsets = json.loads((output_dir / pipeline.FOLLOW_OFFSETS_FILENAME).read_text(encoding="utf-8"))
+    assert offsets["sources"][str(a_path.resolve())] == {"kind": "jsonl", "offset": a_path.stat().st_size}
+
+    events.clear()
+    with a_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(run_payload(run_id="r5")) + "\n")
+    follow_once()
+
+    # Runs before the saved offsets are not even re-read.
+    assert events == [("running", "r5"), ("analyzed", "r5")]
+    assert _analysis_run_ids(output_dir / "a.jsonl") == ["r1", "r2", "r3", "r5"]
+
+
+def test_result_follower_follows_suite_result_paths_and_pins_offsets_of_failed_runs(tmp_path) -> None:
+    results_dir = tmp_path / "experiment"
+    a_path = results_dir / "a.jsonl"
+    b_path = results_dir / "b.jsonl"
+    write_jsonl(a_path, [run_payload(run_id="r1"), run_payload(run_id="r2")])
+    write_jsonl(results_dir / "unrelated.jsonl", [run_payload(run_id="x1")])
+    tasks = [
+        SuiteTask(
+            task_id=f"task-{index}",
+            index=index,
+            system=SystemName.ACE,
+            model="qwen3:4b",
+            corpus=Corpus.SOLAR_SYSTEM_WIKI,
+            questions_file="questions.json",
+            path_to_corpora="corpora",
+            question_id=f"ss_L1_00{index}",
+            question_text="Follow?",
+            level=1,
+            command=["true"],
+            status=status,
+            result_path=result_path,
+        )
+        for index, (status, result_path) in enumerate(
+            [(SuiteTaskStatus.SUCCEEDED, str(a_path)), (SuiteTaskStatus.RUNNING, None)], start=1
+        )
+    ]
+    suite_state_path = tmp_path / "suite.state.json"
+    state = ExperimentSuiteState(suite_id="suite-1", suite_name="suite", runner_pid=os.getpid(), tasks=tasks)
+    suite_state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    offsets_path = tmp_path / "analysis" / "follow.offsets.json"
+    follower = ResultFollower(results_dir, offsets_path, suite_state_path=suite_state_path)
+
+    r1, r2 = follower.poll()
+    assert [r1.run.run_id, r2.run.run_id] == ["r1", "r2"]
+    assert follower.suite_finished is False
+    follower.accept(r1)
+    follower.accept(r2)
+    follower.done(a_path.resolve(), False)
+    follower.done(a_path.resolve(), True)
+
+    write_jsonl(b_path, [run_payload(run_id="r3")])
+    state.tasks[1].status = SuiteTaskStatus.SUCCEEDED
+    state.tasks[1].result_path = str(b_path)
+    suite_state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    (r3,) = follower.poll()
+    assert r3.run.run_id == "r3"
+    assert follower.suite_finished is True
+    follower.skip(r3)
+    follower.save()
+
+    offsets = json.loads(offsets_path.read_text(encoding="utf-8"))["sources"]
+    # r1 failed, so a restart reads a.jsonl from the start again.
+    assert offsets[str(a_path.resolve())]["offset"] == 0
+    assert offsets[str(b_path.resolve())]["offset"] == b_path.stat().st_size
+    assert [followed.run.run_id for followed in ResultFollower(
+        results_dir, offsets_path, suite_state_path=suite_state_path
+    ).poll()] == ["r1", "r2"]
+
+
+def test_result_follower_treats_a_suite_without_a_live_runner_as_finished(tmp_path) -> None:
+    task = SuiteTask(
+        task_id="task-1",
+        index=1,
+        system=SystemName.ACE,
+        model="qwen3:4b",
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        questions_file="questions.json",
+        path_to_corpora="corpora",
+        question_id="ss_L1_001",
+        question_text="Follow?",
+        level=1,
+        command=["true"],
+        status=SuiteTaskStatus.RUNNING,
+    )
+    dead = subprocess.Popen([sys.executable, "-c", ""])
+    dead.wait()
+    suite_state_path = tmp_path / "suite.state.json"
+    follower = ResultFollower(tmp_path / "experiment", tmp_path / "follow.offsets.json", suite_state_path=suite_state_path)
+
+    for runner_pid, finished in ((os.getpid(), False), (dead.pid, True), (None, True)):
+        state = ExperimentSuiteState(suite_id="suite-1", suite_name="suite", runner_pid=runner_pid, tasks=[task])
+        suite_state_path.write_text(state.model_dump_json(), encoding="utf-8")
+        follower.poll()
+        assert follower.suite_finished is finished
+
+
 def test_experiment_output_path_uses_collision_resistant_suffix(monkeypatch, tmp_path) -> None:
     class FixedDatetime(datetime):
         @classmethod
@@ -272,3 +689,254 @@ def test_examiner_llm_invoke_json_validates_response_and_uses_fallback() -> None
     examiner._client = Client("not-json")
     verdict = examiner._invoke_json("prompt", _ClaimVerdict, fallback=fallback)
     assert verdict == fallback
+
+
+def test_examiner_llm_sizes_num_ctx_per_request_and_counts_truncation_risks(monkeypatch) -> None:
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+    from langchain_ollama import ChatOllama
+
+    sizes = []
+
+    def answer(self, messages, stop=None, run_manager=None, **kwargs):
+        sizes.append(self.num_ctx)
+        content = '{"status":"supported","justification":"ok","helpfulness_rating":4,"notes":"ok"}'
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    monkeypatch.delenv("AGENT_LLM_CASSETTE_MODE", raising=False)
+    monkeypatch.setattr(ChatOllama, "_generate", answer)
+    examiner = ExaminerLLM("qwen3:4b", num_ctx=16384, num_ctx_mode="dynamic")
+
+    short = examiner.classify_claim("Mars is red.", "Mars is red.", "mars.md", 0, 1)
+    long = examiner.classify_claim("Mars is red.", "Mars is red. " * 1500, "mars.md", 0, 1)
+    summary = examiner.summarize("Q?", "Mars is red. " * 5000, "- [supported] Mars is red.")
+
+    # Claim checks keep their own context: a long summary does not inflate them, and
+    # within a kind the context only grows, so a shorter claim does not reload the model.
+    again = examiner.classify_claim("Mars is red.", "Mars is red.", "mars.md", 0, 1)
+    short_summary = examiner.summarize("Q?", "Mars is red.", "- [supported] Mars is red.")
+
+    assert sizes == [2048, 8192, 16384, 8192, 16384]
+    assert (short.num_ctx, long.num_ctx, summary.num_ctx, again.num_ctx) == (2048, 8192, 16384, 8192)
+    assert short_summary.num_ctx == 16384
+    assert (short.truncation_risk, long.truncation_risk, summary.truncation_risk) == (False, False, True)
+    assert examiner.truncation_risks == 1
+
+    sizes.clear()
+    fixed = ExaminerLLM("qwen3:4b", num_ctx=16384)
+    assert fixed.classify_claim("Mars is red.", "Mars is red.", "mars.md", 0, 1).num_ctx == 16384
+    assert sizes == [16384]
+
+
+def test_examiner_llm_counts_truncation_risks_per_request_in_batch_mode(monkeypatch) -> None:
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+    from langchain_ollama import ChatOllama
+
+    replies = iter([
+        '{"verdicts": [{"id": "C1", "status": "supported"}, {"id": "C2", "status": "supported"}]}',
+        "not-json",
+        '{"status": "supported", "justification": "ok"}',
+    ])
+
+    def answer(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=next(replies)))])
+
+    monkeypatch.delenv("AGENT_LLM_CASSETTE_MODE", raising=False)
+    monkeypatch.setattr(ChatOllama, "_generate", answer)
+    examiner = ExaminerLLM("qwen3:4b", num_ctx=2048, claim_mode="batch")
+    excerpt = "Mars is red. " * 600
+    checks = [ClaimCheck(claim, excerpt, "mars.md", 0, 1) for claim in ("Mars is red.", "Mars is a planet.")]
+
+    answered = examiner.classify_claims(checks)
+    # A failed batch is re-asked claim by claim; all three requests overflowed.
+    failed = examiner.classify_claims(checks[:1])
+
+    assert [verdict.truncation_risk for verdict in answered.verdicts] == [True, True]
+    assert (answered.calls, answered.truncation_risks) == (1, 1)
+    assert (failed.calls, failed.truncation_risks) == (2, 2)
+    assert examiner.truncation_risks == 3
+
+
+def test_examiner_llm_classifies_claims_concurrently_in_order() -> None:
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    class Client:
+        def invoke(self, prompt: str):
+            index = int(re.search(r"claim (\d+)", prompt).group(1))
+            with lock:
+                in_flight.append(index)
+                peak.append(len(in_flight))
+            # Earlier claims answer last, so completion order differs from input order.
+            time.sleep(0.02 * (6 - index))
+            with lock:
+                in_flight.remove(index)
+            status = "supported" if index % 2 else "not_supported"
+            return SimpleNamespace(content=json.dumps({"status": status, "justification": f"claim {index}"}))
+
+    examiner = ExaminerLLM.__new__(ExaminerLLM)
+    examiner._client = Client()
+    examiner.parallelism = 3
+    checks = [ClaimCheck(f"claim {index}", f"excerpt {index}", "doc.md", 0, 1) for index in range(6)]
+    checks.insert(2, ClaimCheck("unresolvable", None, "missing.md", 0, 1))
+
+    batch = examiner.classify_claims(checks)
+
+    assert [verdict.justification for verdict in batch.verdicts] == [
+        "claim 0", "claim 1", batch.verdicts[2].justification, "claim 2", "claim 3", "claim 4", "claim 5",
+    ]
+    assert batch.verdicts[2].status == ClaimStatus.BAD_REFERENCE
+    assert batch.verdicts[1].status == ClaimStatus.SUPPORTED
+    assert batch.calls == 6
+    assert max(peak) == 3
+    assert batch.concurrency is not None and batch.concurrency > 1.5
+
+
+def test_verdict_cache_reuses_examiner_verdicts_across_runs(tmp_path) -> None:
+    prompts = []
+
+    class Client:
+        content = '{"status":"supported","justification":"from the examiner"}'
+
+        def invoke(self, prompt: str):
+            prompts.append(prompt)
+            return SimpleNamespace(content=self.content)
+
+    def examiner(cache):
+        instance = ExaminerLLM.__new__(ExaminerLLM)
+        instance.model = "qwen3:4b"
+        instance.parallelism = 2
+        instance.verdict_cache = cache
+        instance._client = Client()
+        return instance
+
+    checks = [
+        ClaimCheck("Mars is red.", "Mars is red.", "mars.md", 0, 1),
+        ClaimCheck("Venus is hot.", "Venus is hot.", "venus.md", 0, 1),
+        ClaimCheck("unresolvable", None, "missing.md", 0, 1),
+    ]
+    cache_path = tmp_path / "examiner_verdicts.db"
+    with VerdictCache(cache_path) as cache:
+        first = examiner(cache).classify_claims(checks)
+    # Same claim (modulo whitespace) and excerpt, cited by another system at other lines.
+    checks[0] = ClaimCheck("Mars  is\nred.", "Mars is red.", "text/mars.md", 3, 4)
+    with VerdictCache(cache_path) as cache:
+        second = examiner(cache).classify_claims(checks)
+        stats = cache.stats()
+
+    assert (first.calls, first.cache_hits) == (2, 0)
+    assert (second.calls, second.cache_hits) == (0, 2)
+    assert len(prompts) == 2
+    assert [v.status for v in second.verdicts] == [ClaimStatus.SUPPORTED, ClaimStatus.SUPPORTED, ClaimStatus.BAD_REFERENCE]
+    assert second.verdicts[0].justification == "from the examiner"
+    assert (stats.hits, stats.misses, stats.entries, stats.hit_rate) == (2, 0, 2, 1.0)
+
+    with VerdictCache(cache_path, mode="refresh") as cache:
+        Client.content = "not-json"
+        refreshed = examiner(cache).classify_claims(checks[:1])
+        assert refreshed.calls == 1
+        assert refreshed.verdicts[0].status == ClaimStatus.BAD_REFERENCE
+        # Fallback verdicts are not stored, so the good one survives.
+        assert cache.stats().writes == 0
+
+    Client.content = '{"status":"supported","justification":"from the examiner"}'
+    with VerdictCache(cache_path) as cache:
+        assert examiner(cache).classify_claims(checks[:1]).cache_hits == 1
+    with VerdictCache(cache_path, max_entries=1) as cache:
+        # Venus is the least recently used verdict.
+        assert cache.stats().entries == 1
+        assert examiner(cache).classify_claims(checks[:1]).cache_hits == 1
+
+
+def test_batch_claim_mode_validates_each_verdict_and_re_asks_failures() -> None:
+    prompts = []
+
+    class Client:
+        def invoke(self, prompt: str):
+            prompts.append(prompt)
+            if '"verdicts"' in prompt:
+                content = {"verdicts": [
+                    {"id": "C1", "status": "supported", "justification": "batch"},
+                    {"id": "C2", "status": "maybe", "justification": "invalid status"},
+                    {"id": "C9", "status": "supported", "justification": "unknown id"},
+                ]}
+            else:
+                content = {"status": "not_supported", "justification": "single"}
+            return SimpleNamespace(content=json.dumps(content))
+
+    examiner = ExaminerLLM.__new__(ExaminerLLM)
+    examiner.model = "qwen3:4b"
+    examiner.claim_mode = "batch"
+    examiner._client = Client()
+    shared = "Mars is the fourth planet. It is red."
+    checks = [
+        ClaimCheck("Mars is the fourth planet.", shared, "mars.md", 0, 2),
+        ClaimCheck("Mars is red.", shared, "mars.md", 0, 2),
+        ClaimCheck("unresolvable", None, "missing.md", 0, 1),
+        ClaimCheck("Venus is hot.", "Venus is hot.", "venus.md", 0, 1),
+    ]
+
+    batch = examiner.classify_claims(checks)
+
+    assert [v.justification for v in batch.verdicts] == [
+        "batch", "single", batch.verdicts[2].justification, "single",
+    ]
+    assert batch.verdicts[2].status == ClaimStatus.BAD_REFERENCE
+    assert (batch.calls, batch.batched_claims, batch.batch_fallbacks) == (3, 1, 2)
+    batch_prompt = prompts[0]
+    # Claims citing the same range share one copy of the excerpt.
+    assert batch_prompt.count(shared) == 1
+    assert "[C2] (cites E1) Mars is red." in batch_prompt
+    assert "[C3] (cites E2) Venus is hot." in batch_prompt
+    assert "unresolvable" not in batch_prompt
+
+
+def test_batch_claim_mode_sends_fewer_prompt_tokens(monkeypatch) -> None:
+    from agent.fake_ollama import FakeOllamaConfig, FakeOllamaServer, Latency
+
+    from result_processor.commands.benchmark import fake_examiner_reply
+
+    checks = [
+        ClaimCheck(f"Planet {index} orbits the sun.", "Every planet orbits the sun.\n" * 20, "planets.md", 0, 20)
+        for index in range(6)
+    ]
+    zero = Latency(0.0)
+    config = FakeOllamaConfig(prefill_per_1k_tokens=zero, decode_per_token=zero, json_reply=fake_examiner_reply)
+    with FakeOllamaServer(config) as server:
+        monkeypatch.setenv("OLLAMA_HOST", server.base_url)
+        tokens = {}
+        for mode in ("per_claim", "batch"):
+            server.reset_stats()
+            batch = ExaminerLLM("qwen3:4b", claim_mode=mode).classify_claims(checks)
+            assert [v.status for v in batch.verdicts] == [ClaimStatus.SUPPORTED] * 6
+            tokens[mode] = server.stats().prompt_tokens
+
+    assert batch.calls == 1
+    assert tokens["batch"] * 3 < tokens["per_claim"]
+
+
+def test_examiner_llm_replays_recorded_verdicts_without_ollama(monkeypatch, tmp_path) -> None:
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+    from langchain_ollama import ChatOllama
+
+    def answer(self, messages, stop=None, run_manager=None, **kwargs):
+        content = '{"status":"supported","justification":"recorded"}'
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    def unreachable(self, messages, stop=None, run_manager=None, **kwargs):
+        raise ConnectionError("ollama is not running")
+
+    monkeypatch.setenv("AGENT_LLM_CASSETTE_DIR", str(tmp_path))
+    monkeypatch.setenv("AGENT_LLM_CASSETTE_MODE", "record")
+    monkeypatch.setattr(ChatOllama, "_generate", answer)
+    recorded = ExaminerLLM("qwen3:4b").classify_claim("Mars is red.", "Mars is red.", "mars.md", 0, 1)
+
+    monkeypatch.setenv("AGENT_LLM_CASSETTE_MODE", "replay")
+    monkeypatch.setattr(ChatOllama, "_generate", unreachable)
+    replayed = ExaminerLLM("qwen3:4b").classify_claim("Mars is red.", "Mars is red.", "mars.md", 0, 1)
+
+    assert recorded.status == replayed.status == ClaimStatus.SUPPORTED
+    assert replayed.justification == "recorded"
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from pathlib import Path
 
+from result_processor.analysis.io import iter_run_results
+from result_processor.analysis_job_store import AnalysisJobStore, analysis_job_store_path
 from result_processor.commands import analysis_job
-from result_processor.models.analysis_job import AnalysisTaskStatus
+from result_processor.models.analysis_job import AnalysisJobState, AnalysisTaskStatus
 from result_processor.tests.conftest import analysis_result, run_payload, write_jsonl
 
 
@@ -127,3 +131,141 @@ def test_analysis_job_cancel_and_summary(tmp_path, capsys) -> None:
     assert loaded.cancel_requested is True
     assert summary["pending"] == 1
     assert "cancel requested" in capsys.readouterr().out
+
+
+def test_run_analysis_job_updates_indexed_store_and_batches_snapshots(tmp_path, monkeypatch) -> None:
+    runs_path = tmp_path / "experiment" / "runs.jsonl"
+    write_jsonl(runs_path, [run_payload(run_id=f"r{index}") for index in range(300)])
+    output_dir = tmp_path / "analysis"
+    state = analysis_job.build_analysis_job_state(
+        job_name="large analysis",
+        experiment_results_dir=str(tmp_path / "experiment"),
+        output_dir=str(output_dir),
+        path_to_corpora="corpora",
+        examiner_model="qwen3:4b",
+        num_ctx=8192,
+        input_files=[str(runs_path)],
+        resume=False,
+    )
+    state_path = tmp_path / "analysis.state.json"
+    analysis_job.save_analysis_job_state(state_path, state)
+    state_path_arg = argparse.Namespace(state=str(state_path))
+
+    def fake_analyze_directory(*, input_files, progress_callback, should_cancel, **_kwargs) -> None:
+        source = Path(input_files[0])
+        for run in iter_run_results(source):
+            if should_cancel():
+                return
+            progress_callback("running", run, source, None)
+            progress_callback("analyzed", run, source, None)
+            if run.run_id == "r199":
+                analysis_job.run_analysis_job_cancel(state_path_arg)
+
+    snapshots: list[Path] = []
+    write_text = analysis_job._atomic_write_text
+    monkeypatch.setattr(analysis_job, "analyze_directory", fake_analyze_directory)
+    monkeypatch.setattr(
+        analysis_job,
+        "_atomic_write_text",
+        lambda path, text: (snapshots.append(path), write_text(path, text)),
+    )
+
+    final = analysis_job.run_analysis_job(state_path)
+
+    # One snapshot when the job starts and one when it ends, not one per update.
+    assert snapshots == [state_path, state_path]
+    assert analysis_job_store_path(state_path) == tmp_path / "analysis.state.db"
+    summary = analysis_job.summarize_analysis_job_state(final)
+    assert summary["analyzed"] == 200
+    assert summary["cancelled"] == 100
+    with AnalysisJobStore(analysis_job_store_path(state_path)) as store:
+        assert store.get_task(str(runs_path.resolve()), "r0").status == AnalysisTaskStatus.ANALYZED
+        assert store.get_task(str(runs_path.resolve()), "r299").status == AnalysisTaskStatus.CANCELLED
+        assert store.cancel_requested() is True
+    snapshot = AnalysisJobState.model_validate_json(state_path.read_text(encoding="utf-8"))
+    assert [task.status for task in snapshot.tasks] == [task.status for task in final.tasks]
+    metadata = json.loads((output_dir / "analysis.meta.json").read_text(encoding="utf-8"))
+    assert metadata["updated_at"] == snapshot.updated_at.isoformat()
+
+    rewritten = snapshot.model_copy(update={"cancel_requested": False})
+    state_path.write_text(rewritten.model_dump_json(), encoding="utf-8")
+    os.utime(state_path, ns=(1, 1))
+
+    assert analysis_job.load_analysis_job_state(state_path).cancel_requested is False
+
+
+def test_analysis_job_state_readers_never_write_and_a_live_job_blocks_reimports(tmp_path) -> None:
+    runs_path = tmp_path / "experiment" / "runs.jsonl"
+    write_jsonl(runs_path, [run_payload(run_id="r1")])
+    state = analysis_job.build_analysis_job_state(
+        job_name="live analysis",
+        experiment_results_dir=str(tmp_path / "experiment"),
+        output_dir=str(tmp_path / "analysis"),
+        path_to_corpora="corpora",
+        examiner_model="qwen3:4b",
+        num_ctx=8192,
+        input_files=[str(runs_path)],
+        resume=False,
+    )
+    state.active_pid = os.getpid()
+    state_path = tmp_path / "analysis.state.json"
+    state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    with analysis_job.open_analysis_job_store(state_path) as store:
+        task = store.get_task(str(runs_path.resolve()), "r1")
+        task.status = AnalysisTaskStatus.ANALYZED
+        store.update_task(task)
+    # The job's own snapshot, caught before it records the snapshot mtime.
+    os.utime(state_path, ns=(1, 1))
+
+    assert analysis_job.load_analysis_job_state(state_path).tasks[0].status == AnalysisTaskStatus.ANALYZED
+    with analysis_job.open_analysis_job_store(state_path) as store:
+        assert store.get_task(str(runs_path.resolve()), "r1").status == AnalysisTaskStatus.ANALYZED
+        store.update_meta(active_pid=None)
+
+    # Without a live job readers see the rewritten JSON, but leave importing it to writers.
+    assert analysis_job.load_analysis_job_state(state_path).tasks[0].status == AnalysisTaskStatus.PENDING
+    with AnalysisJobStore(analysis_job_store_path(state_path), read_only=True) as store:
+        assert store.get_task(str(runs_path.resolve()), "r1").status == AnalysisTaskStatus.ANALYZED
+
+
+def test_following_analysis_job_adds_tasks_for_runs_that_land_later(tmp_path, monkeypatch) -> None:
+    first = tmp_path / "experiment" / "first.jsonl"
+    later = tmp_path / "experiment" / "later.jsonl"
+    write_jsonl(first, [run_payload(run_id="r1")])
+    state = analysis_job.build_analysis_job_state(
+        job_name="followed analysis",
+        experiment_results_dir=str(tmp_path / "experiment"),
+        output_dir=str(tmp_path / "analysis"),
+        path_to_corpora="corpora",
+        examiner_model="qwen3:4b",
+        num_ctx=8192,
+        input_files=[str(first), str(later)],
+        resume=True,
+        suite_state_path=str(tmp_path / "suite.state.json"),
+        follow=True,
+    )
+    state_path = tmp_path / "analysis.state.json"
+    analysis_job.save_analysis_job_state(state_path, state)
+    calls = {}
+
+    def fake_analyze_directory(*, progress_callback, **kwargs) -> None:
+        calls.update(kwargs)
+        write_jsonl(later, [run_payload(run_id="r2")])
+        for source in (first, later):
+            for run in iter_run_results(source):
+                progress_callback("running", run, source, None)
+                progress_callback("analyzed", run, source, None)
+
+    monkeypatch.setattr(analysis_job, "analyze_directory", fake_analyze_directory)
+
+    final = analysis_job.run_analysis_job(state_path)
+
+    assert [task.run_id for task in state.tasks] == ["r1"]
+    assert calls["follow"] is True
+    assert calls["follow_suite_state_path"] == str(tmp_path / "suite.state.json")
+    assert [(task.run_id, task.status) for task in final.tasks] == [
+        ("r1", AnalysisTaskStatus.ANALYZED),
+        ("r2", AnalysisTaskStatus.ANALYZED),
+    ]
+    assert final.input_files == [str(first.resolve()), str(later.resolve())]
+    assert analysis_job.reconcile_analysis_job_state(final).tasks[1].status == AnalysisTaskStatus.ANALYZED
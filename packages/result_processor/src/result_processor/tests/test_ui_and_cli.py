@@ -16,7 +16,9 @@ from experiment_runner.models.suite import (
     SuiteTask,
     SuiteTaskStatus,
 )
+from experiment_runner.suite_store import SuiteStateStore
 from result_processor import main as result_main
+from result_processor.analysis_job_store import AnalysisJobStore
 from result_processor.commands.analyze import run_analyze
 from result_processor.commands.analysis_job import load_analysis_job_state
 from result_processor.commands.dashboard import run_dashboard
@@ -558,6 +560,76 @@ def test_kill_tracked_background_processes_cancels_state_and_processes(tmp_path,
     assert updated_analysis.tasks[0].status == AnalysisTaskStatus.CANCELLED
 
 
+def test_kill_tracked_suite_state_updates_only_running_tasks_of_a_store(tmp_path, monkeypatch) -> None:
+    suite_dir = tmp_path / "suites"
+    suite_dir.mkdir()
+    task = SuiteTask(
+        task_id="t1",
+        index=1,
+        system=SystemName.ACE,
+        model="qwen3:4b",
+        corpus=Corpus.SOLAR_SYSTEM_WIKI,
+        questions_file="questions.json",
+        path_to_corpora="corpora",
+        question_id="ss_L1_001",
+        question_text="Question?",
+        level=1,
+        command=["python"],
+        status=SuiteTaskStatus.RUNNING,
+    )
+    state = ExperimentSuiteState(
+        suite_id="suite-1",
+        suite_name="suite",
+        active_pid=12345,
+        tasks=[task, task.model_copy(update={"task_id": "t2", "index": 2, "status": SuiteTaskStatus.PENDING})],
+    )
+    state_path = suite_dir / "suite.state.json"
+    state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    with ui.open_suite_store(state_path):
+        pass
+    # Rewriting the whole state would clobber task rows the runner updates meanwhile.
+    monkeypatch.setattr(SuiteStateStore, "replace", lambda *_args: pytest.fail("cancel rewrote the suite state"))
+    monkeypatch.setattr(ui, "_terminate_pid_tree", lambda pid: True)
+
+    ui._kill_tracked_background_processes(suite_dir, tmp_path / "analysis")
+
+    updated = ui.load_suite_state(state_path)
+    assert (updated.cancel_requested, updated.active_pid) == (True, None)
+    assert [task.status for task in updated.tasks] == [SuiteTaskStatus.CANCELLED, SuiteTaskStatus.PENDING]
+
+
+def test_kill_tracked_analysis_state_updates_only_running_tasks_of_a_store(tmp_path, monkeypatch) -> None:
+    analysis_dir = tmp_path / "analysis"
+    analysis_dir.mkdir()
+    task = AnalysisJobTask(
+        run_id="run-1",
+        source_file="run.jsonl",
+        output_file="analysis.jsonl",
+        status=AnalysisTaskStatus.RUNNING,
+    )
+    state = AnalysisJobState(
+        job_name="analysis",
+        experiment_results_dir="results",
+        output_dir=str(tmp_path / "analysis-output"),
+        path_to_corpora="corpora",
+        examiner_model="qwen3:4b",
+        active_pid=12346,
+        tasks=[task, task.model_copy(update={"run_id": "run-2", "status": AnalysisTaskStatus.ANALYZED})],
+    )
+    state_path = analysis_dir / "analysis.state.json"
+    state_path.write_text(state.model_dump_json(), encoding="utf-8")
+    with ui.open_analysis_job_store(state_path):
+        pass
+    monkeypatch.setattr(AnalysisJobStore, "replace", lambda *_args: pytest.fail("cancel rewrote the job state"))
+    monkeypatch.setattr(ui, "_terminate_pid_tree", lambda pid: True)
+
+    ui._kill_tracked_background_processes(tmp_path / "suites", analysis_dir)
+
+    updated = load_analysis_job_state(state_path)
+    assert (updated.cancel_requested, updated.active_pid) == (True, None)
+    assert [task.status for task in updated.tasks] == [AnalysisTaskStatus.CANCELLED, AnalysisTaskStatus.ANALYZED]
+
+
 def test_analysis_run_records_link_legacy_directory_by_suite_result_names(tmp_path) -> None:
     result_path = tmp_path / "experiment" / "run.jsonl"
     write_jsonl(result_path, [run_payload(run_id="r1")])
@@ -854,8 +926,23 @@ def test_command_wrappers_delegate_to_pipelines(monkeypatch) -> None:
             path_to_corpora="corpora",
             examiner_model="qwen3:4b",
             num_ctx=8192,
+            num_ctx_mode="dynamic",
+            examiner_parallelism=2,
+            run_parallelism=3,
+            claim_mode="batch",
+            fast_path="audit",
+            fast_path_support_similarity=0.95,
+            fast_path_reject_coverage=0.0,
+            excerpt_token_budget=512,
+            verdict_cache=None,
+            verdict_cache_mode="refresh",
+            verdict_cache_max_entries=10,
             input_files=["runs.jsonl"],
             resume=False,
+            follow=True,
+            follow_suite_state="suite.state.json",
+            follow_poll_interval=2.0,
+            follow_idle_timeout=None,
         )
     )
     run_visualize(
@@ -869,6 +956,18 @@ def test_command_wrappers_delegate_to_pipelines(monkeypatch) -> None:
 
     assert calls["analyze"]["resume"] is False
     assert calls["analyze"]["input_files"] == ["runs.jsonl"]
+    assert calls["analyze"]["examiner_parallelism"] == 2
+    assert calls["analyze"]["run_parallelism"] == 3
+    assert calls["analyze"]["claim_mode"] == "batch"
+    assert calls["analyze"]["num_ctx_mode"] == "dynamic"
+    assert calls["analyze"]["follow"] is True
+    assert calls["analyze"]["follow_suite_state_path"] == "suite.state.json"
+    assert calls["analyze"]["follow_poll_interval_s"] == 2.0
+    assert calls["analyze"]["fast_path"] == "audit"
+    assert calls["analyze"]["excerpt_token_budget"] == 512
+    assert calls["analyze"]["lexical_thresholds"].support_similarity == 0.95
+    assert calls["analyze"]["verdict_cache_path"] == os.path.join("analysis", "examiner_verdicts.db")
+    assert calls["analyze"]["verdict_cache_mode"] == "refresh"
     assert calls["visualize"]["formats"] == ["html"]
 
 
@@ -5,6 +5,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from experiment_runner.result_store import compact_results_dir
+
 from result_processor.tests.conftest import analysis_result, run_payload, write_jsonl
 from result_processor.visualization.loader import build_dataframe, build_dataframe_for_files, load_analyses, load_runs
 from result_processor.visualization.pipeline import visualize_results
@@ -61,11 +63,24 @@ def test_loader_joins_runs_and_analyses_with_dates_and_levels(tmp_path) -> None:
     assert bool(df.loc[df["run_id"] == "r2", "has_answer_error"].iloc[0]) is True
 
 
-def test_loader_builds_dataframe_for_selected_result_files(tmp_path) -> None:
+def test_loader_builds_dataframe_for_selected_result_files(tmp_path, capsys) -> None:
     experiment_dir, analysis_dir = _write_result_files(tmp_path)
 
-    df = build_dataframe_for_files([experiment_dir / "runs.jsonl"], analysis_dir)
+    df = build_dataframe_for_files([experiment_dir / "runs.jsonl", experiment_dir / "missing.jsonl"], analysis_dir)
+
+    assert df["run_id"].tolist() == ["r1", "r2"]
+    assert df.loc[df["run_id"] == "r1", "support_rate"].iloc[0] == 1.0
+    assert f"result file not found, skipped: {experiment_dir / 'missing.jsonl'}" in capsys.readouterr().err
 
+
+def test_loader_reads_compacted_result_store_alongside_uncompacted_files(tmp_path) -> None:
+    experiment_dir, analysis_dir = _write_result_files(tmp_path)
+    compact_results_dir(experiment_dir)
+    write_jsonl(experiment_dir / "later.jsonl", [run_payload(run_id="r3", question_id="ss_L1_009")])
+
+    assert not (experiment_dir / "runs.jsonl").exists()
+    assert sorted(run.run_id for run in load_runs(experiment_dir)) == ["r1", "r2", "r3"]
+    df = build_dataframe_for_files([experiment_dir / "runs.jsonl"], analysis_dir)
     assert df["run_id"].tolist() == ["r1", "r2"]
     assert df.loc[df["run_id"] == "r1", "support_rate"].iloc[0] == 1.0
 
@@ -24,12 +24,14 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
+from agent.ollama_host import ollama_num_parallel
 from agent.prompts import EXAMINEE_SYSTEM_MESSAGE
 from experiment_runner.commands.suite import (
     build_augmented_suite_state,
     build_suite_tasks,
     load_suite_config,
     load_suite_state,
+    open_suite_store,
     save_suite_config,
     save_suite_state,
     summarize_suite_state,
@@ -43,18 +45,31 @@ from experiment_runner.models.suite import (
     default_state_path,
     suite_slug,
 )
-from experiment_runner.runners.registry import DISABLED_SYSTEMS, SYSTEM_AUTOMATION_LEVELS
+from experiment_runner.result_store import (
+    ResultStore,
+    iter_result_file,
+    result_file_exists,
+    result_store_path,
+)
+from experiment_runner.runners.registry import DISABLED_SYSTEMS, HIDDEN_SYSTEMS, SYSTEM_AUTOMATION_LEVELS
 from experiment_runner.runners.baseline.anythingllm import build_anythingllm_prompt_command
 from experiment_runner.runners.baseline.claudecodelocal import build_claude_command, claude_environment_overrides
 from experiment_runner.runners.baseline.clawcode import build_claw_command, claw_environment_overrides
 from experiment_runner.runners.baseline.gptcodexlocal import build_codex_command
+from experiment_runner.suite_estimate import SuiteEstimate, estimate_suite, format_duration
+from experiment_runner.suite_store import suite_store_path
+from experiment_runner.trace_store import inline_trace, load_trace
+from result_processor.analysis.verdict_cache import VERDICT_CACHE_FILENAME, VERDICT_CACHE_MODES, verdict_cache_path
+from result_processor.analysis_job_store import analysis_job_store_path
 from result_processor.commands.analysis_job import (
     build_analysis_job_state,
     copy_matching_analysis_outputs,
     load_analysis_job_state,
+    open_analysis_job_store,
     save_analysis_job_state,
     summarize_analysis_job_state,
 )
+from result_processor.models.analysis import CLAIM_MODES, FAST_PATH_MODES, NUM_CTX_MODES
 from result_processor.models.analysis_job import AnalysisTaskStatus
 from result_processor.visualization.loader import (
     build_dataframe,
@@ -70,7 +85,11 @@ _AUTOMATION_BADGE: dict[AutomationLevel, str] = {
     AutomationLevel.MANUAL: "✋ manual",
 }
 
-_ALL_SYSTEMS: list[SystemName] = [s for s in SYSTEM_AUTOMATION_LEVELS if s not in DISABLED_SYSTEMS]
+_SHOW_HIDDEN_SYSTEMS = os.environ.get("EXPERIMENT_RUNNER_SHOW_HIDDEN_SYSTEMS") == "1"
+_ALL_SYSTEMS: list[SystemName] = [
+    s for s in SYSTEM_AUTOMATION_LEVELS
+    if s not in DISABLED_SYSTEMS and (_SHOW_HIDDEN_SYSTEMS or s not in HIDDEN_SYSTEMS)
+]
 _AUTOMATED_SYSTEMS: list[SystemName] = [
     s for s in _ALL_SYSTEMS if SYSTEM_AUTOMATION_LEVELS[s] == AutomationLevel.FULL
 ]
@@ -96,6 +115,11 @@ CORPUS_DEFAULTS: dict[str, tuple[str, str]] = {
     ),
 }
 
+# Follow jobs started from the dashboard stop after this long without a new
+# result, so a suite whose runner dies without updating its state cannot keep
+# one running forever.
+DASHBOARD_FOLLOW_IDLE_TIMEOUT_S = 3600
+
 _PROGRESS_RE = re.compile(r"^\[(\d+)/(\d+)\]\s+(.+)$")
 _RESULT_RE = re.compile(r"^results\s*(?:→|->)\s*(.+)$")
 DEFAULT_MODEL = "qwen3:4b"
@@ -354,6 +378,13 @@ def _model_options(default: str = DEFAULT_MODEL) -> list[str]:
     return models
 
 
+def _default_examiner_parallelism() -> int:
+    try:
+        return min(ollama_num_parallel(), 64)
+    except ValueError:
+        return 1
+
+
 def _select_model(label: str, default: str = DEFAULT_MODEL, *, key: str) -> str:
     options = _model_options(default)
     index = options.index(default) if default in options else 0
@@ -368,26 +399,18 @@ def _render_model_refresh_button(*, key: str, width: str = "stretch") -> None:
 
 def _render_run_errors(result_path: str) -> None:
     """Parse a result JSONL and show any answer_error entries immediately."""
-    import json as _json
-
-    path = Path(result_path)
-    if not path.exists():
+    if not result_file_exists(result_path):
         return
 
     errors: list[dict] = []
     try:
-        with path.open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                record = _json.loads(line)
-                if record.get("answer_error"):
-                    errors.append({
-                        "question_id": record.get("question_id", "?"),
-                        "question": record.get("question_text", "")[:80],
-                        "error": record["answer_error"],
-                    })
+        for run in iter_result_file(result_path):
+            if run.answer_error:
+                errors.append({
+                    "question_id": run.question_id,
+                    "question": run.question_text[:80],
+                    "error": run.answer_error,
+                })
     except Exception:
         return
 
@@ -598,6 +621,22 @@ def _analysis_state_paths(analysis_dir: Path) -> list[Path]:
 
 
 def _cancel_tracked_suite_state(state_path: Path) -> int | None:
+    if suite_store_path(state_path).is_file():
+        # Touch only the cancel flag and the running tasks: the runner may be
+        # updating other tasks concurrently.
+        with open_suite_store(state_path) as store:
+            state = store.load()
+            store.update_meta(cancel_requested=True, active_pid=None)
+            for loaded in state.tasks:
+                if loaded.status != SuiteTaskStatus.RUNNING:
+                    continue
+                task = store.get_task(loaded.task_id)
+                if task is not None and task.status == SuiteTaskStatus.RUNNING:
+                    task.status = SuiteTaskStatus.CANCELLED
+                    task.error = "Killed from dashboard."
+                    task.finished_at = datetime.now(timezone.utc)
+                    store.update_task(task)
+        return state.active_pid
     state = load_suite_state(state_path)
     pid = state.active_pid
     now = datetime.now(timezone.utc)
@@ -613,6 +652,21 @@ def _cancel_tracked_suite_state(state_path: Path) -> int | None:
 
 
 def _cancel_tracked_analysis_state(state_path: Path) -> int | None:
+    if analysis_job_store_path(state_path).is_file():
+        # The job's worker threads may be updating other tasks concurrently.
+        with open_analysis_job_store(state_path) as store:
+            state = store.load()
+            store.update_meta(cancel_requested=True, active_pid=None)
+            for loaded in state.tasks:
+                if loaded.status != AnalysisTaskStatus.RUNNING:
+                    continue
+                task = store.get_task(loaded.source_file, loaded.run_id)
+                if task is not None and task.status == AnalysisTaskStatus.RUNNING:
+                    task.status = AnalysisTaskStatus.CANCELLED
+                    task.error = "Killed from dashboard."
+                    task.finished_at = datetime.now(timezone.utc)
+                    store.update_task(task)
+        return state.active_pid
     state = load_analysis_job_state(state_path)
     pid = state.active_pid
     now = datetime.now(timezone.utc)
@@ -694,6 +748,53 @@ def _sidebar() -> dict:
         _refresh_ollama_models()
         st.rerun()
     num_ctx = st.sidebar.number_input("num_ctx", min_value=1024, max_value=131072, value=8192, step=1024)
+    num_ctx_mode = st.sidebar.selectbox(
+        "num_ctx_mode",
+        NUM_CTX_MODES,
+        index=0,
+        help="dynamic uses the smallest context that fits the largest examiner prompt of the same kind"
+        " (claim, batch or summary) so far, growing up to num_ctx.",
+    )
+    examiner_parallelism = st.sidebar.number_input(
+        "examiner_parallelism",
+        min_value=1,
+        max_value=64,
+        value=_default_examiner_parallelism(),
+        help="Claims classified concurrently; match the Ollama server's OLLAMA_NUM_PARALLEL.",
+    )
+    run_parallelism = st.sidebar.number_input(
+        "analysis_run_parallelism",
+        min_value=1,
+        max_value=64,
+        value=1,
+        help="Runs analyzed concurrently, each with examiner_parallelism claims in flight.",
+    )
+    claim_mode = st.sidebar.selectbox(
+        "examiner_claim_mode",
+        CLAIM_MODES,
+        index=0,
+        help="batch verifies all claims of an answer in one examiner call, sending each excerpt once.",
+    )
+    fast_path = st.sidebar.selectbox(
+        "claim_fast_path",
+        FAST_PATH_MODES,
+        index=0,
+        help="use decides near-verbatim and unrelated claims without the examiner; audit asks it anyway and records both.",
+    )
+    excerpt_token_budget = st.sidebar.number_input(
+        "excerpt_token_budget",
+        min_value=0,
+        max_value=16384,
+        value=0,
+        step=256,
+        help="Trim longer excerpts to the lines that best match each claim; 0 sends whole excerpts.",
+    )
+    verdict_cache_mode = st.sidebar.selectbox(
+        "verdict_cache",
+        VERDICT_CACHE_MODES,
+        index=0,
+        help=f"Reuse claim verdicts stored in <analysis dir>/{VERDICT_CACHE_FILENAME}, refresh them or bypass the cache.",
+    )
 
     if st.sidebar.button("🔄 Refresh data", width="stretch"):
         st.cache_data.clear()
@@ -711,6 +812,13 @@ def _sidebar() -> dict:
         "corpora_root": corpora_root,
         "examiner_model": examiner_model,
         "num_ctx": int(num_ctx),
+        "num_ctx_mode": num_ctx_mode,
+        "examiner_parallelism": int(examiner_parallelism),
+        "run_parallelism": int(run_parallelism),
+        "verdict_cache_mode": verdict_cache_mode,
+        "claim_mode": claim_mode,
+        "fast_path": fast_path,
+        "excerpt_token_budget": int(excerpt_token_budget) or None,
     }
 
 
@@ -866,9 +974,12 @@ def _tab_charts(df: pd.DataFrame) -> None:
 
 def _render_trace_steps(run) -> None:
     """Render trace steps (reasoning, tool calls, messages) for a run."""
-    if run is None or run.trace is None or not run.trace.steps:
+    if run is None:
         return
-    steps = run.trace.steps
+    trace = load_trace(run)
+    if trace is None or not trace.steps:
+        return
+    steps = trace.steps
     with st.expander(f"Execution trace ({len(steps)} steps)", expanded=False):
         for i, step in enumerate(steps, 1):
             label = f"Step {i} — `{step.type}`"
@@ -906,6 +1017,11 @@ def _render_corpus_snapshot(run) -> None:
         if snapshot.temp_root_path:
             fs_label = f" ({snapshot.temp_root_filesystem})" if snapshot.temp_root_filesystem else ""
             st.caption(f"Temporary root: `{snapshot.temp_root_path}`{fs_label}")
+        if snapshot.strategy:
+            timing = f" in {snapshot.prepare_time_s:.3f}s" if snapshot.prepare_time_s is not None else ""
+            if snapshot.wait_time_s is not None:
+                timing += f" (run waited {snapshot.wait_time_s:.3f}s)"
+            st.caption(f"Prepared via `{snapshot.strategy.value}`{timing}")
 
         if snapshot.error:
             st.warning(snapshot.error)
@@ -915,6 +1031,27 @@ def _render_corpus_snapshot(run) -> None:
         if snapshot.copied_paths:
             st.markdown("**Copied paths**")
             st.code("\n".join(snapshot.copied_paths), language="text")
+        if snapshot.pre_run_root_hash:
+            st.caption(f"Root hash before run: `{snapshot.pre_run_root_hash}`")
+        if snapshot.post_run_root_hash:
+            st.caption(f"Root hash after run: `{snapshot.post_run_root_hash}`")
+        diff = snapshot.post_run_diff
+        if diff is not None:
+            if snapshot.post_run_root_hash == snapshot.pre_run_root_hash:
+                st.success("Corpus unchanged by the run.")
+            else:
+                st.warning(
+                    f"Corpus changed during the run: {diff.added_count} added, "
+                    f"{diff.removed_count} removed, {diff.modified_count} modified."
+                )
+                lines = (
+                    [f"+ {path}" for path in diff.added]
+                    + [f"- {path}" for path in diff.removed]
+                    + [f"~ {path}" for path in diff.modified]
+                )
+                if diff.truncated:
+                    lines.append("… (truncated)")
+                st.code("\n".join(lines), language="diff")
         cols = st.columns(2)
         if snapshot.pre_run_tree:
             cols[0].markdown("**Before run**")
@@ -1070,7 +1207,7 @@ def _result_files_from_suite_states(state_paths: list[Path]) -> list[str]:
         except Exception:
             continue
         for task in state.tasks:
-            if task.result_path and Path(task.result_path).is_file():
+            if task.result_path and result_file_exists(task.result_path):
                 paths.add(str(Path(task.result_path).resolve()))
     return sorted(paths)
 
@@ -1090,7 +1227,7 @@ def _carried_over_result_files_from_suite_state(state_path: Path) -> list[str]:
         except Exception:
             continue
         for task in source_state.tasks:
-            if task.result_path and Path(task.result_path).is_file():
+            if task.result_path and result_file_exists(task.result_path):
                 source_by_task_id[task.task_id] = str(Path(task.result_path).resolve())
 
     carried: set[str] = set()
@@ -1098,7 +1235,7 @@ def _carried_over_result_files_from_suite_state(state_path: Path) -> list[str]:
         if not task.result_path or task.task_id not in source_by_task_id:
             continue
         result_path = Path(task.result_path)
-        if result_path.is_file() and str(result_path.resolve()) == source_by_task_id[task.task_id]:
+        if result_file_exists(result_path) and str(result_path.resolve()) == source_by_task_id[task.task_id]:
             carried.add(str(result_path.resolve()))
     return sorted(carried)
 
@@ -1114,7 +1251,7 @@ def _suite_records(suite_dir: Path) -> list[dict]:
         result_files = [
             str(Path(task.result_path).resolve())
             for task in state.tasks
-            if task.result_path and Path(task.result_path).is_file()
+            if task.result_path and result_file_exists(task.result_path)
         ]
         records.append({
             "suite_key": str(state_path.resolve()),
@@ -1163,12 +1300,12 @@ def _analysis_run_records(analysis_root: Path, suite_records: list[dict], experi
                 linked_suite = matches[0]
         result_files, missing_files = _result_files_for_analysis_dir(analysis_dir, experiment_dir)
         if metadata and metadata.get("input_files"):
-            result_files = [Path(p) for p in metadata["input_files"] if Path(p).is_file()]
+            result_files = [Path(p) for p in metadata["input_files"] if result_file_exists(p)]
         elif linked_suite:
             analysis_names = {file.name for file in analysis_files}
             result_files = [
                 Path(path) for path in linked_suite["result_files"]
-                if Path(path).name in analysis_names and Path(path).is_file()
+                if Path(path).name in analysis_names and result_file_exists(path)
             ]
         records.append({
             "analysis_name": metadata.get("analysis_name") if metadata else analysis_dir.name,
@@ -1250,7 +1387,13 @@ def _create_analysis_export_zip(
         zf.writestr("manifest.json", json.dumps(manifest, indent=2) + "\n")
         if suite_record["config_path"].is_file():
             zf.write(suite_record["config_path"], f"suite/{suite_record['config_path'].name}")
-        if suite_record["state_path"].is_file():
+        if suite_store_path(suite_record["state_path"]).is_file():
+            # Store-backed suites only snapshot JSON periodically; export the live state.
+            zf.writestr(
+                f"suite/{suite_record['state_path'].name}",
+                load_suite_state(suite_record["state_path"]).model_dump_json(indent=2) + "\n",
+            )
+        elif suite_record["state_path"].is_file():
             zf.write(suite_record["state_path"], f"suite/{suite_record['state_path'].name}")
         if not analysis_df.empty:
             zf.writestr("tables/analysis_results.csv", analysis_df.to_csv(index=False))
@@ -1296,8 +1439,18 @@ def _create_analysis_export_zip(
         for record in analysis_records:
             prefix = suite_slug(record["analysis_name"])
             for path in record["result_files"]:
-                if Path(path).is_file():
-                    zf.write(path, f"experiment_data/{prefix}/{Path(path).name}")
+                if not result_file_exists(path):
+                    continue
+                arcname = f"experiment_data/{prefix}/{Path(path).name}"
+                try:
+                    # Re-emit as self-contained JSONL: compacted rows come from the
+                    # result store and out-of-line traces are inlined again.
+                    zf.writestr(
+                        arcname,
+                        "".join(inline_trace(run).model_dump_json() + "\n" for run in iter_result_file(path)),
+                    )
+                except ValueError:
+                    zf.write(path, arcname)
             for path in record["analysis_files"]:
                 if path.is_file():
                     zf.write(path, f"analysis_results/{prefix}/{path.name}")
@@ -1367,7 +1520,7 @@ def _result_files_for_analysis_dir(analysis_dir: Path, experiment_dir: Path) ->
     missing_files: list[Path] = []
     for analysis_file in sorted(analysis_dir.glob("*.jsonl")):
         result_file = experiment_dir / analysis_file.name
-        if result_file.is_file():
+        if result_file_exists(result_file):
             result_files.append(result_file)
         else:
             missing_files.append(result_file)
@@ -1712,7 +1865,10 @@ def _run_from_result_path(result_path) -> RunResult | None:
         return None
     path = Path(result_path)
     if not path.is_file():
-        return None
+        try:
+            return next(iter_result_file(path), None)
+        except (OSError, ValueError):
+            return None
     try:
         with path.open("r", encoding="utf-8") as fh:
             for line in fh:
@@ -1901,9 +2057,10 @@ def _render_suite_progress(state_path: Path, df: pd.DataFrame, analyses, runs) -
             st.info("The selected task has not produced a result file yet.")
 
 
-def _suite_task_preview(config: ExperimentSuiteConfig) -> pd.DataFrame:
+def _suite_task_preview(config: ExperimentSuiteConfig) -> tuple[pd.DataFrame, SuiteEstimate]:
     tasks = build_suite_tasks(config)
-    return pd.DataFrame(
+    estimate = estimate_suite(config, tasks)
+    preview = pd.DataFrame(
         [
             {
                 "index": task.index,
@@ -1912,11 +2069,43 @@ def _suite_task_preview(config: ExperimentSuiteConfig) -> pd.DataFrame:
                 "level": task.level,
                 "question_id": task.question_id,
                 "system": task.system.value,
+                "cached": task.cache_hit,
+                "timeout_s": task.timeout_s,
+                "timeout_runs": task.timeout_samples,
+                "expected_s": round(estimate.task_expected_s[task.task_id], 1)
+                if task.task_id in estimate.task_expected_s else None,
                 "command": _shell_command(task.command),
             }
             for task in tasks
         ]
     )
+    return preview, estimate
+
+
+def _render_suite_estimate(estimate: SuiteEstimate) -> None:
+    cols = st.columns(4)
+    cols[0].metric("Tasks to run", estimate.pending_tasks, help=f"{estimate.cached_tasks} cached")
+    cols[1].metric("Expected total", format_duration(estimate.expected_total_s))
+    cols[2].metric("p90 total", format_duration(estimate.p90_total_s))
+    cols[3].metric("Model loads", estimate.model_loads)
+    st.caption("What-if: suites run one task at a time; this assumes tasks scale linearly across workers.")
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {
+                    "workers": level.workers,
+                    "expected": format_duration(level.expected_s),
+                    "p90": format_duration(level.p90_s),
+                }
+                for level in estimate.parallelism
+            ]
+        ),
+        hide_index=True,
+    )
+    if estimate.tasks_without_history:
+        st.caption(
+            f"{estimate.tasks_without_history} task(s) have no past durations and are counted at their timeout."
+        )
 
 
 def _compact_names(values: list[str], *, max_items: int = 3) -> str:
@@ -2236,9 +2425,10 @@ def _tab_experiment_suite(cfg: dict, df: pd.DataFrame, analyses, runs) -> None:
 
     st.markdown("### Generated task commands")
     try:
-        preview = _suite_task_preview(config)
+        preview, estimate = _suite_task_preview(config)
         st.dataframe(preview, width="stretch", hide_index=True)
         st.caption(f"{len(preview)} task command(s) generated.")
+        _render_suite_estimate(estimate)
     except Exception as exc:
         preview = pd.DataFrame()
         st.error(f"Could not build suite preview: {exc}")
@@ -2477,7 +2667,16 @@ def _tab_actions(cfg: dict, filtered: pd.DataFrame, analyses, runs) -> None:
                 "--path-to-corpora", cfg["corpora_root"],
                 "--examiner-model", cfg["examiner_model"],
                 "--num-ctx", str(cfg["num_ctx"]),
+                "--num-ctx-mode", cfg["num_ctx_mode"],
+                "--examiner-parallelism", str(cfg["examiner_parallelism"]),
+                "--run-parallelism", str(cfg["run_parallelism"]),
+                "--claim-mode", cfg["claim_mode"],
+                "--fast-path", cfg["fast_path"],
+                "--verdict-cache", str(verdict_cache_path(cfg["analysis_dir"])),
+                "--verdict-cache-mode", cfg["verdict_cache_mode"],
             ]
+            if cfg["excerpt_token_budget"]:
+                args += ["--excerpt-token-budget", str(cfg["excerpt_token_budget"])]
             if not resume:
                 args.append("--no-resume")
             if only_filtered and not filtered.empty:
@@ -2510,6 +2709,19 @@ def _tab_actions(cfg: dict, filtered: pd.DataFrame, analyses, runs) -> None:
             )
             analysis_name = st.text_input("Analysis run name", value=default_analysis_name)
             suite_resume = st.checkbox("Resume suite analysis (skip cached)", value=True)
+            suite_follow = st.checkbox(
+                "Follow the running suite",
+                value=False,
+                help="Analyze each result as soon as the suite writes it, until the suite finishes.",
+            )
+            suite_follow_idle_timeout_s = st.number_input(
+                "Stop following after idle (s)",
+                min_value=60,
+                value=DASHBOARD_FOLLOW_IDLE_TIMEOUT_S,
+                step=300,
+                disabled=not suite_follow,
+                help="Stop when no new result has landed for this long, even if the suite looks unfinished.",
+            )
             carried_over_result_files = _carried_over_result_files_from_suite_state(selected_state)
             st.caption(f"{len(result_files)} result file(s) found for selected suite state.")
             analysis_output_dir, analysis_state_path, analysis_log_path = _analysis_job_paths(
@@ -2577,6 +2789,14 @@ def _tab_actions(cfg: dict, filtered: pd.DataFrame, analyses, runs) -> None:
                     path_to_corpora=cfg["corpora_root"],
                     examiner_model=cfg["examiner_model"],
                     num_ctx=cfg["num_ctx"],
+                    num_ctx_mode=cfg["num_ctx_mode"],
+                    examiner_parallelism=cfg["examiner_parallelism"],
+                    run_parallelism=cfg["run_parallelism"],
+                    claim_mode=cfg["claim_mode"],
+                    fast_path=cfg["fast_path"],
+                    excerpt_token_budget=cfg["excerpt_token_budget"],
+                    verdict_cache_path=str(verdict_cache_path(cfg["analysis_dir"])),
+                    verdict_cache_mode=cfg["verdict_cache_mode"],
                     input_files=result_files,
                     resume=True,
                     log_path=str(analysis_log_path),
@@ -2594,7 +2814,7 @@ def _tab_actions(cfg: dict, filtered: pd.DataFrame, analyses, runs) -> None:
                     "▶ Run / resume suite analysis",
                     type="primary",
                     width="stretch",
-                    disabled=not result_files
+                    disabled=(not result_files and not suite_follow)
                     or not analysis_name.strip()
                     or analysis_name_conflict,
             ):
@@ -2605,8 +2825,18 @@ def _tab_actions(cfg: dict, filtered: pd.DataFrame, analyses, runs) -> None:
                     path_to_corpora=cfg["corpora_root"],
                     examiner_model=cfg["examiner_model"],
                     num_ctx=cfg["num_ctx"],
+                    num_ctx_mode=cfg["num_ctx_mode"],
+                    examiner_parallelism=cfg["examiner_parallelism"],
+                    run_parallelism=cfg["run_parallelism"],
+                    claim_mode=cfg["claim_mode"],
+                    fast_path=cfg["fast_path"],
+                    excerpt_token_budget=cfg["excerpt_token_budget"],
+                    verdict_cache_path=str(verdict_cache_path(cfg["analysis_dir"])),
+                    verdict_cache_mode=cfg["verdict_cache_mode"],
                     input_files=result_files,
                     resume=suite_resume,
+                    follow=suite_follow,
+                    follow_idle_timeout_s=float(suite_follow_idle_timeout_s) if suite_follow else None,
                     log_path=str(analysis_log_path),
                     suite_id=selected_suite_state.suite_id,
                     suite_name=selected_suite_state.suite_name,
@@ -2865,6 +3095,12 @@ def _render_import_archive(cfg: dict) -> None:
 
 def _locate_source_file(experiment_dir: Path, run_id: str) -> str | None:
     """Find which JSONL file contains a given run_id (for --input-files)."""
+    store_path = result_store_path(experiment_dir)
+    if store_path.is_file():
+        with ResultStore(store_path) as store:
+            source = store.source_for_run(run_id)
+        if source is not None:
+            return source
     for jsonl in experiment_dir.glob("*.jsonl"):
         try:
             with jsonl.open("r", encoding="utf-8") as fh:
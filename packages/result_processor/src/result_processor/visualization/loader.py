@@ -3,12 +3,15 @@ from __future__ import annotations
 
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
 from experiment_runner.models.result import RunResult
+from experiment_runner.result_store import ResultStore, result_store_path, source_key
+from experiment_runner.trace_store import bind_trace_store
 
 from result_processor.models.analysis import AnalysisResult
 
@@ -36,18 +39,46 @@ def _read_jsonl(path: Path) -> list[dict[str, Any]]:
 
 
 def load_runs(experiment_results_dir: Path) -> list[RunResult]:
+    """Load the directory's result store plus any JSONL files not yet compacted into it."""
     runs: list[RunResult] = []
+    stored_sources: set[str] = set()
+    store_path = result_store_path(experiment_results_dir)
+    if store_path.is_file():
+        with ResultStore(store_path) as store:
+            stored_sources = store.source_files()
+            runs.extend(store.iter_runs())
     for jsonl in sorted(experiment_results_dir.glob("*.jsonl")):
+        if source_key(jsonl) in stored_sources:
+            continue
         for row in _read_jsonl(jsonl):
-            runs.append(RunResult.model_validate(row))
+            runs.append(bind_trace_store(RunResult.model_validate(row), experiment_results_dir))
     return runs
 
 
 def load_runs_from_files(jsonl_files: list[Path]) -> list[RunResult]:
+    """Load result paths, reading compacted ones from their directory's result store.
+
+    Paths that are neither a file nor rows of a result store are skipped with
+    a warning on stderr.
+    """
     runs: list[RunResult] = []
-    for jsonl in sorted(jsonl_files):
-        for row in _read_jsonl(jsonl):
-            runs.append(RunResult.model_validate(row))
+    stores: dict[Path, ResultStore] = {}
+    try:
+        for jsonl in sorted(Path(path) for path in jsonl_files):
+            if jsonl.is_file():
+                for row in _read_jsonl(jsonl):
+                    runs.append(bind_trace_store(RunResult.model_validate(row), jsonl.parent))
+                continue
+            store_path = result_store_path(jsonl.parent)
+            if store_path.is_file() and store_path not in stores:
+                stores[store_path] = ResultStore(store_path)
+            if store_path not in stores or not stores[store_path].has_source(jsonl):
+                sys.stderr.write(f"warning: result file not found, skipped: {jsonl}\n")
+                continue
+            runs.extend(stores[store_path].iter_runs(source_file=jsonl))
+    finally:
+        for store in stores.values():
+            store.close()
     return runs
 
 
@@ -112,6 +143,10 @@ def _run_record(run: RunResult, analysis: AnalysisResult | None) -> dict[str, An
         "helpfulness_rating": analysis.helpfulness_rating if analysis else None,
         "examiner_model": analysis.examiner_model if analysis else None,
         "analysis_time_s": analysis.analysis_time_s if analysis else None,
+        "classification_time_s": analysis.classification_time_s if analysis else None,
+        "claim_concurrency": analysis.claim_concurrency if analysis else None,
+        "claims_decided_lexically": analysis.claims_decided_lexically if analysis else None,
+        "lexical_agreement": analysis.lexical_agreement if analysis else None,
         "analysis_run_name": analysis.analysis_run_name if analysis else None,
         "suite_id": analysis.suite_id if analysis else None,
         "suite_name": analysis.suite_name if analysis else None,